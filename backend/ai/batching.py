@@ -0,0 +1,125 @@
+"""
+Micro-batching LLM dispatcher for Project Sovereign.
+
+When several games share a server, LLM fallbacks from different players
+arrive within milliseconds of each other. Instead of one provider request
+per fallback, BatchingDispatcher collects them over a short window (or
+until max_batch are waiting) and sends them together through
+provider.parse_batch(). Results are handed back to each caller, which then
+validates its own result exactly as for a single parse.
+
+Model: the first caller into an empty window becomes the batch leader. It
+waits up to window_seconds for others to join (the batch is sent early once
+full), then starts the provider call on a worker thread. Every caller,
+leader included, waits on its own event; if no result arrives within
+timeout_seconds, submit() returns None and that caller uses its fast parser
+result (the late batch result is discarded).
+
+/command handlers run in FastAPI's thread pool, so this uses threads and
+events rather than asyncio.
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from .schemas import ParseResult
+from backend.utils.metrics import LLM_BATCH_SIZE
+
+# Defaults (overridable via LLM_BATCH_WINDOW_MS / LLM_BATCH_MAX)
+DEFAULT_BATCH_WINDOW_SECONDS = 0.02
+DEFAULT_MAX_BATCH = 8
+
+
+class _PendingParse:
+    """One caller's command waiting for a batch result."""
+
+    __slots__ = ("command_text", "game_state", "result", "done")
+
+    def __init__(self, command_text: str, game_state: Optional[Dict]):
+        self.command_text = command_text
+        self.game_state = game_state
+        self.result: Optional[ParseResult] = None
+        self.done = threading.Event()
+
+
+class _Batch:
+    """Commands collected in one window."""
+
+    __slots__ = ("items", "full")
+
+    def __init__(self):
+        self.items: List[_PendingParse] = []
+        self.full = threading.Event()
+
+
+class BatchingDispatcher:
+    """Collects concurrent provider parses into parse_batch() calls."""
+
+    def __init__(
+        self,
+        provider,
+        window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        timeout_seconds: float = 5.0,
+    ):
+        """
+        Args:
+            provider: BaseProvider whose parse_batch() receives the batches
+            window_seconds: How long the leader waits for more commands
+            max_batch: Send as soon as this many commands are waiting
+            timeout_seconds: Per-caller wait before falling back (None result)
+        """
+        self.provider = provider
+        self.window_seconds = window_seconds
+        self.max_batch = max(1, max_batch)
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._open: Optional[_Batch] = None
+
+    def submit(self, command_text: str, game_state: Optional[Dict] = None) -> Optional[ParseResult]:
+        """
+        Parse one command as part of the current batch.
+
+        Returns:
+            The provider's ParseResult for this command, or None on timeout
+            or dispatch failure (caller falls back to the fast parser)
+        """
+        item = _PendingParse(command_text, game_state)
+        with self._lock:
+            batch = self._open
+            leader = batch is None
+            if leader:
+                batch = self._open = _Batch()
+            batch.items.append(item)
+            if len(batch.items) >= self.max_batch:
+                self._open = None  # Closed: later callers start a new batch
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window_seconds)
+            with self._lock:
+                if self._open is batch:
+                    self._open = None
+            threading.Thread(target=self._dispatch, args=(batch.items,), daemon=True).start()
+
+        if not item.done.wait(self.timeout_seconds):
+            print(f"LLM batch: no result for '{command_text[:40]}' within {self.timeout_seconds}s")
+            return None
+        return item.result
+
+    def _dispatch(self, items: List[_PendingParse]) -> None:
+        """Send one batch and wake every caller in it."""
+        LLM_BATCH_SIZE.observe(len(items))
+        try:
+            results = self.provider.parse_batch(
+                [(item.command_text, item.game_state) for item in items])
+            if len(results) != len(items):
+                results = [None] * len(items)
+        except Exception as e:
+            # Providers should not raise; if one does, every caller falls back
+            print(f"LLM batch: provider error: {e}")
+            results = [None] * len(items)
+
+        for item, result in zip(items, results):
+            item.result = result
+            item.done.set()
@@ -52,9 +52,11 @@ IMPLEMENTED:
 """
 
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from backend.models.world_state import WorldState
 from backend.models.marshal import Marshal, Stance
+from backend.models.marshal_table import FLAG_BROKEN, FLAG_RETREATED_THIS_TURN
+from backend.game_logic.profiler import profiled
 
 # ═══════════════════════════════════════════════════════════════════
 # BUG FIX HISTORY (context for future maintainers)
@@ -600,7 +602,8 @@ class EnemyAI:
             "strategic_score": ai_score,
         }
 
-    def process_nation_turn(self, nation: str, world: WorldState, game_state: Dict) -> List[Dict]:
+    def process_nation_turn(self, nation: str, world: WorldState, game_state: Dict,
+                            on_action: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
         """
         Process a single nation's turn with round-robin action distribution.
 
@@ -613,6 +616,8 @@ class EnemyAI:
             nation: Nation name (e.g., "Britain", "Prussia")
             world: Current world state
             game_state: Game state dict for executor
+            on_action: Optional callback invoked with each successful action
+                result as soon as it executes (used to stream the enemy phase)
 
         Returns:
             List of action results for this nation
@@ -746,6 +751,8 @@ class EnemyAI:
             result["action_number"] = action_count
             result["marshal_priority"] = marshal_priority
             results.append(result)
+            if on_action:
+                on_action(result)
 
             # Track successful stance changes to prevent spam
             if selected_action["action"] == "stance_change":
@@ -1005,6 +1012,7 @@ class EnemyAI:
             return True
         return False
 
+    @profiled()
     def _evaluate_marshal(self, marshal: Marshal, nation: str, world: WorldState) -> Tuple[Optional[Dict], int]:
         """
         Evaluate best action for a single marshal.
@@ -1399,6 +1407,7 @@ class EnemyAI:
         # No useful action found - marshal is in optimal state
         return (None, 999)
 
+    @profiled()
     def _get_recovery_action(self, marshal: Marshal, world: WorldState, nation: str) -> Optional[Dict]:
         """Get action for marshal in retreat recovery (limited options).
 
@@ -1459,7 +1468,7 @@ class EnemyAI:
                 if enemy.strength <= 0:
                     continue
                 # Enemy in same region or adjacent = threatening
-                if enemy.location == marshal.location or enemy.location in marshal_region.adjacent_regions:
+                if enemy.location == marshal.location or marshal_region.is_adjacent_to(enemy.location):
                     enemies_threatening = True
                     break
 
@@ -1492,6 +1501,7 @@ class EnemyAI:
             "action": "wait"
         }
 
+    @profiled()
     def _get_survival_action(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """Get action for critically wounded marshal (survival mode).
 
@@ -1509,7 +1519,7 @@ class EnemyAI:
         marshal_region = world.get_region(marshal.location)
         if marshal_region:
             for enemy in enemies:
-                if enemy.location in marshal_region.adjacent_regions:
+                if marshal_region.is_adjacent_to(enemy.location):
                     enemy_adjacent = True
                     break
 
@@ -1561,15 +1571,23 @@ class EnemyAI:
         effective_ratio = base_ratio
         bonuses_applied = []
 
+        # Tactical state from the target's cached modifier vector
+        if hasattr(target, 'get_combat_modifiers'):
+            target_mods = target.get_combat_modifiers()
+            is_drilling = target_mods.drilling
+            target_fortify = target_mods.fortify_bonus
+        else:
+            is_drilling = getattr(target, 'drilling', False) or getattr(target, 'drilling_locked', False)
+            target_fortify = getattr(target, 'defense_bonus', 0)
+
         # Drilling targets are vulnerable (-25% defense penalty)
-        is_drilling = getattr(target, 'drilling', False) or getattr(target, 'drilling_locked', False)
         if is_drilling:
             effective_ratio *= 1.25  # +25% effective advantage
             bonuses_applied.append("DRILLING +25%")
 
         # Fortified targets are harder to attack
         # Balance: cap at 20% to prevent distorted ratios (max_fortify_bonus is 15-20%)
-        fortify_bonus = min(getattr(target, 'defense_bonus', 0), 0.20)
+        fortify_bonus = min(target_fortify, 0.20)
         if fortify_bonus > 0:
             # Reduce effective ratio by fortify bonus (e.g., 15% fortify = 0.85 multiplier)
             effective_ratio *= (1.0 - fortify_bonus)
@@ -1607,6 +1625,7 @@ class EnemyAI:
 
         return effective_ratio
 
+    @profiled()
     def _check_threats(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """Check for threats and respond appropriately."""
         enemies = world.get_enemies_of_nation(nation)
@@ -1618,7 +1637,7 @@ class EnemyAI:
         # Find adjacent enemies
         adjacent_enemies = []
         for enemy in enemies:
-            if enemy.location in marshal_region.adjacent_regions:
+            if marshal_region.is_adjacent_to(enemy.location):
                 adjacent_enemies.append(enemy)
             elif enemy.location == marshal.location:
                 # Enemy in same region! Must respond
@@ -1653,6 +1672,7 @@ class EnemyAI:
 
         return None
 
+    @profiled()
     def _get_counter_punch_action(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """
         Get counter-punch attack action for cautious marshals.
@@ -1679,7 +1699,7 @@ class EnemyAI:
         # Find adjacent enemies only (counter-punch is immediate retaliation)
         adjacent_enemies = []
         for enemy in enemies:
-            if enemy.strength > 0 and enemy.location in marshal_region.adjacent_regions:
+            if enemy.strength > 0 and marshal_region.is_adjacent_to(enemy.location):
                 adjacent_enemies.append(enemy)
 
         if not adjacent_enemies:
@@ -1718,6 +1738,14 @@ class EnemyAI:
         it has allies ready to follow up.
         """
         total = marshal.strength
+        table = world.get_marshal_table() if hasattr(world, 'get_marshal_table') else None
+        if table is not None:
+            for other in table.select(
+                    nation=nation, location=marshal.location,
+                    exclude_flags=FLAG_BROKEN | FLAG_RETREATED_THIS_TURN):
+                if other.name != marshal.name:
+                    total += other.strength
+            return total
         for other in world.marshals.values():
             if (other.name != marshal.name
                     and other.nation == nation
@@ -1728,6 +1756,7 @@ class EnemyAI:
                 total += other.strength
         return total
 
+    @profiled()
     def _find_attack_opportunity(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """Find a valid attack target based on personality."""
         # Check if already drilling (cannot attack)
@@ -1868,6 +1897,7 @@ class EnemyAI:
             "target": target.name
         }
 
+    @profiled()
     def _find_undefended_capture(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """
         Find an undefended enemy region to capture.
@@ -1950,6 +1980,7 @@ class EnemyAI:
             "target": best_target
         }
 
+    @profiled()
     def _find_ally_support_opportunity(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """
         Find opportunity to support an ally who is:
@@ -2003,7 +2034,7 @@ class EnemyAI:
             # Also check if ally is threatened (enemy adjacent)
             enemies_adjacent_to_ally = [
                 m for m in world.marshals.values()
-                if m.location in ally_region.adjacent_regions
+                if ally_region.is_adjacent_to(m.location)
                 and m.nation != nation
                 and m.strength > 0
             ]
@@ -2052,7 +2083,7 @@ class EnemyAI:
                 continue
 
             # Can we reach ally? Check if ally's location is adjacent to us
-            if ally.location in marshal_region.adjacent_regions:
+            if marshal_region.is_adjacent_to(ally.location):
                 # Check if there are enemies blocking the path
                 enemies_at_dest = [
                     m for m in world.marshals.values()
@@ -2115,6 +2146,7 @@ class EnemyAI:
 
         return None
 
+    @profiled()
     def _get_stagnation_action(self, marshal: Marshal, nation: str, world: WorldState,
                                stagnation: int, personality: str) -> Optional[Dict]:
         """
@@ -2219,6 +2251,7 @@ class EnemyAI:
 
         return None
 
+    @profiled()
     def _consider_consolidation(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """
         Fix #4: Weak marshals consolidate with strongest ally instead of ping-ponging.
@@ -2315,6 +2348,7 @@ class EnemyAI:
 
         return None
 
+    @profiled()
     def _consider_fortify(self, marshal: Marshal, world: WorldState) -> Optional[Dict]:
         """Consider fortifying (cautious marshals prefer this)."""
         # Don't fortify if already fortified
@@ -2384,6 +2418,7 @@ class EnemyAI:
             "action": "fortify"
         }
 
+    @profiled()
     def _consider_drill(self, marshal: Marshal, world: WorldState) -> Optional[Dict]:
         """Consider drilling (aggressive marshals like this when no threat)."""
         # Don't drill if already drilling or have bonus
@@ -2404,7 +2439,7 @@ class EnemyAI:
                     ai_debug(f"    P6: Can't drill - engaged with {enemy.name}")
                     return None
                 # Check adjacent
-                if enemy.location in marshal_region.adjacent_regions:
+                if marshal_region.is_adjacent_to(enemy.location):
                     ai_debug(f"    P6: Can't drill - {enemy.name} adjacent")
                     return None
 
@@ -2413,6 +2448,7 @@ class EnemyAI:
             "action": "drill"
         }
 
+    @profiled()
     def _consider_strategic_move(self, marshal: Marshal, nation: str, world: WorldState) -> Optional[Dict]:
         """Consider moving strategically."""
         personality = self._get_effective_personality(marshal, world)
@@ -2477,7 +2513,7 @@ class EnemyAI:
             # Check if threatened (enemy adjacent)
             enemy_adjacent = False
             for enemy in enemies:
-                if enemy.location in marshal_region.adjacent_regions:
+                if marshal_region.is_adjacent_to(enemy.location):
                     enemy_adjacent = True
                     break
 
@@ -2524,6 +2560,7 @@ class EnemyAI:
 
         return None
 
+    @profiled()
     def _get_default_action(self, marshal: Marshal, world: WorldState) -> Optional[Dict]:
         """
         Get default action when no other priority applies.
@@ -2789,24 +2826,12 @@ class EnemyAI:
         if start == end:
             return [start]
 
-        from collections import deque
-        queue = deque([(start, [start])])
-        visited = {start}
-
-        while queue:
-            current, path = queue.popleft()
-            current_region = world.get_region(current)
-            if not current_region:
-                continue
-
-            for neighbor in current_region.adjacent_regions:
-                if neighbor == end:
-                    return path + [neighbor]
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
-
-        return []  # No path found
+        graph = world.get_region_graph()
+        start_id, end_id = graph.id_of(start), graph.id_of(end)
+        if start_id < 0 or end_id < 0:
+            return []  # No path found
+        path = graph.path(start_id, end_id)
+        return graph.names_of(path) if path is not None else []
 
     def _path_is_blocked(
         self,
@@ -2832,9 +2857,13 @@ class EnemyAI:
             return (False, None)  # Adjacent or same region - no intermediate to block
 
         # Check intermediate regions (not start, not destination)
+        table = world.get_marshal_table() if hasattr(world, 'get_marshal_table') else None
         for region_name in path[1:-1]:
-            blockers = [m for m in world.marshals.values()
-                       if m.location == region_name and m.nation != nation and m.strength > 0]
+            if table is not None:
+                blockers = table.select(not_nation=nation, location=region_name)
+            else:
+                blockers = [m for m in world.marshals.values()
+                           if m.location == region_name and m.nation != nation and m.strength > 0]
             if blockers:
                 ai_debug(f"    [PATH BLOCKED] {blockers[0].name} in {region_name} blocks path")
                 return (True, blockers[0].name)
@@ -2872,23 +2901,33 @@ class EnemyAI:
         if not target:
             return (False, "Invalid region")
 
+        # One pass over marshals, testing positions against the target's
+        # adjacency bitset (and the target itself for friendly support)
+        graph = world.get_region_graph()
+        region_ids = graph.ids
+        target_id = graph.id_of(target_region)
+        adjacent_bits = graph.adjacency_bits[target_id] if target_id >= 0 else 0
+        support_bits = adjacent_bits | (1 << target_id) if target_id >= 0 else 0
+
         # Count enemies that would be adjacent AFTER we move to target
         adjacent_enemies = 0
         adjacent_enemy_strength = 0
-        for adj_name in target.adjacent_regions:
-            for m in world.marshals.values():
-                if m.location == adj_name and m.nation != nation and m.strength > 0:
-                    adjacent_enemies += 1
-                    adjacent_enemy_strength += m.strength
-
         # Count friendly support (friendly marshals adjacent to target or in target)
         friendly_support = 0
         friendly_strength = 0
-        for adj_name in list(target.adjacent_regions) + [target_region]:
-            for m in world.marshals.values():
-                if m.location == adj_name and m.nation == nation and m.name != marshal.name and m.strength > 0:
-                    friendly_support += 1
-                    friendly_strength += m.strength
+        for m in world.marshals.values():
+            if m.strength <= 0:
+                continue
+            region_id = region_ids.get(m.location)
+            if region_id is None:
+                continue
+            if m.nation != nation:
+                if adjacent_bits >> region_id & 1:
+                    adjacent_enemies += 1
+                    adjacent_enemy_strength += m.strength
+            elif m.name != marshal.name and support_bits >> region_id & 1:
+                friendly_support += 1
+                friendly_strength += m.strength
 
         # Check for complete encirclement (aggressive only avoids this)
         total_adjacent = len(target.adjacent_regions)
@@ -2969,6 +3008,7 @@ class EnemyAI:
         # Check if this is the capital of the controlling nation
         return capitals.get(controller) == region_name
 
+    @profiled()
     def _check_fortification_opportunity(
         self,
         marshal: Marshal,
@@ -3176,7 +3216,7 @@ class EnemyAI:
                 # Check if ally is threatened (enemy adjacent and ally outnumbered)
                 enemies_adjacent_to_ally = [
                     m for m in world.marshals.values()
-                    if m.location in ally_region.adjacent_regions and m.nation != nation and m.strength > 0
+                    if ally_region.is_adjacent_to(m.location) and m.nation != nation and m.strength > 0
                 ]
 
                 ally_needs_help = False
@@ -3236,7 +3276,9 @@ class EnemyAI:
             }
         }
 
-        result = self.executor.execute(command, game_state)
+        # Enemy phase battles are shown from their numbers (enemy_phase
+        # dialog), so skip the battle narrative
+        result = self.executor.execute(command, {**game_state, "narrate_battles": False})
         result["ai_action"] = action
 
         # ════════════════════════════════════════════════════════════
@@ -0,0 +1,249 @@
+"""
+Local intent classifier for Project Sovereign.
+
+A middle tier between the fast parser and the LLM provider. Commands the
+fast parser isn't confident about usually name their marshal and target
+plainly ("Ney, go and deal with the British") - only the verb is unusual.
+This classifier predicts the ACTION from the raw text; the fast parser's
+marshal/target extraction is kept. If the (calibrated) probability is at
+least the threshold, the command never leaves the process; otherwise it
+escalates to the LLM as before.
+
+MODEL
+- Features: character n-grams (2-4, word-boundary padded) plus word unigrams
+- Multinomial logistic regression, trained with SGD + L2 (pure Python, no
+  numpy; a few thousand examples train in seconds)
+- Calibration: temperature scaling fitted on a held-out split, so reported
+  probabilities mean what they say (see expected_calibration_error)
+- Saved as JSON (labels, sparse weights, bias, temperature)
+
+TRAINING DATA
+Logged (raw_command, validated ParseResult) pairs: set LLM_PARSE_JOURNAL to
+a file and LLMClient appends one JSON line per validated LLM parse
+(ParseJournal). scripts/train_intent_classifier.py reads journals and saved
+games' command_history, trains, and prints an accuracy/latency report.
+
+USAGE
+    LLM_INTENT_MODEL=models/intent.json   # enable the tier
+    LLM_INTENT_CONFIDENCE=0.9             # escalate below this
+"""
+
+import json
+import math
+import random
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Default acceptance threshold for the calibrated top probability
+DEFAULT_INTENT_CONFIDENCE = 0.9
+
+_NON_WORD = re.compile(r"[^a-z0-9' ]+")
+
+
+def featurize(text: str, ngram_range: Tuple[int, int] = (2, 4)) -> List[str]:
+    """Char n-grams (word-boundary padded) and word unigrams of normalized text."""
+    normalized = " ".join(_NON_WORD.sub(" ", text.lower()).split())
+    features = [f"w:{word}" for word in normalized.split()]
+    padded = f" {normalized} "
+    low, high = ngram_range
+    for n in range(low, high + 1):
+        features.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return features
+
+
+def _softmax(scores: Sequence[float], temperature: float = 1.0) -> List[float]:
+    scaled = [s / temperature for s in scores]
+    top = max(scaled)
+    exps = [math.exp(s - top) for s in scaled]
+    total = sum(exps)
+    return [e / total for e in exps]
+
+
+class IntentClassifier:
+    """Char n-gram multinomial logistic regression over parse actions."""
+
+    def __init__(self, labels: Sequence[str], ngram_range: Tuple[int, int] = (2, 4)):
+        self.labels = list(labels)
+        self.ngram_range = tuple(ngram_range)
+        self.weights: Dict[str, List[float]] = {}
+        self.bias = [0.0] * len(self.labels)
+        self.temperature = 1.0
+
+    # ── Inference ──
+
+    def _scores(self, features: Iterable[str]) -> List[float]:
+        scores = list(self.bias)
+        for feature in features:
+            row = self.weights.get(feature)
+            if row is not None:
+                for k, w in enumerate(row):
+                    scores[k] += w
+        return scores
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        """Calibrated probability of every label."""
+        probs = _softmax(self._scores(featurize(text, self.ngram_range)), self.temperature)
+        return dict(zip(self.labels, probs))
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """(most likely action, calibrated probability)."""
+        probs = _softmax(self._scores(featurize(text, self.ngram_range)), self.temperature)
+        best = max(range(len(probs)), key=probs.__getitem__)
+        return self.labels[best], probs[best]
+
+    # ── Training ──
+
+    @classmethod
+    def train(
+        cls,
+        examples: Sequence[Tuple[str, str]],
+        epochs: int = 15,
+        learning_rate: float = 0.2,
+        l2: float = 1e-4,
+        calibration_fraction: float = 0.2,
+        seed: int = 0,
+    ) -> "IntentClassifier":
+        """
+        Fit on (raw_command, action) pairs, then calibrate the temperature on
+        a held-out calibration_fraction of them.
+
+        Raises:
+            ValueError: If there are fewer than two distinct actions
+        """
+        labels = sorted({action for _, action in examples})
+        if len(labels) < 2:
+            raise ValueError("Need examples of at least two actions to train")
+        model = cls(labels)
+        index = {label: k for k, label in enumerate(labels)}
+
+        rng = random.Random(seed)
+        rows = [(featurize(text, model.ngram_range), index[action]) for text, action in examples]
+        rng.shuffle(rows)
+        n_calibration = int(len(rows) * calibration_fraction) if len(rows) >= 20 else 0
+        calibration, fit = rows[:n_calibration], rows[n_calibration:]
+
+        n_labels = len(labels)
+        for epoch in range(epochs):
+            rng.shuffle(fit)
+            rate = learning_rate / (1.0 + epoch * 0.3)
+            for features, target in fit:
+                probs = _softmax(model._scores(features))
+                grads = [p - (1.0 if k == target else 0.0) for k, p in enumerate(probs)]
+                for k in range(n_labels):
+                    model.bias[k] -= rate * grads[k]
+                for feature in features:
+                    row = model.weights.get(feature)
+                    if row is None:
+                        row = model.weights[feature] = [0.0] * n_labels
+                    for k in range(n_labels):
+                        row[k] -= rate * (grads[k] + l2 * row[k])
+
+        if calibration:
+            model.temperature = model._fit_temperature(calibration)
+        return model
+
+    def _fit_temperature(self, rows: Sequence[Tuple[List[str], int]]) -> float:
+        """Temperature minimizing held-out negative log-likelihood (grid search)."""
+        scored = [(self._scores(features), target) for features, target in rows]
+        best_t, best_nll = 1.0, float("inf")
+        for step in range(1, 61):
+            t = 0.25 * step  # 0.25 .. 15
+            nll = -sum(math.log(max(_softmax(scores, t)[target], 1e-12)) for scores, target in scored)
+            if nll < best_nll:
+                best_t, best_nll = t, nll
+        return best_t
+
+    # ── Persistence ──
+
+    def to_dict(self) -> Dict:
+        return {
+            "format_version": 1,
+            "labels": self.labels,
+            "ngram_range": list(self.ngram_range),
+            "temperature": self.temperature,
+            "bias": self.bias,
+            # Drop near-zero weights: most n-grams seen once carry nothing
+            "weights": {f: [round(w, 5) for w in row] for f, row in self.weights.items()
+                        if max(abs(w) for w in row) > 1e-4},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "IntentClassifier":
+        model = cls(data["labels"], tuple(data.get("ngram_range", (2, 4))))
+        model.temperature = data.get("temperature", 1.0)
+        model.bias = list(data["bias"])
+        model.weights = {f: list(row) for f, row in data["weights"].items()}
+        return model
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "IntentClassifier":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def expected_calibration_error(predictions: Sequence[Tuple[float, bool]], bins: int = 10) -> float:
+    """
+    ECE over (confidence, correct) pairs: |accuracy - confidence| per
+    confidence bin, weighted by bin size.
+    """
+    if not predictions:
+        return 0.0
+    buckets: List[List[Tuple[float, bool]]] = [[] for _ in range(bins)]
+    for confidence, correct in predictions:
+        buckets[min(bins - 1, int(confidence * bins))].append((confidence, correct))
+    total = len(predictions)
+    return sum(
+        len(b) / total * abs(sum(c for _, c in b) / len(b) - sum(p for p, _ in b) / len(b))
+        for b in buckets if b
+    )
+
+
+class ParseJournal:
+    """Append-only JSONL log of validated LLM parses (training data)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, raw_command: str, result) -> None:
+        """Append one (raw_command, validated ParseResult) pair; never raises."""
+        line = json.dumps({
+            "raw_command": raw_command,
+            "action": result.action,
+            "marshals": result.marshals,
+            "target": result.target,
+            "target_stance": result.target_stance,
+            "mode": result.mode,
+        })
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"ParseJournal: could not write {self.path}: {e}")
+
+
+def load_examples(journal_paths: Sequence[str] = (), save_paths: Sequence[str] = ()) -> List[Tuple[str, str]]:
+    """
+    (raw_command, action) training pairs from parse journals (JSONL) and
+    saved games (WorldState.to_dict() JSON, read from command_history).
+    Entries without a usable action are skipped.
+    """
+    examples: List[Tuple[str, str]] = []
+    for path in journal_paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                examples.append((entry.get("raw_command", ""), entry.get("action")))
+    for path in save_paths:
+        with open(path, encoding="utf-8") as f:
+            for entry in json.load(f).get("command_history", []):
+                examples.append((entry.get("raw_input", ""), entry.get("action")))
+    return [(text, action) for text, action in examples if text and action and action != "unknown"]
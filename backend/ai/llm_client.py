@@ -8,6 +8,8 @@ FLOW:
 1. Fast parser (keyword matching) runs ALWAYS - instant, free
 2. If confidence >= threshold OR mode == "mock" -> return fast result
 3. If confidence < threshold AND mode == "live" AND game_state provided:
+   0. If a local intent classifier is configured (LLM_INTENT_MODEL) and
+      sure of the action -> return that (intent_classifier.py)
    a. Call LLM provider with prompt
    b. Validate LLM response
    c. If validation fails -> return fast result (safety net)
@@ -24,12 +26,20 @@ See docs/PHASE_5_2_IMPLEMENTATION_PLAN.md Section 6 for keywords to add:
 
 import os
 import re
-from typing import Dict, Optional, List
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import replace
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
 from dotenv import load_dotenv
 
 from .schemas import ParseResult
-from .providers import get_provider, PROVIDERS
-from .validation import validate_parse_result, should_skip_validation
+from .providers import get_provider, PROVIDERS, REQUEST_TIMEOUT_SECONDS
+from .batching import BatchingDispatcher, DEFAULT_MAX_BATCH
+from .resilience import CircuitBreaker, ResilientProvider, TokenBucket
+from .intent_classifier import DEFAULT_INTENT_CONFIDENCE, IntentClassifier, ParseJournal
+from .validation import META_ACTIONS, validate_parse_result, should_skip_validation
+from backend.utils.metrics import PARSE_PATH_TOTAL
 
 # Load environment variables
 load_dotenv()
@@ -46,6 +56,56 @@ load_dotenv()
 # - <0.7 = "Fast parser is guessing, LLM might do better"
 LLM_FALLBACK_CONFIDENCE_THRESHOLD = 0.7
 
+# Parse path of the most recent parse in this context (request), e.g. "fast",
+# "llm", "validation_fallback". Read by /command for the X-Parse-Path header.
+_last_parse_path: ContextVar[Optional[str]] = ContextVar("last_parse_path", default=None)
+
+
+def _record_parse_path(path: str) -> None:
+    """Count a parse path in PARSE_PATH_TOTAL and remember it for this request."""
+    PARSE_PATH_TOTAL.labels(path).inc()
+    _last_parse_path.set(path)
+
+
+def last_parse_path() -> Optional[str]:
+    """Parse path taken by the last parse_command() in this context, if any."""
+    return _last_parse_path.get()
+
+
+class LazyGameState(Mapping):
+    """
+    Read-only game state dict built on first access.
+
+    The prompt game state (marshals, enemies, map_data) is only needed when
+    a command actually falls back to the LLM, which most commands don't.
+    Pass one of these instead of a built dict: _should_fallback_to_llm()
+    only checks it against None, so the builder runs only when a provider
+    (or validation after it) reads a key.
+    """
+
+    def __init__(self, builder: Callable[[], Dict]):
+        self._builder = builder
+        self._data: Optional[Dict] = None
+
+    @property
+    def built(self) -> bool:
+        """True once the underlying dict has been built."""
+        return self._data is not None
+
+    def _get_data(self) -> Dict:
+        if self._data is None:
+            self._data = self._builder()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._get_data()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._get_data())
+
+    def __len__(self) -> int:
+        return len(self._get_data())
+
 
 class LLMClient:
     """
@@ -107,6 +167,34 @@ class LLMClient:
             print(f"Warning: API key not found for provider '{self.provider_name}'. "
                   "Parsing will fall back to mock mode if provider fails.")
 
+        # Circuit breaker / rate limit / hedging in front of live providers
+        if self.use_real_api:
+            self.provider = self._build_resilient_provider(self.provider)
+
+        # Optional local intent classifier between fast parser and provider,
+        # and optional journal of validated LLM parses (its training data)
+        self.intent_classifier: Optional[IntentClassifier] = None
+        self.intent_confidence = float(os.getenv("LLM_INTENT_CONFIDENCE", DEFAULT_INTENT_CONFIDENCE))
+        model_path = os.getenv("LLM_INTENT_MODEL")
+        if model_path:
+            try:
+                self.intent_classifier = IntentClassifier.load(model_path)
+                print(f"LLM Client: intent classifier {model_path} "
+                      f"({len(self.intent_classifier.labels)} actions, threshold={self.intent_confidence})")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Warning: could not load intent classifier '{model_path}': {e}")
+        journal_path = os.getenv("LLM_PARSE_JOURNAL")
+        self._journal: Optional[ParseJournal] = ParseJournal(journal_path) if journal_path else None
+
+        # Worker threads for start_parse() (created on first speculative fallback)
+        self._speculation_pool: Optional[ThreadPoolExecutor] = None
+
+        # Optional micro-batching of concurrent LLM fallbacks (0 = off)
+        self._dispatcher: Optional[BatchingDispatcher] = None
+        batch_window_ms = float(os.getenv("LLM_BATCH_WINDOW_MS", "0") or 0)
+        if self.use_real_api and batch_window_ms > 0:
+            self.enable_batching(batch_window_ms, int(os.getenv("LLM_BATCH_MAX", DEFAULT_MAX_BATCH)))
+
         print(f"LLM Client: provider={self.provider_name.upper()}, key_source={self.key_source}")
 
     @classmethod
@@ -132,6 +220,47 @@ class LLMClient:
             # Mock mode
             return cls(use_real_api=False)
 
+    def _build_resilient_provider(self, provider):
+        """
+        Wrap a live provider in ResilientProvider (see resilience.py).
+
+        Env: LLM_BREAKER_COOLDOWN_SECONDS, LLM_RATE_LIMIT_RPS (0 = off),
+        LLM_RATE_LIMIT_BURST, LLM_RATE_LIMIT_MAX_WAIT_MS, LLM_HEDGE_PROVIDER
+        (unset = no hedging) and LLM_HEDGE_AFTER_MS.
+        """
+        rate = float(os.getenv("LLM_RATE_LIMIT_RPS", "0") or 0)
+        burst = os.getenv("LLM_RATE_LIMIT_BURST")
+        hedge = None
+        hedge_name = os.getenv("LLM_HEDGE_PROVIDER", "").lower()
+        if hedge_name and hedge_name != self.provider_name and hedge_name in PROVIDERS and hedge_name != "mock":
+            hedge = ResilientProvider(get_provider(hedge_name))
+            print(f"LLM Client: hedging to {hedge_name} after {os.getenv('LLM_HEDGE_AFTER_MS', '1500')}ms")
+        return ResilientProvider(
+            provider,
+            breaker=CircuitBreaker(
+                cooldown_seconds=float(os.getenv("LLM_BREAKER_COOLDOWN_SECONDS", "30") or 30)),
+            bucket=TokenBucket(rate, float(burst) if burst else None),
+            max_wait_seconds=float(os.getenv("LLM_RATE_LIMIT_MAX_WAIT_MS", "1000") or 0) / 1000.0,
+            hedge=hedge,
+            hedge_after_seconds=float(os.getenv("LLM_HEDGE_AFTER_MS", "1500") or 1500) / 1000.0,
+        )
+
+    def enable_batching(self, window_ms: float, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        """
+        Send concurrent LLM fallbacks as micro-batches (see batching.py).
+
+        Args:
+            window_ms: How long to collect fallbacks before sending (e.g. 20)
+            max_batch: Send early once this many are waiting
+        """
+        self._dispatcher = BatchingDispatcher(
+            self.provider,
+            window_seconds=window_ms / 1000.0,
+            max_batch=max_batch,
+            timeout_seconds=REQUEST_TIMEOUT_SECONDS + window_ms / 1000.0,
+        )
+        print(f"LLM Client: batching fallbacks (window={window_ms}ms, max={max_batch})")
+
     @property
     def key_source(self) -> str:
         """Return 'none', 'inhouse', or 'byok' for logging/UI."""
@@ -168,16 +297,61 @@ class LLMClient:
         # Step 2: Decide if we should try LLM
         # Skip LLM if: mock mode, high confidence, no game_state, or meta command
         if not self._should_fallback_to_llm(fast_result, game_state):
+            _record_parse_path("fast")
             return fast_result.to_dict()
 
-        # Step 3: Try LLM provider (only for low-confidence parses)
+        # Step 3: Local intent classifier (if configured and sure enough)
+        classified = self._classify_locally(command_text, fast_result, game_state)
+        if classified is not None:
+            return classified.to_dict()
+
+        # Step 4: Try LLM provider (only for low-confidence parses)
         print(f"LLM fallback: '{command_text[:40]}...' (confidence={fast_result.confidence})")
         llm_result = self._parse_with_live_provider(command_text, game_state, fast_result)
 
-        # Step 4: Return best result
+        # Step 5: Return best result
         # _parse_with_live_provider handles validation and fallback internally
         return llm_result.to_dict()
 
+    def start_parse(self, command_text: str, game_state: Optional[Dict] = None) -> Tuple[Dict, Optional[Future]]:
+        """
+        Split parse_command() for speculative execution (see speculation.py).
+
+        Runs the fast parser now and, if the command would fall back to the
+        LLM, starts that fallback on a worker thread instead of waiting.
+
+        Returns:
+            (parse dict, future or None). Pass the future to resolve_parse()
+            for parse_command()'s dict on the LLM path; None means the dict
+            is final (fast parser or local classifier, no LLM needed).
+        """
+        fast_result = self._parse_with_mock(command_text)
+        if not self._should_fallback_to_llm(fast_result, game_state):
+            _record_parse_path("fast")
+            return fast_result.to_dict(), None
+
+        classified = self._classify_locally(command_text, fast_result, game_state)
+        if classified is not None:
+            return classified.to_dict(), None
+
+        print(f"LLM fallback (speculative): '{command_text[:40]}...' (confidence={fast_result.confidence})")
+        if self._speculation_pool is None:
+            self._speculation_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-speculative")
+
+        def run_fallback() -> Tuple[Dict, Optional[str]]:
+            result = self._parse_with_live_provider(command_text, game_state, fast_result)
+            return result.to_dict(), last_parse_path()  # Path as recorded on the worker
+
+        return fast_result.to_dict(), self._speculation_pool.submit(run_fallback)
+
+    @staticmethod
+    def resolve_parse(future: Future) -> Dict:
+        """Wait for a start_parse() future; records its parse path in this context."""
+        result, path = future.result()
+        if path:
+            _last_parse_path.set(path)
+        return result
+
     def _should_fallback_to_llm(self, fast_result: ParseResult, game_state: Optional[Dict]) -> bool:
         """
         Decide if we should try LLM fallback after fast parser.
@@ -242,11 +416,61 @@ class LLMClient:
 
         # Step 2: Decide if we should try LLM
         if not self._should_fallback_to_llm(fast_result, game_state):
+            _record_parse_path("fast")
             return fast_result
 
-        # Step 3: Try LLM
+        # Step 3: Local intent classifier, then LLM
+        classified = self._classify_locally(command_text, fast_result, game_state)
+        if classified is not None:
+            return classified
         return self._parse_with_live_provider(command_text, game_state, fast_result)
 
+    def _classify_locally(
+        self,
+        command_text: str,
+        fast_result: ParseResult,
+        game_state: Optional[Dict]
+    ) -> Optional[ParseResult]:
+        """
+        Middle tier: predict the action with the local intent classifier.
+
+        Only used when the fast parser resolved a marshal: the classifier
+        replaces the action, keeps the fast parser's marshal/target and goes
+        through the same validation as an LLM result. Meta actions are never
+        taken from the classifier.
+
+        Returns:
+            The classified ParseResult (mode "classifier"), or None to
+            escalate to the LLM
+        """
+        if self.intent_classifier is None or not fast_result.marshals:
+            return None
+        action, probability = self.intent_classifier.predict(command_text)
+        if action in META_ACTIONS or probability < self.intent_confidence:
+            print(f"Intent classifier unsure ({action} p={probability:.2f}), escalating to LLM")
+            return None
+
+        validated = validate_parse_result(
+            replace(
+                fast_result,
+                matched=True,
+                action=action,
+                confidence=probability,
+                mode="classifier",
+                interpretation=f"Local classifier: {action}",
+            ),
+            self._extract_valid_marshals(game_state),
+            self._extract_valid_regions(game_state),
+            self._extract_valid_targets(game_state),
+        )
+        if not validated.matched:
+            print(f"Intent classifier result failed validation: {validated.suggestion}")
+            return None
+
+        print(f"Intent classifier: '{command_text[:40]}' -> {action} (p={probability:.2f})")
+        _record_parse_path("classifier")
+        return validated
+
     def _parse_with_live_provider(
         self,
         command_text: str,
@@ -271,12 +495,21 @@ class LLMClient:
             Validated LLM result, or fast_result if anything fails
         """
         try:
-            # Call provider (may raise exceptions)
-            llm_result = self.provider.parse(command_text, game_state)
+            # Call provider (may raise exceptions), batched with other
+            # sessions' fallbacks when a dispatcher is configured
+            if self._dispatcher is not None:
+                llm_result = self._dispatcher.submit(command_text, game_state)
+                if llm_result is None:
+                    print(f"LLM batch timed out, using fast parser result")
+                    _record_parse_path("timeout_fallback")
+                    return fast_result
+            else:
+                llm_result = self.provider.parse(command_text, game_state)
 
             # Provider returned but couldn't parse
             if not llm_result.matched:
                 print(f"LLM couldn't parse command, using fast parser result")
+                _record_parse_path("unmatched_fallback")
                 return fast_result
 
             # Validate LLM result against game rules
@@ -296,10 +529,14 @@ class LLMClient:
             if not validated.matched:
                 print(f"LLM result failed validation: {validated.suggestion}")
                 print(f"Falling back to fast parser result")
+                _record_parse_path("validation_fallback")
                 return fast_result
 
-            # Success! Return validated LLM result
+            # Success! Log it as classifier training data, return validated LLM result
+            if self._journal is not None:
+                self._journal.record(command_text, validated)
             print(f"LLM parse successful: {validated.action} by {validated.marshals}")
+            _record_parse_path("llm")
             return validated
 
         except Exception as e:
@@ -307,6 +544,7 @@ class LLMClient:
             # Log and return fast result - never crash
             print(f"LLM provider error: {e}")
             print(f"Falling back to fast parser result")
+            _record_parse_path("error_fallback")
             return fast_result
 
     def _extract_valid_marshals(self, game_state: Optional[Dict]) -> List[str]:
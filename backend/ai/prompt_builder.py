@@ -18,8 +18,8 @@ User Input
     v
 +---------------------------------------------+
 |  build_parse_prompt() <-- THIS FILE         |
-|  - Builds context-aware prompt              |
-|  - ~300 tokens input budget                 |
+|  - Static instructions built once at import |
+|  - Situation + command rendered per call    |
 +---------------------------------------------+
     |
     v
@@ -61,6 +61,8 @@ Provider Swap (Anthropic -> Groq):
     - Prompt uses Markdown headers (provider-agnostic)
     - No XML tags or Claude-specific formatting
     - Same prompt works for any OpenAI-compatible API
+    - Anthropic sends PARSE_INSTRUCTIONS as a cache_control system block
+      (build_system_blocks); others send build_parse_prompt() whole
 
 New Actions:
     - Update VALID_ACTIONS in validation.py (single source of truth)
@@ -79,7 +81,7 @@ New Marshals/Regions:
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 from .validation import VALID_ACTIONS, VALID_STANCES
 
@@ -237,6 +239,7 @@ def build_parse_prompt(
     marshal_name: Optional[str] = None,
     personality: Optional[str] = None,
     command_history: Optional[List[str]] = None,
+    include_static: bool = True,
 ) -> str:
     """
     Build prompt for LLM command parsing.
@@ -247,12 +250,18 @@ def build_parse_prompt(
     Output used by:
         LLM returns JSON → parsed into ParseResult → validated by validation.py
 
+    The prompt is PARSE_INSTRUCTIONS (static, built once at import) followed
+    by the situation (marshals, enemies, regions, command, history). Providers
+    with prompt caching send PARSE_INSTRUCTIONS via build_system_blocks() and
+    pass include_static=False here.
+
     Args:
         raw_input: The player's command text (e.g., "Ney attack Wellington")
         game_state: Current game state dict with marshals, regions, enemies
         marshal_name: If known, the marshal being addressed (optional)
         personality: If known, the marshal's personality type (optional)
         command_history: Recent player commands for repetition detection (optional)
+        include_static: Prepend PARSE_INSTRUCTIONS (False when sent as cached system blocks)
 
     Returns:
         Complete prompt string ready to send to LLM
@@ -265,108 +274,106 @@ def build_parse_prompt(
         - Phase 6: Update marshals field to show it accepts multiple
         - New actions: Imported from validation.py automatically
     """
-    # Extract data from game state
-    marshals_info = _format_marshals(game_state)
-    enemies_info = _format_enemies(game_state)
-    regions_list = _get_regions_list(game_state)
-    actions_list = ", ".join(sorted(VALID_ACTIONS))
-    stances_list = ", ".join(sorted(VALID_STANCES))
+    prompt = _render_situation(raw_input, game_state, command_history)
+    prompt += "\n\nReturn JSON only. No explanation."
 
-    # Build the prompt with Markdown headers (cross-provider compatible)
-    prompt = f"""# Command Parser - Napoleonic Wars
+    if include_static:
+        return PARSE_INSTRUCTIONS + "\n\n" + prompt
+    return prompt
 
-## Your Marshals (French)
-{marshals_info}
 
-## Enemy Forces
-{enemies_info}
+def build_system_prompt() -> str:
+    """
+    Build system prompt for LLM.
 
-## Valid Actions
-{actions_list}
+    Separate from user prompt for providers that support system messages.
+    For providers without system message support, prepend to user prompt.
 
-## Valid Regions
-{regions_list}
+    Returns:
+        System prompt string
+    """
+    return SYSTEM_CONTEXT
 
-## Valid Stances (for stance_change)
-{stances_list}
 
-## Personality Rules
-- AGGRESSIVE: biases toward attack, eager for battle
-- CAUTIOUS: biases toward defense, wants intel first
-- LITERAL: interprets exactly as stated, picks nearest for ambiguity
+def build_system_blocks() -> List[Dict[str, Any]]:
+    """
+    System prompt plus parse instructions as Anthropic content blocks.
 
-## Strategic Commands (Multi-Turn Orders)
-Commands that imply ongoing, multi-turn execution are STRATEGIC, not tactical.
-Set is_strategic=true and strategic_type to one of: MOVE_TO, PURSUE, HOLD, SUPPORT.
+    The instructions block carries cache_control, so the whole static prefix
+    is cached provider-side and billed at the cache-read rate on repeat
+    calls. Pair with build_parse_prompt(..., include_static=False).
+    (Prefixes shorter than the model's minimum cacheable length are simply
+    not cached.)
 
-Strategic keywords:
-- MOVE_TO: "march to", "advance to", "proceed to", "head to", "travel to", "withdraw to", "fall back to"
-- PURSUE: "pursue", "chase", "hunt down", "hunt", "go after", "intercept", "track"
-- HOLD: "hold position", "hold the line", "hold", "dig in", "guard", "protect"
-- SUPPORT: "link up with", "support", "reinforce", "assist", "aid", "join", "back up"
+    Returns:
+        List of {"type": "text", ...} blocks for the Messages API "system" field
+    """
+    return [
+        {"type": "text", "text": SYSTEM_CONTEXT},
+        {"type": "text", "text": PARSE_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}},
+    ]
 
-Conditions (set in strategic_condition dict):
-- "until_marshal_arrives": marshal name (e.g. "until Ney arrives")
-- "until_marshal_destroyed": marshal name (e.g. "until destroyed")
-- "until_relieved": true
-- "until_battle_won": true
-- "max_turns": number (e.g. "for 3 turns")
 
-IMPORTANT: "move to [region]" (2 words) = tactical (immediate). "march to [region]" = strategic (multi-turn).
-If the command implies an ongoing campaign or uses strategic keywords above, set is_strategic=true.
+def build_batch_parse_prompt(
+    commands: List[Tuple[str, Dict[str, Any], Optional[List[str]]]],
+) -> str:
+    """
+    Build one user prompt for several independent commands (micro-batching).
 
-## Cardinal Directions & Generic Targets
-Players may use directions instead of region names. Resolve to the actual region:
-- "march north/south/east/west" → resolve to the adjacent region in that direction from the marshal's position
-- "advance to the front" / "march forward" → nearest region with enemy presence
-- "fall back" / "retreat south" → direction toward Paris (French capital)
-- "support whoever needs it" → target the most threatened ally (set target to generic)
-- "pursue the enemy" → target the nearest enemy marshal (set target to generic)
+    Each command comes from a different game and carries its own situation.
+    Pair with build_system_blocks() for the shared, cached instructions.
 
-Geographic layout (approximate):
-  North: Netherlands, Belgium  |  Northeast: Waterloo, Rhine
-  Central: Paris               |  East: Bavaria, Vienna
-  South: Lyon, Marseille       |  Southwest: Bordeaux, Brittany
-  Southeast: Geneva, Milan
+    Args:
+        commands: (raw_input, game_state, command_history) per command
 
-If you can resolve a direction to a specific region, set the target to that region name (low ambiguity).
-If you cannot determine the specific region, set target to "generic" and ambiguity to 60+.
+    Returns:
+        Prompt asking for a JSON array with one result per command, in order
+    """
+    count = len(commands)
+    sections = [
+        f"# Batch of {count} Independent Commands\n"
+        f"Each command comes from a different game. Parse each one using only its own situation."
+    ]
+    for i, (raw_input, game_state, command_history) in enumerate(commands, 1):
+        sections.append(_render_situation(
+            raw_input, game_state, command_history, heading=f"# Command {i} of {count}"))
+    sections.append(
+        f"Return ONLY a JSON array of exactly {count} objects, one per command in the order "
+        f"given, each matching the output format. No explanation."
+    )
+    return "\n\n".join(sections)
 
-## Cancel Command (Clears Strategic Orders)
-Cancel keywords: "halt", "stop", "cancel", "abort", "stand down", "belay that"
-When detected, set action="cancel". This clears the marshal's current strategic order.
-Example: "Ney, halt" → action: cancel, marshal: Ney
-Example: "Cancel Davout's orders" → action: cancel, marshal: Davout
-Example: "Stop everything" → action: cancel (marshal inferred from context)
 
-## Ambiguity Scoring (0-100)
-- 0-20: Crystal clear ("Attack Wellington at Waterloo", "March to Vienna")
-- 21-40: Clear but minor gaps ("March to Vienna" — no condition specified)
-- 41-60: Somewhat vague ("Push toward the enemy", "Handle the flank")
-- 61-100: Very vague ("Handle the situation", "Deal with the Prussians")
+# =============================================================================
+# HELPER FUNCTIONS
+# =============================================================================
 
-Generic targets like "the enemy", "them", "hostile forces" = ambiguity 60+
-Specific names like "Wellington", "Blücher" = ambiguity under 30
-No marshal specified = +20 ambiguity
+def _render_situation(
+    raw_input: str,
+    game_state: Dict[str, Any],
+    command_history: Optional[List[str]] = None,
+    heading: str = "# Current Situation",
+) -> str:
+    """Dynamic prompt section: roster, enemies, regions, command, history."""
+    # Extract data from game state
+    marshals_info = _format_marshals(game_state)
+    enemies_info = _format_enemies(game_state)
+    regions_list = _get_regions_list(game_state)
 
-## Strategic Score (0-100)
-- 0-20: Simple immediate action ("Attack", "Move to Belgium")
-- 21-50: Tactical decision ("Fortify and hold the line")
-- 51-100: Campaign-level ("March to Vienna and crush resistance", "Pursue until destroyed")
+    # Build the prompt with Markdown headers (cross-provider compatible)
+    prompt = f"""{heading}
 
-## Command to Parse
-"{raw_input}"
+## Your Marshals (French)
+{marshals_info}
 
-## Output Format
-Return ONLY valid JSON matching this structure:
-```json
-{OUTPUT_SCHEMA}
-```
+## Enemy Forces
+{enemies_info}
 
-## Examples
-{_format_examples()}
+## Valid Regions
+{regions_list}
 
-Return JSON only. No explanation."""
+## Command to Parse
+"{raw_input}\""""
 
     # Add repetition context if history exists
     if command_history and len(command_history) > 0:
@@ -385,23 +392,6 @@ REPETITION RULES:
     return prompt
 
 
-def build_system_prompt() -> str:
-    """
-    Build system prompt for LLM.
-
-    Separate from user prompt for providers that support system messages.
-    For providers without system message support, prepend to user prompt.
-
-    Returns:
-        System prompt string
-    """
-    return SYSTEM_CONTEXT
-
-
-# =============================================================================
-# HELPER FUNCTIONS
-# =============================================================================
-
 def _format_marshals(game_state: Dict[str, Any]) -> str:
     """
     Format player marshals for prompt.
@@ -413,21 +403,18 @@ def _format_marshals(game_state: Dict[str, Any]) -> str:
     lines = []
     marshals = game_state.get("marshals", {})
 
-    # Also check map_data for more complete marshal info
-    map_data = game_state.get("map_data", {})
+    # Personality comes from map_data: index it once (one pass over regions)
+    personalities = {
+        m.get("name"): m.get("personality", "unknown")
+        for region_data in game_state.get("map_data", {}).values()
+        for m in region_data.get("marshals", [])
+    }
 
     for name, data in marshals.items():
         location = data.get("location", "unknown")
         strength = data.get("strength", 0)
         strength_k = f"{strength // 1000}K" if strength >= 1000 else str(strength)
-
-        # Try to get personality from map_data
-        personality = "unknown"
-        for region_data in map_data.values():
-            for m in region_data.get("marshals", []):
-                if m.get("name") == name:
-                    personality = m.get("personality", "unknown")
-                    break
+        personality = personalities.get(name, "unknown")
 
         lines.append(f"- {name} ({personality}) at {location}, {strength_k} troops")
 
@@ -525,6 +512,100 @@ def _json_value(val: Any) -> str:
     return str(val)
 
 
+def _build_parse_instructions() -> str:
+    """
+    Static part of the parse prompt: actions, stances, rules, scoring,
+    output schema and examples. Nothing here depends on game state.
+    """
+    actions_list = ", ".join(sorted(VALID_ACTIONS))
+    stances_list = ", ".join(sorted(VALID_STANCES))
+
+    return f"""# Command Parser - Napoleonic Wars
+
+## Valid Actions
+{actions_list}
+
+## Valid Stances (for stance_change)
+{stances_list}
+
+## Personality Rules
+- AGGRESSIVE: biases toward attack, eager for battle
+- CAUTIOUS: biases toward defense, wants intel first
+- LITERAL: interprets exactly as stated, picks nearest for ambiguity
+
+## Strategic Commands (Multi-Turn Orders)
+Commands that imply ongoing, multi-turn execution are STRATEGIC, not tactical.
+Set is_strategic=true and strategic_type to one of: MOVE_TO, PURSUE, HOLD, SUPPORT.
+
+Strategic keywords:
+- MOVE_TO: "march to", "advance to", "proceed to", "head to", "travel to", "withdraw to", "fall back to"
+- PURSUE: "pursue", "chase", "hunt down", "hunt", "go after", "intercept", "track"
+- HOLD: "hold position", "hold the line", "hold", "dig in", "guard", "protect"
+- SUPPORT: "link up with", "support", "reinforce", "assist", "aid", "join", "back up"
+
+Conditions (set in strategic_condition dict):
+- "until_marshal_arrives": marshal name (e.g. "until Ney arrives")
+- "until_marshal_destroyed": marshal name (e.g. "until destroyed")
+- "until_relieved": true
+- "until_battle_won": true
+- "max_turns": number (e.g. "for 3 turns")
+
+IMPORTANT: "move to [region]" (2 words) = tactical (immediate). "march to [region]" = strategic (multi-turn).
+If the command implies an ongoing campaign or uses strategic keywords above, set is_strategic=true.
+
+## Cardinal Directions & Generic Targets
+Players may use directions instead of region names. Resolve to the actual region:
+- "march north/south/east/west" → resolve to the adjacent region in that direction from the marshal's position
+- "advance to the front" / "march forward" → nearest region with enemy presence
+- "fall back" / "retreat south" → direction toward Paris (French capital)
+- "support whoever needs it" → target the most threatened ally (set target to generic)
+- "pursue the enemy" → target the nearest enemy marshal (set target to generic)
+
+Geographic layout (approximate):
+  North: Netherlands, Belgium  |  Northeast: Waterloo, Rhine
+  Central: Paris               |  East: Bavaria, Vienna
+  South: Lyon, Marseille       |  Southwest: Bordeaux, Brittany
+  Southeast: Geneva, Milan
+
+If you can resolve a direction to a specific region, set the target to that region name (low ambiguity).
+If you cannot determine the specific region, set target to "generic" and ambiguity to 60+.
+
+## Cancel Command (Clears Strategic Orders)
+Cancel keywords: "halt", "stop", "cancel", "abort", "stand down", "belay that"
+When detected, set action="cancel". This clears the marshal's current strategic order.
+Example: "Ney, halt" → action: cancel, marshal: Ney
+Example: "Cancel Davout's orders" → action: cancel, marshal: Davout
+Example: "Stop everything" → action: cancel (marshal inferred from context)
+
+## Ambiguity Scoring (0-100)
+- 0-20: Crystal clear ("Attack Wellington at Waterloo", "March to Vienna")
+- 21-40: Clear but minor gaps ("March to Vienna" — no condition specified)
+- 41-60: Somewhat vague ("Push toward the enemy", "Handle the flank")
+- 61-100: Very vague ("Handle the situation", "Deal with the Prussians")
+
+Generic targets like "the enemy", "them", "hostile forces" = ambiguity 60+
+Specific names like "Wellington", "Blücher" = ambiguity under 30
+No marshal specified = +20 ambiguity
+
+## Strategic Score (0-100)
+- 0-20: Simple immediate action ("Attack", "Move to Belgium")
+- 21-50: Tactical decision ("Fortify and hold the line")
+- 51-100: Campaign-level ("March to Vienna and crush resistance", "Pursue until destroyed")
+
+## Output Format
+Return ONLY valid JSON matching this structure:
+```json
+{OUTPUT_SCHEMA}
+```
+
+## Examples
+{_format_examples()}"""
+
+
+# Built once at import (see build_parse_prompt / build_system_blocks)
+PARSE_INSTRUCTIONS = _build_parse_instructions()
+
+
 # =============================================================================
 # PROMPT VARIANTS FOR SPECIAL CASES
 # =============================================================================
@@ -22,7 +22,10 @@ This module implements the provider pattern for LLM integrations:
          |                      Returns ParseResult or None on error
          |
          +-- GroqProvider: Groq API (OpenAI-compatible endpoint)
-                           Future implementation
+                           Same prompts and error contract
+
+    ResilientProvider (resilience.py) wraps any of these with a circuit
+    breaker, client-side rate limiting and optional hedging.
 
 ===============================================================================
 ERROR CONTRACT
@@ -71,13 +74,17 @@ Example:
 import json
 import os
 import re
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 
 from .schemas import ParseResult, ProviderConfig
-from .prompt_builder import build_parse_prompt, build_system_prompt
+from .prompt_builder import (
+    build_batch_parse_prompt, build_parse_prompt, build_system_blocks, build_system_prompt,
+)
+from backend.utils.metrics import LLM_REQUEST_SECONDS, LLM_TOKENS_TOTAL
 
 
 # =============================================================================
@@ -90,12 +97,32 @@ ANTHROPIC_API_ENDPOINT = "https://api.anthropic.com/v1/messages"
 # API version header required by Anthropic
 ANTHROPIC_API_VERSION = "2023-06-01"
 
+# Groq API endpoint (OpenAI-compatible chat completions)
+GROQ_API_ENDPOINT = "https://api.groq.com/openai/v1/chat/completions"
+
+# Both endpoints can be overridden (ANTHROPIC_API_ENDPOINT / GROQ_API_ENDPOINT
+# env vars), e.g. to point at a local stub server for resilience or load tests
+
 # Request timeout in seconds
 # 5 seconds is reasonable for parsing requests (~500 tokens)
 # Longer timeouts would block the game too long
 REQUEST_TIMEOUT_SECONDS = 5.0
 
 
+def retry_after_seconds(response) -> Optional[float]:
+    """
+    Read a 429 response's retry-after header as seconds.
+
+    Only the delay-seconds form is handled; an HTTP-date (or a missing or
+    malformed header) returns None and the caller uses its default pause.
+    """
+    value = response.headers.get("retry-after") if getattr(response, "headers", None) else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
 # =============================================================================
 # JSON PARSING HELPER
 # =============================================================================
@@ -145,6 +172,36 @@ def parse_llm_json_response(response_text: str) -> Optional[Dict]:
     return None
 
 
+def parse_llm_json_array(response_text: str) -> Optional[List[Dict]]:
+    """
+    Parse a JSON array of objects from LLM response text (batched parses).
+
+    Accepts a bare array, an array in a markdown code block, or an array
+    buried in text. Returns None if no array of objects is found.
+    """
+    if not response_text:
+        return None
+
+    candidates = [response_text.strip()]
+    block_match = re.search(r'```(?:json)?\s*(\[.*?\])\s*```', response_text, re.DOTALL)
+    if block_match:
+        candidates.append(block_match.group(1))
+    first, last = response_text.find('['), response_text.rfind(']')
+    if first != -1 and last > first:
+        candidates.append(response_text[first:last + 1])
+
+    for candidate in candidates:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, list) and all(isinstance(item, dict) for item in data):
+            return data
+
+    print(f"Failed to parse JSON array from LLM response: {response_text[:200]}...")
+    return None
+
+
 def json_to_parse_result(json_data: Dict, raw_command: str, mode: str) -> ParseResult:
     """
     Convert parsed JSON from LLM into ParseResult.
@@ -196,6 +253,9 @@ class BaseProvider(ABC):
     def __init__(self, config: Optional[ProviderConfig] = None):
         self.config = config
         self._api_key: Optional[str] = None
+        # Optional callback(outcome, retry_after) for every API call; set by
+        # ResilientProvider (resilience.py) to feed its breaker and rate limiter
+        self.observer: Optional[Callable[[str, Optional[float]], None]] = None
 
     @property
     def name(self) -> str:
@@ -216,6 +276,21 @@ class BaseProvider(ABC):
         """
         pass
 
+    def parse_batch(self, commands: List[Tuple[str, Optional[Dict]]]) -> List[ParseResult]:
+        """
+        Parse several independent commands (micro-batching dispatcher).
+
+        Default: one parse() per command. Providers that can answer several
+        commands in one request override this.
+
+        Args:
+            commands: (command_text, game_state) pairs
+
+        Returns:
+            One ParseResult per command, in order
+        """
+        return [self.parse(command_text, game_state) for command_text, game_state in commands]
+
     def validate_config(self) -> bool:
         """
         Validate provider configuration.
@@ -231,6 +306,26 @@ class BaseProvider(ABC):
             self._api_key = os.getenv(self.config.api_key_env)
         return self._api_key
 
+    def _record_latency(self, start: float, status, retry_after: Optional[float] = None) -> None:
+        """
+        Observe one API call in the provider latency histogram and report
+        its outcome to the observer, if any.
+
+        Args:
+            start: time.perf_counter() when the request was sent
+            status: HTTP status code, or "timeout" / "connect_error"
+            retry_after: Seconds from a 429's retry-after header, if given
+        """
+        if status == 200:
+            outcome = "ok"
+        elif isinstance(status, int):
+            outcome = "rate_limited" if status == 429 else f"http_{status // 100}xx"
+        else:
+            outcome = status
+        LLM_REQUEST_SECONDS.labels(self.name, outcome).observe(time.perf_counter() - start)
+        if self.observer is not None:
+            self.observer(outcome, retry_after)
+
 
 class MockProvider(BaseProvider):
     """
@@ -280,6 +375,7 @@ class AnthropicProvider(BaseProvider):
             name="anthropic",
             api_key_env="ANTHROPIC_API_KEY",
             model="claude-3-haiku-20240307",  # Fast, cheap model for parsing
+            endpoint=os.getenv("ANTHROPIC_API_ENDPOINT", ANTHROPIC_API_ENDPOINT),
             max_tokens=500,
             temperature=0.3,
         ))
@@ -300,8 +396,9 @@ class AnthropicProvider(BaseProvider):
         ===========================
 
         1. PROMPT BUILDING
-           - build_system_prompt() → military commander context
-           - build_parse_prompt() → game state + command + examples
+           - build_system_blocks() → military commander context + static
+             parse instructions/examples (cache_control: cached provider-side)
+           - build_parse_prompt(include_static=False) → game state + command
 
         2. HTTP REQUEST
            - POST to https://api.anthropic.com/v1/messages
@@ -358,7 +455,9 @@ class AnthropicProvider(BaseProvider):
         # =================================================================
         # STEP 2: Build prompts
         # =================================================================
-        system_prompt = build_system_prompt()
+        # Static instructions go in cached system blocks; the user message
+        # carries only the situation and command
+        system_prompt = build_system_blocks()
 
         # Get command history from world for repetition detection
         world = game_state.get("world") if game_state else None
@@ -368,6 +467,7 @@ class AnthropicProvider(BaseProvider):
             raw_input=command_text,
             game_state=game_state or {},
             command_history=command_history,
+            include_static=False,
         )
 
         print(f"AnthropicProvider: Calling API for '{command_text[:50]}...'")
@@ -415,10 +515,64 @@ class AnthropicProvider(BaseProvider):
 
         return result
 
+    def parse_batch(self, commands: List[Tuple[str, Optional[Dict]]]) -> List[ParseResult]:
+        """
+        Parse several independent commands in ONE Messages API request.
+
+        Each command keeps its own situation section; the static instructions
+        are the same cached system blocks parse() uses. The response must be
+        a JSON array with one object per command. On any request-level
+        failure (or a wrong-length array) every command gets matched=False,
+        so each caller falls back to its own fast parser result.
+
+        Args:
+            commands: (command_text, game_state) pairs
+
+        Returns:
+            One ParseResult per command, in order
+        """
+        if len(commands) == 1:
+            return [self.parse(*commands[0])]
+
+        def failed(reason: str) -> List[ParseResult]:
+            return [
+                ParseResult(matched=False, action="unknown", raw_command=command_text,
+                            mode="anthropic", interpretation=reason, confidence=0.0)
+                for command_text, _ in commands
+            ]
+
+        if not self.validate_config():
+            return failed("API key not configured")
+
+        batch = []
+        for command_text, game_state in commands:
+            world = game_state.get("world") if game_state else None
+            command_history = world.get_command_history_for_prompt() if world else []
+            batch.append((command_text, game_state or {}, command_history))
+        user_prompt = build_batch_parse_prompt(batch)
+
+        print(f"AnthropicProvider: Calling API for batch of {len(commands)} commands")
+        response_text, error = self._make_api_request(
+            build_system_blocks(), user_prompt,
+            max_tokens=self.config.max_tokens * len(commands))
+        if error:
+            return failed(f"API error: {error}")
+
+        items = parse_llm_json_array(response_text)
+        if items is None or len(items) != len(commands):
+            print(f"AnthropicProvider: Batch response did not contain {len(commands)} results")
+            return failed("LLM batch response did not match the commands sent")
+
+        return [
+            json_to_parse_result(item, command_text, "anthropic")
+            for item, (command_text, _) in zip(items, commands)
+        ]
+
     def _make_api_request(
         self,
-        system_prompt: str,
-        user_prompt: str
+        system_prompt: Union[str, List[Dict[str, Any]]],
+        user_prompt: str,
+        max_tokens: Optional[int] = None,
     ) -> Tuple[Optional[str], Optional[str]]:
         """
         Make HTTP request to Anthropic Messages API.
@@ -427,8 +581,9 @@ class AnthropicProvider(BaseProvider):
         It NEVER raises exceptions - all errors are returned as (None, error_msg).
 
         Args:
-            system_prompt: System message for Claude
+            system_prompt: System message for Claude (string or content blocks)
             user_prompt: User message with command and context
+            max_tokens: Output budget (default: config.max_tokens)
 
         Returns:
             Tuple of (response_text, error_message):
@@ -444,9 +599,10 @@ class AnthropicProvider(BaseProvider):
             "anthropic-version": ANTHROPIC_API_VERSION,
         }
 
+        max_tokens = max_tokens or self.config.max_tokens
         body = {
             "model": self.config.model,
-            "max_tokens": self.config.max_tokens,
+            "max_tokens": max_tokens,
             "system": system_prompt,
             "messages": [
                 {"role": "user", "content": user_prompt}
@@ -454,19 +610,23 @@ class AnthropicProvider(BaseProvider):
         }
 
         # Log request (without API key!)
-        print(f"AnthropicProvider: POST {ANTHROPIC_API_ENDPOINT}")
+        print(f"AnthropicProvider: POST {self.config.endpoint}")
         print(f"AnthropicProvider: model={self.config.model}, "
-              f"max_tokens={self.config.max_tokens}, "
+              f"max_tokens={max_tokens}, "
               f"prompt_len={len(user_prompt)}")
 
+        start = time.perf_counter()
         try:
             # Make request with timeout
             with httpx.Client(timeout=REQUEST_TIMEOUT_SECONDS) as client:
                 response = client.post(
-                    ANTHROPIC_API_ENDPOINT,
+                    self.config.endpoint,
                     headers=headers,
                     json=body
                 )
+            self._record_latency(
+                start, response.status_code,
+                retry_after_seconds(response) if response.status_code == 429 else None)
 
             # Log response status
             print(f"AnthropicProvider: Response status={response.status_code}")
@@ -512,15 +672,24 @@ class AnthropicProvider(BaseProvider):
             if usage:
                 input_tokens = usage.get("input_tokens", 0)
                 output_tokens = usage.get("output_tokens", 0)
-                print(f"AnthropicProvider: Tokens used - input={input_tokens}, output={output_tokens}")
+                cache_read = usage.get("cache_read_input_tokens", 0) or 0
+                cache_write = usage.get("cache_creation_input_tokens", 0) or 0
+                print(f"AnthropicProvider: Tokens used - input={input_tokens}, output={output_tokens}, "
+                      f"cache_read={cache_read}, cache_write={cache_write}")
+                LLM_TOKENS_TOTAL.labels(self.name, "input").inc(input_tokens)
+                LLM_TOKENS_TOTAL.labels(self.name, "output").inc(output_tokens)
+                LLM_TOKENS_TOTAL.labels(self.name, "cache_read").inc(cache_read)
+                LLM_TOKENS_TOTAL.labels(self.name, "cache_write").inc(cache_write)
 
             return text_content, None
 
         except httpx.TimeoutException:
+            self._record_latency(start, "timeout")
             print(f"AnthropicProvider: ERROR - Request timed out after {REQUEST_TIMEOUT_SECONDS}s")
             return None, f"Request timed out after {REQUEST_TIMEOUT_SECONDS}s"
 
         except httpx.ConnectError as e:
+            self._record_latency(start, "connect_error")
             print(f"AnthropicProvider: ERROR - Connection failed: {e}")
             return None, "Connection failed - check internet"
 
@@ -533,7 +702,10 @@ class AnthropicProvider(BaseProvider):
 class GroqProvider(BaseProvider):
     """
     Groq API provider.
-    Future implementation for fast, cheap LLM parsing.
+
+    Fast, cheap LLM parsing via Groq's OpenAI-compatible chat completions
+    endpoint. Same prompts and error contract as AnthropicProvider; also the
+    usual hedge provider for ResilientProvider (see resilience.py).
     """
 
     def __init__(self):
@@ -541,7 +713,7 @@ class GroqProvider(BaseProvider):
             name="groq",
             api_key_env="GROQ_API_KEY",
             model="llama-3.1-8b-instant",  # Fast Llama model
-            endpoint="https://api.groq.com/openai/v1/chat/completions",
+            endpoint=os.getenv("GROQ_API_ENDPOINT", GROQ_API_ENDPOINT),
             max_tokens=500,
             temperature=0.3,
         ))
@@ -567,17 +739,20 @@ class GroqProvider(BaseProvider):
         Returns:
             ParseResult from LLM, or error result if API call fails
         """
-        # Validate configuration
-        if not self.validate_config():
+        def failed(reason: str) -> ParseResult:
             return ParseResult(
                 matched=False,
                 action="unknown",
                 raw_command=command_text,
                 mode="groq",
-                interpretation="API key not configured",
+                interpretation=reason,
                 confidence=0.0,
             )
 
+        # Validate configuration
+        if not self.validate_config():
+            return failed("API key not configured")
+
         # Build prompt using prompt_builder (same as Anthropic)
         system_prompt = build_system_prompt()
 
@@ -591,38 +766,102 @@ class GroqProvider(BaseProvider):
             command_history=command_history,
         )
 
-        print(f"GroqProvider: Built prompt ({len(user_prompt)} chars)")
-
-        # TODO: Implement actual API call using OpenAI-compatible endpoint
-        # Structure will be:
-        #
-        # import openai
-        # client = openai.OpenAI(
-        #     api_key=self.get_api_key(),
-        #     base_url=self.config.endpoint
-        # )
-        # response = client.chat.completions.create(
-        #     model=self.config.model,
-        #     max_tokens=self.config.max_tokens,
-        #     temperature=self.config.temperature,
-        #     messages=[
-        #         {"role": "system", "content": system_prompt},
-        #         {"role": "user", "content": user_prompt}
-        #     ]
-        # )
-        # response_text = response.choices[0].message.content
-        # json_data = parse_llm_json_response(response_text)
-        # ... convert to ParseResult ...
-
-        return ParseResult(
-            matched=False,
-            action="unknown",
-            raw_command=command_text,
-            mode="groq",
-            interpretation="Groq API call not yet implemented - prompt ready",
-            confidence=0.0,
-            suggestion="LLM flow reached provider - API call pending implementation",
-        )
+        print(f"GroqProvider: Calling API for '{command_text[:50]}...' ({len(user_prompt)} chars)")
+
+        response_text, error = self._make_api_request(system_prompt, user_prompt)
+        if error:
+            return failed(f"API error: {error}")
+
+        json_data = parse_llm_json_response(response_text)
+        if json_data is None:
+            print(f"GroqProvider: Failed to parse JSON from response")
+            return failed("LLM response was not valid JSON")
+
+        result = json_to_parse_result(json_data, command_text, "groq")
+        print(f"GroqProvider: Parsed '{command_text}' -> "
+              f"action={result.action}, marshals={result.marshals}")
+        return result
+
+    def _make_api_request(self, system_prompt: str, user_prompt: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Make HTTP request to the chat completions endpoint.
+
+        Never raises - all errors are returned as (None, error_msg), like
+        AnthropicProvider._make_api_request.
+
+        Returns:
+            Tuple of (response_text, error_message)
+        """
+        headers = {
+            "authorization": f"Bearer {self.get_api_key()}",
+            "content-type": "application/json",
+        }
+        body = {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+
+        start = time.perf_counter()
+        try:
+            with httpx.Client(timeout=REQUEST_TIMEOUT_SECONDS) as client:
+                response = client.post(self.config.endpoint, headers=headers, json=body)
+            self._record_latency(
+                start, response.status_code,
+                retry_after_seconds(response) if response.status_code == 429 else None)
+
+            if response.status_code == 401:
+                print("GroqProvider: ERROR 401 - Invalid API key")
+                return None, "Invalid API key"
+            if response.status_code == 429:
+                print("GroqProvider: ERROR 429 - Rate limited")
+                return None, "Rate limited - too many requests"
+            if response.status_code >= 500:
+                print(f"GroqProvider: ERROR {response.status_code} - Server error")
+                return None, f"Server error ({response.status_code})"
+            if response.status_code != 200:
+                print(f"GroqProvider: ERROR {response.status_code} - {response.text[:200]}")
+                return None, f"HTTP {response.status_code}"
+
+            try:
+                response_json = response.json()
+            except json.JSONDecodeError as e:
+                print(f"GroqProvider: Failed to parse response JSON: {e}")
+                return None, "Invalid JSON in response"
+
+            # Response format: {"choices": [{"message": {"content": "..."}}], "usage": {...}}
+            choices = response_json.get("choices") or []
+            text_content = ""
+            if choices and isinstance(choices, list):
+                text_content = (choices[0].get("message") or {}).get("content") or ""
+            if not text_content:
+                print(f"GroqProvider: Empty text in response")
+                return None, "Empty text in response"
+
+            usage = response_json.get("usage") or {}
+            if usage:
+                LLM_TOKENS_TOTAL.labels(self.name, "input").inc(usage.get("prompt_tokens", 0) or 0)
+                LLM_TOKENS_TOTAL.labels(self.name, "output").inc(usage.get("completion_tokens", 0) or 0)
+
+            return text_content, None
+
+        except httpx.TimeoutException:
+            self._record_latency(start, "timeout")
+            print(f"GroqProvider: ERROR - Request timed out after {REQUEST_TIMEOUT_SECONDS}s")
+            return None, f"Request timed out after {REQUEST_TIMEOUT_SECONDS}s"
+
+        except httpx.ConnectError as e:
+            self._record_latency(start, "connect_error")
+            print(f"GroqProvider: ERROR - Connection failed: {e}")
+            return None, "Connection failed - check internet"
+
+        except Exception as e:
+            print(f"GroqProvider: ERROR - Unexpected: {type(e).__name__}: {e}")
+            return None, f"Unexpected error: {type(e).__name__}"
 
 
 # Provider registry for easy lookup
@@ -0,0 +1,323 @@
+"""
+Provider resilience layer for Project Sovereign.
+
+A degraded provider used to cost the full REQUEST_TIMEOUT_SECONDS on every
+low-confidence command before falling back to the fast parser. The
+ResilientProvider wrapper adds three guards in front of any BaseProvider:
+
+1. CIRCUIT BREAKER - tracks the outcome of the last `window` API calls. Once
+   at least `min_calls` are recorded and the failure ratio (timeouts,
+   connection errors, 5xx) reaches `failure_ratio`, the circuit OPENS and
+   every parse returns matched=False immediately (fast parser fallback).
+   After `cooldown_seconds` it goes HALF-OPEN and lets one probe call
+   through: success closes it, failure re-opens it.
+
+2. TOKEN BUCKET - optional client-side rate limit (`rate_per_second`,
+   `capacity` burst). A call waits up to `max_wait_seconds` for a token,
+   otherwise it is short-circuited. A 429 pauses the bucket for the
+   response's retry-after (or DEFAULT_RETRY_AFTER_SECONDS), so nothing is
+   sent to the provider until the pause has passed - even when no rate is
+   configured.
+
+3. HEDGING - optional second provider. If the primary has not answered
+   within `hedge_after_seconds` (or answered unmatched), the same parse is
+   sent to the hedge provider and the first matched result wins.
+
+Outcomes reach the breaker and bucket through BaseProvider.observer, which
+providers call from _record_latency() for every HTTP call. Short-circuited
+calls return the usual matched=False ParseResult, so the error contract in
+providers.py (never raise) is unchanged for LLMClient.
+
+Threading: /command handlers run in FastAPI's thread pool, so all state is
+lock-protected and hedging uses a small thread pool (no asyncio).
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .providers import BaseProvider, REQUEST_TIMEOUT_SECONDS
+from .schemas import ParseResult
+from backend.utils.metrics import LLM_HEDGE_TOTAL, LLM_SHORT_CIRCUIT_TOTAL
+
+# Pause after a 429 without a usable retry-after header
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+# Outcomes (see BaseProvider._record_latency) that count against the breaker.
+# 429s are handled by the bucket; 4xx are our fault, not the provider's.
+FAILURE_OUTCOMES = frozenset({"timeout", "connect_error", "http_5xx"})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Failure-ratio circuit breaker over a sliding window of calls."""
+
+    def __init__(
+        self,
+        window: int = 20,
+        failure_ratio: float = 0.5,
+        min_calls: int = 5,
+        cooldown_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            window: Number of recent calls considered
+            failure_ratio: Open once this fraction of the window failed
+            min_calls: Never open on fewer recorded calls than this
+            cooldown_seconds: Time open before a half-open probe is allowed
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._outcomes = deque(maxlen=window)  # True = failure
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """closed, open or half_open (open turns half_open after the cooldown)."""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown_seconds:
+                self._state = HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        True if a call may go to the provider now.
+
+        Half-open allows one probe at a time; a probe that never reports an
+        outcome (e.g. no API key) stops blocking others after a cooldown.
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        with self._lock:
+            now = self._clock()
+            if self._probe_started is None or now - self._probe_started >= self.cooldown_seconds:
+                self._probe_started = now
+                return True
+            return False
+
+    def record(self, failed: bool) -> None:
+        """Record one API call outcome."""
+        with self._lock:
+            if self._state == HALF_OPEN or self._probe_started is not None:
+                self._probe_started = None
+                self._outcomes.clear()
+                if failed:
+                    self._trip()
+                else:
+                    self._state = CLOSED
+                return
+
+            self._outcomes.append(failed)
+            if self._state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = sum(self._outcomes)
+                if failures / len(self._outcomes) >= self.failure_ratio:
+                    self._trip()
+
+    def _trip(self) -> None:
+        """Open the circuit (lock held)."""
+        print(f"CircuitBreaker: OPEN for {self.cooldown_seconds}s")
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+
+
+class TokenBucket:
+    """Client-side rate limiter that also honors 429 retry-after pauses."""
+
+    def __init__(
+        self,
+        rate_per_second: float = 0.0,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate_per_second: Sustained request rate (0 = unlimited; pauses still apply)
+            capacity: Burst size (default: max(1, rate_per_second))
+            clock: Monotonic time source (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = max(0.0, rate_per_second)
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, max_wait: float = 0.0) -> bool:
+        """
+        Take one token, waiting up to max_wait seconds for it.
+
+        Returns:
+            True if the call may proceed, False if it would wait too long
+        """
+        with self._lock:
+            now = self._clock()
+            wait_seconds = max(0.0, self._paused_until - now)
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                # Tokens accrued during a pause are usable once it ends
+                ready_at = now + max(0.0, (1.0 - self._tokens) / self.rate)
+                wait_seconds = max(wait_seconds, ready_at - now)
+            if wait_seconds > max_wait:
+                return False
+            if self.rate > 0:
+                self._tokens -= 1.0  # May go negative: reserved for this waiter
+
+        if wait_seconds > 0:
+            self._sleep(wait_seconds)
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """Send nothing for the next `seconds` (a 429's retry-after)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = self._clock()
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds left in the current retry-after pause (0 if none)."""
+        with self._lock:
+            return max(0.0, self._paused_until - self._clock())
+
+
+class ResilientProvider(BaseProvider):
+    """
+    Wraps a provider with a circuit breaker, rate limiter and optional hedge.
+
+    Looks like the wrapped provider to LLMClient (same name and config), so
+    it can stand in for it anywhere, including BatchingDispatcher.
+    """
+
+    def __init__(
+        self,
+        primary: BaseProvider,
+        breaker: Optional[CircuitBreaker] = None,
+        bucket: Optional[TokenBucket] = None,
+        max_wait_seconds: float = 1.0,
+        hedge: Optional[BaseProvider] = None,
+        hedge_after_seconds: float = 1.5,
+    ):
+        """
+        Args:
+            primary: Provider that serves every call while healthy
+            breaker: Circuit breaker (default: CircuitBreaker())
+            bucket: Rate limiter (default: unlimited, honors retry-after)
+            max_wait_seconds: Longest a call may queue for a token
+            hedge: Optional second provider (wrap it in its own
+                   ResilientProvider to give it a breaker too)
+            hedge_after_seconds: Primary latency before the hedge is sent
+        """
+        super().__init__(primary.config)
+        self.primary = primary
+        self.breaker = breaker or CircuitBreaker()
+        self.bucket = bucket or TokenBucket()
+        self.max_wait_seconds = max_wait_seconds
+        self.hedge = hedge
+        self.hedge_after_seconds = hedge_after_seconds
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-hedge") if hedge else None
+        primary.observer = self._on_outcome
+
+    def validate_config(self) -> bool:
+        return self.primary.validate_config()
+
+    def get_api_key(self) -> Optional[str]:
+        return self.primary.get_api_key()
+
+    def _on_outcome(self, outcome: str, retry_after: Optional[float]) -> None:
+        """BaseProvider.observer: feed the breaker and the bucket."""
+        if outcome == "rate_limited":
+            pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER_SECONDS
+            print(f"{self.name}: rate limited, pausing requests for {pause:.1f}s")
+            self.bucket.pause(pause)
+            return
+        self.breaker.record(outcome in FAILURE_OUTCOMES)
+
+    def _short_circuit_reason(self) -> Optional[str]:
+        """Why the next call must skip the provider, or None to send it."""
+        if not self.breaker.allow():
+            return "circuit_open"
+        if not self.bucket.acquire(self.max_wait_seconds):
+            return "rate_limited"
+        return None
+
+    def _skipped(self, command_text: str, reason: str) -> ParseResult:
+        LLM_SHORT_CIRCUIT_TOTAL.labels(self.name, reason).inc()
+        return ParseResult(
+            matched=False,
+            action="unknown",
+            raw_command=command_text,
+            mode=self.name,
+            interpretation=f"Provider skipped: {reason}",
+            confidence=0.0,
+        )
+
+    def _guarded_parse(self, command_text: str, game_state: Optional[Dict]) -> ParseResult:
+        reason = self._short_circuit_reason()
+        if reason:
+            return self._skipped(command_text, reason)
+        return self.primary.parse(command_text, game_state)
+
+    def parse(self, command_text: str, game_state: Optional[Dict] = None) -> ParseResult:
+        """Parse through the guards; hedge to the second provider if configured."""
+        if self.hedge is None:
+            return self._guarded_parse(command_text, game_state)
+        return self._hedged_parse(command_text, game_state)
+
+    def parse_batch(self, commands: List[Tuple[str, Optional[Dict]]]) -> List[ParseResult]:
+        """One guarded batch request to the primary (batches are not hedged)."""
+        reason = self._short_circuit_reason()
+        if reason:
+            return [self._skipped(command_text, reason) for command_text, _ in commands]
+        return self.primary.parse_batch(commands)
+
+    def _hedged_parse(self, command_text: str, game_state: Optional[Dict]) -> ParseResult:
+        """
+        Send to the primary; after hedge_after_seconds (or an unmatched
+        answer) also send to the hedge. First matched result wins; if
+        neither matches, the primary's result is returned.
+        """
+        primary = self._pool.submit(self._guarded_parse, command_text, game_state)
+        done, _ = wait([primary], timeout=self.hedge_after_seconds)
+        if done and primary.result().matched:
+            LLM_HEDGE_TOTAL.labels("primary").inc()
+            return primary.result()
+
+        print(f"{self.name}: hedging '{command_text[:40]}' to {self.hedge.name}")
+        hedge = self._pool.submit(self.hedge.parse, command_text, game_state)
+        pending = {primary, hedge}
+        deadline = time.monotonic() + REQUEST_TIMEOUT_SECONDS
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.result().matched:
+                    LLM_HEDGE_TOTAL.labels("primary" if future is primary else "hedge").inc()
+                    return future.result()
+
+        LLM_HEDGE_TOTAL.labels("neither").inc()
+        if primary.done():
+            return primary.result()
+        return self._skipped(command_text, "hedge_timeout")
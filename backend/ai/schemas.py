@@ -29,7 +29,7 @@ class ParseResult:
         dialogue: LLM-generated personality response (None in mock mode)
         suggestion: LLM-generated alternative suggestion (None in mock mode)
         confidence: 0.0-1.0, parser confidence in the interpretation
-        mode: "mock" or "live" (which parser was used)
+        mode: "mock", "classifier" or the live provider (which parser was used)
         target_stance: For stance_change action, the target stance
         raw_command: Original command text
         type: Command type marker (e.g., "debug" for special commands)
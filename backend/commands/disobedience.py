@@ -16,7 +16,10 @@ This is Phase 2 (Mock Mode) - NO LLM API calls. All logic is deterministic.
 
 from typing import Dict, Optional, List, Tuple
 import random
-from backend.commands.severity import calculate_objection_severity, get_severity_breakdown
+from backend.commands.severity import (
+    calculate_objection_severity, get_severity_breakdown,
+    severity_cache_key, severity_from_breakdown
+)
 from backend.models.personality import Personality, get_personality, analyze_order_situation
 from backend.models.trust import calculate_obedience_chance
 
@@ -212,6 +215,9 @@ def get_valid_actions(marshal, game_state) -> List[Dict]:
     """
     Return all actions this marshal can currently take.
 
+    Served from get_valid_actions_for_all() when game_state is a WorldState,
+    so repeated lookups in the same state share one table.
+
     Always includes (based on state):
     - defend (current location)
     - attack (each enemy in range) - blocked if fortified
@@ -226,6 +232,17 @@ def get_valid_actions(marshal, game_state) -> List[Dict]:
     - feint: Threaten attack, hold position
     - abilities: Marshal-specific special actions
     """
+    entry = _get_action_entry(marshal, game_state)
+    if entry is not None:
+        return [dict(a) for a in entry["actions"]]
+
+    enemies_in_range = get_enemies_in_range(marshal, game_state)
+    valid_move_targets = get_valid_move_targets(marshal, game_state)
+    return _build_valid_actions(marshal, [e.name for e in enemies_in_range], valid_move_targets)
+
+
+def _build_valid_actions(marshal, enemies_in_range: List[str], valid_move_targets: List[str]) -> List[Dict]:
+    """Assemble the valid-action list from precomputed attack and move targets."""
     valid = []
 
     # Check current tactical state
@@ -242,17 +259,15 @@ def get_valid_actions(marshal, game_state) -> List[Dict]:
 
     # Attack targets in range (blocked if fortified)
     if not is_fortified:
-        enemies_in_range = get_enemies_in_range(marshal, game_state)
-        for enemy in enemies_in_range:
+        for enemy_name in enemies_in_range:
             valid.append({
                 "action": "attack",
-                "target": enemy.name,
-                "description": f"Attack {enemy.name}"
+                "target": enemy_name,
+                "description": f"Attack {enemy_name}"
             })
 
     # Move destinations (blocked if fortified, validated against game rules)
     if not is_fortified:
-        valid_move_targets = get_valid_move_targets(marshal, game_state)
         for region in valid_move_targets:
             valid.append({
                 "action": "move",
@@ -339,6 +354,104 @@ def get_valid_actions(marshal, game_state) -> List[Dict]:
     return valid
 
 
+def get_valid_actions_for_all(world, nation: str) -> Dict[str, Dict]:
+    """
+    Valid-action table for every living marshal of a nation, built in one sweep.
+
+    Occupancy is indexed once and each distinct marshal location gets one BFS,
+    instead of per-marshal get_enemies_in_range() / is_valid_move() / can_drill()
+    scans. The table is cached until the world's next state change, so UI hover,
+    AI and objection logic share it. Treat it as read-only.
+
+    Enemies are marshals of any other nation (for the player's nation this is
+    the same set get_enemies_in_range() uses).
+
+    Returns:
+        {marshal_name: {
+            "actions": [...],                # Same format as get_valid_actions()
+            "enemies_in_range": [names],     # Closest first
+            "enemies_in_region": [names],
+            "move_targets": [region names],  # Legal adjacent moves
+            "can_drill": bool,
+        }}
+    """
+    return world.get_derived(
+        ("valid_actions", nation),
+        lambda: _build_valid_action_table(world, nation)
+    )
+
+
+def _build_valid_action_table(world, nation: str) -> Dict[str, Dict]:
+    """Build the table returned by get_valid_actions_for_all()."""
+    # One sweep: living marshals by region, in world order
+    living_by_region: Dict[str, List] = {}
+    for m in world.marshals.values():
+        if m.strength > 0:
+            living_by_region.setdefault(m.location, []).append(m)
+
+    # Enemy positions as region ids; hop counts come from the region graph's BFS
+    graph = world.get_region_graph()
+    enemies = [(graph.id_of(m.location), m) for m in world.marshals.values()
+               if m.nation != nation and m.strength > 0]
+
+    table = {}
+    for marshal in world.get_marshals_by_nation(nation):
+        location = marshal.location
+        movement_range = getattr(marshal, 'movement_range', 2)
+        in_range = [(_hops_between(graph, location, region_id, e.location), e.name)
+                    for region_id, e in enemies]
+        in_range = [pair for pair in in_range if pair[0] <= movement_range]
+        in_range.sort(key=lambda pair: pair[0])  # Stable: world order breaks ties
+        enemies_in_range = [name for _, name in in_range]
+
+        enemies_here = [m.name for m in living_by_region.get(location, ()) if m.nation != nation]
+
+        move_targets = []
+        region = world.regions.get(location)
+        for adj_name in (region.adjacent_regions if region else ()):
+            if enemies_here:
+                # Engagement rule: only retreat to friendly territory
+                adj_region = world.regions.get(adj_name)
+                if adj_region and adj_region.controller != nation:
+                    continue
+            if any(m.nation != nation for m in living_by_region.get(adj_name, ())):
+                continue  # Enemy at destination - must ATTACK
+            move_targets.append(adj_name)
+
+        drill_blocked = (getattr(marshal, 'drilling', False) or getattr(marshal, 'drilling_locked', False)
+                         or getattr(marshal, 'fortified', False) or getattr(marshal, 'retreating', False))
+
+        table[marshal.name] = {
+            "actions": _build_valid_actions(marshal, enemies_in_range, move_targets),
+            "enemies_in_range": enemies_in_range,
+            "enemies_in_region": enemies_here,
+            "move_targets": move_targets,
+            "can_drill": not drill_blocked and not enemies_here,
+        }
+    return table
+
+
+def _hops_between(graph, origin: str, region_id: int, region_name: str) -> int:
+    """get_distance(origin, region_name) with the target already interned."""
+    origin_id = graph.id_of(origin)
+    if origin_id < 0 or region_id < 0:
+        return 0 if origin == region_name else 999
+    hops = graph.hops_from(origin_id)[region_id]
+    return hops if hops >= 0 else 999
+
+
+def _get_action_entry(marshal, game_state) -> Optional[Dict]:
+    """This marshal's row of get_valid_actions_for_all(), or None if unavailable."""
+    world = getattr(game_state, 'world', game_state) if game_state else None
+    if not hasattr(world, 'get_derived') or not hasattr(world, 'get_marshals_by_nation'):
+        return None
+    table = get_valid_actions_for_all(world, getattr(marshal, 'nation', 'France'))
+    entry = table.get(getattr(marshal, 'name', None))
+    if entry is None or world.marshals.get(marshal.name) is not marshal:
+        return None
+    return entry
+
+
 def find_action_in_valid(action: str, target: str, valid_actions: List[Dict]) -> Optional[Dict]:
     """Check if a specific action+target exists in valid actions."""
     for v in valid_actions:
@@ -518,6 +631,11 @@ class DisobedienceSystem:
         """Initialize disobedience system."""
         self.major_objections_this_turn: int = 0
 
+        # Severity breakdowns keyed by severity_cache_key(). Entries from an
+        # older world state version are dropped on the next lookup.
+        self._breakdown_cache: Dict[Tuple, Dict] = {}
+        self._breakdown_cache_version = None
+
     def reset_turn(self) -> None:
         """Reset turn-based counters."""
         self.major_objections_this_turn = 0
@@ -541,8 +659,9 @@ class DisobedienceSystem:
             dict with type='mild_objection' - Auto-resolve with message
             dict with type='major_objection' - Awaiting player choice
         """
-        # Calculate severity
-        severity = calculate_objection_severity(marshal, order, game_state)
+        # Calculate severity (deterministic part cached, variance drawn fresh)
+        breakdown = self.get_severity_breakdown(marshal, order, game_state)
+        severity = severity_from_breakdown(breakdown)
 
         if severity < 0.20:
             # No objection - marshal complies
@@ -562,6 +681,35 @@ class DisobedienceSystem:
             self.major_objections_this_turn += 1
             return self._create_major_objection(marshal, order, severity, game_state)
 
+    def get_severity_breakdown(self, marshal, order: Dict, game_state) -> Dict:
+        """
+        Severity breakdown for (marshal, order), cached per world state version.
+
+        The frontend, objection alternatives and AI paths evaluate the same
+        order several times per action; only the first call runs the
+        situation analysis and modifier lookups.
+
+        Returns:
+            Dict as returned by severity.get_severity_breakdown() (a copy)
+        """
+        key = severity_cache_key(marshal, order, game_state)
+        if key is None:
+            return get_severity_breakdown(marshal, order, game_state)
+
+        version = key[0]
+        if version != self._breakdown_cache_version:
+            self._breakdown_cache = {}
+            self._breakdown_cache_version = version
+
+        breakdown = self._breakdown_cache.get(key)
+        if breakdown is None:
+            breakdown = get_severity_breakdown(marshal, order, game_state)
+            self._breakdown_cache[key] = breakdown
+
+        result = dict(breakdown)
+        result['modifiers'] = dict(breakdown['modifiers'])
+        return result
+
     def _create_mild_objection(
         self,
         marshal,
@@ -680,8 +828,12 @@ class DisobedienceSystem:
         personality = get_personality(marshal.personality)
 
         # Get valid actions for validation
-        enemies = get_enemies_in_range(marshal, game_state)
-        attack_target = enemies[0].name if enemies else None
+        entry = _get_action_entry(marshal, game_state)
+        if entry is not None:
+            attack_target = entry["enemies_in_range"][0] if entry["enemies_in_range"] else None
+        else:
+            enemies = get_enemies_in_range(marshal, game_state)
+            attack_target = enemies[0].name if enemies else None
         move_target = self._get_move_toward_enemy(marshal, game_state)
 
         # ════════════════════════════════════════════════════════════
@@ -785,9 +937,16 @@ class DisobedienceSystem:
         alt_action = alternative.get('action', '').lower()
         personality = get_personality(marshal.personality)
 
-        # Get context
-        enemies_in_range = get_enemies_in_range(marshal, game_state)
-        enemies_in_region = get_enemies_in_region(marshal, game_state)
+        # Get context (shared valid-action table when available)
+        entry = _get_action_entry(marshal, game_state)
+        if entry is not None:
+            enemies_in_range = entry["enemies_in_range"]
+            enemies_in_region = entry["enemies_in_region"]
+            marshal_can_drill = entry["can_drill"]
+        else:
+            enemies_in_range = [e.name for e in get_enemies_in_range(marshal, game_state)]
+            enemies_in_region = get_enemies_in_region(marshal, game_state)
+            marshal_can_drill = can_drill(marshal, game_state)
         has_enemies_nearby = len(enemies_in_range) > 0
         is_engaged = len(enemies_in_region) > 0
 
@@ -807,7 +966,7 @@ class DisobedienceSystem:
                     }
 
                 # No enemies in region? Drill for shock bonus
-                if not is_engaged and can_drill(marshal, game_state):
+                if not is_engaged and marshal_can_drill:
                     return {
                         'action': 'drill',
                         'target': marshal.location,
@@ -838,7 +997,7 @@ class DisobedienceSystem:
 
                 # Can fortify? Dig in for safety
                 is_fortified = getattr(marshal, 'fortified', False)
-                if not is_fortified and not is_engaged and can_drill(marshal, game_state):
+                if not is_fortified and not is_engaged and marshal_can_drill:
                     # Use can_drill check as proxy for "not blocked"
                     return {
                         'action': 'fortify',
@@ -868,14 +1027,14 @@ class DisobedienceSystem:
 
             elif compromise_action == 'attack':
                 if enemies_in_range:
-                    return {'action': 'attack', 'target': enemies_in_range[0].name}
+                    return {'action': 'attack', 'target': enemies_in_range[0]}
                 move_target = self._get_move_toward_enemy(marshal, game_state)
                 if move_target:
                     return {'action': 'move', 'target': move_target}
                 return {'action': 'defend', 'target': marshal.location}
 
             elif compromise_action == 'drill':
-                if can_drill(marshal, game_state):
+                if marshal_can_drill:
                     return {'action': 'drill', 'target': marshal.location}
                 return {'action': 'defend', 'target': marshal.location}
 
@@ -1368,6 +1527,16 @@ class DisobedienceSystem:
         # FIX: Clear redemption_pending flag now that we're resolving it
         marshal.redemption_pending = False
 
+        try:
+            return self._apply_redemption_choice(world, marshal, marshal_name, choice)
+        finally:
+            # Autonomy, sidelining and dismissal change who can act and with
+            # how many troops - invalidate caches keyed on the state version
+            if hasattr(world, 'mark_state_changed'):
+                world.mark_state_changed()
+
+    def _apply_redemption_choice(self, world, marshal, marshal_name: str, choice: str) -> Dict:
+        """Apply a redemption choice to the marshal (see handle_redemption_response)."""
         # ════════════════════════════════════════════════════════════════════════════
         # GRANT AUTONOMY - Marshal acts independently for 3 turns
         # ════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,131 @@
+"""
+Pre-parse Command Dispatch for Project Sovereign
+
+Two kinds of /command input never need the parse pipeline
+(LLMClient -> fuzzy matching -> validation -> classification):
+
+1. Responses to a pending strategic interrupt (cannon fire, blocked path):
+   "investigate", "press on", "go around"... map straight to a choice for
+   StrategicExecutor.handle_response(). Pending marshals come from the
+   world's pending-interrupt set (no roster scan) and the choice from one
+   compiled keyword matcher.
+
+2. Meta commands ("help", "end turn", ...): the whole command is a known
+   phrase, so the parse result is a constant. It is handed to
+   CommandExecutor.execute() directly.
+
+Everything else (and any near-miss like "help me, Ney") takes the normal
+parser path, so behavior for those commands is unchanged.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+from backend.models.marshal import Marshal
+
+# Interrupt response keywords, highest priority first. A command matching
+# several groups takes the first group's choice (substring match, as before).
+INTERRUPT_KEYWORDS = (
+    ("investigate", "march to", "guns", "attack", "charge", "join"),
+    ("continue", "ignore", "keep going", "carry on", "press on"),
+    ("hold", "stay", "stop", "wait", "halt"),
+    ("go around", "reroute", "avoid"),
+    ("cancel", "abort", "belay"),
+)
+
+# Choices each group maps to, first available option wins
+INTERRUPT_CHOICES = (
+    ("investigate", "attack"),
+    ("continue_order",),
+    ("hold_position",),
+    ("go_around",),
+    ("cancel_order",),
+)
+
+_INTERRUPT_PATTERN = re.compile("|".join(
+    f"(?P<g{group}>{'|'.join(re.escape(kw) for kw in keywords)})"
+    for group, keywords in enumerate(INTERRUPT_KEYWORDS)
+))
+
+# Whole-command meta phrases -> action (the fast parser's help/end_turn aliases)
+META_COMMANDS: Dict[str, str] = {
+    "help": "help",
+    "?": "help",
+    "commands": "help",
+    "what can i do": "help",
+    "end turn": "end_turn",
+    "end_turn": "end_turn",
+    "next turn": "end_turn",
+}
+
+
+def match_interrupt_choice(command_lower: str, options) -> Optional[str]:
+    """
+    Map lowercased player text to one of an interrupt's response options.
+
+    Args:
+        command_lower: Stripped, lowercased command
+        options: The interrupt's available choices
+
+    Returns:
+        The choice, or None if the text isn't a response to this interrupt
+    """
+    groups = [int(m.lastgroup[1:]) for m in _INTERRUPT_PATTERN.finditer(command_lower)]
+    if not groups:
+        return None
+    for choice in INTERRUPT_CHOICES[min(groups)]:
+        if choice in options:
+            return choice
+    return None
+
+
+def parse_meta_command(command_text: str) -> Optional[Dict]:
+    """
+    Parse result for a bare meta command, or None for anything else.
+
+    Returns the same dict CommandParser.parse() gives for these commands.
+    That includes "mode": "mock" in live mode too. Meta commands never reach
+    the LLM (the fast parser always answers them), so they stay out of
+    command history and feedback, as they did before this shortcut existed.
+    """
+    action = META_COMMANDS.get(command_text.strip().lower().rstrip(".!"))
+    if action is None:
+        return None
+    return {
+        "success": True,
+        "command": {
+            "marshal": None,
+            "action": action,
+            "target": None,
+            "confidence": 0.8,
+            "type": "specific",
+        },
+        "raw_input": command_text,
+        "strategic_score": 10,
+        "ambiguity": 5,
+        "mode": "mock",
+    }
+
+
+def route_interrupt(command_text: str, world) -> Optional[Tuple[Marshal, str, str]]:
+    """
+    Find the pending interrupt this command answers.
+
+    Args:
+        command_text: Raw player command
+        world: WorldState
+
+    Returns:
+        (marshal, interrupt_type, choice), or None to parse normally
+    """
+    pending_marshals = world.get_pending_interrupt_marshals()
+    if not pending_marshals:
+        return None
+
+    command_lower = command_text.strip().lower()
+    for marshal in pending_marshals:
+        pending = marshal.pending_interrupt
+        choice = match_interrupt_choice(command_lower, pending.get("options", []))
+        if choice:
+            return marshal, pending.get("interrupt_type", ""), choice
+    return None
@@ -7,11 +7,14 @@ Includes Disobedience System (Phase 2):
 - Handles major objections by pausing execution for player choice
 - Updates vindication tracker after battles
 
+Multi-marshal orders (e.g., "Ney and Davout, attack Wellington") run as one
+coordinated group via execute_group(): the plan is checked against the
+action budget first and attacks on a shared target get one flanking
+calculation covering every attacker that can reach it.
+
 TODO (Future): Multi-Army Battles
 - Support 3+ marshals vs 2+ enemies in same region
-- Multi-step commands (e.g., "Ney and Davout, attack Wellington")
 - Combined strength calculations with command bonuses
-- Coordinated attacks with flanking bonuses
 """
 from typing import Dict, List, Optional, Tuple
 from backend.models.world_state import WorldState
@@ -20,6 +23,12 @@ from backend.game_logic.combat import CombatResolver
 from backend.game_logic.turn_manager import TurnManager
 from backend.utils.fuzzy_matcher import FuzzyMatcher
 
+# Actions that never cost from the player's action budget
+FREE_ACTIONS = ("status", "help", "end_turn", "unknown", "retreat", "debug")
+
+# Result markers for a command waiting on the player (objection, clarification)
+AWAITING_STATES = ("awaiting_player_choice", "awaiting_clarification")
+
 
 class CommandExecutor:
     """
@@ -286,6 +295,10 @@ class CommandExecutor:
         if strategic_reports:
             result["strategic_reports"] = strategic_reports
 
+        # Turn profile (only when game_state["include_timings"] is set)
+        if "timings" in turn_result:
+            result["timings"] = turn_result["timings"]
+
         return result
 
     def _apply_grouchy_ambiguity_buff(self, marshal, ambiguity: int, strategic_score: int, action: str):
@@ -423,8 +436,203 @@ RETREAT RECOVERY (3 turns):
             "new_state": game_state
         }
 
+    def _actions_required(self, parsed_command: Dict, world: WorldState) -> int:
+        """
+        Actions a costing player command needs up front.
+
+        Strategic commands cost 2 (1 for literal personality), everything
+        else 1. Free actions are decided by the caller.
+        """
+        command = parsed_command.get("command", {})
+        if (not command.get("_strategic_execution", False) and
+                parsed_command.get("is_strategic") and
+                parsed_command.get("strategic_type")):
+            marshal_for_cost = world.get_marshal(command.get("marshal", ""))
+            is_literal = marshal_for_cost and getattr(marshal_for_cost, 'personality', '') == 'literal'
+            return 1 if is_literal else 2
+        return 1
+
     def execute(self, parsed_command: Dict, game_state: Dict) -> Dict:
         """Execute a command against the current game state."""
+        try:
+            return self._execute_command(parsed_command, game_state)
+        finally:
+            # Any command may move armies, fight or shift trust - invalidate
+            # caches keyed on the world's state version (severity breakdowns, ...)
+            world = game_state.get("world")
+            if world is not None and hasattr(world, 'mark_state_changed'):
+                world.mark_state_changed()
+
+    def execute_group(self, parsed_commands: List[Dict], game_state: Dict) -> Dict:
+        """
+        Execute a multi-marshal order as one coordinated group.
+
+        The plan is checked first: every part must have parsed and the
+        player must have actions for all of them, or nothing executes.
+        Attacks by two or more members on the same region that can all
+        reach it share one flanking calculation covering every member's
+        origin, so the first attacker already fights with the pincer bonus.
+        Each attack is recorded when it is made; a member whose part fails
+        or stops is withdrawn from the plan and any record it left undone.
+
+        Execution stops at a part that needs the player (objection,
+        clarification, glorious charge); that part's result is returned
+        with the finished parts in "group_results".
+
+        Args:
+            parsed_commands: CommandParser.parse_multiple() results
+            game_state: {"world": WorldState, ...}
+
+        Returns:
+            Combined result with success, message, events, group_results
+        """
+        world: WorldState = game_state.get("world")
+        if not world:
+            return {
+                "success": False,
+                "message": "Error: No world state available"
+            }
+
+        if not parsed_commands:
+            return {
+                "success": False,
+                "message": "No orders given"
+            }
+
+        unparsed = [p for p in parsed_commands if not p.get("success")]
+        if unparsed:
+            return {
+                "success": False,
+                "message": "Could not understand part of the order: " + "; ".join(
+                    f"'{p.get('raw_input', '')}' ({p.get('error', 'unknown error')})" for p in unparsed),
+                "suggestion": unparsed[0].get("suggestion"),
+            }
+
+        required_actions = sum(self._group_part_cost(p, world) for p in parsed_commands)
+        if world.actions_remaining < required_actions:
+            return {
+                "success": False,
+                "message": f"Not enough actions for the combined order! Need {required_actions}, "
+                           f"have {world.actions_remaining}.",
+                "actions_remaining": int(world.actions_remaining),
+                "action_summary": world.get_action_summary()
+            }
+
+        plans = self._plan_coordinated_attacks(parsed_commands, world)
+        group_state = {**game_state, "coordinated_attacks": plans}
+        results = []
+        for index, parsed in enumerate(parsed_commands):
+            recorded = {target: len(attacks) for target, attacks in world.attacks_this_turn.items()}
+            result = self.execute(parsed, group_state)
+            awaiting = result.get("state") in AWAITING_STATES or result.get("pending_glorious_charge")
+            if awaiting or not result.get("success"):
+                self._withdraw_coordinated_attacker(parsed, plans, world, recorded)
+            if awaiting:
+                return {
+                    **result,
+                    "group_results": results,
+                    "group_pending": [p.get("raw_input") for p in parsed_commands[index + 1:]],
+                }
+            # new_state is the world itself; the group result keeps one copy
+            results.append({k: v for k, v in result.items() if k != "new_state"})
+
+        # Turn-level fields (action_info, enemy_phase, ...) come from the last part:
+        # the budget check means only it can spend the final action
+        return {
+            **results[-1],
+            "success": all(r.get("success", False) for r in results),
+            "message": "\n\n".join(r["message"] for r in results if r.get("message")),
+            "events": [event for r in results for event in r.get("events", [])],
+            "group_results": results,
+        }
+
+    def _group_part_cost(self, parsed_command: Dict, world: WorldState) -> int:
+        """Player actions one part of a group order will spend (0 if free)."""
+        command = parsed_command.get("command", {})
+        if command.get("action", "unknown") in FREE_ACTIONS:
+            return 0
+        marshal = world.get_marshal(command.get("marshal") or "")
+        if marshal and marshal.nation != world.player_nation:
+            return 0
+        return self._actions_required(parsed_command, world)
+
+    def _plan_coordinated_attacks(self, parsed_commands: List[Dict], world: WorldState) -> Dict[str, Dict]:
+        """
+        Target region -> {"attackers": {name: origin}, "flanking": None} for
+        regions that two or more members of a group order can attack now.
+        """
+        plans: Dict[str, Dict] = {}
+        for parsed in parsed_commands:
+            command = parsed.get("command", {})
+            marshal = world.get_marshal(command.get("marshal") or "")
+            target = command.get("target")
+            if command.get("action") != "attack" or not marshal or not target:
+                continue
+            enemy = world.get_enemy_by_name_for_nation(target, marshal.nation)
+            location = enemy.location if enemy else target
+            if world.get_region(location) is None or not self._can_join_coordinated_attack(marshal, location, world):
+                continue
+            plan = plans.setdefault(location, {"attackers": {}, "flanking": None})
+            plan["attackers"][marshal.name] = marshal.location
+        return {location: plan for location, plan in plans.items() if len(plan["attackers"]) > 1}
+
+    def _can_join_coordinated_attack(self, marshal, location: str, world: WorldState) -> bool:
+        """
+        True if marshal's attack on location would reach battle this turn.
+
+        Applies the executor's attack gates up front: a defender there is a
+        valid attack target (alive, in range, attacker not fortified), the
+        attacker isn't retreating, broken, locked in drill, engaged
+        elsewhere or due a glorious charge, and no enemy blocks a 2-region
+        cavalry charge. Objections can't be foreseen; execute_group
+        withdraws a member whose part stops for one.
+        """
+        from backend.commands.disobedience import find_action_in_valid, get_valid_actions
+
+        valid_actions = get_valid_actions(marshal, world)
+        defenders = [m for m in world.get_marshals_in_region(location)
+                     if m.nation != marshal.nation and m.strength > 0]
+        if not any(find_action_in_valid("attack", d.name, valid_actions) for d in defenders):
+            return False
+        if marshal.retreating or marshal.broken or marshal.drilling_locked:
+            return False
+        if marshal.is_reckless_cavalry and marshal.recklessness >= 3:
+            return False
+        if marshal.location != location and any(
+                m.nation != marshal.nation and m.strength > 0
+                for m in world.get_marshals_in_region(marshal.location)):
+            return False
+        if world.get_distance(marshal.location, location) == 2:
+            for middle in world.get_region(marshal.location).adjacent_regions:
+                if world.get_distance(middle, location) == 1 and any(
+                        m.nation != marshal.nation and m.strength > 0
+                        for m in world.get_marshals_in_region(middle)):
+                    return False
+        return True
+
+    def _withdraw_coordinated_attacker(self, parsed_command: Dict, plans: Dict[str, Dict],
+                                       world: WorldState, recorded: Dict[str, int]) -> None:
+        """
+        Drop a group member whose part failed or stopped from the attack plans.
+
+        Attack records the part left behind are removed (recorded holds each
+        target's record count before the part ran), and the shared flanking
+        of its plans is recomputed by the next member to attack.
+        """
+        for target in list(world.attacks_this_turn):
+            before = recorded.get(target, 0)
+            if before:
+                del world.attacks_this_turn[target][before:]
+            else:
+                del world.attacks_this_turn[target]
+
+        name = parsed_command.get("command", {}).get("marshal")
+        for plan in plans.values():
+            if plan["attackers"].pop(name, None) is not None:
+                plan["flanking"] = None
+
+    def _execute_command(self, parsed_command: Dict, game_state: Dict) -> Dict:
+        """Body of execute(); see execute() for state version bookkeeping."""
         world: WorldState = game_state.get("world")
 
         if not world:
@@ -464,7 +672,7 @@ RETREAT RECOVERY (3 turns):
         # Actions don't apply to status queries or help
         # retreat is FREE (costs 0 actions - strategic withdrawal)
         # debug is FREE (for testing abilities)
-        free_actions = ["status", "help", "end_turn", "unknown", "retreat", "debug"]
+        free_actions = FREE_ACTIONS
 
         # Check if action costs points
         action_costs_point = action not in free_actions
@@ -483,14 +691,7 @@ RETREAT RECOVERY (3 turns):
 
         if action_costs_point and is_player_action_check:
             # Determine how many actions this command needs
-            required_actions = 1
-            if (not is_strategic_execution and
-                    parsed_command.get("is_strategic") and
-                    parsed_command.get("strategic_type")):
-                # Strategic commands cost 2 (1 for literal personality)
-                marshal_for_cost = world.get_marshal(command.get("marshal", ""))
-                is_literal = marshal_for_cost and getattr(marshal_for_cost, 'personality', '') == 'literal'
-                required_actions = 1 if is_literal else 2
+            required_actions = self._actions_required(parsed_command, world)
 
             if world.actions_remaining < required_actions:
                 return {
@@ -1035,6 +1236,9 @@ RETREAT RECOVERY (3 turns):
                 result["game_over"] = True
                 result["victory"] = turn_result["victory_check"].get("result")
 
+            if "timings" in turn_result:
+                result["timings"] = turn_result["timings"]
+
         return result
 
     def _execute_specific(self, command: Dict, game_state: Dict) -> Dict:
@@ -1089,6 +1293,15 @@ RETREAT RECOVERY (3 turns):
                 "message": f"Unknown action: {action}"
             }
 
+    def _resolve_battle(self, game_state: Dict, **battle) -> Dict:
+        """
+        CombatResolver.resolve_battle(), skipping the narrative when
+        game_state["narrate_battles"] is False (enemy AI turns, whose
+        results are shown from the numbers).
+        """
+        return self.combat_resolver.resolve_battle(
+            narrate=game_state.get("narrate_battles", True), **battle)
+
     def _handle_forced_retreat(
         self,
         battle_result: Dict,
@@ -1594,12 +1807,22 @@ RETREAT RECOVERY (3 turns):
         # Record this attack for flanking calculation
         world.record_attack(marshal.name, origin_region, target_location)
 
-        # Calculate flanking bonus based on all attacks this turn
-        flanking_info = world.calculate_flanking_bonus(target_location)
+        coordinated = (game_state.get("coordinated_attacks") or {}).get(target_location)
+        if coordinated is not None and marshal.name in coordinated["attackers"]:
+            # Coordinated group attack (execute_group): members still to
+            # attack count toward one shared flanking calculation
+            if coordinated["flanking"] is None:
+                coordinated["flanking"] = world.calculate_flanking_bonus(
+                    target_location, coordinated["attackers"].values())
+            flanking_info = coordinated["flanking"]
+        else:
+            # Calculate flanking bonus based on all attacks this turn
+            flanking_info = world.calculate_flanking_bonus(target_location)
         flanking_bonus = flanking_info["bonus"]
 
         # Generate flanking message if applicable
-        flanking_message = world.get_flanking_message(marshal.name, origin_region, target_location)
+        flanking_message = world.get_flanking_message(
+            marshal.name, origin_region, target_location, flanking_info)
 
         # ════════════════════════════════════════════════════════════
         # CAVALRY CHARGE (Phase 2.8): Ney can attack from 2 regions away
@@ -1640,7 +1863,8 @@ RETREAT RECOVERY (3 turns):
                 cavalry_charge_message = f"🐴 {marshal.name}'s cavalry charges across the battlefield! (Cavalry Charge: 2-region attack)\n"
 
         # RESOLVE COMBAT with flanking bonus!
-        battle_result = self.combat_resolver.resolve_battle(
+        battle_result = self._resolve_battle(
+            game_state,
             attacker=marshal,
             defender=enemy_marshal,
             terrain="open",
@@ -3196,7 +3420,8 @@ RETREAT RECOVERY (3 turns):
         flanking_message = world.get_flanking_message(best_marshal.name, origin_region, target_location)
 
         # Resolve battle with flanking
-        battle_result = self.combat_resolver.resolve_battle(
+        battle_result = self._resolve_battle(
+            game_state,
             attacker=best_marshal,
             defender=best_enemy,
             terrain="open",
@@ -3322,7 +3547,8 @@ RETREAT RECOVERY (3 turns):
             flanking_message = world.get_flanking_message(nearest_marshal.name, origin_region, target_location)
 
             # Execute attack with flanking
-            battle_result = self.combat_resolver.resolve_battle(
+            battle_result = self._resolve_battle(
+                game_state,
                 attacker=nearest_marshal,
                 defender=enemy,
                 terrain="open",
@@ -3432,7 +3658,8 @@ RETREAT RECOVERY (3 turns):
             flanking_bonus = flanking_info["bonus"]
             flanking_message = world.get_flanking_message(nearest_marshal.name, origin_region, target_location)
 
-            battle_result = self.combat_resolver.resolve_battle(
+            battle_result = self._resolve_battle(
+                game_state,
                 attacker=nearest_marshal,
                 defender=enemy,
                 terrain="open",
@@ -5092,7 +5319,8 @@ RETREAT RECOVERY (3 turns):
         recklessness_before = getattr(marshal, 'recklessness', 0)
 
         # Get combat result with glorious charge flag
-        combat_result = self.combat_resolver.resolve_battle(
+        combat_result = self._resolve_battle(
+            game_state,
             attacker=marshal,
             defender=target_marshal,
             glorious_charge=True  # 2x damage multiplier
@@ -5160,6 +5388,14 @@ RETREAT RECOVERY (3 turns):
         Returns:
             Result dict
         """
+        try:
+            return self._resolve_glorious_charge(response, world)
+        finally:
+            # This path bypasses execute(), so invalidate state-versioned caches here
+            world.mark_state_changed()
+
+    def _resolve_glorious_charge(self, response: str, world: WorldState) -> Dict:
+        """Apply the player's Glorious Charge choice (see respond_to_glorious_charge)."""
         # Find marshal with pending charge
         pending_marshal = None
         for m in world.marshals.values():
@@ -5629,6 +5865,14 @@ RETREAT RECOVERY (3 turns):
         Returns:
             Execution result dict
         """
+        try:
+            return self._run_post_objection(parsed_command, game_state, marshal_name)
+        finally:
+            # This path bypasses execute(), so invalidate state-versioned caches here
+            game_state.get("world").mark_state_changed()
+
+    def _run_post_objection(self, parsed_command: Dict, game_state: Dict, marshal_name: str) -> Dict:
+        """Execute the resolved command (see _execute_post_objection)."""
         world: WorldState = game_state.get("world")
         command = parsed_command.get("command", {})
         action = command.get("action", "unknown")
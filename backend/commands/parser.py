@@ -3,6 +3,7 @@ Command Parser for Project Sovereign
 Converts natural language commands into validated, executable orders
 """
 
+import re
 from typing import Dict, List, Optional
 from backend.ai.llm_client import LLMClient
 from backend.ai.strategic_parser import detect_strategic_command
@@ -270,6 +271,37 @@ class CommandParser:
         try:
             # Step 1: Use LLM to parse natural language
             llm_result = self.llm.parse_command(command_text, game_state)
+        except Exception as e:
+            # Safety net - should never happen but prevents crashes
+            return {
+                "success": False,
+                "error": f"Parser error: {str(e)}",
+                "raw_input": command_text
+            }
+
+        # Steps 2-4: fuzzy matching, validation, classification
+        return self.finish_parse(llm_result, command_text, game_state, world)
+
+    def finish_parse(self, llm_result: Dict, command_text: str,
+                     game_state: Optional[Dict] = None, world=None) -> Dict:
+        """
+        Turn an LLMClient.parse_command() result into parse()'s return dict.
+
+        Split out of parse() so an interpretation obtained elsewhere (e.g. the
+        fast parse run speculatively, see speculation.py) goes through the same
+        fuzzy matching, validation and strategic detection.
+
+        Args:
+            llm_result: Dict from LLMClient.parse_command() / ParseResult.to_dict()
+            command_text: Natural language command
+            game_state: Current game state (for validation)
+            world: WorldState for strategic command detection
+
+        Returns:
+            Same structure as parse()
+        """
+        try:
+            llm_result = dict(llm_result)
 
             # Step 2: Apply fuzzy matching to correct typos
             llm_result, fuzzy_error = self._apply_fuzzy_matching(llm_result, command_text)
@@ -433,30 +465,90 @@ class CommandParser:
 
         # Default fallback
         return "specific"
-    def parse_multiple(self, command_text: str, game_state: Optional[Dict] = None) -> List[Dict]:
+    def split_multiple(self, command_text: str) -> List[str]:
+        """
+        Split an order addressed to several marshals into one command each.
+
+        - Shared order: "Ney and Davout, attack Wellington"
+          -> ["Ney, attack Wellington", "Davout, attack Wellington"]
+        - Separate clauses: "Ney attack Wellington and Davout defend Paris"
+          -> ["Ney attack Wellington", "Davout defend Paris"]
+
+        Clauses are only split when each one opens with a different marshal
+        and carries its own order (an action the fast parser recognizes).
+        Anything else - a compound order for one marshal ("Ney attack
+        Wellington and fortify"), an "and" that doesn't separate marshals
+        ("Ney, attack and hold") or a marshal named as a target ("Ney, attack
+        Wellington and Davout") - is returned as a single part.
+        """
+        name = "(?:" + "|".join(re.escape(m) for m in self.valid_marshals) + ")"
+        canonical = {m.lower(): m for m in self.valid_marshals}
+
+        # "Ney and Davout, <order>" / "Ney, Davout and Murat <order>"
+        shared = re.match(
+            rf"^\s*((?:marshal\s+)?\b{name}\b(?:\s*(?:,\s*and|,|and)\s+(?:marshal\s+)?\b{name}\b)+)[\s,:]+(.+)$",
+            command_text, re.IGNORECASE)
+        if shared:
+            names = list(dict.fromkeys(canonical[n.lower()] for n in re.findall(rf"\b{name}\b", shared.group(1), re.IGNORECASE)))
+            if len(names) > 1:
+                return [f"{n}, {shared.group(2).strip()}" for n in names]
+
+        # "<marshal> <order> and <marshal> <order>"
+        clauses = [c.strip(" ,") for c in re.split(r"\s+and\s+", command_text, flags=re.IGNORECASE)]
+        if len(clauses) > 1:
+            addressed = [re.match(rf"(?:marshal\s+)?({name})\b", c, re.IGNORECASE) for c in clauses]
+            if (all(addressed) and len({a.group(1).lower() for a in addressed}) == len(clauses)
+                    and all(self._has_own_order(c, a) for c, a in zip(clauses, addressed))):
+                return clauses
+        return [command_text]
+
+    def _has_own_order(self, clause: str, addressed: re.Match) -> bool:
+        """True if the clause still names an action once its leading marshal is removed."""
+        order = clause[:addressed.start()] + clause[addressed.end():]
+        return self.llm._parse_with_mock(order).action != "unknown"
+
+    def parse_multiple(self, command_text: str, game_state: Optional[Dict] = None, world=None) -> List[Dict]:
         """
         Parse commands that mention multiple marshals.
 
         Example: "Ney and Davout, attack Wellington"
 
-        Returns list of individual commands.
+        Every part is fast-parsed first; parts that need the LLM start their
+        fallbacks at once on worker threads (LLMClient.start_parse), so the
+        calls overlap - or share one provider request when LLM batching is
+        enabled - instead of running one after another.
+
+        Returns list of individual commands (parse() results, in order).
         """
-        # Simple implementation: check if "and" is in command
-        if " and " in command_text.lower():
-            # Split into individual commands
-            # This is simplified - real version would be smarter
-            parts = command_text.lower().split(" and ")
-
-            results = []
-            for part in parts:
-                # Parse each part
-                result = self.parse(part.strip(), game_state)
-                results.append(result)
-
-            return results
-        else:
-            # Single command
-            return [self.parse(command_text, game_state)]
+        parts = self.split_multiple(command_text)
+        if len(parts) == 1:
+            return [self.parse(command_text, game_state, world=world)]
+
+        started = []
+        for part in parts:
+            try:
+                started.append(self.llm.start_parse(part, game_state))
+            except Exception as e:
+                started.append(e)
+
+        results = []
+        for part, item in zip(parts, started):
+            try:
+                if isinstance(item, Exception):
+                    raise item
+                llm_result, pending = item
+                if pending is not None:
+                    llm_result = LLMClient.resolve_parse(pending)
+            except Exception as e:
+                # Safety net - should never happen but prevents crashes
+                results.append({
+                    "success": False,
+                    "error": f"Parser error: {str(e)}",
+                    "raw_input": part
+                })
+                continue
+            results.append(self.finish_parse(llm_result, part, game_state, world))
+        return results
 
     def get_help(self) -> str:
         """
@@ -13,6 +13,10 @@ Final severity determines objection type:
 - < 0.20: No objection
 - 0.20-0.49: Mild objection (auto-resolve with grumbling)
 - 0.50-0.95: Major objection (player choice required)
+
+Everything except variance is deterministic, so the breakdown (situation,
+base severity, modifiers) can be cached - see severity_cache_key() and
+DisobedienceSystem.get_severity_breakdown().
 """
 
 import random
@@ -51,49 +55,83 @@ def calculate_objection_severity(
     Returns:
         Severity value (0.0 to 0.95)
     """
-    # Step 1: Get base severity from personality trigger
-    personality = get_personality(marshal.personality)
-    situation = analyze_order_situation(order, marshal, game_state)
-
-    if situation is None:
-        return 0.0  # No triggering situation
-
-    base_severity = get_base_severity(personality, situation)
-    if base_severity is None:
-        return 0.0  # Personality doesn't trigger on this situation
+    # Steps 1-2: base severity x modifiers (deterministic)
+    breakdown = get_severity_breakdown(marshal, order, game_state)
 
-    severity = base_severity
+    # Steps 3-4: variance and cap
+    return severity_from_breakdown(breakdown, include_variance)
 
-    # Step 2: Apply multiplicative modifiers
 
-    # 2a: Trust modifier (inverse - low trust = high modifier)
-    trust_modifier = get_trust_modifier(marshal)
-    severity *= trust_modifier
-
-    # 2b: Vindication modifier (been proven right = more bold)
-    vindication_modifier = get_vindication_modifier(marshal)
-    severity *= vindication_modifier
+def severity_from_breakdown(breakdown: Dict, include_variance: bool = True) -> float:
+    """
+    Turn a severity breakdown into a final severity.
 
-    # 2c: Performance modifier (winning = less objection)
-    performance_modifier = get_performance_modifier(marshal)
-    severity *= performance_modifier
+    Only this step is random, so a cached breakdown can be reused with
+    fresh variance on every evaluation.
 
-    # 2d: Override modifier (frequently overridden = more objection)
-    override_modifier = get_override_modifier(marshal)
-    severity *= override_modifier
+    Args:
+        breakdown: Dict from get_severity_breakdown()
+        include_variance: Whether to add random variance (for testing)
 
-    # 2e: Authority modifier (from game state)
-    authority_modifier = get_authority_modifier(game_state)
-    severity *= authority_modifier
+    Returns:
+        Severity value (0.0 to 0.95)
+    """
+    severity = breakdown['raw_severity']
 
     # Step 3: Apply tiered variance
     if include_variance:
         severity = apply_variance(severity)
 
     # Step 4: Cap at 0.95
-    severity = min(0.95, max(0.0, severity))
+    return min(0.95, max(0.0, severity))
+
+
+def severity_cache_key(marshal, order: Dict, game_state) -> Optional[Tuple]:
+    """
+    Build a cache key for a severity breakdown.
 
-    return severity
+    The key combines the world's state version (positions, strengths and
+    control of every other marshal and region) with the marshal's own inputs
+    and the order fields analyze_order_situation() reads. The marshal's
+    trust/vindication/history and the authority modifier are included so
+    objection responses, which change them, never serve a stale breakdown.
+
+    Returns:
+        Hashable key, or None if the breakdown must not be cached
+        (e.g. a game state without a state version).
+    """
+    if game_state is None:
+        version = None  # Situation depends only on the order and marshal
+    else:
+        world = getattr(game_state, 'world', game_state)
+        if not hasattr(world, 'get_state_version'):
+            return None
+        version = world.get_state_version()
+
+    trust = getattr(marshal, 'trust', None)
+    stance = getattr(marshal, 'stance', None)
+    key = (
+        version,
+        getattr(marshal, 'name', None),
+        getattr(marshal, 'personality', None),
+        getattr(marshal, 'location', None),
+        getattr(marshal, 'strength', None),
+        getattr(marshal, 'morale', 100),
+        getattr(stance, 'value', stance),
+        getattr(trust, 'value', trust),
+        getattr(marshal, 'vindication_score', 0),
+        tuple(getattr(marshal, 'recent_battles', [])[-3:]),
+        tuple(getattr(marshal, 'recent_overrides', [])[-5:]),
+        get_authority_modifier(game_state),
+        order.get('action', ''),
+        order.get('target'),
+        order.get('target_stance'),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def get_trust_modifier(marshal) -> float:
@@ -288,16 +326,17 @@ def get_severity_breakdown(marshal, order: Dict, game_state) -> Dict:
     }
 
     # Calculate without variance
-    final = base_severity
+    raw = base_severity
     for mod in modifiers.values():
-        final *= mod
-    final = min(0.95, max(0.0, final))
+        raw *= mod
+    final = min(0.95, max(0.0, raw))
 
     return {
         'personality': personality.value,
         'situation': situation,
         'base_severity': base_severity,
         'modifiers': modifiers,
+        'raw_severity': raw,  # Uncapped; variance is applied to this
         'final_severity': final,
         'label': get_severity_label(final),
         'will_object': final >= 0.20,
@@ -0,0 +1,98 @@
+"""
+Speculative Fast-Parse Execution for Project Sovereign
+
+When a command falls back to the LLM, the player normally waits for the
+provider round trip and only then pays for execution. Often the LLM just
+confirms the fast parser's low-confidence guess. In speculative mode
+(LLM_SPECULATIVE=1) the two run side by side:
+
+    fast parse ──► finish_parse + execute on world.fork() ──┐
+         └──► LLM fallback (worker thread) ─────────────────┴─► compare
+
+- LLM agrees (same marshal, action, target, stance, strategic type) and
+  the live world has not changed meanwhile -> world.adopt(fork): the
+  speculative outcome is committed. Latency = max(LLM, execution).
+- Otherwise the fork is dropped and the LLM interpretation executes on
+  the live world as usual (latency = LLM + execution, as before).
+
+If the LLM fallback itself fails, LLMClient returns the fast result, which
+trivially agrees, so the speculation is committed.
+
+Commands the fast parser is confident about never speculate: they take
+the normal parse -> execute path.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from backend.ai.llm_client import LLMClient
+from backend.utils.metrics import SPECULATION_TOTAL
+
+
+def _interpretation(parsed: Dict) -> Tuple:
+    """The fields of a parse() result that decide what executes."""
+    command = parsed.get("command") or {}
+    return (
+        parsed.get("success", False),
+        command.get("marshal"),
+        command.get("action"),
+        command.get("target"),
+        command.get("target_stance"),
+        parsed.get("is_strategic", False),
+        parsed.get("strategic_type"),
+    )
+
+
+class SpeculativeRunner:
+    """Parse and execute one command, speculating on the fast parse."""
+
+    def __init__(self, parser, executor):
+        """
+        Args:
+            parser: CommandParser (its LLMClient runs the fallback)
+            executor: CommandExecutor used for both the fork and the live world
+        """
+        self.parser = parser
+        self.executor = executor
+
+    def run(self, command_text: str, llm_game_state: Optional[Dict], game_state: Dict) -> Tuple[Dict, Dict]:
+        """
+        Parse and execute, speculatively when the LLM is consulted.
+
+        Args:
+            command_text: Raw player command
+            llm_game_state: Prompt game state (dict or LazyGameState)
+            game_state: Executor game state ({"world": WorldState, ...})
+
+        Returns:
+            (parsed, result) exactly as parser.parse() then executor.execute()
+            would have produced them
+        """
+        world = game_state["world"]
+        llm: LLMClient = self.parser.llm
+        fast, pending = llm.start_parse(command_text, llm_game_state)
+
+        if pending is None:
+            parsed = self.parser.finish_parse(fast, command_text, llm_game_state, world)
+            return parsed, self.executor.execute(parsed, game_state)
+
+        # Speculate on a private copy while the provider call is in flight
+        version = world.get_state_version()
+        fork = world.fork()
+        fast_parsed = self.parser.finish_parse(fast, command_text, llm_game_state, fork)
+        speculative = self.executor.execute(fast_parsed, {**game_state, "world": fork})
+
+        parsed = self.parser.finish_parse(LLMClient.resolve_parse(pending), command_text, llm_game_state, world)
+
+        if world.get_state_version() != version:
+            outcome = "stale"  # Another request changed the world meanwhile
+        elif _interpretation(parsed) == _interpretation(fast_parsed):
+            world.adopt(fork)
+            SPECULATION_TOTAL.labels("committed").inc()
+            print(f"[SPECULATION] Committed fast parse of '{command_text[:40]}'")
+            return parsed, speculative
+        else:
+            outcome = "discarded"
+
+        SPECULATION_TOTAL.labels(outcome).inc()
+        print(f"[SPECULATION] {outcome.capitalize()}: executing LLM interpretation of '{command_text[:40]}'")
+        return parsed, self.executor.execute(parsed, game_state)
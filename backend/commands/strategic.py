@@ -18,7 +18,11 @@ All actions go through executor.execute() with _strategic_execution=True
 to maintain the Building Blocks principle.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Cannon fire carries this many regions (Phase 5.2)
+CANNON_FIRE_RANGE = 2
 
 
 def _strategic_command_flavor(cmd_type: str) -> str:
@@ -31,6 +35,92 @@ def _strategic_command_flavor(cmd_type: str) -> str:
     }.get(cmd_type, "his orders")
 
 
+class StrategicTurnContext:
+    """
+    Shared inputs for one process_strategic_orders() pass.
+
+    Every marshal with a standing order used to re-derive the same data:
+    enemy-occupied regions (every region x every marshal), adjacent threats
+    and BFS paths. The context builds each of these once and reuses it
+    across the pass. Nearby battles come from the world's cannon fire index.
+
+    Invalidation:
+    - Occupancy and threats are dropped whenever an order executes a command
+      (moves and combat change who stands where). See StrategicExecutor._execute.
+    - Paths depend only on the map (the avoid set is part of the key), so they
+      live for the whole pass.
+    """
+
+    def __init__(self, world):
+        self.world = world
+        self._occupancy: Dict[str, Dict[Any, list]] = {}  # nation -> region id -> enemies
+        self._graph = world.get_region_graph() if hasattr(world, 'get_region_graph') else None
+        self._threatened: Dict[Tuple[str, str], bool] = {}  # (region, nation) -> threatened
+        self._paths: Dict[Tuple, Optional[List[str]]] = {}
+
+    def invalidate(self) -> None:
+        """Drop position-dependent data after a command has executed."""
+        self._occupancy = {}
+        self._threatened = {}
+
+    def _region_key(self, region: str):
+        """Region id for occupancy keys; names outside the map stay strings."""
+        if self._graph is None:
+            return region
+        region_id = self._graph.id_of(region)
+        return region_id if region_id >= 0 else region
+
+    def _enemies_by_region(self, nation: str) -> Dict[Any, list]:
+        """Living enemies of nation grouped by region id (one pass over marshals)."""
+        occupancy = self._occupancy.get(nation)
+        if occupancy is None:
+            occupancy = {}
+            for m in self.world.marshals.values():
+                if m.nation != nation and m.strength > 0:
+                    occupancy.setdefault(self._region_key(m.location), []).append(m)
+            self._occupancy[nation] = occupancy
+        return occupancy
+
+    def enemies_in_region(self, region: str, nation: str) -> list:
+        """Same result as world.get_enemies_in_region(), served from the occupancy map."""
+        return list(self._enemies_by_region(nation).get(self._region_key(region), ()))
+
+    def enemy_occupied_regions(self, nation: str) -> List[str]:
+        """Regions (in map order) holding at least one living enemy of nation."""
+        occupancy = self._enemies_by_region(nation)
+        return [name for name in self.world.regions if self._region_key(name) in occupancy]
+
+    def is_threatened(self, region_name: str, nation: str) -> bool:
+        """True if an enemy of nation stands in region_name or any adjacent region."""
+        key = (region_name, nation)
+        threatened = self._threatened.get(key)
+        if threatened is None:
+            occupancy = self._enemies_by_region(nation)
+            region_key = self._region_key(region_name)
+            threatened = region_key in occupancy
+            if not threatened and isinstance(region_key, int):
+                threatened = any(adj in occupancy for adj in self._graph.adjacency[region_key])
+            elif not threatened and self._graph is None:
+                region = self.world.get_region(region_name)
+                if region:
+                    threatened = any(adj in occupancy for adj in region.adjacent_regions)
+            self._threatened[key] = threatened
+        return threatened
+
+    def battles_near(self, location: str) -> List[Dict]:
+        """Battles this turn within cannon range of location, in recorded order."""
+        return self.world.get_battles_within_range(location, CANNON_FIRE_RANGE)
+
+    def find_path(self, start: str, end: str,
+                  avoid_regions: List[str] = None) -> Optional[List[str]]:
+        """Memoized world.find_path(). Returns a fresh list (callers pop from it)."""
+        key = (start, end, frozenset(avoid_regions) if avoid_regions else None)
+        if key not in self._paths:
+            self._paths[key] = self.world.find_path(start, end, avoid_regions=avoid_regions)
+        path = self._paths[key]
+        return list(path) if path is not None else None
+
+
 class StrategicExecutor:
     """
     Executes strategic orders during turn processing.
@@ -46,6 +136,22 @@ class StrategicExecutor:
             command_executor: CommandExecutor instance for action execution
         """
         self.executor = command_executor
+        # Set only while process_strategic_orders() is running
+        self._turn_context: Optional[StrategicTurnContext] = None
+
+    def _context(self, world) -> StrategicTurnContext:
+        """Current pass context, or a throwaway one outside a pass (responses, tests)."""
+        ctx = self._turn_context
+        if ctx is None or ctx.world is not world:
+            return StrategicTurnContext(world)
+        return ctx
+
+    def _execute(self, parsed_command: Dict, game_state: Dict) -> Dict:
+        """Run a command through the executor, then drop stale occupancy data."""
+        result = self.executor.execute(parsed_command, game_state)
+        if self._turn_context is not None:
+            self._turn_context.invalidate()
+        return result
 
     def process_strategic_orders(self, world, game_state: Dict) -> List[Dict]:
         """
@@ -54,9 +160,20 @@ class StrategicExecutor:
         Called at START of player's turn, AFTER enemy phase, BEFORE advance_turn().
         This timing ensures we can see battles_this_turn for cannon fire detection.
 
+        Shared inputs (battle proximity, occupancy, threats, paths) are
+        computed once in a StrategicTurnContext and reused by every marshal.
+
         Returns:
             List of reports for UI display
         """
+        self._turn_context = StrategicTurnContext(world)
+        try:
+            return self._process_orders(world, game_state)
+        finally:
+            self._turn_context = None
+
+    def _process_orders(self, world, game_state: Dict) -> List[Dict]:
+        """Body of process_strategic_orders(), run with the pass context set."""
         reports = []
 
         print(f"[STRATEGIC] Processing orders for turn {world.current_turn}")
@@ -187,7 +304,7 @@ class StrategicExecutor:
 
             if distance <= attack_range and enemies_at_battle:
                 # Within range — attack!
-                action_result = self.executor.execute(
+                action_result = self._execute(
                     {"command": {
                         "marshal": marshal.name,
                         "action": "attack",
@@ -219,7 +336,7 @@ class StrategicExecutor:
                     enemies_blocking = world.get_enemies_in_region(next_step, marshal.nation)
                     if enemies_blocking:
                         break
-                    move_result = self.executor.execute(
+                    move_result = self._execute(
                         {"command": {
                             "marshal": marshal.name,
                             "action": "move",
@@ -299,7 +416,7 @@ class StrategicExecutor:
 
         if choice in ("attack", "attack_anyway"):
             # Attack the blocking enemy
-            result = self.executor.execute(
+            result = self._execute(
                 {"command": {
                     "marshal": marshal.name,
                     "action": "attack",
@@ -336,7 +453,7 @@ class StrategicExecutor:
             # Recalculate path avoiding ALL enemy regions (not just the one)
             destination = order.target_snapshot_location or order.target
             enemy_regions = self._get_enemy_occupied_regions(marshal.nation, world)
-            new_path = world.find_path(
+            new_path = self._context(world).find_path(
                 marshal.location, destination,
                 avoid_regions=enemy_regions
             )
@@ -640,7 +757,7 @@ class StrategicExecutor:
             next_region = order.path[0]
 
             # Check for enemies blocking the next region
-            enemies = world.get_enemies_in_region(next_region, marshal.nation)
+            enemies = self._context(world).enemies_in_region(next_region, marshal.nation)
             if enemies:
                 if not moves_made:  # First move blocked
                     return self._handle_blocked_path(
@@ -649,7 +766,7 @@ class StrategicExecutor:
                     break  # Moved some, stop at blockage
 
             # Execute move through executor (skip objections + action cost)
-            result = self.executor.execute(
+            result = self._execute(
                 {"command": {
                     "marshal": marshal.name,
                     "action": "move",
@@ -697,10 +814,10 @@ class StrategicExecutor:
 
         # Check attack_on_arrival
         if order.attack_on_arrival:
-            enemies = world.get_enemies_in_region(marshal.location, marshal.nation)
+            enemies = self._context(world).enemies_in_region(marshal.location, marshal.nation)
             if enemies:
                 target = enemies[0]
-                result = self.executor.execute(
+                result = self._execute(
                     {"command": {
                         "marshal": marshal.name,
                         "action": "attack",
@@ -763,7 +880,7 @@ class StrategicExecutor:
                 return self._complete_order(marshal, world,
                     f"{marshal.name} engaged {target.name} — pursuit complete")
 
-            result = self.executor.execute(
+            result = self._execute(
                 {"command": {
                     "marshal": marshal.name,
                     "action": "attack",
@@ -794,7 +911,7 @@ class StrategicExecutor:
             next_region = path[0]
 
             # Check for enemies blocking the path
-            enemies = world.get_enemies_in_region(next_region, marshal.nation)
+            enemies = self._context(world).enemies_in_region(next_region, marshal.nation)
             blocking = [e for e in enemies if e.name != order.target]
 
             # If this is the target's region, don't treat other enemies as blockers —
@@ -812,7 +929,7 @@ class StrategicExecutor:
                 personality = getattr(marshal, 'personality', 'balanced')
                 attack_on_arrival = getattr(order, 'attack_on_arrival', False)
                 if personality == "aggressive" or attack_on_arrival:
-                    attack_result = self.executor.execute(
+                    attack_result = self._execute(
                         {"command": {
                             "marshal": marshal.name,
                             "action": "attack",
@@ -828,7 +945,7 @@ class StrategicExecutor:
                     return self._complete_order(marshal, world,
                         f"{marshal.name} has located {target.name} at {next_region} and awaits orders")
 
-            result = self.executor.execute(
+            result = self._execute(
                 {"command": {
                     "marshal": marshal.name,
                     "action": "move",
@@ -845,7 +962,7 @@ class StrategicExecutor:
                 # Did we catch up? Pursuit complete.
                 if marshal.location == target.location:
                     if self._should_auto_attack(marshal, target, world):
-                        attack_result = self.executor.execute(
+                        attack_result = self._execute(
                             {"command": {
                                 "marshal": marshal.name,
                                 "action": "attack",
@@ -866,7 +983,7 @@ class StrategicExecutor:
                     attack_on_arrival = getattr(order, 'attack_on_arrival', False)
                     if personality == "aggressive" or attack_on_arrival:
                         if self._should_auto_attack(marshal, target, world):
-                            attack_result = self.executor.execute(
+                            attack_result = self._execute(
                                 {"command": {
                                     "marshal": marshal.name,
                                     "action": "attack",
@@ -923,17 +1040,18 @@ class StrategicExecutor:
         # Not at hold position yet? Move there first
         if marshal.location != hold_position:
             # Temporarily use path-based movement
-            path = world.find_path(marshal.location, hold_position)
+            ctx = self._context(world)
+            path = ctx.find_path(marshal.location, hold_position)
             if path:
                 path = [r for r in path if r != marshal.location]
                 if path:
                     next_region = path[0]
-                    enemies = world.get_enemies_in_region(next_region, marshal.nation)
+                    enemies = ctx.enemies_in_region(next_region, marshal.nation)
                     if enemies:
                         return self._handle_blocked_path(
                             marshal, enemies, next_region, world, game_state)
 
-                    result = self.executor.execute(
+                    result = self._execute(
                         {"command": {
                             "marshal": marshal.name,
                             "action": "move",
@@ -989,7 +1107,7 @@ class StrategicExecutor:
         elif personality == "cautious":
             # Auto-fortify if not already at max
             if not getattr(marshal, 'fortified', False):
-                self.executor.execute(
+                self._execute(
                     {"command": {
                         "marshal": marshal.name,
                         "action": "fortify",
@@ -1011,8 +1129,9 @@ class StrategicExecutor:
             # Check for nearby enemies to sally
             region = world.get_region(marshal.location)
             if region:
+                ctx = self._context(world)
                 for adj_name in region.adjacent_regions:
-                    enemies = world.get_enemies_in_region(adj_name, marshal.nation)
+                    enemies = ctx.enemies_in_region(adj_name, marshal.nation)
                     if enemies:
                         enemy = enemies[0]
                         ratio = marshal.strength / max(1, enemy.strength)
@@ -1020,7 +1139,7 @@ class StrategicExecutor:
                         if ratio >= 1.0 and self._should_auto_attack(marshal, enemy, world):  # Favorable odds, no combat loop
                             # SALLY: Move to enemy region, attack, return
                             # Step 1: Move to the adjacent region
-                            move_result = self.executor.execute(
+                            move_result = self._execute(
                                 {"command": {
                                     "marshal": marshal.name,
                                     "action": "move",
@@ -1033,7 +1152,7 @@ class StrategicExecutor:
                             combat_result = None
                             if move_result.get("success"):
                                 # Step 2: Attack the enemy (now same region)
-                                combat_result = self.executor.execute(
+                                combat_result = self._execute(
                                     {"command": {
                                         "marshal": marshal.name,
                                         "action": "attack",
@@ -1046,7 +1165,7 @@ class StrategicExecutor:
 
                             # Step 3: Return to hold position
                             if marshal.location != hold_position:
-                                self.executor.execute(
+                                self._execute(
                                     {"command": {
                                         "marshal": marshal.name,
                                         "action": "move",
@@ -1107,17 +1226,10 @@ class StrategicExecutor:
                     return self._complete_order(marshal, world,
                                                 f"{ally.name} won the battle!")
 
-            # Check if ally is safe (no adjacent enemies)
+            # Check if ally is safe (no enemies here or adjacent)
             ally_safe = True
-            region = world.get_region(ally.location)
-            if region:
-                for adj in region.adjacent_regions:
-                    if world.get_enemies_in_region(adj, ally.nation):
-                        ally_safe = False
-                        break
-                # Also check current region
-                if world.get_enemies_in_region(ally.location, ally.nation):
-                    ally_safe = False
+            if world.get_region(ally.location):
+                ally_safe = not self._context(world).is_threatened(ally.location, ally.nation)
 
             if ally_safe:
                 return self._complete_order(marshal, world,
@@ -1165,7 +1277,7 @@ class StrategicExecutor:
                 break
 
             next_region = path[0]
-            enemies = world.get_enemies_in_region(next_region, marshal.nation)
+            enemies = self._context(world).enemies_in_region(next_region, marshal.nation)
 
             if enemies:
                 if not moves_made:
@@ -1173,7 +1285,7 @@ class StrategicExecutor:
                         marshal, enemies, next_region, world, game_state)
                 break
 
-            result = self.executor.execute(
+            result = self._execute(
                 {"command": {
                     "marshal": marshal.name,
                     "action": "move",
@@ -1271,7 +1383,7 @@ class StrategicExecutor:
             return None
 
         # Check for nearby battles (cannon fire)
-        nearby_battles = world.get_battles_within_range(marshal.location, 2)
+        nearby_battles = self._context(world).battles_near(marshal.location)
 
         for battle in nearby_battles:
             # Skip battles we're involved in
@@ -1314,13 +1426,11 @@ class StrategicExecutor:
                 # Distance-based response: attack if in range, otherwise move toward
                 is_cavalry = getattr(marshal, 'cavalry', False)
                 attack_range = getattr(marshal, 'movement_range', 1) if is_cavalry else 1
-                path_to_battle = world.find_path(marshal.location, battle_loc)
+                ctx = self._context(world)
+                path_to_battle = ctx.find_path(marshal.location, battle_loc)
                 distance = len(path_to_battle) - 1 if path_to_battle else 999
 
-                enemies_at_battle = [
-                    m for m in world.get_enemies_of_nation(marshal.nation)
-                    if m.location == battle_loc and m.strength > 0
-                ]
+                enemies_at_battle = ctx.enemies_in_region(battle_loc, marshal.nation)
 
                 print(f"[STRATEGIC INTERRUPT] {marshal.name}: Cannon fire at {battle_loc}")
                 print(f"[STRATEGIC INTERRUPT]   Distance={distance}, cavalry={is_cavalry}, "
@@ -1334,7 +1444,7 @@ class StrategicExecutor:
                     # Within attack range AND enemy present — ATTACK
                     print(f"[STRATEGIC INTERRUPT] {marshal.name}: Within attack range, attacking!")
                     action_taken = "attack"
-                    action_result = self.executor.execute(
+                    action_result = self._execute(
                         {"command": {
                             "action": "attack",
                             "marshal": marshal.name,
@@ -1351,7 +1461,7 @@ class StrategicExecutor:
                     action_taken = "move"
                     for i in range(steps):
                         next_region = path_to_battle[1 + i]
-                        step_result = self.executor.execute(
+                        step_result = self._execute(
                             {"command": {
                                 "marshal": marshal.name,
                                 "action": "move",
@@ -1511,7 +1621,7 @@ class StrategicExecutor:
             # Reroute silently around ALL enemy regions
             destination = order.target_snapshot_location or order.target
             enemy_regions = self._get_enemy_occupied_regions(marshal.nation, world)
-            new_path = world.find_path(
+            new_path = self._context(world).find_path(
                 marshal.location, destination,
                 avoid_regions=enemy_regions
             )
@@ -1533,7 +1643,7 @@ class StrategicExecutor:
             ratio = marshal.strength / max(1, enemy.strength)
             if ratio >= 0.7 and self._should_auto_attack(marshal, enemy, world):
                 # Auto-attack — favorable enough odds
-                result = self.executor.execute(
+                result = self._execute(
                     {"command": {
                         "marshal": marshal.name,
                         "action": "attack",
@@ -1668,11 +1778,7 @@ class StrategicExecutor:
 
     def _get_enemy_occupied_regions(self, nation: str, world) -> List[str]:
         """Get list of regions with enemies (for cautious pathfinding)."""
-        enemy_regions = []
-        for region_name in world.regions:
-            if world.get_enemies_in_region(region_name, nation):
-                enemy_regions.append(region_name)
-        return enemy_regions
+        return self._context(world).enemy_occupied_regions(nation)
 
     def _get_personality_aware_path(self, marshal, destination, world) -> Optional[List[str]]:
         """
@@ -1685,23 +1791,24 @@ class StrategicExecutor:
         Returns path excluding start location, or None if no path exists.
         """
         personality = getattr(marshal, 'personality', 'balanced')
+        ctx = self._context(world)
 
         if personality == "cautious":
-            enemy_regions = self._get_enemy_occupied_regions(marshal.nation, world)
-            path = world.find_path(marshal.location, destination,
-                                   avoid_regions=enemy_regions)
+            enemy_regions = ctx.enemy_occupied_regions(marshal.nation)
+            path = ctx.find_path(marshal.location, destination,
+                                 avoid_regions=enemy_regions)
             if not path:
                 # No safe route — fall back to direct path. The marshal will
                 # NOT walk through enemies: the movement loop (line 466-468)
                 # blocks entry and triggers _handle_blocked_path(), which asks
                 # the player before proceeding. This is intentional UX — the
                 # marshal starts moving and reports contact when it happens.
-                path = world.find_path(marshal.location, destination)
+                path = ctx.find_path(marshal.location, destination)
         else:
             # Aggressive/literal/balanced: direct path. Movement loop at
             # _execute_move_to line 466 still blocks entry into enemy regions
             # and triggers _handle_blocked_path() for interrupt/reroute.
-            path = world.find_path(marshal.location, destination)
+            path = ctx.find_path(marshal.location, destination)
 
         if not path:
             return None
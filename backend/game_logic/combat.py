@@ -7,13 +7,23 @@ Features:
 - Critical success/failure on natural 12/2
 - Skill-based advantage for better marshals
 - Variance while maintaining tactical superiority
+
+resolve_battle_core() is the numeric kernel (no string work);
+render_battle() builds the narrative only when a response needs it.
+The kernel also draws the narrative line, so the random stream is the
+same whether or not a battle is rendered.
 """
 
-from typing import Dict, Tuple, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional
 from backend.models.marshal import Marshal
 import random
 
 
+# Morale at or below which a surviving army is forced to retreat
+FORCED_RETREAT_THRESHOLD = 25
+
+
 def ordinal(n: int) -> str:
     """Convert number to ordinal string (1 -> '1st', 2 -> '2nd', etc.)."""
     if 11 <= (n % 100) <= 13:
@@ -23,6 +33,82 @@ def ordinal(n: int) -> str:
     return f"{n}{suffix}"
 
 
+@dataclass
+class BattleOutcome:
+    """
+    Compact numeric result of CombatResolver.resolve_battle_core().
+
+    Holds the numbers plus the few facts (stance, drill, fortify, ...) that
+    CombatResolver.render_battle() needs to build messages later.
+    """
+    attacker: str
+    defender: str
+    terrain: str
+    attacker_roll: Dict
+    flanking_bonus: int = 0
+    glorious_charge: bool = False
+    narrative_pick: int = 0  # Which roll-band line _get_combat_narrative uses
+
+    # Filled in once casualties are applied
+    outcome: str = ""
+    victor: Optional[str] = None
+    attacker_won: bool = False
+    attacker_lost: bool = False
+    attacker_casualties: int = 0
+    defender_casualties: int = 0
+    attacker_remaining: int = 0
+    defender_remaining: int = 0
+    attacker_morale: int = 0
+    defender_morale: int = 0
+    attacker_forced_retreat: bool = False
+    defender_forced_retreat: bool = False
+
+    # Narrative inputs (captured before state changes)
+    ability_name: Optional[str] = None
+    attacker_drill_bonus: float = 0
+    attacks_before: int = 0
+    attacker_stance: object = None
+    attacker_personality: str = "unknown"
+    attacker_modifier: float = 1.0
+    strength_ratio: float = 1.0
+    defender_fortify_bonus: float = 0
+    defender_was_drilling: bool = False
+    defender_stance: object = None
+    defender_personality: str = "unknown"
+    defender_modifier: float = 1.0
+    defender_outnumbered: bool = False
+    defender_holding: bool = False
+    reckless_cavalry: bool = False
+    old_recklessness: int = 0
+    new_recklessness: int = 0
+
+    def to_dict(self) -> Dict:
+        """Numeric part of the resolve_battle() result (no messages)."""
+        return {
+            "outcome": self.outcome,
+            "victor": self.victor,
+            "attacker": {
+                "name": self.attacker,
+                "casualties": self.attacker_casualties,
+                "remaining": self.attacker_remaining,
+                "morale": self.attacker_morale,
+                "forced_retreat": self.attacker_forced_retreat
+            },
+            "defender": {
+                "name": self.defender,
+                "casualties": self.defender_casualties,
+                "remaining": self.defender_remaining,
+                "morale": self.defender_morale,
+                "forced_retreat": self.defender_forced_retreat
+            },
+            "terrain": self.terrain,
+            "attacker_roll": self.attacker_roll,
+            "flanking_bonus": self.flanking_bonus,  # Phase 2.5: Flanking system
+            "glorious_charge": self.glorious_charge,  # Phase 3: Cavalry recklessness
+            "attacker_won": self.attacker_won,  # Phase 3: For recklessness tracking
+        }
+
+
 class CombatResolver:
     """
     Resolves battles between armies.
@@ -105,11 +191,17 @@ class CombatResolver:
             terrain: str = "open",
             flanking_bonus: int = 0,
             flanking_message: str = None,
-            glorious_charge: bool = False
+            glorious_charge: bool = False,
+            narrate: bool = True
     ) -> Dict:
         """
         Resolve a battle between two marshals using 2d6 dice system.
 
+        Runs the numeric kernel (resolve_battle_core) and renders its
+        narrative for human-facing responses. With narrate=False (battles
+        nobody reads the prose of, e.g. enemy AI turns) the result has the
+        same numbers and a one-line description instead.
+
         Args:
             attacker: The attacking marshal
             defender: The defending marshal
@@ -117,12 +209,94 @@ class CombatResolver:
             flanking_bonus: Coordination bonus from attacking from multiple directions (0-3)
             flanking_message: Message describing the flanking situation
             glorious_charge: If True, deals 2x damage dealt AND taken (cavalry recklessness)
+            narrate: If False, skip the narrative layer (see summarize_battle)
         """
+        outcome = self.resolve_battle_core(
+            attacker, defender,
+            terrain=terrain,
+            flanking_bonus=flanking_bonus,
+            glorious_charge=glorious_charge
+        )
+        if not narrate:
+            return self.summarize_battle(outcome, flanking_message=flanking_message)
+        return self.render_battle(outcome, flanking_message=flanking_message)
 
-        #print(f"\n BATTLE: {attacker.name} vs {defender.name}")
-        #print(f"   Attacker: {attacker.strength:,} troops, {attacker.morale}% morale")
-        #print(f"   Defender: {defender.strength:,} troops, {defender.morale}% morale")
+    def resolve_battle_core(
+            self,
+            attacker: Marshal,
+            defender: Marshal,
+            terrain: str = "open",
+            flanking_bonus: int = 0,
+            glorious_charge: bool = False
+    ) -> BattleOutcome:
+        """
+        Numeric battle kernel: dice, modifiers, casualties and state changes.
+
+        Applies everything resolve_battle() does to the marshals (casualties,
+        morale, drill consumption, counter-punch, recklessness) but builds no
+        messages. Headless callers (simulations, AI evaluation) use this
+        directly; render_battle() turns the outcome into the full result.
+        """
+        result, attacker_casualties, defender_casualties = self._compute_engagement(
+            attacker, defender, terrain, flanking_bonus, glorious_charge
+        )
+        return self._apply_battle_result(
+            attacker, defender, attacker_casualties, defender_casualties, result
+        )
+
+    def resolve_many(self, engagements: List[Dict], narrate: bool = True) -> List:
+        """
+        Resolve several engagements, one after another in list order.
 
+        Each engagement is a dict of resolve_battle() keyword arguments
+        (attacker, defender, and optionally terrain, flanking_bonus,
+        flanking_message, glorious_charge). Every engagement is computed
+        (_compute_engagement) and applied (_apply_battle_result) before the
+        next one starts, so a marshal fighting twice sees its losses and the
+        dice are drawn in the same order as sequential resolve_battle() calls.
+
+        Args:
+            engagements: Engagement dicts, resolved in list order
+            narrate: If False, return BattleOutcome objects without narrative
+
+        Returns:
+            One result per engagement, in order: resolve_battle() dicts when
+            narrate is True, otherwise BattleOutcome objects
+        """
+        results = []
+        for engagement in engagements:
+            attacker, defender = engagement["attacker"], engagement["defender"]
+            result, attacker_casualties, defender_casualties = self._compute_engagement(
+                attacker, defender,
+                engagement.get("terrain", "open"),
+                engagement.get("flanking_bonus", 0),
+                engagement.get("glorious_charge", False)
+            )
+            outcome = self._apply_battle_result(
+                attacker, defender, attacker_casualties, defender_casualties, result
+            )
+            if narrate:
+                outcome = self.render_battle(outcome, flanking_message=engagement.get("flanking_message"))
+            results.append(outcome)
+        return results
+
+    def _compute_engagement(
+            self,
+            attacker: Marshal,
+            defender: Marshal,
+            terrain: str,
+            flanking_bonus: int,
+            glorious_charge: bool
+    ) -> Tuple[BattleOutcome, int, int]:
+        """
+        Dice, modifiers and casualties for one engagement, before they are applied.
+
+        Consumes one-shot bonuses (drill, strategic bonuses) and cancels an
+        interrupted drill, but does not touch strength or morale.
+
+        Returns:
+            (partial BattleOutcome, attacker_casualties, defender_casualties)
+        """
         # Roll combat dice for attacker (flanking bonus adds to roll)
         attacker_roll = self.roll_combat_dice(attacker, flanking_bonus=int(flanking_bonus))
 
@@ -130,19 +304,12 @@ class CombatResolver:
         attacker_effective = self._calculate_effective_strength(attacker, is_attacker=True)
         defender_effective = self._calculate_effective_strength(defender, is_attacker=False)
 
-        #print(f"   Attacker effective: {attacker_effective:,.0f}")
-        #print(f"   Defender effective: {defender_effective:,.0f}")
-
         # Apply terrain modifiers
         terrain_bonus = self._get_terrain_bonus(terrain)
         defender_effective *= (1 + terrain_bonus)
 
-        #print(f"   Defender after terrain: {defender_effective:,.0f}")
-
-        # Calculate casualties with dice multiplier and skills
-        # Attacker's roll affects how much damage they deal to defender
-
         # Base casualties before skill modifiers
+        # Attacker's roll affects how much damage they deal to defender
         base_attacker_casualties = self._calculate_casualties(
             attacker.strength,
             defender_effective,
@@ -156,84 +323,30 @@ class CombatResolver:
         )
 
         # Apply SHOCK skill to attacker damage (increases damage dealt to defender)
-        # Higher shock = more casualties inflicted
         # shock_skill / 20 gives 0.05 to 0.50 bonus (5% to 50% more damage)
         attacker_shock = attacker.get_effective_skill("shock") if hasattr(attacker, 'get_effective_skill') else attacker.skills.get("shock", 5)
 
         # SIGNATURE ABILITY: Ney's "Bravest of the Brave" (Phase 2.3)
         # When attacking, Ney gets +2 Shock
-        ability_message = None
+        ability_name = None
         if hasattr(attacker, 'ability') and attacker.ability.get("trigger") == "when_attacking":
             # Check if this is an attack-triggering ability (currently only Ney has this)
             if attacker.ability.get("name") == "Bravest of the Brave":
                 attacker_shock += 2
-                ability_message = f"{attacker.name}'s '{attacker.ability['name']}' inspires the assault!"
+                ability_name = attacker.ability['name']
 
-        # ════════════════════════════════════════════════════════════
         # DRILL BONUS (Phase 2.6): +20% attack from drill training
-        # NOTE: Actual calculation is in marshal.get_attack_modifier()
-        # Save value for message generation, clear AFTER modifier is calculated
-        # ════════════════════════════════════════════════════════════
+        # Actual calculation is in marshal.get_attack_modifier(); save the value
+        # and clear it AFTER the modifier is calculated
         attacker_drill_bonus = getattr(attacker, 'shock_bonus', 0)
-        drill_bonus_message = None
-        if attacker_drill_bonus > 0:
-            drill_bonus_message = f"{attacker.name}'s drilled troops attack with +{attacker_drill_bonus * 10}% effectiveness!"
-
-        # ════════════════════════════════════════════════════════════
-        # EXHAUSTION MESSAGE (Phase 3 - Attack Spam Prevention)
-        # Check if attacker has made previous attacks this turn
-        # ════════════════════════════════════════════════════════════
-        exhaustion_message = None
-        attacks_this_turn = getattr(attacker, 'attacks_this_turn', 0)
-        if attacks_this_turn > 0:
-            # This is 2nd, 3rd, or 4th+ attack
-            penalty_map = {1: 10, 2: 20}  # 1 previous = 2nd attack = -10%, etc.
-            penalty = penalty_map.get(attacks_this_turn, 30)  # 3+ = -30%
-            attack_num = attacks_this_turn + 1
-            exhaustion_message = f"{attacker.name}'s troops are exhausted from repeated attacks! ({ordinal(attack_num)} attack: -{penalty}%)"
 
-        # ════════════════════════════════════════════════════════════
-        # STANCE & PERSONALITY MODIFIER (Phase 2.7/2.8): Apply attack modifiers
+        # STANCE & PERSONALITY MODIFIER (Phase 2.7/2.8)
         # NOTE: get_attack_modifier() includes stance, personality, AND drill bonus
-        # ════════════════════════════════════════════════════════════
-        attacker_stance_message = None
-        attacker_personality_message = None
-        attacker_stance_modifier = 1.0
-
-        # Calculate strength ratio for personality modifiers (Davout bad odds)
+        # Strength ratio feeds personality modifiers (Davout bad odds)
         strength_ratio = attacker.strength / defender.strength if defender.strength > 0 else float('inf')
-
+        attacker_stance_modifier = 1.0
         if hasattr(attacker, 'get_attack_modifier'):
             attacker_stance_modifier = attacker.get_attack_modifier(strength_ratio)
-            if attacker_stance_modifier != 1.0:
-                from backend.models.marshal import Stance
-                current_stance = getattr(attacker, 'stance', Stance.NEUTRAL)
-                personality = getattr(attacker, 'personality', 'unknown')
-
-                # Stance messages
-                if current_stance == Stance.AGGRESSIVE:
-                    attacker_stance_message = f"{attacker.name}'s AGGRESSIVE stance drives the assault! (+15% attack)"
-                elif current_stance == Stance.DEFENSIVE:
-                    attacker_stance_message = f"{attacker.name}'s DEFENSIVE stance hampers offensive operations (-10% attack)"
-
-                # Personality-specific messages
-                if personality == "aggressive":
-                    base_bonus = 15
-                    if current_stance == Stance.AGGRESSIVE:
-                        base_bonus += 5  # +5% additional
-                    if attacker_drill_bonus > 0:  # Use saved value
-                        base_bonus += 5  # +5% drill synergy
-                    if base_bonus > 15:
-                        attacker_personality_message = f"{attacker.name}'s aggression fuels the attack! (Bravest of the Brave: +{base_bonus}% total)"
-                    else:
-                        attacker_personality_message = f"{attacker.name} leads the charge! (Aggressive: +15% attack)"
-
-                elif personality == "cautious":
-                    if strength_ratio < 1.0:
-                        attacker_personality_message = f"{attacker.name} attacks cautiously at unfavorable odds. (Cautious: -10% attack)"
-                    if current_stance == Stance.AGGRESSIVE:
-                        if not attacker_personality_message:
-                            attacker_personality_message = f"{attacker.name} is hesitant in aggressive posture. (Cautious: -5% attack)"
 
         # Clear drill bonus AFTER modifier calculation (one-time use)
         if attacker_drill_bonus > 0:
@@ -247,86 +360,31 @@ class CombatResolver:
         shock_multiplier *= attacker_stance_modifier
 
         # Apply DEFENSE skill to defender protection (reduces casualties taken)
-        # Higher defense = fewer casualties taken
-        # defense_skill // 2 gives 0 to 5 percentage points of protection
         defender_defense = defender.get_effective_skill("defense") if hasattr(defender, 'get_effective_skill') else defender.skills.get("defense", 5)
 
-        # ════════════════════════════════════════════════════════════
-        # FORTIFY BONUS (Phase 2.6): Defense bonus from fortified position
-        # NOTE: Actual calculation is in marshal.get_defense_modifier()
-        # This section only generates the message for UI feedback
-        # ════════════════════════════════════════════════════════════
-        fortify_bonus_message = None
+        # FORTIFY BONUS (Phase 2.6): actual calculation is in marshal.get_defense_modifier()
         defender_fortify_bonus = getattr(defender, 'defense_bonus', 0)
-        if defender_fortify_bonus > 0:
-            fortify_percent = int(defender_fortify_bonus * 100)  # 0.16 → 16%
-            fortify_bonus_message = f"{defender.name}'s fortified position provides +{fortify_percent}% defense!"
 
-        # ════════════════════════════════════════════════════════════
         # DRILLING PENALTY (Phase 2.6): -25% defense when caught drilling
-        # NOTE: Actual penalty is in marshal.get_defense_modifier()
-        # This section handles state changes and message generation
-        # ════════════════════════════════════════════════════════════
-        drilling_penalty_message = None
-        is_drilling = getattr(defender, 'drilling', False) or getattr(defender, 'drilling_locked', False)
-        if is_drilling:
-            drilling_penalty_message = f"{defender.name}'s drill was interrupted by the attack! (-25% defense)"
-            # Cancel drill - they lose all progress (state change stays here)
+        # Actual penalty is in marshal.get_defense_modifier(); state change stays here
+        defender_was_drilling = getattr(defender, 'drilling', False) or getattr(defender, 'drilling_locked', False)
+        if defender_was_drilling:
+            # Cancel drill - they lose all progress
             defender.drilling = False
             defender.drilling_locked = False
             defender.drill_complete_turn = -1
             defender.shock_bonus = 0  # Clear any pending bonus
 
-        # ════════════════════════════════════════════════════════════
-        # STANCE & PERSONALITY MODIFIER (Phase 2.7/2.8): Apply defense modifiers
-        # ════════════════════════════════════════════════════════════
-        defender_stance_message = None
-        defender_personality_message = None
-        defender_stance_modifier = 1.0
-
         # Check if defender is outnumbered (for Davout bonus)
         is_outnumbered = defender.strength < attacker.strength
-
+        defender_stance_modifier = 1.0
         if hasattr(defender, 'get_defense_modifier'):
             defender_stance_modifier = defender.get_defense_modifier(is_outnumbered)
-            if defender_stance_modifier != 1.0 and not is_drilling:  # Don't double message if drilling
-                from backend.models.marshal import Stance
-                current_stance = getattr(defender, 'stance', Stance.NEUTRAL)
-                personality = getattr(defender, 'personality', 'unknown')
-
-                # Stance messages
-                if current_stance == Stance.DEFENSIVE:
-                    defender_stance_message = f"{defender.name}'s DEFENSIVE stance strengthens the line! (+15% defense)"
-                elif current_stance == Stance.AGGRESSIVE:
-                    defender_stance_message = f"{defender.name}'s AGGRESSIVE stance leaves flanks exposed (-10% defense)"
-
-                # Personality-specific messages
-                if personality == "aggressive":
-                    if current_stance == Stance.AGGRESSIVE:
-                        defender_personality_message = f"{defender.name}'s reckless aggression weakens defense! (Aggressive: -5% additional)"
-                    elif current_stance == Stance.DEFENSIVE:
-                        defender_personality_message = f"{defender.name} chafes at defensive duty. (Aggressive: +10% defense, not +15%)"
-
-                elif personality == "cautious":
-                    if current_stance == Stance.DEFENSIVE:
-                        defender_personality_message = f"{defender.name}'s methodical defense is exemplary! (Iron Marshal: +20% total)"
-                    if is_outnumbered:
-                        if not defender_personality_message:
-                            defender_personality_message = f"{defender.name} stands firm against superior numbers! (Cautious: +10% outnumbered)"
-                        else:
-                            defender_personality_message += f" Outnumbered bonus: +10%"
-
-                elif personality == "literal":
-                    is_holding = getattr(defender, 'holding_position', False)
-                    if is_holding:
-                        defender_personality_message = f"{defender.name} holds the position exactly as ordered! (Immovable: +15% defense)"
 
         defense_bonus = defender_defense / 20.0  # 0.05 to 0.50 (5% to 50% reduction)
-        # Apply stance modifier to defense - note: higher modifier = better defense (reduces casualties MORE)
         # defender_stance_modifier > 1 means better defense (e.g., 1.15 for defensive stance)
         defense_multiplier = (1.0 - defense_bonus) / defender_stance_modifier
 
-        # Calculate final casualties
         # Attacker takes casualties (reduced by their defense skill)
         attacker_defense = attacker.get_effective_skill("defense") if hasattr(attacker, 'get_effective_skill') else attacker.skills.get("defense", 5)
         attacker_defense_mult = 1.0 - (attacker_defense / 20.0)
@@ -340,26 +398,56 @@ class CombatResolver:
             * attacker_roll['multiplier']  # Dice roll affects damage
         )
 
-        # ════════════════════════════════════════════════════════════
         # GLORIOUS CHARGE (Phase 3): 2x damage dealt AND taken
-        # ════════════════════════════════════════════════════════════
-        glorious_charge_message = None
         if glorious_charge:
             attacker_casualties = int(attacker_casualties * 2)
             defender_casualties = int(defender_casualties * 2)
-            glorious_charge_message = f"🐴⚔️ GLORIOUS CHARGE! {attacker.name}'s cavalry deals devastating damage - but exposes themselves! (2x casualties both ways)"
 
-        #print(f"   💀 Casualties: {attacker.name} {attacker_casualties:,}, {defender.name} {defender_casualties:,}")
+        # Narrative line (one of three per roll band), drawn last so the
+        # random stream matches rendering right after each battle
+        narrative_pick = random.randrange(3)
+
+        return (
+            BattleOutcome(
+                attacker=attacker.name,
+                defender=defender.name,
+                terrain=terrain,
+                attacker_roll=attacker_roll,
+                flanking_bonus=int(flanking_bonus),
+                glorious_charge=glorious_charge,
+                narrative_pick=narrative_pick,
+                ability_name=ability_name,
+                attacker_drill_bonus=attacker_drill_bonus,
+                attacks_before=getattr(attacker, 'attacks_this_turn', 0),
+                attacker_stance=getattr(attacker, 'stance', None),
+                attacker_personality=getattr(attacker, 'personality', 'unknown'),
+                attacker_modifier=attacker_stance_modifier,
+                strength_ratio=strength_ratio,
+                defender_fortify_bonus=defender_fortify_bonus,
+                defender_was_drilling=defender_was_drilling,
+                defender_stance=getattr(defender, 'stance', None),
+                defender_personality=getattr(defender, 'personality', 'unknown'),
+                defender_modifier=defender_stance_modifier,
+                defender_outnumbered=is_outnumbered,
+                defender_holding=getattr(defender, 'holding_position', False),
+            ),
+            attacker_casualties,
+            defender_casualties
+        )
 
-        # Apply casualties FIRST (this was missing!)
-        #print(f"   BEFORE: {attacker.name}={attacker.strength:,}, {defender.name}={defender.strength:,}")
+    def _apply_battle_result(
+            self,
+            attacker: Marshal,
+            defender: Marshal,
+            attacker_casualties: int,
+            defender_casualties: int,
+            result: BattleOutcome
+    ) -> BattleOutcome:
+        """Apply casualties, morale, counter-punch and recklessness; fill in result."""
+        # Apply casualties FIRST, then determine victor
         attacker.take_casualties(attacker_casualties)
         defender.take_casualties(defender_casualties)
-        #print(f"   AFTER: {attacker.name}={attacker.strength:,}, {defender.name}={defender.strength:,}")
-
-        # Determine victor (AFTER applying casualties)
 
-        # Determine victor
         if attacker.strength <= 0 and defender.strength <= 0:
             victor = None
             outcome = "mutual_destruction"
@@ -410,9 +498,163 @@ class CombatResolver:
                     defender.counter_punch_turns = 2  # Survives one turn transition
                     print(f"  [COUNTER-PUNCH EARNED] {defender.name} held the line - can now attack for FREE!")
 
+        # FORCED RETREAT CHECK: Armies with critically low morale must retreat
+        attacker_forced_retreat = attacker.strength > 0 and attacker.morale <= FORCED_RETREAT_THRESHOLD
+        defender_forced_retreat = defender.strength > 0 and defender.morale <= FORCED_RETREAT_THRESHOLD
+
+        # CAVALRY RECKLESSNESS (Phase 3): Update attacker's recklessness
+        # - Increment on attack WIN (not glorious_charge, which resets)
+        # - Reset on attack LOSS
+        # - Glorious charge resets are handled in executor._execute_glorious_charge
+        attacker_won = outcome in ["attacker_victory", "attacker_tactical_victory"]
+        attacker_lost = outcome in ["defender_victory", "defender_tactical_victory", "mutual_destruction"]
+        reckless_cavalry = bool(getattr(attacker, 'is_reckless_cavalry', False))
+        old_recklessness = getattr(attacker, 'recklessness', 0)
+        if reckless_cavalry and not result.glorious_charge:
+            if attacker_won:
+                attacker._increment_recklessness()
+            elif attacker_lost and old_recklessness > 0:
+                attacker.reset_recklessness()
+
+        result.outcome = outcome
+        result.victor = victor.name if victor else None
+        result.attacker_won = attacker_won
+        result.attacker_lost = attacker_lost
+        result.attacker_casualties = int(attacker_casualties)
+        result.defender_casualties = int(defender_casualties)
+        result.attacker_remaining = int(attacker.strength)
+        result.defender_remaining = int(defender.strength)
+        result.attacker_morale = int(attacker.morale)
+        result.defender_morale = int(defender.morale)
+        result.attacker_forced_retreat = attacker_forced_retreat
+        result.defender_forced_retreat = defender_forced_retreat
+        result.reckless_cavalry = reckless_cavalry
+        result.old_recklessness = old_recklessness
+        result.new_recklessness = getattr(attacker, 'recklessness', 0)
+        return result
+
+    # ════════════════════════════════════════════════════════════
+    # NARRATIVE LAYER: Only runs when a human-facing result is built
+    # ════════════════════════════════════════════════════════════
+
+    def summarize_battle(self, result: BattleOutcome, flanking_message: str = None) -> Dict:
+        """
+        Result dict for an unrendered battle: resolve_battle()'s numbers with
+        a one-line description and no tactical messages.
+        """
+        battle = result.to_dict()
+        battle["flanking_message"] = flanking_message
+        battle["description"] = f"{result.attacker} vs {result.defender}: {result.outcome.replace('_', ' ')}."
+        return battle
+
+    def render_battle(self, result: BattleOutcome, flanking_message: str = None) -> Dict:
+        """
+        Build the full battle result dict (messages and description) from an outcome.
+
+        Returns the dict resolve_battle() has always returned.
+        """
+        from backend.models.marshal import Stance
+        attacker = result.attacker
+        defender = result.defender
+
+        ability_message = None
+        if result.ability_name:
+            ability_message = f"{attacker}'s '{result.ability_name}' inspires the assault!"
+
+        drill_bonus_message = None
+        if result.attacker_drill_bonus > 0:
+            drill_bonus_message = f"{attacker}'s drilled troops attack with +{result.attacker_drill_bonus * 10}% effectiveness!"
+
+        # EXHAUSTION MESSAGE (Phase 3 - Attack Spam Prevention)
+        exhaustion_message = None
+        if result.attacks_before > 0:
+            # This is 2nd, 3rd, or 4th+ attack
+            penalty_map = {1: 10, 2: 20}  # 1 previous = 2nd attack = -10%, etc.
+            penalty = penalty_map.get(result.attacks_before, 30)  # 3+ = -30%
+            attack_num = result.attacks_before + 1
+            exhaustion_message = f"{attacker}'s troops are exhausted from repeated attacks! ({ordinal(attack_num)} attack: -{penalty}%)"
+
+        attacker_stance_message = None
+        attacker_personality_message = None
+        if result.attacker_modifier != 1.0:
+            current_stance = result.attacker_stance if result.attacker_stance is not None else Stance.NEUTRAL
+            personality = result.attacker_personality
+
+            # Stance messages
+            if current_stance == Stance.AGGRESSIVE:
+                attacker_stance_message = f"{attacker}'s AGGRESSIVE stance drives the assault! (+15% attack)"
+            elif current_stance == Stance.DEFENSIVE:
+                attacker_stance_message = f"{attacker}'s DEFENSIVE stance hampers offensive operations (-10% attack)"
+
+            # Personality-specific messages
+            if personality == "aggressive":
+                base_bonus = 15
+                if current_stance == Stance.AGGRESSIVE:
+                    base_bonus += 5  # +5% additional
+                if result.attacker_drill_bonus > 0:
+                    base_bonus += 5  # +5% drill synergy
+                if base_bonus > 15:
+                    attacker_personality_message = f"{attacker}'s aggression fuels the attack! (Bravest of the Brave: +{base_bonus}% total)"
+                else:
+                    attacker_personality_message = f"{attacker} leads the charge! (Aggressive: +15% attack)"
+
+            elif personality == "cautious":
+                if result.strength_ratio < 1.0:
+                    attacker_personality_message = f"{attacker} attacks cautiously at unfavorable odds. (Cautious: -10% attack)"
+                if current_stance == Stance.AGGRESSIVE:
+                    if not attacker_personality_message:
+                        attacker_personality_message = f"{attacker} is hesitant in aggressive posture. (Cautious: -5% attack)"
+
+        fortify_bonus_message = None
+        if result.defender_fortify_bonus > 0:
+            fortify_percent = int(result.defender_fortify_bonus * 100)  # 0.16 → 16%
+            fortify_bonus_message = f"{defender}'s fortified position provides +{fortify_percent}% defense!"
+
+        drilling_penalty_message = None
+        if result.defender_was_drilling:
+            drilling_penalty_message = f"{defender}'s drill was interrupted by the attack! (-25% defense)"
+
+        defender_stance_message = None
+        defender_personality_message = None
+        if result.defender_modifier != 1.0 and not result.defender_was_drilling:  # Don't double message if drilling
+            current_stance = result.defender_stance if result.defender_stance is not None else Stance.NEUTRAL
+            personality = result.defender_personality
+
+            # Stance messages
+            if current_stance == Stance.DEFENSIVE:
+                defender_stance_message = f"{defender}'s DEFENSIVE stance strengthens the line! (+15% defense)"
+            elif current_stance == Stance.AGGRESSIVE:
+                defender_stance_message = f"{defender}'s AGGRESSIVE stance leaves flanks exposed (-10% defense)"
+
+            # Personality-specific messages
+            if personality == "aggressive":
+                if current_stance == Stance.AGGRESSIVE:
+                    defender_personality_message = f"{defender}'s reckless aggression weakens defense! (Aggressive: -5% additional)"
+                elif current_stance == Stance.DEFENSIVE:
+                    defender_personality_message = f"{defender} chafes at defensive duty. (Aggressive: +10% defense, not +15%)"
+
+            elif personality == "cautious":
+                if current_stance == Stance.DEFENSIVE:
+                    defender_personality_message = f"{defender}'s methodical defense is exemplary! (Iron Marshal: +20% total)"
+                if result.defender_outnumbered:
+                    if not defender_personality_message:
+                        defender_personality_message = f"{defender} stands firm against superior numbers! (Cautious: +10% outnumbered)"
+                    else:
+                        defender_personality_message += f" Outnumbered bonus: +10%"
+
+            elif personality == "literal":
+                if result.defender_holding:
+                    defender_personality_message = f"{defender} holds the position exactly as ordered! (Immovable: +15% defense)"
+
+        glorious_charge_message = None
+        if result.glorious_charge:
+            glorious_charge_message = f"🐴⚔️ GLORIOUS CHARGE! {attacker}'s cavalry deals devastating damage - but exposes themselves! (2x casualties both ways)"
+
         # Build description with tactical state messages
         base_description = self._generate_description(
-            attacker, defender, outcome, attacker_casualties, defender_casualties, attacker_roll
+            attacker, defender, result.outcome,
+            result.attacker_casualties, result.defender_casualties, result.attacker_roll,
+            result.narrative_pick
         )
 
         # Prepend tactical state messages if applicable
@@ -438,86 +680,38 @@ class CombatResolver:
         if tactical_prefix:
             tactical_prefix += "\n"
 
-        # ════════════════════════════════════════════════════════════════
-        # FORCED RETREAT CHECK: Armies with critically low morale must retreat
-        # Threshold: 25% morale triggers forced retreat
-        # ════════════════════════════════════════════════════════════════
-        FORCED_RETREAT_THRESHOLD = 25
-        attacker_forced_retreat = (
-            attacker.strength > 0 and
-            attacker.morale <= FORCED_RETREAT_THRESHOLD
-        )
-        defender_forced_retreat = (
-            defender.strength > 0 and
-            defender.morale <= FORCED_RETREAT_THRESHOLD
-        )
-
         # Add forced retreat message to description if applicable
         retreat_message = ""
-        if attacker_forced_retreat:
-            retreat_message += f"\n\n⚠️ {attacker.name}'s troops are BROKEN (morale {int(attacker.morale)}%)! FORCED RETREAT!"
-        if defender_forced_retreat:
-            retreat_message += f"\n\n⚠️ {defender.name}'s troops are BROKEN (morale {int(defender.morale)}%)! FORCED RETREAT!"
+        if result.attacker_forced_retreat:
+            retreat_message += f"\n\n⚠️ {attacker}'s troops are BROKEN (morale {result.attacker_morale}%)! FORCED RETREAT!"
+        if result.defender_forced_retreat:
+            retreat_message += f"\n\n⚠️ {defender}'s troops are BROKEN (morale {result.defender_morale}%)! FORCED RETREAT!"
 
-        # ════════════════════════════════════════════════════════════
-        # CAVALRY RECKLESSNESS (Phase 3): Update attacker's recklessness
-        # - Increment on attack WIN (not glorious_charge, which resets)
-        # - Reset on attack LOSS
-        # - Glorious charge resets are handled in executor._execute_glorious_charge
-        # ════════════════════════════════════════════════════════════
         recklessness_message = None
-        attacker_won = outcome in ["attacker_victory", "attacker_tactical_victory"]
-        attacker_lost = outcome in ["defender_victory", "defender_tactical_victory", "mutual_destruction"]
-
-        if hasattr(attacker, 'is_reckless_cavalry') and attacker.is_reckless_cavalry:
-            old_recklessness = getattr(attacker, 'recklessness', 0)
-
-            if glorious_charge:
+        if result.reckless_cavalry:
+            old_recklessness = result.old_recklessness
+            new_recklessness = result.new_recklessness
+            if result.glorious_charge:
                 # Glorious charge: reset handled in executor (already done before this call)
-                # But add message for clarity
-                recklessness_message = f"[{attacker.name}'s recklessness resets after Glorious Charge]"
-            elif attacker_won:
-                # Won as attacker (not charge): increment
-                attacker._increment_recklessness()
-                new_recklessness = getattr(attacker, 'recklessness', 0)
+                recklessness_message = f"[{attacker}'s recklessness resets after Glorious Charge]"
+            elif result.attacker_won:
                 if new_recklessness > old_recklessness:
                     if new_recklessness == 1:
-                        recklessness_message = f"🐴 {attacker.name}'s blood is up! (Recklessness: {new_recklessness})"
+                        recklessness_message = f"🐴 {attacker}'s blood is up! (Recklessness: {new_recklessness})"
                     elif new_recklessness == 2:
-                        recklessness_message = f"🐴 {attacker.name} is building momentum! (Recklessness: {new_recklessness})"
+                        recklessness_message = f"🐴 {attacker} is building momentum! (Recklessness: {new_recklessness})"
                     elif new_recklessness == 3:
-                        recklessness_message = f"🐴⚠️ {attacker.name}'s recklessness is dangerous! Glorious Charge popup next attack. (Recklessness: {new_recklessness})"
+                        recklessness_message = f"🐴⚠️ {attacker}'s recklessness is dangerous! Glorious Charge popup next attack. (Recklessness: {new_recklessness})"
                     else:  # 4+
-                        recklessness_message = f"🐴🔥 {attacker.name} is UNCONTROLLABLE! Will auto-charge at next turn start! (Recklessness: {new_recklessness})"
-            elif attacker_lost:
-                # Lost as attacker: reset
-                if old_recklessness > 0:
-                    attacker.reset_recklessness()
-                    recklessness_message = f"🐴 {attacker.name}'s momentum broken by defeat. (Recklessness: {old_recklessness} → 0)"
+                        recklessness_message = f"🐴🔥 {attacker} is UNCONTROLLABLE! Will auto-charge at next turn start! (Recklessness: {new_recklessness})"
+            elif result.attacker_lost and old_recklessness > 0:
+                recklessness_message = f"🐴 {attacker}'s momentum broken by defeat. (Recklessness: {old_recklessness} → 0)"
 
         if recklessness_message:
             retreat_message += f"\n\n{recklessness_message}"
 
-        # THIS RETURN MUST BE HERE!
-        return {
-            "outcome": outcome,
-            "victor": victor.name if victor else None,
-            "attacker": {
-                "name": attacker.name,
-                "casualties": int(attacker_casualties),
-                "remaining": int(attacker.strength),
-                "morale": int(attacker.morale),
-                "forced_retreat": attacker_forced_retreat
-            },
-            "defender": {
-                "name": defender.name,
-                "casualties": int(defender_casualties),
-                "remaining": int(defender.strength),
-                "morale": int(defender.morale),
-                "forced_retreat": defender_forced_retreat
-            },
-            "terrain": terrain,
-            "attacker_roll": attacker_roll,
+        battle = result.to_dict()
+        battle.update({
             "ability_triggered": ability_message,  # Phase 2.3: Signature abilities
             "drill_bonus_triggered": drill_bonus_message,  # Phase 2.6: Drill bonus
             "fortify_bonus_triggered": fortify_bonus_message,  # Phase 2.6: Fortify bonus
@@ -526,13 +720,10 @@ class CombatResolver:
             "defender_stance_triggered": defender_stance_message,  # Phase 2.7: Stance system
             "attacker_personality_triggered": attacker_personality_message,  # Phase 2.8: Personality abilities
             "defender_personality_triggered": defender_personality_message,  # Phase 2.8: Personality abilities
-            "flanking_bonus": int(flanking_bonus),  # Phase 2.5: Flanking system
             "flanking_message": flanking_message,
-            "glorious_charge": glorious_charge,  # Phase 3: Cavalry recklessness
-            "attacker_won": attacker_won,  # Phase 3: For recklessness tracking
             "description": tactical_prefix + base_description + retreat_message
-        }
-        # ... rest of existing code ...
+        })
+        return battle
 
     def _calculate_effective_strength(self, marshal: Marshal, is_attacker: bool) -> float:
         """Calculate effective combat strength considering morale."""
@@ -589,10 +780,8 @@ class CombatResolver:
 
         return casualties
 
-    def _get_combat_narrative(self, attacker_name: str, roll_modified: int, is_critical_success: bool, is_critical_failure: bool) -> str:
-        """Generate narrative description based on roll quality."""
-        import random
-
+    def _get_combat_narrative(self, attacker_name: str, roll_modified: int, is_critical_success: bool, is_critical_failure: bool, pick: int = 0) -> str:
+        """Generate narrative description based on roll quality (pick: line 0-2)."""
         if is_critical_success:
             narratives = [
                 f"{attacker_name} executes a brilliant maneuver!",
@@ -624,61 +813,63 @@ class CombatResolver:
                 f"{attacker_name}'s attack meets fierce resistance."
             ]
 
-        return random.choice(narratives)
+        return narratives[pick]
 
     def _generate_description(
             self,
-            attacker: Marshal,
-            defender: Marshal,
+            attacker_name: str,
+            defender_name: str,
             outcome: str,
             atk_casualties: int,
             def_casualties: int,
-            attacker_roll: Dict
+            attacker_roll: Dict,
+            narrative_pick: int = 0
     ) -> str:
         """Generate narrative description of battle without exposing dice mechanics."""
         # Get narrative based on roll quality (no numbers shown)
         narrative = self._get_combat_narrative(
-            attacker.name,
+            attacker_name,
             attacker_roll['modified'],
             attacker_roll['is_critical_success'],
-            attacker_roll['is_critical_failure']
+            attacker_roll['is_critical_failure'],
+            narrative_pick
         )
 
         # Build outcome description with narrative
         descriptions = {
             "attacker_victory": (
                 f"{narrative} "
-                f"{attacker.name} decisively defeats {defender.name}! "
-                f"{defender.name}'s army is destroyed. "
-                f"{attacker.name} suffered {atk_casualties:,} casualties."
+                f"{attacker_name} decisively defeats {defender_name}! "
+                f"{defender_name}'s army is destroyed. "
+                f"{attacker_name} suffered {atk_casualties:,} casualties."
             ),
             "defender_victory": (
                 f"{narrative} "
-                f"{defender.name} repels the assault! "
-                f"{attacker.name}'s army is shattered. "
-                f"{defender.name} suffered {def_casualties:,} casualties."
+                f"{defender_name} repels the assault! "
+                f"{attacker_name}'s army is shattered. "
+                f"{defender_name} suffered {def_casualties:,} casualties."
             ),
             "attacker_tactical_victory": (
                 f"{narrative} "
-                f"{attacker.name} gains the advantage over {defender.name}. "
-                f"Casualties: {attacker.name} {atk_casualties:,}, {defender.name} {def_casualties:,}. "
+                f"{attacker_name} gains the advantage over {defender_name}. "
+                f"Casualties: {attacker_name} {atk_casualties:,}, {defender_name} {def_casualties:,}. "
                 f"Both armies remain in the field."
             ),
             "defender_tactical_victory": (
                 f"{narrative} "
-                f"{defender.name} holds the line. "
-                f"Casualties: {attacker.name} {atk_casualties:,}, {defender.name} {def_casualties:,}. "
+                f"{defender_name} holds the line. "
+                f"Casualties: {attacker_name} {atk_casualties:,}, {defender_name} {def_casualties:,}. "
                 f"Both armies remain in the field."
             ),
             "stalemate": (
                 f"{narrative} "
-                f"Brutal stalemate between {attacker.name} and {defender.name}. "
-                f"Heavy casualties on both sides: {attacker.name} {atk_casualties:,}, "
-                f"{defender.name} {def_casualties:,}."
+                f"Brutal stalemate between {attacker_name} and {defender_name}. "
+                f"Heavy casualties on both sides: {attacker_name} {atk_casualties:,}, "
+                f"{defender_name} {def_casualties:,}."
             ),
             "mutual_destruction": (
                 f"{narrative} "
-                f"Catastrophic battle! Both {attacker.name} and {defender.name} "
+                f"Catastrophic battle! Both {attacker_name} and {defender_name} "
                 f"annihilate each other. No survivors."
             )
         }
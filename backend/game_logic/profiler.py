@@ -0,0 +1,211 @@
+"""
+Turn Profiler for Project Sovereign
+
+Wall-time and call-count breakdown of end_turn(), grouped as:
+- phases:  end_turn and advance_turn phases (enemy phase, strategic orders,
+           tactical states, income, ...)
+- nations: each enemy nation's turn
+- ai:      EnemyAI priority handlers (_check_threats, _find_attack_opportunity, ...)
+
+TurnManager.end_turn() runs inside a TurnProfiler; instrumented code calls
+profile_phase() or is decorated with @profiled. With no profiler active
+(unit tests calling the AI directly, tools) both are a context-variable
+lookup and nothing else.
+
+Timings are inclusive: a handler that calls another handler counts the
+inner call in both rows.
+
+Every profiled turn is folded into TURN_METRICS (served by /metrics).
+A single turn's breakdown is returned under "timings" when the caller
+opts in with game_state["include_timings"].
+"""
+
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+GROUPS = ("phases", "nations", "ai")
+
+_active: ContextVar[Optional["TurnProfiler"]] = ContextVar("turn_profiler", default=None)
+
+
+class _PhaseTimer:
+    """Adds one call and its wall time to a [calls, seconds] slot."""
+
+    __slots__ = ("slot", "start")
+
+    def __init__(self, slot: List[float]):
+        self.slot = slot
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.slot[0] += 1
+        self.slot[1] += time.perf_counter() - self.start
+        return False
+
+
+class _NullTimer:
+    """Stand-in when no profiler is active."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class TurnProfiler:
+    """
+    Timings for one end_turn() call.
+
+    Use as a context manager: entering makes it the active profiler for
+    the current thread/task, leaving records the total wall time.
+    """
+
+    def __init__(self):
+        self.slots: Dict[Tuple[str, str], List[float]] = {}
+        self.total = 0.0
+        self._start = 0.0
+        self._token = None
+
+    def __enter__(self):
+        self._token = _active.set(self)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total = time.perf_counter() - self._start
+        _active.reset(self._token)
+        self._token = None
+        return False
+
+    def phase(self, name: str, group: str = "phases") -> _PhaseTimer:
+        """Timer for one call of a named phase."""
+        key = (group, name)
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.slots[key] = [0, 0.0]
+        return _PhaseTimer(slot)
+
+    def seconds(self, name: str, group: str = "phases") -> Optional[float]:
+        """Total seconds recorded for a phase, or None if it never ran."""
+        slot = self.slots.get((group, name))
+        return slot[1] if slot else None
+
+    def to_dict(self) -> Dict:
+        """{"total_ms", "phases": {name: {"calls", "ms"}}, "nations": ..., "ai": ...}"""
+        result = {"total_ms": round(self.total * 1000, 3)}
+        for group in GROUPS:
+            result[group] = {}
+        for (group, name), (calls, seconds) in self.slots.items():
+            result[group][name] = {"calls": int(calls), "ms": round(seconds * 1000, 3)}
+        return result
+
+
+def get_active_profiler() -> Optional[TurnProfiler]:
+    """The profiler for the turn being processed, if any."""
+    return _active.get()
+
+
+def profile_phase(name: str, group: str = "phases"):
+    """
+    Context manager timing a block under the active profiler.
+
+    Args:
+        name: Row name (e.g. "enemy_phase", "Britain", "_check_threats")
+        group: One of GROUPS
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _NULL_TIMER
+    return profiler.phase(name, group)
+
+
+def profiled(name: Optional[str] = None, group: str = "ai") -> Callable:
+    """Decorator: time every call of the function (default row = function name)."""
+    def decorate(func: Callable) -> Callable:
+        row = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active.get()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.phase(row, group):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorate
+
+
+class TurnMetrics:
+    """Cross-turn aggregate of TurnProfiler results (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every recorded turn."""
+        with self._lock:
+            self.turns = 0
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+            # (group, name) -> [calls, seconds, max seconds in one turn]
+            self.rows: Dict[Tuple[str, str], List[float]] = {}
+
+    def record(self, profiler: TurnProfiler) -> None:
+        """Fold one finished turn into the aggregate."""
+        with self._lock:
+            self.turns += 1
+            self.total_seconds += profiler.total
+            self.max_seconds = max(self.max_seconds, profiler.total)
+            for key, (calls, seconds) in profiler.slots.items():
+                row = self.rows.get(key)
+                if row is None:
+                    row = self.rows[key] = [0, 0.0, 0.0]
+                row[0] += calls
+                row[1] += seconds
+                row[2] = max(row[2], seconds)
+
+    def snapshot(self) -> Dict:
+        """
+        Aggregated timings across every recorded turn.
+
+        Returns:
+            {"turns", "total_ms", "mean_ms", "max_ms",
+             "phases"/"nations"/"ai": {name: {"calls", "total_ms", "mean_ms_per_turn", "max_ms"}}}
+        """
+        with self._lock:
+            turns = self.turns
+            result = {
+                "turns": turns,
+                "total_ms": round(self.total_seconds * 1000, 3),
+                "mean_ms": round(self.total_seconds * 1000 / turns, 3) if turns else 0.0,
+                "max_ms": round(self.max_seconds * 1000, 3),
+            }
+            for group in GROUPS:
+                result[group] = {}
+            for (group, name), (calls, seconds, max_seconds) in self.rows.items():
+                result[group][name] = {
+                    "calls": int(calls),
+                    "total_ms": round(seconds * 1000, 3),
+                    "mean_ms_per_turn": round(seconds * 1000 / turns, 3),
+                    "max_ms": round(max_seconds * 1000, 3),
+                }
+            return result
+
+
+# Process-wide aggregate (one game per server process)
+TURN_METRICS = TurnMetrics()
@@ -17,11 +17,24 @@ Strategic orders process at START of player turn:
 3. BEFORE player can issue new commands
 
 Add _process_strategic_orders() method that calls StrategicExecutor.
+
+STREAMING:
+If game_state carries an "on_turn_event" callback, end_turn() pushes each
+enemy action, strategic report, tactical event and independent command
+entry to it as soon as it is produced (see /end_turn/stream in main.py).
+The returned result dict is unchanged.
+
+PROFILING:
+end_turn() runs under a TurnProfiler (backend/game_logic/profiler.py).
+Per-phase, per-nation and per-AI-handler wall time is aggregated for
+/metrics and returned under "timings" when game_state["include_timings"].
 """
 
 from typing import Dict, List, Optional
 from backend.models.world_state import WorldState
 from backend.commands.strategic import StrategicExecutor
+from backend.game_logic.profiler import TURN_METRICS, TurnProfiler, profile_phase
+from backend.utils.metrics import ENEMY_PHASE_SECONDS
 
 
 class TurnManager:
@@ -40,6 +53,18 @@ class TurnManager:
         self.world = world
         self.executor = executor  # CommandExecutor for strategic orders (Phase 5.2)
 
+    @staticmethod
+    def _emit(game_state: Optional[Dict], event: Dict) -> None:
+        """Push a turn event to the streaming callback, if one is attached."""
+        on_event = game_state.get("on_turn_event") if game_state else None
+        if on_event:
+            on_event(event)
+
+    def _emit_tactical_events(self, game_state: Optional[Dict], tactical_events: List[Dict]) -> None:
+        """Stream tactical events processed during advance_turn()."""
+        for event in tactical_events:
+            self._emit(game_state, {"type": "tactical_event", "event": event})
+
     def start_turn(self) -> Dict:
         """
         Start a new turn.
@@ -65,6 +90,27 @@ class TurnManager:
         }
 
     def end_turn(self, game_state: Optional[Dict] = None) -> Dict:
+        """
+        End turn and advance (profiled; see _end_turn for the phases).
+
+        Wall time per phase, enemy nation and AI handler is folded into
+        TURN_METRICS. If game_state["include_timings"] is set, this turn's
+        breakdown is also returned under "timings".
+
+        Args:
+            game_state: Game state dict for executor (required for enemy AI)
+        """
+        with TurnProfiler() as profiler:
+            result = self._end_turn(game_state)
+        TURN_METRICS.record(profiler)
+        enemy_phase_seconds = profiler.seconds("enemy_phase")
+        if enemy_phase_seconds is not None:
+            ENEMY_PHASE_SECONDS.observe(enemy_phase_seconds)
+        if game_state and game_state.get("include_timings"):
+            result["timings"] = profiler.to_dict()
+        return result
+
+    def _end_turn(self, game_state: Optional[Dict] = None) -> Dict:
         """
         End turn and advance.
 
@@ -84,14 +130,17 @@ class TurnManager:
         # BUG #2 FIX: CHECK VICTORY BEFORE ENEMY PHASE
         # If game is already over (player won/lost), skip enemy phase
         # ════════════════════════════════════════════════════════════
-        pre_enemy_victory_check = self._check_victory_conditions()
+        with profile_phase("victory_check"):
+            pre_enemy_victory_check = self._check_victory_conditions()
         if pre_enemy_victory_check["game_over"]:
             print(f"\n[GAME OVER] {pre_enemy_victory_check['reason']} - skipping enemy phase")
             self.world.game_over = True
             self.world.victory = pre_enemy_victory_check["result"]
             # Skip to turn advancement without enemy phase
-            self.world.advance_turn()
+            with profile_phase("advance_turn"):
+                self.world.advance_turn()
             tactical_events = self.world.get_last_tactical_events()
+            self._emit_tactical_events(game_state, tactical_events)
             return {
                 "turn_ended": old_turn,
                 "next_turn": self.world.current_turn,
@@ -105,7 +154,8 @@ class TurnManager:
         # ════════════════════════════════════════════════════════════
         enemy_phase_results = None
         if game_state:
-            enemy_phase_results = self._process_enemy_turns(game_state)
+            with profile_phase("enemy_phase"):
+                enemy_phase_results = self._process_enemy_turns(game_state)
             # Store for later retrieval if needed
             self.world._last_enemy_phase_results = enemy_phase_results
 
@@ -116,8 +166,10 @@ class TurnManager:
                 self.world.game_over = True
                 self.world.victory = "defeat"
                 # Still advance turn but game is over
-                self.world.advance_turn()
+                with profile_phase("advance_turn"):
+                    self.world.advance_turn()
                 tactical_events = self.world.get_last_tactical_events()
+                self._emit_tactical_events(game_state, tactical_events)
                 return {
                     "turn_ended": old_turn,
                     "next_turn": self.world.current_turn,
@@ -140,8 +192,11 @@ class TurnManager:
         strategic_reports = []
         if game_state and hasattr(self, 'executor'):
             strategic_exec = StrategicExecutor(self.executor)
-            strategic_reports = strategic_exec.process_strategic_orders(
-                self.world, game_state)
+            with profile_phase("strategic_orders"):
+                strategic_reports = strategic_exec.process_strategic_orders(
+                    self.world, game_state)
+            for report in strategic_reports:
+                self._emit(game_state, {"type": "strategic_report", "report": report})
 
         # ════════════════════════════════════════════════════════════
         # ADVANCE TURN (includes tactical state processing!)
@@ -150,13 +205,15 @@ class TurnManager:
         # - Income application
         # - Action reset
         # ════════════════════════════════════════════════════════════
-        self.world.advance_turn()
+        with profile_phase("advance_turn"):
+            self.world.advance_turn()
 
         # Get tactical events that were processed during advance
         tactical_events = self.world.get_last_tactical_events()
         print(f"[TURN_MANAGER DEBUG] Retrieved {len(tactical_events)} tactical events")
         for i, evt in enumerate(tactical_events):
             print(f"  Event {i}: type={evt.get('type')}, has_message={bool(evt.get('message'))}")
+        self._emit_tactical_events(game_state, tactical_events)
 
         # ════════════════════════════════════════════════════════════
         # AUTONOMOUS MARSHALS: Process at START of new turn (Phase 2.5)
@@ -165,10 +222,12 @@ class TurnManager:
         # ════════════════════════════════════════════════════════════
         autonomous_report = None
         if game_state:
-            autonomous_report = self._process_autonomous_marshals(game_state)
+            with profile_phase("autonomous_marshals"):
+                autonomous_report = self._process_autonomous_marshals(game_state)
 
         # Check victory/defeat conditions
-        victory_check = self._check_victory_conditions()
+        with profile_phase("victory_check"):
+            victory_check = self._check_victory_conditions()
 
         if victory_check["game_over"]:
             self.world.game_over = True
@@ -328,6 +387,7 @@ class TurnManager:
                 print(f"\n  ✅ AUTONOMY ENDED: {end_result['message']}")
 
             report.append(report_entry)
+            self._emit(game_state, {"type": "independent_command", "entry": report_entry})
 
         return {
             "show_independent_command_report": True,
@@ -457,8 +517,14 @@ class TurnManager:
                 results["summary"].append(f"{nation}: No marshals (eliminated?)")
                 continue
 
-            # Process this nation's turn
-            nation_results = ai.process_nation_turn(nation, self.world, game_state)
+            # Process this nation's turn (streaming each action if requested)
+            self._emit(game_state, {"type": "nation_turn", "nation": nation})
+            with profile_phase(nation, group="nations"):
+                nation_results = ai.process_nation_turn(
+                    nation, self.world, game_state,
+                    on_action=lambda action, nation=nation: self._emit(
+                        game_state, {"type": "enemy_action", "nation": nation, "action": action})
+                )
 
             results["nations"][nation] = {
                 "actions": nation_results,
@@ -496,18 +562,17 @@ class TurnManager:
             Dict with victory info, or None if no enemy victory
         """
         for nation in self.world.enemy_nations:
-            regions = self.world.get_nation_regions(nation)
-            if len(regions) >= 8:
+            region_count = self.world.get_nation_region_count(nation)
+            if region_count >= 8:
                 return {
                     "nation": nation,
-                    "regions_controlled": len(regions),
-                    "message": f"{nation} has conquered Europe! They control {len(regions)} regions."
+                    "regions_controlled": region_count,
+                    "message": f"{nation} has conquered Europe! They control {region_count} regions."
                 }
         return None
 
     def _generate_situation_report(self) -> Dict:
         """Generate situation report for player."""
-        player_regions = self.world.get_player_regions()
         player_marshals = self.world.get_player_marshals()
 
         # Calculate total military strength
@@ -515,7 +580,7 @@ class TurnManager:
         avg_morale = sum(m.morale for m in player_marshals) / len(player_marshals) if player_marshals else 0
 
         return {
-            "regions_controlled": len(player_regions),
+            "regions_controlled": self.world.get_nation_region_count(self.world.player_nation),
             "total_military_strength": total_strength,
             "average_morale": int(avg_morale),
             "marshals": [
@@ -541,11 +606,12 @@ class TurnManager:
         - Lose Paris (capital lost)
         - All marshals destroyed
         """
-        player_regions = self.world.get_player_regions()
+        player_nation = self.world.player_nation
+        region_count = self.world.get_nation_region_count(player_nation)
         player_marshals = self.world.get_player_marshals()
 
         # Check defeat conditions first
-        if "Paris" not in player_regions:
+        if not self.world.controls_region(player_nation, "Paris"):
             return {
                 "game_over": True,
                 "result": "defeat",
@@ -560,7 +626,7 @@ class TurnManager:
             }
 
         # Check victory conditions
-        if len(player_regions) >= 12:  # All regions
+        if region_count >= 12:  # All regions
             return {
                 "game_over": True,
                 "result": "victory",
@@ -569,7 +635,7 @@ class TurnManager:
 
         if self.world.current_turn > self.world.max_turns:
             # Already handled in world.advance_turn(), but check here too
-            if len(player_regions) >= 8:
+            if region_count >= 8:
                 return {
                     "game_over": True,
                     "result": "victory",
@@ -596,7 +662,7 @@ class TurnManager:
             "max_turns": self.world.max_turns,
             "turns_remaining": self.world.max_turns - self.world.current_turn,
             "gold": self.world.gold,
-            "regions": len(self.world.get_player_regions()),
+            "regions": self.world.get_nation_region_count(self.world.player_nation),
             "game_over": self.world.game_over,
             "victory": self.world.victory
         }
@@ -3,18 +3,30 @@ FastAPI server for Project Sovereign
 Connects Godot frontend to Python game logic
 """
 
+import asyncio
+import json
 import os
+import contextvars
+import time
 from dotenv import load_dotenv
 
 # Load .env BEFORE any imports that might read env vars
 load_dotenv()
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 from backend.commands.parser import CommandParser
 from backend.commands.executor import CommandExecutor
+from backend.commands.speculation import SpeculativeRunner
+from backend.commands.dispatch import parse_meta_command, route_interrupt
+from backend.ai.llm_client import LazyGameState, last_parse_path
+from backend.game_logic.profiler import TURN_METRICS
+from backend.utils.field_projection import parse_fields
+from backend.utils.metrics import HTTP_REQUEST_SECONDS, REGISTRY, process_max_rss_bytes
 from backend.models.world_state import WorldState
 
 # ════════════════════════════════════════════════════════════
@@ -41,8 +53,22 @@ executor = CommandExecutor()
 world = WorldState(player_nation="France")
 game_state = {"world": world, "debug_mode": DEBUG_MODE}
 
+# Opt-in: execute the fast parse on a forked world while the LLM fallback is
+# in flight, committing it if the LLM agrees (see commands/speculation.py)
+speculator = (SpeculativeRunner(parser, executor)
+              if os.getenv("LLM_SPECULATIVE", "0") == "1" and parser.llm.use_real_api else None)
+
 
 def get_llm_game_state() -> dict:
+    """
+    Game state dict for the LLM prompt, cached per world state version.
+
+    Callers must not mutate the result (see WorldState.get_derived).
+    """
+    return world.get_derived("llm_game_state", _build_llm_game_state)
+
+
+def _build_llm_game_state() -> dict:
     """
     Build game state dict in the format expected by prompt_builder.
 
@@ -102,8 +128,58 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Observe request latency per route template (streams: time to first byte)."""
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    HTTP_REQUEST_SECONDS.labels(request.method, getattr(route, "path", "unmatched")).observe(
+        time.perf_counter() - start)
+    return response
+
+
+# Per-request game_state projection from ?fields= / ?profile= (None = full summary)
+_state_fields: contextvars.ContextVar = contextvars.ContextVar("state_fields", default=None)
+
+
+@app.middleware("http")
+async def project_game_state(request: Request, call_next):
+    """Parse ?fields= / ?profile= once; 400 on an unknown field or profile."""
+    try:
+        fields = parse_fields(request.query_params.get("fields"),
+                              request.query_params.get("profile"))
+    except ValueError as e:
+        return JSONResponse({"detail": str(e)}, status_code=400)
+    _state_fields.set(fields)
+    return await call_next(request)
+
+
+def _state_summary() -> dict:
+    """world.get_game_state_summary() projected to the request's fields."""
+    return world.get_game_state_summary(_state_fields.get())
+
+
+def _session_metrics():
+    """Scrape-time session gauges (this server hosts a single game session)."""
+    state_bytes = world.get_derived(
+        "metrics.state_bytes", lambda: len(json.dumps(jsonable_encoder(world.to_dict()))))
+    yield ("sovereign_active_sessions", "gauge", "Game sessions held in memory", [({}, 1)])
+    yield ("sovereign_session_state_bytes", "gauge",
+           "Serialized size of each session's world state (re-measured when the state changes)",
+           [({"session": "default"}, state_bytes)])
+    rss = process_max_rss_bytes()
+    if rss is not None:
+        yield ("sovereign_process_max_rss_bytes", "gauge", "Peak resident memory of the server",
+               [({}, rss)])
+
+
+REGISTRY.register_collector(_session_metrics)
+
+
 class CommandRequest(BaseModel):
     command: str
+    timings: bool = False  # Opt-in: return end-turn phase timings under "timings"
 
 
 class ObjectionResponse(BaseModel):
@@ -137,13 +213,19 @@ def test_connection():
         "turn": int(world.current_turn),
         "gold": int(world.gold),
         "action_summary": world.get_action_summary(),
-        "game_state": world.get_game_state_summary()
+        "game_state": _state_summary()
     }
 
 
 @app.post("/command")
-def execute_command(request: CommandRequest):
-    """Execute a game command and return result."""
+def execute_command(request: CommandRequest, http_response: Response):
+    """
+    Execute a game command and return result.
+
+    The X-Parse-Path header reports how the command was parsed (fast, llm,
+    classifier, *_fallback, meta, multi or interrupt) for load tests
+    (scripts/load_test.py).
+    """
     # print(f"\n{'=' * 60}")
     # print(f"📨 COMMAND RECEIVED: '{request.command}'")
     # print(f"   Current turn: {world.current_turn}")
@@ -156,58 +238,59 @@ def execute_command(request: CommandRequest):
         # If a marshal has a pending interrupt (cannon fire, blocked path),
         # try to map the player's text input to a response choice.
         # This prevents the command from being parsed as a new order.
+        # (O(1) when no interrupt is pending - see commands/dispatch.py)
         # ════════════════════════════════════════════════════════════
-        for m in world.get_player_marshals():
-            pending = getattr(m, 'pending_interrupt', None)
-            if pending:
-                options = pending.get("options", [])
-                interrupt_type = pending.get("interrupt_type", "")
-                cmd_lower = request.command.strip().lower()
-
-                # Map natural language to response choices
-                choice = None
-                if any(kw in cmd_lower for kw in ["investigate", "march to", "guns", "attack", "charge", "join"]):
-                    choice = "investigate" if "investigate" in options else "attack" if "attack" in options else None
-                elif any(kw in cmd_lower for kw in ["continue", "ignore", "keep going", "carry on", "press on"]):
-                    choice = "continue_order" if "continue_order" in options else None
-                elif any(kw in cmd_lower for kw in ["hold", "stay", "stop", "wait", "halt"]):
-                    choice = "hold_position" if "hold_position" in options else None
-                elif any(kw in cmd_lower for kw in ["go around", "reroute", "avoid"]):
-                    choice = "go_around" if "go_around" in options else None
-                elif any(kw in cmd_lower for kw in ["cancel", "abort", "belay"]):
-                    choice = "cancel_order" if "cancel_order" in options else None
-
-                if choice:
-                    print(f"[INTERRUPT ROUTE] Routing '{request.command}' -> "
-                          f"{m.name} {interrupt_type} response: {choice}")
-                    from backend.commands.strategic import StrategicExecutor
-                    strategic_exec = StrategicExecutor(executor)
-                    result = strategic_exec.handle_response(
-                        m.name, interrupt_type, choice, world, game_state)
-                    result["action_summary"] = world.get_action_summary()
-                    result["game_state"] = world.get_game_state_summary()
-                    return result
+        interrupt = route_interrupt(request.command, world)
+        if interrupt:
+            m, interrupt_type, choice = interrupt
+            http_response.headers["X-Parse-Path"] = "interrupt"
+            print(f"[INTERRUPT ROUTE] Routing '{request.command}' -> "
+                  f"{m.name} {interrupt_type} response: {choice}")
+            from backend.commands.strategic import StrategicExecutor
+            strategic_exec = StrategicExecutor(executor)
+            result = strategic_exec.handle_response(
+                m.name, interrupt_type, choice, world, game_state)
+            result["action_summary"] = world.get_action_summary()
+            result["game_state"] = _state_summary()
+            return result
 
         # Parse command
-        # Build LLM-compatible game state for command parsing
-        llm_game_state = get_llm_game_state()
-        parsed = parser.parse(request.command, llm_game_state, world=world)
-        print(f"[OK] Parsed: {parsed.get('command', {}).get('action', 'unknown')}")
-
-        # ════════════════════════════════════════════════════════════
-        # COMMAND HISTORY (Phase 5): Track commands for LLM repetition detection
-        # Only in LLM mode (not mock) and only for successfully parsed commands
-        # ════════════════════════════════════════════════════════════
-        if parsed.get("mode") != "mock" and parsed.get("success"):
-            world.add_to_command_history({
-                "raw_input": request.command,
-                "marshal": parsed.get("command", {}).get("marshal"),
-                "action": parsed.get("command", {}).get("action"),
-                "turn": int(world.current_turn),
-            })
+        # LLM-compatible game state, built only if the command falls back to the LLM
+        llm_game_state = LazyGameState(get_llm_game_state)
+        exec_state = {**game_state, "include_timings": True} if request.timings else game_state
+        turn = int(world.current_turn)
+
+        meta = parse_meta_command(request.command)
+        parts = parser.split_multiple(request.command) if meta is None else []
+        if meta is not None:
+            # Meta command (help, end turn): constant parse, straight to the executor
+            parsed = meta
+            http_response.headers["X-Parse-Path"] = "meta"
+            _record_command_history(request.command, parsed, turn)
+            result = executor.execute(parsed, exec_state)
+        elif len(parts) > 1:
+            # Multi-marshal order: parts parsed concurrently, then validated
+            # and executed as one coordinated group
+            parsed_parts = parser.parse_multiple(request.command, llm_game_state, world=world)
+            http_response.headers["X-Parse-Path"] = "multi"
+            for part in parsed_parts:
+                _record_command_history(part["raw_input"], part, turn)
+            parsed = parsed_parts[0]
+            result = executor.execute_group(parsed_parts, exec_state)
+        elif speculator is not None:
+            # Speculative mode: parse + execute, overlapping execution of the
+            # fast parse with the LLM fallback
+            parsed, result = speculator.run(request.command, llm_game_state, exec_state)
+            http_response.headers["X-Parse-Path"] = last_parse_path() or "none"
+            _record_command_history(request.command, parsed, turn)
+        else:
+            parsed = parser.parse(request.command, llm_game_state, world=world)
+            http_response.headers["X-Parse-Path"] = last_parse_path() or "none"
+            print(f"[OK] Parsed: {parsed.get('command', {}).get('action', 'unknown')}")
+            _record_command_history(request.command, parsed, turn)
 
-        # Execute command
-        result = executor.execute(parsed, game_state)
+            # Execute command
+            result = executor.execute(parsed, exec_state)
 
         # ════════════════════════════════════════════════════════════
         # CHECK FOR OBJECTION: If awaiting player choice, return full result
@@ -216,7 +299,7 @@ def execute_command(request: CommandRequest):
             print(f"🛑 OBJECTION RESPONSE - Returning full result to frontend")
             # Return the full objection result plus action summary
             result["action_summary"] = world.get_action_summary()
-            result["game_state"] = world.get_game_state_summary()
+            result["game_state"] = _state_summary()
             return result
 
         # ════════════════════════════════════════════════════════════
@@ -225,7 +308,7 @@ def execute_command(request: CommandRequest):
         if result.get("state") == "awaiting_clarification":
             print(f"[CLARIFICATION] Returning clarification popup to frontend")
             result["action_summary"] = world.get_action_summary()
-            result["game_state"] = world.get_game_state_summary()
+            result["game_state"] = _state_summary()
             return result
 
         # ════════════════════════════════════════════════════════════
@@ -234,112 +317,10 @@ def execute_command(request: CommandRequest):
         if result.get("pending_glorious_charge"):
             print(f"🐴 GLORIOUS CHARGE PENDING - Returning full result to frontend")
             result["action_summary"] = world.get_action_summary()
-            result["game_state"] = world.get_game_state_summary()
+            result["game_state"] = _state_summary()
             return result
 
-        # Get action summary
-        action_summary = world.get_action_summary()
-
-        # ════════════════════════════════════════════════════════════
-        # FEEDBACK GENERATION (Phase 5): Generate immersive feedback
-        # Only for non-mock mode, successful player commands
-        #
-        # REQUIRED FIELDS FROM parser.parse() - see parser.py docstring:
-        #   - parsed["mode"]: "mock" or "live"
-        #   - parsed["strategic_score"]: 0-100 (controls morale/trust bonus)
-        #   - parsed["ambiguity"]: 0-100 (controls clarity feedback)
-        #
-        # If these are missing, check parser.py return dict construction!
-        # ════════════════════════════════════════════════════════════
-        feedback = {}
-        mode = parsed.get("mode", "mock")
-
-        if mode != "mock" and result.get("success", False):
-            from backend.ai.feedback import get_strategic_feedback, get_ambiguity_feedback
-
-            # Get scores from parsed command
-            strategic_score = parsed.get("strategic_score", 0)
-            ambiguity_score = parsed.get("ambiguity", 0)
-            print(f"[FEEDBACK DEBUG] mode={mode}, strategic_score={strategic_score}, ambiguity={ambiguity_score}")
-
-            # Get marshal info - try result first, then parsed command
-            marshal_name = result.get("marshal") or parsed.get("command", {}).get("marshal")
-            if marshal_name:
-                marshal = world.get_marshal(marshal_name)
-                if marshal and marshal.nation == world.player_nation:
-                    personality = getattr(marshal, 'personality', 'balanced')
-
-                    # Generate feedback strings
-                    strategic_text = get_strategic_feedback(strategic_score, marshal_name)
-                    ambiguity_text = get_ambiguity_feedback(ambiguity_score, marshal_name, personality)
-
-                    if strategic_text:
-                        feedback["strategic"] = strategic_text
-                    if ambiguity_text:
-                        feedback["ambiguity"] = ambiguity_text
-
-        response = {
-            "success": result.get("success", False),
-            "message": result.get("message", "Command executed"),
-            "events": result.get("events", []),
-            "action_info": result.get("action_info", {}),
-            "action_summary": action_summary,
-            "game_state": world.get_game_state_summary()
-        }
-
-        # Add feedback if generated
-        if feedback:
-            response["feedback"] = feedback
-
-        # Include enemy_phase if present (from end_turn)
-        # Clean up non-serializable fields (new_state contains circular references)
-        if result.get("enemy_phase"):
-            enemy_phase = result["enemy_phase"]
-            cleaned_phase = {
-                "nations": {},
-                "total_actions": enemy_phase.get("total_actions", 0),
-                "summary": enemy_phase.get("summary", [])
-            }
-            # Clean each nation's actions
-            for nation, nation_data in enemy_phase.get("nations", {}).items():
-                cleaned_actions = []
-                for action in nation_data.get("actions", []):
-                    # Remove new_state which has circular references
-                    cleaned_action = {k: v for k, v in action.items() if k != "new_state"}
-                    # DEBUG: Check if events are present
-                    if "events" in cleaned_action:
-                        print(f"[ENEMY_PHASE_DEBUG] {nation} action has events: {len(cleaned_action.get('events', []))} events")
-                        for evt in cleaned_action.get("events", []):
-                            print(f"  - Event type: {evt.get('type')}, keys: {list(evt.keys())}")
-                    else:
-                        print(f"[ENEMY_PHASE_DEBUG] {nation} action has NO events! Keys: {list(cleaned_action.keys())}")
-                    cleaned_actions.append(cleaned_action)
-                cleaned_phase["nations"][nation] = {
-                    "actions": cleaned_actions,
-                    "action_count": nation_data.get("action_count", 0)
-                }
-            if enemy_phase.get("enemy_victory"):
-                cleaned_phase["enemy_victory"] = enemy_phase["enemy_victory"]
-            response["enemy_phase"] = cleaned_phase
-
-            # DEBUG: Print final enemy_phase structure
-            print(f"[ENEMY_PHASE_FINAL] Sending to Godot:")
-            for nation, data in cleaned_phase.get("nations", {}).items():
-                print(f"  {nation}: {len(data.get('actions', []))} actions")
-                for i, act in enumerate(data.get("actions", [])):
-                    has_events = "events" in act and len(act.get("events", [])) > 0
-                    print(f"    [{i}] {act.get('ai_action', {}).get('action', '?')} - has_events: {has_events}")
-
-        # Include strategic reports if present (Phase 5.2-C)
-        if result.get("strategic_reports"):
-            response["strategic_reports"] = result["strategic_reports"]
-
-        # Include independent command report if present (Phase 2.5)
-        if result.get("show_independent_command_report"):
-            response["show_independent_command_report"] = True
-            response["independent_command_report"] = result.get("independent_command_report", [])
-
-        return response
+        return _command_response(parsed, result)
     except Exception as e:
         print(f"[ERROR]: {e}")
         import traceback
@@ -351,14 +332,235 @@ def execute_command(request: CommandRequest):
             "events": [],
             "action_info": {"remaining": int(world.actions_remaining)},
             "action_summary": world.get_action_summary(),
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
 
+def _command_response(parsed: dict, result: dict) -> dict:
+    """
+    Build the /command response for an executed command: message, events,
+    feedback, action summary, game state and any end-turn reports (cleaned
+    of non-serializable fields).
+    """
+    # Get action summary
+    action_summary = world.get_action_summary()
+
+    # ════════════════════════════════════════════════════════════
+    # FEEDBACK GENERATION (Phase 5): Generate immersive feedback
+    # Only for non-mock mode, successful player commands
+    #
+    # REQUIRED FIELDS FROM parser.parse() - see parser.py docstring:
+    #   - parsed["mode"]: "mock" or "live"
+    #   - parsed["strategic_score"]: 0-100 (controls morale/trust bonus)
+    #   - parsed["ambiguity"]: 0-100 (controls clarity feedback)
+    #
+    # If these are missing, check parser.py return dict construction!
+    # ════════════════════════════════════════════════════════════
+    feedback = {}
+    mode = parsed.get("mode", "mock")
+
+    if mode != "mock" and result.get("success", False):
+        from backend.ai.feedback import get_strategic_feedback, get_ambiguity_feedback
+
+        # Get scores from parsed command
+        strategic_score = parsed.get("strategic_score", 0)
+        ambiguity_score = parsed.get("ambiguity", 0)
+        print(f"[FEEDBACK DEBUG] mode={mode}, strategic_score={strategic_score}, ambiguity={ambiguity_score}")
+
+        # Get marshal info - try result first, then parsed command
+        marshal_name = result.get("marshal") or parsed.get("command", {}).get("marshal")
+        if marshal_name:
+            marshal = world.get_marshal(marshal_name)
+            if marshal and marshal.nation == world.player_nation:
+                personality = getattr(marshal, 'personality', 'balanced')
+
+                # Generate feedback strings
+                strategic_text = get_strategic_feedback(strategic_score, marshal_name)
+                ambiguity_text = get_ambiguity_feedback(ambiguity_score, marshal_name, personality)
+
+                if strategic_text:
+                    feedback["strategic"] = strategic_text
+                if ambiguity_text:
+                    feedback["ambiguity"] = ambiguity_text
+
+    response = {
+        "success": result.get("success", False),
+        "message": result.get("message", "Command executed"),
+        "events": result.get("events", []),
+        "action_info": result.get("action_info", {}),
+        "action_summary": action_summary,
+        "game_state": _state_summary()
+    }
+
+    # Add feedback if generated
+    if feedback:
+        response["feedback"] = feedback
+
+    # Include enemy_phase if present (from end_turn)
+    # Clean up non-serializable fields (new_state contains circular references)
+    if result.get("enemy_phase"):
+        enemy_phase = result["enemy_phase"]
+        cleaned_phase = {
+            "nations": {},
+            "total_actions": enemy_phase.get("total_actions", 0),
+            "summary": enemy_phase.get("summary", [])
+        }
+        # Clean each nation's actions
+        for nation, nation_data in enemy_phase.get("nations", {}).items():
+            cleaned_actions = []
+            for action in nation_data.get("actions", []):
+                cleaned_action = _clean_enemy_action(action)
+                # DEBUG: Check if events are present
+                if "events" in cleaned_action:
+                    print(f"[ENEMY_PHASE_DEBUG] {nation} action has events: {len(cleaned_action.get('events', []))} events")
+                    for evt in cleaned_action.get("events", []):
+                        print(f"  - Event type: {evt.get('type')}, keys: {list(evt.keys())}")
+                else:
+                    print(f"[ENEMY_PHASE_DEBUG] {nation} action has NO events! Keys: {list(cleaned_action.keys())}")
+                cleaned_actions.append(cleaned_action)
+            cleaned_phase["nations"][nation] = {
+                "actions": cleaned_actions,
+                "action_count": nation_data.get("action_count", 0)
+            }
+        if enemy_phase.get("enemy_victory"):
+            cleaned_phase["enemy_victory"] = enemy_phase["enemy_victory"]
+        response["enemy_phase"] = cleaned_phase
+
+        # DEBUG: Print final enemy_phase structure
+        print(f"[ENEMY_PHASE_FINAL] Sending to Godot:")
+        for nation, data in cleaned_phase.get("nations", {}).items():
+            print(f"  {nation}: {len(data.get('actions', []))} actions")
+            for i, act in enumerate(data.get("actions", [])):
+                has_events = "events" in act and len(act.get("events", [])) > 0
+                print(f"    [{i}] {act.get('ai_action', {}).get('action', '?')} - has_events: {has_events}")
+
+    # Per-marshal outcomes of a multi-marshal order
+    if "group_results" in result:
+        response["group_results"] = [
+            {"success": r.get("success", False), "message": r.get("message", "")}
+            for r in result["group_results"]
+        ]
+
+    # Include strategic reports if present (Phase 5.2-C)
+    if result.get("strategic_reports"):
+        response["strategic_reports"] = result["strategic_reports"]
+
+    # Include independent command report if present (Phase 2.5)
+    if result.get("show_independent_command_report"):
+        response["show_independent_command_report"] = True
+        response["independent_command_report"] = result.get("independent_command_report", [])
+
+    # Include end-turn profile if requested
+    if "timings" in result:
+        response["timings"] = result["timings"]
+
+    return response
+
+
+def _record_command_history(raw_input: str, parsed: dict, turn: int) -> None:
+    """
+    COMMAND HISTORY (Phase 5): Track commands for LLM repetition detection.
+    Only in LLM mode (not mock) and only for successfully parsed commands.
+    """
+    if parsed.get("mode") != "mock" and parsed.get("success"):
+        world.add_to_command_history({
+            "raw_input": raw_input,
+            "marshal": parsed.get("command", {}).get("marshal"),
+            "action": parsed.get("command", {}).get("action"),
+            "turn": turn,
+        })
+
+
+def _clean_enemy_action(action: dict) -> dict:
+    """Copy of an enemy action result without new_state (circular references)."""
+    return {k: v for k, v in action.items() if k != "new_state"}
+
+
+def _sse_event(event: dict) -> str:
+    """Format one turn event as a Server-Sent Events frame."""
+    if event.get("type") == "enemy_action":
+        event = {**event, "action": _clean_enemy_action(event["action"])}
+    return f"event: {event['type']}\ndata: {json.dumps(jsonable_encoder(event))}\n\n"
+
+
+@app.post("/end_turn/stream")
+async def end_turn_stream():
+    """
+    End the turn, streaming the enemy phase as Server-Sent Events.
+
+    Same game effect as sending "end turn" to /command, but each enemy
+    action, strategic report, tactical event and independent command entry
+    is pushed as soon as it is produced instead of after the whole phase.
+    A final "summary" event closes the stream. It carries the same fields
+    as the /command end-turn response (message, game state, enemy victory,
+    strategic and independent command reports...), except that enemy_phase
+    keeps only per-nation action counts, since the actions were streamed.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def push(frame):
+        loop.call_soon_threadsafe(queue.put_nowait, frame)
+
+    def run_end_turn():
+        stream_state = {**game_state, "on_turn_event": lambda event: push(_sse_event(event))}
+        try:
+            parsed = parse_meta_command("end turn")
+            result = executor.execute(parsed, stream_state)
+            summary = _command_response(parsed, result)
+            if "enemy_phase" in summary:
+                summary["enemy_phase"]["nations"] = {
+                    nation: {"action_count": data["action_count"]}
+                    for nation, data in summary["enemy_phase"]["nations"].items()
+                }
+            push(_sse_event({"type": "summary", **summary}))
+        except Exception as e:
+            print(f"[ERROR]: {e}")
+            import traceback
+            traceback.print_exc()
+            push(_sse_event({"type": "error", "message": f"Error: {str(e)}"}))
+        finally:
+            push(None)  # Close the stream
+
+    async def frames():
+        # Run in a copy of the request context (game_state field projection)
+        worker = loop.run_in_executor(None, contextvars.copy_context().run, run_end_turn)
+        while True:
+            frame = await queue.get()
+            if frame is None:
+                break
+            yield frame
+        await worker
+
+    return StreamingResponse(frames(), media_type="text/event-stream")
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    Operational metrics in Prometheus text format.
+
+    Request latency per route, parse paths, LLM latency and tokens,
+    enemy-phase duration, end-turn profile and session memory.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/metrics/turns")
+def get_turn_metrics():
+    """
+    End-turn timings aggregated across every turn this server has processed.
+
+    Per phase, enemy nation and AI priority handler: call count, total and
+    per-turn mean wall time, and the slowest single turn.
+    """
+    return {"turns": TURN_METRICS.snapshot()}
+
+
 @app.get("/status")
 def get_status():
     """Get current game status."""
-    return world.get_game_state_summary()
+    return _state_summary()
 
 
 # ============================================================
@@ -425,7 +627,7 @@ def respond_to_objection(request: ObjectionResponse):
             "events": result.get("events", []),
             "action_info": result.get("action_info", {}),
             "action_summary": world.get_action_summary(),
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
         # ════════════════════════════════════════════════════════════
@@ -446,7 +648,7 @@ def respond_to_objection(request: ObjectionResponse):
         return {
             "success": False,
             "message": f"Error: {str(e)}",
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
 
@@ -469,7 +671,7 @@ def respond_to_redemption(request: RedemptionResponse):
             return {
                 "success": False,
                 "message": "No redemption event pending.",
-                "game_state": world.get_game_state_summary()
+                "game_state": _state_summary()
             }
 
         redemption_event = world.pending_redemption
@@ -480,7 +682,7 @@ def respond_to_redemption(request: RedemptionResponse):
             return {
                 "success": False,
                 "message": f"Invalid choice: '{request.choice}'. Valid: {', '.join(valid_choices)}",
-                "game_state": world.get_game_state_summary()
+                "game_state": _state_summary()
             }
 
         # Process the redemption response
@@ -505,7 +707,7 @@ def respond_to_redemption(request: RedemptionResponse):
             "troops_frozen": result.get("troops_frozen", 0),
             "authority_bonus": result.get("authority_bonus", 0),
             "action_summary": world.get_action_summary(),
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
     except Exception as e:
         print(f"❌ ERROR handling redemption response: {e}")
@@ -514,7 +716,7 @@ def respond_to_redemption(request: RedemptionResponse):
         return {
             "success": False,
             "message": f"Error: {str(e)}",
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
 
@@ -563,7 +765,7 @@ def respond_to_glorious_charge(request: GloriousChargeResponse):
             return {
                 "success": False,
                 "message": f"Invalid choice: '{request.choice}'. Valid: {', '.join(valid_choices)}",
-                "game_state": world.get_game_state_summary()
+                "game_state": _state_summary()
             }
 
         # Process the response through executor
@@ -575,7 +777,7 @@ def respond_to_glorious_charge(request: GloriousChargeResponse):
             "choice": request.choice,
             "events": result.get("events", []),
             "action_summary": world.get_action_summary(),
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
     except Exception as e:
         print(f"❌ ERROR handling Glorious Charge response: {e}")
@@ -584,7 +786,7 @@ def respond_to_glorious_charge(request: GloriousChargeResponse):
         return {
             "success": False,
             "message": f"Error: {str(e)}",
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
 
@@ -616,7 +818,7 @@ def handle_strategic_response(request: StrategicInterruptResponse):
             "trust_change": result.get("trust_change", 0),
             "action_taken": result.get("action_taken"),
             "action_summary": world.get_action_summary(),
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
     except Exception as e:
         print(f"❌ ERROR handling strategic response: {e}")
@@ -625,7 +827,7 @@ def handle_strategic_response(request: StrategicInterruptResponse):
         return {
             "success": False,
             "message": f"Error: {str(e)}",
-            "game_state": world.get_game_state_summary()
+            "game_state": _state_summary()
         }
 
 
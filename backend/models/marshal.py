@@ -25,9 +25,12 @@ Implemented fields:
 - strategic_defense_bonus: int - 5-15% defense bonus based on order clarity
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Optional, Dict, List
+from operator import attrgetter
+from types import MappingProxyType
+from weakref import WeakValueDictionary
+from typing import Callable, Optional, Dict, List, Mapping
 from backend.models.trust import Trust
 
 
@@ -164,6 +167,146 @@ class Stance(Enum):
     AGGRESSIVE = "aggressive"
 
 
+@dataclass
+class CombatModifiers:
+    """
+    Cached combat modifier vector for one marshal (see Marshal.get_combat_modifiers).
+
+    attack/defense exclude the one-shot strategic bonuses, which
+    get_attack_modifier()/get_defense_modifier() apply when present.
+    """
+    attack: float                 # Normal odds
+    attack_bad_odds: float        # Strength ratio below bad_odds_threshold
+    bad_odds_threshold: float
+    defense: float                # Not outnumbered
+    defense_outnumbered: float
+    drilling: bool
+    fortify_bonus: float
+
+
+@dataclass(frozen=True, eq=False)
+class MarshalProfile:
+    """
+    Immutable identity shared by every Marshal built from the same definition.
+
+    Profiles are interned (see MarshalProfile.get), so the 14 marshals of a
+    scenario loaded in thousands of games hold 14 profiles between them. The
+    intern table holds profiles weakly: one is dropped once no marshal uses it.
+    base_skills and ability are read-only views; live skills are per-marshal
+    state on Marshal.skills.
+    """
+    name: str
+    nation: str
+    personality: str
+    movement_range: int
+    cavalry: bool
+    base_skills: Mapping[str, int]
+    ability: Mapping[str, str]
+
+    @classmethod
+    def get(cls, name: str, nation: str, personality: str, movement_range: int,
+            cavalry: bool, base_skills: Dict[str, int],
+            ability: Dict[str, str]) -> 'MarshalProfile':
+        """Return the shared profile for these values, creating it once."""
+        key = (name, nation, personality, movement_range, cavalry,
+               tuple(base_skills.items()), tuple(ability.items()))
+        profile = _PROFILE_CACHE.get(key)
+        if profile is None:
+            profile = cls(
+                name=name,
+                nation=nation,
+                personality=personality,
+                movement_range=movement_range,
+                cavalry=cavalry,
+                base_skills=MappingProxyType(dict(base_skills)),
+                ability=MappingProxyType(dict(ability)),
+            )
+            _PROFILE_CACHE[key] = profile
+        return profile
+
+    def __copy__(self) -> 'MarshalProfile':
+        return self  # Immutable and interned: copies share the profile
+
+    def __deepcopy__(self, memo) -> 'MarshalProfile':
+        return self
+
+    def __reduce__(self):
+        # Unpickling re-interns instead of building a private copy
+        return (MarshalProfile.get, (
+            self.name, self.nation, self.personality, self.movement_range,
+            self.cavalry, dict(self.base_skills), dict(self.ability),
+        ))
+
+    def evolve(self, **changes) -> 'MarshalProfile':
+        """Return the shared profile with some fields changed (copy-on-write)."""
+        merged = replace(self, **changes)
+        return MarshalProfile.get(
+            merged.name, merged.nation, merged.personality,
+            merged.movement_range, merged.cavalry,
+            dict(merged.base_skills), dict(merged.ability),
+        )
+
+
+_PROFILE_CACHE: 'WeakValueDictionary[tuple, MarshalProfile]' = WeakValueDictionary()
+
+
+# Marshal attributes served by the shared profile (see _profile_property)
+_PROFILE_FIELDS = ('name', 'nation', 'personality', 'movement_range', 'cavalry', 'ability')
+
+
+def _profile_property(attr: str, doc: str) -> property:
+    """Marshal attribute backed by the shared profile; assignment re-interns."""
+    def getter(self):
+        return getattr(self._profile, attr)
+
+    mirrored = attr in MIRRORED_FIELDS
+
+    def setter(self, value):
+        self._profile = self._profile.evolve(**{attr: value})
+        self._combat_modifiers = None  # personality/cavalry feed the modifiers
+        if mirrored and self._mirror is not None:
+            table, row = self._mirror
+            table.update(row, attr, value)
+
+    return property(getter, setter, doc=doc)
+
+
+# State fields CombatModifiers is computed from (see Marshal.get_combat_modifiers)
+_MODIFIER_INPUTS = (
+    'stance', 'shock_bonus', 'defense_bonus', 'drilling', 'drilling_locked',
+    'holding_position', 'recklessness', 'attacks_this_turn',
+)
+
+# Fields a MarshalTable mirrors in its columns (see marshal_table)
+MIRRORED_FIELDS = (
+    'strength', 'morale', 'location', 'nation',
+    'drilling', 'fortified', 'broken', 'retreating', 'retreated_this_turn', 'cavalry',
+)
+
+
+def _state_property(attr: str, doc: str) -> property:
+    """
+    Marshal state field kept in slot '_<attr>'.
+
+    Assignment drops the cached CombatModifiers if attr feeds them and
+    writes through to an attached MarshalTable if attr is mirrored.
+    """
+    slot = '_' + attr
+    getter = attrgetter(slot)
+    modifier_input = attr in _MODIFIER_INPUTS
+    mirrored = attr in MIRRORED_FIELDS
+
+    def setter(self, value):
+        setattr(self, slot, value)
+        if modifier_input:
+            self._combat_modifiers = None
+        if mirrored and self._mirror is not None:
+            table, row = self._mirror
+            table.update(row, attr, value)
+
+    return property(getter, setter, doc=doc)
+
+
 class Marshal:
     """
     A marshal commanding an army.
@@ -173,8 +316,80 @@ class Marshal:
     - Current location (region)
     - Army strength (abstract number)
     - Morale (affects performance)
+
+    Identity (name, nation, personality, base skills, ability, cavalry,
+    movement_range) lives on a shared MarshalProfile; everything else is
+    per-marshal state held in __slots__.
     """
 
+    __slots__ = (
+        '_profile', '_location', '_strength', 'starting_strength',
+        'spawn_location', 'tactical_skill', 'skills',
+        # Game state
+        '_morale', 'orders_overridden', 'battles_won', 'battles_lost',
+        'just_retreated',
+        # Disobedience
+        'trust', 'vindication_score', 'recent_battles', 'recent_overrides',
+        # Autonomy
+        'autonomous', 'autonomy_turns', 'autonomy_reason', 'redemption_pending',
+        'autonomous_battles_won', 'autonomous_battles_lost',
+        'autonomous_regions_captured', 'trust_warning_shown',
+        # Administrative duty
+        'administrative', 'administrative_strength', 'administrative_location',
+        # Relationships
+        'relationships',
+        # Drill / strategic bonuses
+        '_drilling', '_drilling_locked', 'drill_complete_turn', '_shock_bonus',
+        'strategic_combat_bonus', 'strategic_defense_bonus',
+        'precision_execution_active', 'precision_execution_turns',
+        # Strategic orders
+        'strategic_order', '_pending_interrupt', 'cannon_fire_ignored_turn',
+        # Combat tracking
+        'in_combat_this_turn', 'last_combat_turn', 'last_combat_result',
+        'last_combat_location',
+        # Fortify / retreat / broken
+        '_fortified', 'fortify_expires_turn', '_defense_bonus',
+        '_retreating', 'retreat_recovery', '_retreated_this_turn',
+        '_broken', 'broken_recovery',
+        # Stance and personality abilities
+        '_stance', 'turns_in_defensive_stance', 'turns_fortified',
+        'turns_defensive', 'counter_punch_available', 'counter_punch_turns',
+        '_holding_position', 'hold_region',
+        # Recklessness / exhaustion
+        '_recklessness', 'pending_glorious_charge', 'pending_charge_target',
+        '_attacks_this_turn',
+        # Internal
+        '_recovery_destination', '_combat_modifiers', '_mirror',
+        '_interrupt_listener',
+    )
+
+    name = _profile_property('name', "Marshal name (profile).")
+    nation = _profile_property('nation', "Owning nation (profile).")
+    personality = _profile_property('personality', "Personality type (profile).")
+    movement_range = _profile_property(
+        'movement_range', "Attack range: cavalry=2, infantry=1 (profile).")
+    cavalry = _profile_property(
+        'cavalry', "True for cavalry commanders (Ney), False for infantry (profile).")
+    ability = _profile_property('ability', "Signature ability, read-only (profile).")
+
+    # State behind a property: setters drop cached CombatModifiers and/or
+    # write through to an attached MarshalTable (see _state_property)
+    location = _state_property('location', "Current region (mirrored).")
+    strength = _state_property('strength', "Army strength (mirrored).")
+    morale = _state_property('morale', "Morale 0-100 (mirrored).")
+    stance = _state_property('stance', "Current Stance (modifier input).")
+    drilling = _state_property('drilling', "Drilling this turn (modifier input, mirrored).")
+    drilling_locked = _state_property('drilling_locked', "Locked in drill (modifier input).")
+    shock_bonus = _state_property('shock_bonus', "Completed-drill attack bonus (modifier input).")
+    defense_bonus = _state_property('defense_bonus', "Fortify defense bonus (modifier input).")
+    fortified = _state_property('fortified', "Fortified (mirrored).")
+    retreating = _state_property('retreating', "Recovering from retreat (mirrored).")
+    retreated_this_turn = _state_property('retreated_this_turn', "Retreated this turn (mirrored).")
+    broken = _state_property('broken', "Army broken (mirrored).")
+    holding_position = _state_property('holding_position', "Holding position (modifier input).")
+    recklessness = _state_property('recklessness', "Cavalry recklessness level (modifier input).")
+    attacks_this_turn = _state_property('attacks_this_turn', "Attacks made this turn (modifier input).")
+
     def __init__(
             self,
             name: str,
@@ -191,17 +406,16 @@ class Marshal:
             spawn_location: str = None  # Capital/respawn location when broken
     ):
         """Initialize a marshal."""
-        self.name = name
+        # (MarshalTable, row) while attached to a columnar table (see marshal_table)
+        self._mirror: Optional[tuple] = None
+
         self.location = location
         self.strength = strength
         self.starting_strength = strength  # NEW: Track original strength
-        self.personality = personality
-        self.nation = nation
         # Spawn location: where marshal respawns when army is broken
         # For France: Paris (capital)
         # For enemies: their starting region (TODO: use actual capitals in future)
         self.spawn_location = spawn_location if spawn_location else location
-        self.movement_range = movement_range  # Attack range (cavalry=2, infantry=1)
         self.tactical_skill = tactical_skill  # Tactical skill rating (0-12, affects dice rolls)
 
         # 6-Skill System (Phase 2.2)
@@ -217,7 +431,7 @@ class Marshal:
                 "command": 5
             }
 
-        self.skills: Dict[str, int] = {
+        base_skills = {
             "tactical": int(skills.get("tactical", 5)),      # Combat rolls, flanking bonuses
             "shock": int(skills.get("shock", 5)),            # Attack damage, pursuit effectiveness
             "defense": int(skills.get("defense", 5)),        # Defender bonus, retreat casualties
@@ -237,13 +451,20 @@ class Marshal:
                 "effect": "none"
             }
 
-        self.ability: Dict[str, str] = {
+        ability = {
             "name": str(ability.get("name", "None")),
             "description": str(ability.get("description", "No special ability")),
             "trigger": str(ability.get("trigger", "never")),
             "effect": str(ability.get("effect", "none"))
         }
 
+        # Static identity, shared between marshals with the same definition
+        self._profile: MarshalProfile = MarshalProfile.get(
+            name, nation, personality, movement_range, cavalry, base_skills, ability
+        )
+        # Live skills start from the profile and may change during play
+        self.skills: Dict[str, int] = dict(base_skills)
+
         # Game state (changes during play)
         self.morale: int = 100
         self.orders_overridden: int = 0
@@ -269,6 +490,11 @@ class Marshal:
         self.autonomous_battles_lost: int = 0
         self.autonomous_regions_captured: int = 0
 
+        # Administrative duty (crisis choice): troops frozen until recalled
+        self.administrative: bool = False
+        self.administrative_strength: int = 0
+        self.administrative_location: Optional[str] = None
+
         # Trust Warning System (Phase 3)
         # Tracks if warning has been shown for trust dropping below 40
         # Reset when trust rises back above 40
@@ -305,7 +531,8 @@ class Marshal:
 
         # Strategic Order System (Phase 5.2)
         self.strategic_order: Optional[StrategicOrder] = None
-        self.pending_interrupt: Optional[Dict] = None  # Phase D: stored between raise and response
+        self._interrupt_listener: Optional[Callable] = None  # WorldState pending-interrupt set
+        self._pending_interrupt: Optional[Dict] = None  # Phase D: stored between raise and response
         self.cannon_fire_ignored_turn: Optional[int] = None  # Suppress re-trigger for 1 turn after "continue"
 
         # Battle tracking (for cannon fire detection and until_battle_won)
@@ -346,8 +573,7 @@ class Marshal:
         # ════════════════════════════════════════════════════════════
         # PERSONALITY ABILITY STATE (Phase 2.8)
         # ════════════════════════════════════════════════════════════
-        # Unit type tag for cavalry-specific abilities
-        self.cavalry: bool = cavalry  # True for cavalry commanders (Ney), False for infantry
+        # Unit type tag for cavalry-specific abilities: see the cavalry profile field
 
         # CAVALRY DEFENSIVE LIMITS - Horses can't hold defensive positions
         # After 3 turns in defensive stance → auto-switch to aggressive (-3 trust)
@@ -398,6 +624,62 @@ class Marshal:
         # Counter-punch (reactive) does NOT count toward this
         self.attacks_this_turn: int = 0
 
+        # Enemy AI: safe region a broken/retreating marshal is heading for
+        self._recovery_destination: Optional[str] = None
+
+        # Cached CombatModifiers (see get_combat_modifiers)
+        self._combat_modifiers: Optional[CombatModifiers] = None
+
+    @property
+    def fortify_bonus(self) -> float:
+        """Alias of defense_bonus (older name)."""
+        return self.defense_bonus
+
+    @fortify_bonus.setter
+    def fortify_bonus(self, value: float) -> None:
+        self.defense_bonus = value
+
+    @property
+    def autonomous_turns_remaining(self) -> int:
+        """Alias of autonomy_turns (older name)."""
+        return self.autonomy_turns
+
+    @autonomous_turns_remaining.setter
+    def autonomous_turns_remaining(self, value: int) -> None:
+        self.autonomy_turns = value
+
+    def _state_snapshot(self) -> Dict[str, object]:
+        """
+        Every stored attribute by name: profile fields and set slots.
+
+        Slots behind a public property ('_stance') are reported under the
+        property's name. A fresh dict; changing it does not change the marshal.
+        """
+        state = {attr: getattr(self, attr) for attr in _PROFILE_FIELDS}
+        for slot in Marshal.__slots__:
+            public = slot[1:] if isinstance(getattr(Marshal, slot[1:], None), property) else slot
+            try:
+                state[public] = getattr(self, slot)
+            except AttributeError:
+                continue  # Slot never assigned
+        return state
+
+    @property
+    def pending_interrupt(self) -> Optional[Dict]:
+        """Strategic interrupt awaiting the player's response (None = none)."""
+        return self._pending_interrupt
+
+    @pending_interrupt.setter
+    def pending_interrupt(self, value: Optional[Dict]) -> None:
+        old = self._pending_interrupt
+        self._pending_interrupt = value
+        if bool(old) != bool(value) and self._interrupt_listener is not None:
+            self._interrupt_listener(self, bool(value))
+
+    def attach_interrupt_listener(self, listener: Optional[Callable]) -> None:
+        """Register the callback notified when a pending interrupt is raised or cleared."""
+        self._interrupt_listener = listener
+
     def move_to(self, new_location: str) -> None:
         """
         Move marshal to a new region.
@@ -670,6 +952,36 @@ class Marshal:
     # STANCE MODIFIER METHODS
     # ════════════════════════════════════════════════════════════
 
+    def get_combat_modifiers(self) -> CombatModifiers:
+        """
+        Get the cached combat modifier vector for this marshal.
+
+        Built on first use and dropped by the setters of its inputs (stance,
+        drill, fortify, hold position, recklessness, attacks this turn,
+        personality, cavalry). Read by get_attack_modifier/get_defense_modifier
+        and EnemyAI target evaluation.
+
+        get_effective_skill and get_combat_effectiveness stay uncached: each is
+        a dict lookup or a few float ops, and their inputs (skills, edited in
+        place, morale, retreat_recovery, just_retreated) have no setter to
+        drop a stale value.
+        """
+        cached = self._combat_modifiers
+        if cached is not None:
+            return cached
+
+        from backend.models.personality_modifiers import get_personality_modifiers
+        self._combat_modifiers = CombatModifiers(
+            attack=self._compute_attack_modifier(None),
+            attack_bad_odds=self._compute_attack_modifier(0.0),
+            bad_odds_threshold=get_personality_modifiers(self.personality).get("bad_odds_threshold", 1.0),
+            defense=self._compute_defense_modifier(False),
+            defense_outnumbered=self._compute_defense_modifier(True),
+            drilling=bool(self.drilling or self.drilling_locked),
+            fortify_bonus=self.defense_bonus,
+        )
+        return self._combat_modifiers
+
     def get_attack_modifier(self, strength_ratio: float = None) -> float:
         """
         Get attack modifier from stance, personality, and other sources.
@@ -680,6 +992,19 @@ class Marshal:
         Returns:
             Float multiplier (e.g., 1.15 = +15% attack)
         """
+        # Strategic combat bonus (from inspiring commands, consumed on use)
+        strategic_bonus = getattr(self, 'strategic_combat_bonus', 0)
+        if strategic_bonus > 0:
+            self.strategic_combat_bonus = 0  # Consume after use
+            return self._compute_attack_modifier(strength_ratio, strategic_bonus)
+
+        mods = self.get_combat_modifiers()
+        if strength_ratio is not None and strength_ratio < mods.bad_odds_threshold:
+            return mods.attack_bad_odds
+        return mods.attack
+
+    def _compute_attack_modifier(self, strength_ratio: float = None, strategic_bonus: float = 0) -> float:
+        """Uncached attack modifier (get_attack_modifier consumes the strategic bonus)."""
         from backend.models.personality_modifiers import get_attack_modifier_for_personality
 
         modifier = 1.0
@@ -696,11 +1021,9 @@ class Marshal:
         if has_drill_bonus:
             modifier *= (1.0 + shock * 0.10)  # shock_bonus=2 → +20%
 
-        # Strategic combat bonus (from inspiring commands, consumed on use)
-        strategic_bonus = getattr(self, 'strategic_combat_bonus', 0)
+        # Strategic combat bonus (from inspiring commands)
         if strategic_bonus > 0:
             modifier *= (1.0 + strategic_bonus / 100.0)  # 10 → +10%
-            self.strategic_combat_bonus = 0  # Consume after use
 
         # Personality-specific attack modifiers
         personality_mod = get_attack_modifier_for_personality(
@@ -734,6 +1057,17 @@ class Marshal:
         Returns:
             Float multiplier (e.g., 1.15 = +15% defense)
         """
+        # Strategic defense bonus (from clear orders - Grouchy, consumed on use)
+        strategic_def_bonus = getattr(self, 'strategic_defense_bonus', 0)
+        if strategic_def_bonus > 0:
+            self.strategic_defense_bonus = 0  # Consume after use
+            return self._compute_defense_modifier(is_outnumbered, strategic_def_bonus)
+
+        mods = self.get_combat_modifiers()
+        return mods.defense_outnumbered if is_outnumbered else mods.defense
+
+    def _compute_defense_modifier(self, is_outnumbered: bool = False, strategic_def_bonus: float = 0) -> float:
+        """Uncached defense modifier (get_defense_modifier consumes the strategic bonus)."""
         from backend.models.personality_modifiers import get_defense_modifier_for_personality
 
         modifier = 1.0
@@ -750,11 +1084,9 @@ class Marshal:
         if fortify_bonus > 0:
             modifier *= (1.0 + fortify_bonus)  # 0.16 → 1.16x (16% reduction)
 
-        # Strategic defense bonus (from clear orders - Grouchy, consumed on use)
-        strategic_def_bonus = getattr(self, 'strategic_defense_bonus', 0)
+        # Strategic defense bonus (from clear orders - Grouchy)
         if strategic_def_bonus > 0:
             modifier *= (1.0 + strategic_def_bonus / 100.0)  # 10 → +10%
-            self.strategic_defense_bonus = 0  # Consume after use
 
         # Drilling penalty (caught drilling = vulnerable)
         if getattr(self, 'drilling', False) or getattr(self, 'drilling_locked', False):
@@ -878,7 +1210,7 @@ class Marshal:
 
             # ═══════ SKILLS & ABILITY ═══════
             "skills": {k: int(v) for k, v in self.skills.items()},
-            "ability": self.ability.copy(),
+            "ability": dict(self.ability),
 
             # ═══════ GAME STATE ═══════
             "morale": int(self.morale),
@@ -903,6 +1235,11 @@ class Marshal:
             "autonomous_regions_captured": int(self.autonomous_regions_captured),
             "trust_warning_shown": self.trust_warning_shown,
 
+            # ═══════ ADMINISTRATIVE DUTY ═══════
+            "administrative": self.administrative,
+            "administrative_strength": int(self.administrative_strength),
+            "administrative_location": self.administrative_location,
+
             # ═══════ RELATIONSHIPS ═══════
             "relationships": self.relationships.copy(),
 
@@ -1015,6 +1352,11 @@ class Marshal:
         marshal.autonomous_regions_captured = data.get("autonomous_regions_captured", 0)
         marshal.trust_warning_shown = data.get("trust_warning_shown", False)
 
+        # ═══════ ADMINISTRATIVE DUTY ═══════
+        marshal.administrative = data.get("administrative", False)
+        marshal.administrative_strength = data.get("administrative_strength", 0)
+        marshal.administrative_location = data.get("administrative_location")
+
         # ═══════ RELATIONSHIPS ═══════
         marshal.relationships = data.get("relationships", {}).copy()
 
@@ -0,0 +1,184 @@
+"""
+Columnar Marshal Table for Project Sovereign
+
+Structure-of-arrays mirror of the marshal fields that hot queries filter on
+(strength, morale, location, nation, tactical flags). "Enemies of Prussia",
+"allied strength in Rhine" and "is this path blocked" become mask
+operations over the columns instead of attribute scans over every Marshal.
+
+Columns are NumPy arrays when NumPy is installed and plain lists otherwise;
+query results are identical either way (same marshals, same order).
+
+Sync: the setters of the mirrored Marshal fields write through to the table
+a marshal is attached to (Marshal._mirror). Standard games never attach a
+table. WorldState enables the table for grand-campaign rosters (see
+MARSHAL_TABLE_THRESHOLD) and rebuilds it when marshals are added, removed
+or replaced.
+"""
+
+from typing import Dict, List, Optional
+
+from backend.models.marshal import Marshal
+
+try:
+    import numpy as np
+except ImportError:  # Optional: list columns are used instead
+    np = None
+
+
+# Flag bits (flags column)
+FLAG_DRILLING = 1
+FLAG_FORTIFIED = 2
+FLAG_BROKEN = 4
+FLAG_RETREATING = 8
+FLAG_RETREATED_THIS_TURN = 16
+FLAG_CAVALRY = 32
+
+_FLAG_FIELDS: Dict[str, int] = {
+    "drilling": FLAG_DRILLING,
+    "fortified": FLAG_FORTIFIED,
+    "broken": FLAG_BROKEN,
+    "retreating": FLAG_RETREATING,
+    "retreated_this_turn": FLAG_RETREATED_THIS_TURN,
+    "cavalry": FLAG_CAVALRY,
+}
+
+
+class MarshalTable:
+    """
+    Columnar mirror of a world's marshals.
+
+    Row i describes marshals[i]; rows follow the source dict's order so
+    results match the object scans they replace.
+    """
+
+    def __init__(self, source: Dict[str, Marshal]):
+        """
+        Build the table and attach every marshal in source.
+
+        Args:
+            source: The world's name -> Marshal dict (kept by reference)
+        """
+        self.source = source
+        self.marshals: List[Marshal] = []
+        self.nation_ids: Dict[str, int] = {}
+        self.location_ids: Dict[str, int] = {}
+        self.rebuild()
+
+    # ════════════════════════════════════════════════════════════
+    # BUILD / SYNC
+    # ════════════════════════════════════════════════════════════
+
+    def rebuild(self) -> None:
+        """Re-read every column from the source marshals and re-attach them."""
+        for marshal in self.marshals:
+            marshal._mirror = None  # Detach rows that may have left the world
+
+        self.marshals = list(self.source.values())
+        strength, morale, location, nation, flags = [], [], [], [], []
+        for row, marshal in enumerate(self.marshals):
+            strength.append(marshal.strength)
+            morale.append(marshal.morale)
+            location.append(self._location_id(marshal.location))
+            nation.append(self._nation_id(marshal.nation))
+            bits = 0
+            for attr, bit in _FLAG_FIELDS.items():
+                if getattr(marshal, attr, False):
+                    bits |= bit
+            flags.append(bits)
+
+            marshal._mirror = (self, row)
+
+        if np is not None:
+            self.strength = np.array(strength, dtype=np.float64)
+            self.morale = np.array(morale, dtype=np.float64)
+            self.location = np.array(location, dtype=np.int32)
+            self.nation = np.array(nation, dtype=np.int32)
+            self.flags = np.array(flags, dtype=np.int32)
+        else:
+            self.strength, self.morale = strength, morale
+            self.location, self.nation, self.flags = location, nation, flags
+
+    def is_current(self, source: Dict[str, Marshal]) -> bool:
+        """True if the table still mirrors exactly this roster (same marshal objects, same order)."""
+        if self.source is not source or len(self.marshals) != len(source):
+            return False
+        return all(row is marshal for row, marshal in zip(self.marshals, source.values()))
+
+    def update(self, row: int, attr: str, value) -> None:
+        """Write-through from a Marshal setter for one mirrored field."""
+        if attr == "strength":
+            self.strength[row] = value
+        elif attr == "morale":
+            self.morale[row] = value
+        elif attr == "location":
+            self.location[row] = self._location_id(value)
+        elif attr == "nation":
+            self.nation[row] = self._nation_id(value)
+        else:
+            bit = _FLAG_FIELDS[attr]
+            if value:
+                self.flags[row] = int(self.flags[row]) | bit
+            else:
+                self.flags[row] = int(self.flags[row]) & ~bit
+
+    def _nation_id(self, nation: str) -> int:
+        return self.nation_ids.setdefault(nation, len(self.nation_ids))
+
+    def _location_id(self, location: str) -> int:
+        return self.location_ids.setdefault(location, len(self.location_ids))
+
+    # ════════════════════════════════════════════════════════════
+    # QUERIES
+    # ════════════════════════════════════════════════════════════
+
+    def select(
+        self,
+        nation: Optional[str] = None,
+        not_nation: Optional[str] = None,
+        location: Optional[str] = None,
+        alive: bool = True,
+        exclude_flags: int = 0,
+    ) -> List[Marshal]:
+        """
+        Marshals matching every given filter, in roster order.
+
+        Args:
+            nation: Only this nation
+            not_nation: Every nation except this one
+            location: Only marshals in this region
+            alive: Only marshals with strength > 0
+            exclude_flags: Skip marshals with any of these FLAG_* bits set
+
+        Returns:
+            List of Marshal objects
+        """
+        # Names never seen by the table match nothing (== -1 never holds)
+        nation_id = self.nation_ids.get(nation, -1) if nation is not None else None
+        not_nation_id = self.nation_ids.get(not_nation, -1) if not_nation is not None else None
+        location_id = self.location_ids.get(location, -1) if location is not None else None
+
+        if np is not None:
+            mask = np.ones(len(self.marshals), dtype=bool)
+            if alive:
+                mask &= self.strength > 0
+            if nation_id is not None:
+                mask &= self.nation == nation_id
+            if not_nation_id is not None:
+                mask &= self.nation != not_nation_id
+            if location_id is not None:
+                mask &= self.location == location_id
+            if exclude_flags:
+                mask &= (self.flags & exclude_flags) == 0
+            return [self.marshals[row] for row in np.flatnonzero(mask)]
+
+        strength, nations, locations, flags = self.strength, self.nation, self.location, self.flags
+        return [
+            marshal for row, marshal in enumerate(self.marshals)
+            if (not alive or strength[row] > 0)
+            and (nation_id is None or nations[row] == nation_id)
+            and (not_nation_id is None or nations[row] != not_nation_id)
+            and (location_id is None or locations[row] == location_id)
+            and not (flags[row] & exclude_flags)
+        ]
+
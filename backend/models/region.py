@@ -3,7 +3,7 @@ Region Model for Project Sovereign
 Represents a region/territory on the map
 """
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 
 class Region:
@@ -22,12 +22,45 @@ class Region:
         self.is_capital = is_capital
 
         # Game state (changes during play)
-        self.controller: Optional[str] = None
+        self._controller: Optional[str] = None  # See controller property
         self.garrison_strength: int = 0
 
+        # Called as listener(region, old_controller, new_controller) on change;
+        # WorldState keeps its per-nation control aggregates current this way
+        self._control_listener: Optional[Callable] = None
+
+        # Adjacency bitset + name->id map, set by RegionGraph (see region_graph.py)
+        self._adjacent_bits: Optional[int] = None
+        self._region_ids: Optional[Dict[str, int]] = None
+
+    @property
+    def controller(self) -> Optional[str]:
+        """Nation controlling this region (None = uncontrolled)."""
+        return self._controller
+
+    @controller.setter
+    def controller(self, value: Optional[str]) -> None:
+        old = self._controller
+        self._controller = value
+        if old != value and self._control_listener is not None:
+            self._control_listener(self, old, value)
+
+    def attach_control_listener(self, listener: Optional[Callable]) -> None:
+        """Register the callback notified when controller changes."""
+        self._control_listener = listener
+
+    def attach_adjacency_bits(self, bits: Optional[int], region_ids: Optional[Dict[str, int]]) -> None:
+        """Use a RegionGraph bitset for is_adjacent_to() (None = list lookup)."""
+        self._adjacent_bits = bits
+        self._region_ids = region_ids
+
     def is_adjacent_to(self, other_region_name: str) -> bool:
         """Check if this region borders another region."""
-        return other_region_name in self.adjacent_regions
+        bits = self._adjacent_bits
+        if bits is None:
+            return other_region_name in self.adjacent_regions
+        region_id = self._region_ids.get(other_region_name)
+        return region_id is not None and bool(bits >> region_id & 1)
 
     def to_dict(self) -> dict:
         """Serialize region for save/load."""
@@ -0,0 +1,228 @@
+"""
+Region Graph for Project Sovereign
+
+Integer-interned view of the map. Region ids are assigned in map order when
+the graph is built, adjacency is stored as tuples of ids, and BFS results
+(hop counts, discovery order, parents) are cached per source id.
+
+Adjacency is also kept as integer bitsets (bit i = region id i), with
+precomputed k-hop neighborhoods for k = 1..MAX_NEIGHBORHOOD_HOPS. "Within
+range", "reachable through one intermediate region" and "adjacent to both
+A and B" are then single AND/OR operations on Python ints.
+
+Game state, saves and API responses keep using region names; convert with
+id_of()/name_of() at that boundary. Distances, paths and neighborhoods are
+computed on ints.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.models.region import Region
+
+# Same sentinel get_distance() has always returned for unknown/unreachable
+UNREACHABLE = 999
+
+# Largest k with a precomputed k-hop neighborhood bitset
+MAX_NEIGHBORHOOD_HOPS = 3
+
+
+def iter_bits(bits: int) -> Iterable[int]:
+    """Region ids set in a bitset, ascending (= map order)."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class RegionGraph:
+    """Region ids, id adjacency and cached BFS for one regions dict."""
+
+    def __init__(self, regions: Dict[str, Region]):
+        """
+        Args:
+            regions: The world's name -> Region dict (kept by reference)
+        """
+        self.source = regions
+        self.names: List[str] = list(regions)
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        # Neighbor ids in each region's adjacent_regions order (unknown names dropped)
+        self.adjacency: List[Tuple[int, ...]] = [
+            tuple(self.ids[adj] for adj in regions[name].adjacent_regions if adj in self.ids)
+            for name in self.names
+        ]
+        self._bfs: Dict[int, Tuple[List[int], List[int], List[int]]] = {}
+        self._neighborhoods: Dict[Tuple[int, int], Dict[str, int]] = {}
+
+        # Bitsets: adjacency_bits[r] = neighbors of r;
+        # within_bits[k - 1][r] = regions 1..k hops from r (r itself excluded)
+        self.adjacency_bits: List[int] = []
+        for neighbors in self.adjacency:
+            bits = 0
+            for adj in neighbors:
+                bits |= 1 << adj
+            self.adjacency_bits.append(bits)
+        self.within_bits: List[List[int]] = []
+        reach = [bits | (1 << rid) for rid, bits in enumerate(self.adjacency_bits)]
+        for _ in range(MAX_NEIGHBORHOOD_HOPS):
+            self.within_bits.append([bits & ~(1 << rid) for rid, bits in enumerate(reach)])
+            next_reach = []
+            for bits in reach:
+                expanded = bits
+                for rid in iter_bits(bits):
+                    expanded |= self.adjacency_bits[rid]
+                next_reach.append(expanded)
+            reach = next_reach
+
+        # Regions answer is_adjacent_to() from the bitset when every
+        # neighbor name is on this map (otherwise they keep the list check)
+        for name, neighbors in zip(self.names, self.adjacency):
+            region = regions[name]
+            if len(neighbors) == len(region.adjacent_regions):
+                region.attach_adjacency_bits(self.adjacency_bits[self.ids[name]], self.ids)
+            else:
+                region.attach_adjacency_bits(None, None)
+
+    def is_current(self, regions: Dict[str, Region]) -> bool:
+        """True if the graph was built from this regions dict and roster."""
+        return self.source is regions and len(self.names) == len(regions)
+
+    # ════════════════════════════════════════════════════════════
+    # NAME <-> ID
+    # ════════════════════════════════════════════════════════════
+
+    def id_of(self, name: str) -> int:
+        """Region id for name, or -1 if the region does not exist."""
+        return self.ids.get(name, -1)
+
+    def name_of(self, region_id: int) -> str:
+        """Region name for an id."""
+        return self.names[region_id]
+
+    def names_of(self, region_ids: Iterable[int]) -> List[str]:
+        """Region names for ids, in the given order."""
+        names = self.names
+        return [names[rid] for rid in region_ids]
+
+    def bits_of(self, names: Iterable[str]) -> int:
+        """Bitset of the given region names (unknown names ignored)."""
+        bits = 0
+        for name in names:
+            region_id = self.ids.get(name)
+            if region_id is not None:
+                bits |= 1 << region_id
+        return bits
+
+    def names_in(self, bits: int) -> List[str]:
+        """Region names in a bitset, in map order."""
+        names = self.names
+        return [names[rid] for rid in iter_bits(bits)]
+
+    # ════════════════════════════════════════════════════════════
+    # BITSET NEIGHBORHOODS
+    # ════════════════════════════════════════════════════════════
+
+    def within(self, region_id: int, hops: int) -> int:
+        """Bitset of regions 1..hops away (hops clamped to 1..MAX_NEIGHBORHOOD_HOPS)."""
+        hops = max(1, min(hops, MAX_NEIGHBORHOOD_HOPS))
+        return self.within_bits[hops - 1][region_id]
+
+    def common_neighbors(self, region_a: int, region_b: int) -> int:
+        """Bitset of regions adjacent to both a and b."""
+        return self.adjacency_bits[region_a] & self.adjacency_bits[region_b]
+
+    def has_two_hop_path(self, start: int, end: int) -> bool:
+        """True if some intermediate region borders both start and end."""
+        return bool(self.adjacency_bits[start] & self.adjacency_bits[end])
+
+    # ════════════════════════════════════════════════════════════
+    # BFS
+    # ════════════════════════════════════════════════════════════
+
+    def _search(self, source: int) -> Tuple[List[int], List[int], List[int]]:
+        """(hops, parent, discovery order) from source; hops -1 = unreachable."""
+        cached = self._bfs.get(source)
+        if cached is None:
+            hops = [-1] * len(self.names)
+            parent = [-1] * len(self.names)
+            hops[source] = 0
+            order = [source]
+            adjacency = self.adjacency
+            i = 0
+            while i < len(order):
+                current = order[i]
+                i += 1
+                next_hops = hops[current] + 1
+                for adj in adjacency[current]:
+                    if hops[adj] < 0:
+                        hops[adj] = next_hops
+                        parent[adj] = current
+                        order.append(adj)
+            cached = (hops, parent, order)
+            self._bfs[source] = cached
+        return cached
+
+    def hops_from(self, source: int) -> List[int]:
+        """Hop count from source to every region id (-1 if unreachable)."""
+        return self._search(source)[0]
+
+    def distance(self, region_a: str, region_b: str) -> int:
+        """get_distance() semantics: 0 if equal, UNREACHABLE if unknown/unreachable."""
+        if region_a == region_b:
+            return 0
+        a, b = self.ids.get(region_a, -1), self.ids.get(region_b, -1)
+        if a < 0 or b < 0:
+            return UNREACHABLE
+        hops = self._search(a)[0][b]
+        return hops if hops >= 0 else UNREACHABLE
+
+    def path(self, start: int, end: int, avoid: Optional[set] = None) -> Optional[List[int]]:
+        """
+        Shortest path of ids from start to end (inclusive), or None.
+
+        Neighbors are visited in adjacent_regions order, so ties resolve the
+        same way as the old name-based BFS. The destination is never avoided.
+        """
+        if start == end:
+            return [start]
+        if not avoid:
+            hops, parent, _ = self._search(start)
+            if hops[end] < 0:
+                return None
+        else:
+            parent = [-1] * len(self.names)
+            seen = [False] * len(self.names)
+            seen[start] = True
+            queue = [start]
+            i = 0
+            found = False
+            while i < len(queue) and not found:
+                current = queue[i]
+                i += 1
+                for adj in self.adjacency[current]:
+                    if adj == end:
+                        parent[end] = current
+                        found = True
+                        break
+                    if not seen[adj] and adj not in avoid:
+                        seen[adj] = True
+                        parent[adj] = current
+                        queue.append(adj)
+            if not found:
+                return None
+
+        path = [end]
+        while path[-1] != start:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    def neighborhood(self, source: int, radius: int) -> Dict[str, int]:
+        """{region name: hops} for regions within radius of source, BFS order."""
+        key = (source, radius)
+        hood = self._neighborhoods.get(key)
+        if hood is None:
+            hops, _, order = self._search(source)
+            names = self.names
+            hood = {names[rid]: hops[rid] for rid in order if hops[rid] <= radius}
+            self._neighborhoods[key] = hood
+        return hood
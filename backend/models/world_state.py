@@ -9,12 +9,31 @@ Includes Disobedience System (Phase 2):
 - DisobedienceSystem: Handles marshal objections
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import copy
+import itertools
+from typing import Dict, Iterable, List, Optional, Tuple, Any
 from backend.models.region import Region, create_regions
+from backend.models.region_graph import RegionGraph
 from backend.models.marshal import Marshal, create_starting_marshals, create_enemy_marshals
+from backend.models.marshal_table import MarshalTable
 from backend.models.authority import AuthorityTracker
 from backend.commands.vindication import VindicationTracker
 from backend.commands.disobedience import DisobedienceSystem
+from backend.game_logic.profiler import profile_phase
+from backend.utils.field_projection import select
+
+
+# Precomputed neighborhood radius for battle lookups (cannon fire carries 2 regions)
+BATTLE_NEIGHBORHOOD_RADIUS = 2
+
+# Rosters at least this large get a columnar MarshalTable automatically
+# (grand campaigns); smaller games keep plain attribute scans.
+MARSHAL_TABLE_THRESHOLD = 200
+
+# State versions are drawn from one process-wide sequence, so a forked world
+# (see WorldState.fork) never reuses a version number of its parent and
+# version-keyed caches shared across worlds cannot collide.
+_STATE_VERSIONS = itertools.count(1)
 
 
 class WorldState:
@@ -58,6 +77,42 @@ class WorldState:
         # Battle tracking (Phase 5.2 - for cannon fire detection)
         self.battles_this_turn: List[Dict] = []
 
+        # Cannon fire spatial index: region -> indices into battles_this_turn.
+        # Maintained by record_battle()/clear_turn_battles(); rebuilt lazily if
+        # battles_this_turn is reassigned (e.g. from_dict).
+        self._battles_by_region: Dict[str, List[int]] = {}
+        self._battle_index_source: Optional[List[Dict]] = self.battles_this_turn
+        self._battle_index_size: int = 0
+
+        # Integer-interned map (region ids, id adjacency, cached BFS).
+        # Built on first use; rebuilt if self.regions is replaced.
+        self._region_graph: Optional[RegionGraph] = None
+
+        # Per-nation control aggregates (see _get_control): region bitsets,
+        # counts and income totals, kept current by Region.controller changes.
+        # Rebuilt if self.regions is replaced.
+        self._control_bits: Dict[Optional[str], int] = {}
+        self._control_count: Dict[Optional[str], int] = {}
+        self._control_income: Dict[Optional[str], int] = {}
+        self._control_lists: Dict[Optional[str], List[str]] = {}
+        self._control_source: Optional[Dict[str, Region]] = None
+
+        # Marshal ids: assigned in roster order at load, never reused
+        self._marshal_ids: Dict[str, int] = {}
+        self._marshal_names: List[str] = []
+        self._assign_marshal_ids()
+
+        # Columnar marshal mirror for mask queries (see get_marshal_table).
+        # Rebuilt if self.marshals is replaced or its roster size changes.
+        self._marshal_table: Optional[MarshalTable] = None
+
+        # Names of marshals with a pending strategic interrupt, kept current
+        # by Marshal.pending_interrupt changes (see get_pending_interrupt_marshals).
+        # Rebuilt if self.marshals is replaced or its roster size changes.
+        self._pending_interrupts: set = set()
+        self._interrupt_source: Optional[Dict[str, Marshal]] = None
+        self._interrupt_roster_size: int = 0
+
         # ============================================================
         # ACTION ECONOMY SYSTEM - ALL VALUES ARE INTEGERS
         # ============================================================
@@ -143,6 +198,61 @@ class WorldState:
         # Only populated in LLM mode (not mock mode)
         self.command_history: List[Dict[str, Any]] = []
 
+        # ============================================================
+        # STATE VERSION - Cache invalidation for derived data
+        # ============================================================
+        # Bumped whenever game state may have changed (every executed command,
+        # captures, battles, turn advance). Caches of derived data (objection
+        # severity breakdowns, ...) key on it instead of recomputing per call.
+        self._state_version: int = next(_STATE_VERSIONS)
+        # Derived data cached until the next state change (see get_derived)
+        self._derived_cache: Dict[Any, Any] = {}
+
+    def get_state_version(self) -> int:
+        """Current state version (see mark_state_changed)."""
+        return self._state_version
+
+    def mark_state_changed(self) -> None:
+        """Invalidate caches keyed on the state version."""
+        self._state_version = next(_STATE_VERSIONS)
+        self._derived_cache = {}
+
+    def get_derived(self, key: Any, builder) -> Any:
+        """
+        Return builder() cached until the next mark_state_changed().
+
+        For read-only derived data shared by several callers in one state
+        (e.g. valid-action tables). Callers must not mutate the result.
+        """
+        if key not in self._derived_cache:
+            self._derived_cache[key] = builder()
+        return self._derived_cache[key]
+
+    def fork(self) -> 'WorldState':
+        """
+        Independent deep copy for speculative execution.
+
+        The copy shares only immutable data (marshal profiles) and starts at
+        a fresh state version. Commit it with adopt() or just drop it.
+        """
+        forked = copy.deepcopy(self)
+        forked.mark_state_changed()
+        return forked
+
+    def adopt(self, forked: 'WorldState') -> None:
+        """
+        Replace this world's state with a fork's (commit a speculation).
+
+        Done in place so every holder of this WorldState (game_state dicts,
+        the API module) sees the committed state. The fork must not be used
+        afterwards.
+        """
+        self.__dict__.clear()
+        self.__dict__.update(forked.__dict__)
+        # Regions and marshals still notify the fork's bound listeners; point them here
+        self._rebuild_control_aggregates()
+        self._rebuild_pending_interrupts()
+
     def _setup_initial_control(self) -> None:
         """Set up which nation controls which regions at start."""
         # France starts controlling these regions
@@ -173,16 +283,73 @@ class WorldState:
     # ========================================
 
     def get_nation_regions(self, nation: str) -> List[str]:
-        """Get all regions controlled by a specific nation."""
-        return [
-            name for name, region in self.regions.items()
-            if region.controller == nation
-        ]
+        """Get all regions controlled by a specific nation (map order)."""
+        self._get_control()
+        regions = self._control_lists.get(nation)
+        if regions is None:
+            regions = self.get_region_graph().names_in(self._control_bits.get(nation, 0))
+            self._control_lists[nation] = regions
+        return list(regions)
 
     def get_player_regions(self) -> List[str]:
         """Get regions controlled by the player."""
         return self.get_nation_regions(self.player_nation)
 
+    def get_nation_region_count(self, nation: str) -> int:
+        """Number of regions a nation controls (O(1))."""
+        return self._get_control().get(nation, 0)
+
+    def get_nation_income(self, nation: str) -> int:
+        """Sum of income_value over a nation's regions (O(1))."""
+        self._get_control()
+        return self._control_income.get(nation, 0)
+
+    def controls_region(self, nation: str, region_name: str) -> bool:
+        """True if nation controls region_name (e.g. capital ownership)."""
+        region = self.regions.get(region_name)
+        return region is not None and region.controller == nation
+
+    # ========================================
+    # CONTROL AGGREGATES
+    # ========================================
+
+    def _get_control(self) -> Dict[Optional[str], int]:
+        """Region counts by controller, rebuilding aggregates if regions were replaced."""
+        if self._control_source is not self.regions or not self.get_region_graph().is_current(self.regions):
+            self._rebuild_control_aggregates()
+        return self._control_count
+
+    def _rebuild_control_aggregates(self) -> None:
+        """Recount control from scratch and subscribe to controller changes (init, load)."""
+        graph = self.get_region_graph()
+        self._control_bits = {}
+        self._control_count = {}
+        self._control_income = {}
+        self._control_lists = {}
+        for name, region in self.regions.items():
+            self._add_control(region.controller, graph.ids[name], region.income_value)
+            region.attach_control_listener(self._on_control_changed)
+        self._control_source = self.regions
+
+    def _add_control(self, nation: Optional[str], region_id: int, income: int, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one region from a nation's aggregates."""
+        if sign > 0:
+            self._control_bits[nation] = self._control_bits.get(nation, 0) | (1 << region_id)
+        else:
+            self._control_bits[nation] = self._control_bits.get(nation, 0) & ~(1 << region_id)
+        self._control_count[nation] = self._control_count.get(nation, 0) + sign
+        self._control_income[nation] = self._control_income.get(nation, 0) + sign * income
+        self._control_lists.pop(nation, None)
+
+    def _on_control_changed(self, region: Region, old: Optional[str], new: Optional[str]) -> None:
+        """Region.controller listener: move one region between nations."""
+        if self._control_source is not self.regions or self.regions.get(region.name) is not region:
+            self._control_source = None  # Unexpected source; recount on next read
+            return
+        region_id = self.get_region_graph().id_of(region.name)
+        self._add_control(old, region_id, region.income_value, sign=-1)
+        self._add_control(new, region_id, region.income_value)
+
     def get_region(self, region_name: str) -> Optional[Region]:
         """Get a specific region by name."""
         return self.regions.get(region_name)
@@ -218,13 +385,116 @@ class WorldState:
                 and m.nation != nation
                 and m.strength > 0]
 
+    def enable_marshal_table(self) -> MarshalTable:
+        """
+        Attach a columnar MarshalTable regardless of roster size.
+
+        Returns:
+            The (re)built table
+        """
+        self._marshal_table = MarshalTable(self.marshals)
+        return self._marshal_table
+
+    def get_marshal_table(self) -> Optional[MarshalTable]:
+        """
+        Columnar marshal table, or None when queries should scan objects.
+
+        Enabled automatically at MARSHAL_TABLE_THRESHOLD marshals or via
+        enable_marshal_table(); rebuilt when the roster changed.
+        """
+        table = self._marshal_table
+        if table is None:
+            if len(self.marshals) < MARSHAL_TABLE_THRESHOLD:
+                return None
+            return self.enable_marshal_table()
+        if not table.is_current(self.marshals):
+            table.source = self.marshals
+            table.rebuild()
+        return table
+
+    # ========================================
+    # INTERNED IDS
+    # ========================================
+
+    def get_region_graph(self) -> RegionGraph:
+        """Integer-interned region graph, rebuilt if self.regions was replaced."""
+        graph = self._region_graph
+        if graph is None or not graph.is_current(self.regions):
+            graph = RegionGraph(self.regions)
+            self._region_graph = graph
+        return graph
+
+    def get_region_id(self, region_name: str) -> int:
+        """Region id for a name (-1 if unknown)."""
+        return self.get_region_graph().id_of(region_name)
+
+    def get_region_name(self, region_id: int) -> str:
+        """Region name for an id."""
+        return self.get_region_graph().name_of(region_id)
+
+    def _assign_marshal_ids(self) -> None:
+        """Give every marshal in the roster an id (existing ids are kept)."""
+        for name in self.marshals:
+            self.get_marshal_id(name)
+
+    def get_marshal_id(self, marshal_name: str) -> int:
+        """Stable id for a marshal name, assigned on first sight."""
+        marshal_id = self._marshal_ids.get(marshal_name)
+        if marshal_id is None:
+            marshal_id = len(self._marshal_names)
+            self._marshal_ids[marshal_name] = marshal_id
+            self._marshal_names.append(marshal_name)
+        return marshal_id
+
+    def get_marshal_name(self, marshal_id: int) -> str:
+        """Marshal name for an id."""
+        return self._marshal_names[marshal_id]
+
     def get_player_marshals(self) -> List[Marshal]:
         """Get all marshals belonging to the player's nation."""
+        table = self.get_marshal_table()
+        if table is not None:
+            return table.select(nation=self.player_nation, alive=False)
         return [
             marshal for marshal in self.marshals.values()
             if marshal.nation == self.player_nation
         ]
 
+    def get_pending_interrupt_marshals(self) -> List[Marshal]:
+        """
+        Player marshals with a pending strategic interrupt, in roster order.
+
+        O(1) when nothing is pending (the common case): reads a set kept
+        current by Marshal.pending_interrupt instead of scanning the roster.
+        """
+        if self._interrupt_source is not self.marshals or len(self.marshals) != self._interrupt_roster_size:
+            self._rebuild_pending_interrupts()
+        if not self._pending_interrupts:
+            return []
+        pending = [self.marshals[name] for name in self._pending_interrupts]
+        pending.sort(key=lambda m: self.get_marshal_id(m.name))
+        return [m for m in pending if m.nation == self.player_nation]
+
+    def _rebuild_pending_interrupts(self) -> None:
+        """Rescan pending interrupts and subscribe to changes (first use, roster replaced)."""
+        self._pending_interrupts = set()
+        for name, marshal in self.marshals.items():
+            if marshal.pending_interrupt:
+                self._pending_interrupts.add(name)
+            marshal.attach_interrupt_listener(self._on_interrupt_changed)
+        self._interrupt_source = self.marshals
+        self._interrupt_roster_size = len(self.marshals)
+
+    def _on_interrupt_changed(self, marshal: Marshal, pending: bool) -> None:
+        """Marshal.pending_interrupt listener: add/remove one name."""
+        if self._interrupt_source is not self.marshals or self.marshals.get(marshal.name) is not marshal:
+            self._interrupt_source = None  # Unexpected source; rescan on next read
+            return
+        if pending:
+            self._pending_interrupts.add(marshal.name)
+        else:
+            self._pending_interrupts.discard(marshal.name)
+
     def get_enemy_marshals(self) -> List[Marshal]:
         """Get all marshals NOT belonging to the player's nation."""
         return [
@@ -338,6 +608,9 @@ class WorldState:
         Returns:
             List of Marshal objects belonging to that nation
         """
+        table = self.get_marshal_table()
+        if table is not None:
+            return table.select(nation=nation)
         return [
             marshal for marshal in self.marshals.values()
             if marshal.nation == nation and marshal.strength > 0
@@ -355,6 +628,9 @@ class WorldState:
         Returns:
             List of Marshal objects that are enemies of the given nation
         """
+        table = self.get_marshal_table()
+        if table is not None:
+            return table.select(not_nation=nation)
         return [
             marshal for marshal in self.marshals.values()
             if marshal.nation != nation and marshal.strength > 0
@@ -502,6 +778,7 @@ class WorldState:
             return False
 
         region.controller = capturing_nation
+        self.mark_state_changed()
         return True
 
     # ========================================
@@ -725,29 +1002,19 @@ class WorldState:
 
         Args:
             start: Starting region name
-            max_range: Maximum distance (1 or 2)
+            max_range: Maximum distance (1 or 2; larger values act as 2)
 
         Returns:
-            List of region names within range (excluding start)
+            List of region names within range (excluding start), in map order
         """
-        regions = set()
-        start_region = self.get_region(start)
-        if not start_region:
+        graph = self.get_region_graph()
+        start_id = graph.id_of(start)
+        if start_id < 0:
             return []
 
-        # Add all adjacent regions (distance 1)
-        for adj_name in start_region.adjacent_regions:
-            regions.add(adj_name)
-
-            # If range is 2, add regions adjacent to adjacent
-            if max_range >= 2:
-                adj_region = self.get_region(adj_name)
-                if adj_region:
-                    for adj2_name in adj_region.adjacent_regions:
-                        if adj2_name != start:  # Don't include starting region
-                            regions.add(adj2_name)
-
-        return list(regions)
+        # Precomputed k-hop neighborhood bitset (start itself excluded).
+        # Never more than 2 hops, as before the graph existed.
+        return graph.names_in(graph.within(start_id, min(max_range, 2)))
 
     def _has_valid_path(self, start: str, end: str) -> bool:
         """
@@ -762,19 +1029,14 @@ class WorldState:
         Returns:
             True if valid path exists, False otherwise
         """
-        start_region = self.get_region(start)
-        end_region = self.get_region(end)
+        graph = self.get_region_graph()
+        start_id, end_id = graph.id_of(start), graph.id_of(end)
 
-        if not start_region or not end_region:
+        if start_id < 0 or end_id < 0:
             return False
 
-        # Check if any adjacent region of start is also adjacent to end
-        for adj_name in start_region.adjacent_regions:
-            adj_region = self.get_region(adj_name)
-            if adj_region and end in adj_region.adjacent_regions:
-                return True
-
-        return False
+        # Any region adjacent to both start and end (one AND on the bitsets)
+        return graph.has_two_hop_path(start_id, end_id)
 
     def _region_is_threatened(self, region_name: str) -> bool:
         """
@@ -821,31 +1083,8 @@ class WorldState:
     # ========================================
 
     def get_distance(self, region_a: str, region_b: str) -> int:
-        """Calculate distance between two regions (in hops). Uses BFS."""
-        if region_a == region_b:
-            return 0
-
-        if region_a not in self.regions or region_b not in self.regions:
-            return 999  # Invalid regions
-
-        # BFS to find shortest path
-        visited = {region_a}
-        queue = [(region_a, 0)]  # (region, distance)
-
-        while queue:
-            current, distance = queue.pop(0)
-
-            # Check adjacent regions
-            current_region = self.regions[current]
-            for adjacent in current_region.adjacent_regions:
-                if adjacent == region_b:
-                    return distance + 1
-
-                if adjacent not in visited:
-                    visited.add(adjacent)
-                    queue.append((adjacent, distance + 1))
-
-        return 999  # Not reachable
+        """Calculate distance between two regions (in hops). Uses BFS on region ids."""
+        return self.get_region_graph().distance(region_a, region_b)
 
     # ========================================
     # BATTLE TRACKING (Phase 5.2 - cannon fire detection)
@@ -858,6 +1097,9 @@ class WorldState:
 
         Called by combat.py after resolve_combat().
         """
+        self.mark_state_changed()
+        index = self._get_battle_index()
+        index.setdefault(location, []).append(len(self.battles_this_turn))
         self.battles_this_turn.append({
             "location": location,
             "attacker": attacker,
@@ -865,22 +1107,68 @@ class WorldState:
             "result": result,
             "turn": self.current_turn
         })
+        self._battle_index_size = len(self.battles_this_turn)
 
     def get_battles_within_range(self, location: str, max_distance: int) -> List[Dict]:
-        """Get battles within max_distance regions of location."""
-        nearby = []
-        for battle in self.battles_this_turn:
-            distance = self.get_distance(location, battle["location"])
-            if distance <= max_distance:
-                nearby.append(battle)
-        return nearby
+        """
+        Get battles within max_distance regions of location.
+
+        Uses the region-indexed battle table and the precomputed neighborhood
+        table, so a lookup touches only regions that actually saw fighting.
+        Battles are returned in the order they were recorded.
+        """
+        if max_distance > BATTLE_NEIGHBORHOOD_RADIUS:
+            # Beyond the precomputed radius - fall back to BFS per battle
+            return [
+                battle for battle in self.battles_this_turn
+                if self.get_distance(location, battle.get("location")) <= max_distance
+            ]
+
+        index = self._get_battle_index()
+        if not index:
+            return []
+
+        neighborhood = self._get_neighborhood(location)
+        hits = []
+        for region_name, battle_ids in index.items():
+            hops = neighborhood.get(region_name)
+            if hops is not None and hops <= max_distance:
+                hits.extend(battle_ids)
+        hits.sort()
+        return [self.battles_this_turn[i] for i in hits]
 
     def clear_turn_battles(self) -> None:
         """Clear battle tracking at start of turn."""
         self.battles_this_turn = []
+        self._battles_by_region = {}
+        self._battle_index_source = self.battles_this_turn
+        self._battle_index_size = 0
         for marshal in self.marshals.values():
             marshal.in_combat_this_turn = False
 
+    def _get_battle_index(self) -> Dict[str, List[int]]:
+        """Region -> battle indices, rebuilt if battles_this_turn was replaced or edited directly."""
+        battles = self.battles_this_turn
+        if self._battle_index_source is not battles or self._battle_index_size != len(battles):
+            self._battles_by_region = {}
+            for i, battle in enumerate(battles):
+                self._battles_by_region.setdefault(battle.get("location"), []).append(i)
+            self._battle_index_source = battles
+            self._battle_index_size = len(battles)
+        return self._battles_by_region
+
+    def _get_neighborhood(self, location: str) -> Dict[str, int]:
+        """
+        Regions within BATTLE_NEIGHBORHOOD_RADIUS hops of location, with hop counts.
+
+        Matches get_distance(): an unknown location only "neighbors" itself.
+        """
+        graph = self.get_region_graph()
+        region_id = graph.id_of(location)
+        if region_id < 0:
+            return {location: 0}
+        return graph.neighborhood(region_id, BATTLE_NEIGHBORHOOD_RADIUS)
+
     def find_path(self, start: str, end: str, avoid_regions: List[str] = None) -> Optional[List[str]]:
         """
         Find shortest path between two regions using BFS.
@@ -897,30 +1185,14 @@ class WorldState:
         if start == end:
             return [start]
 
-        if start not in self.regions or end not in self.regions:
+        graph = self.get_region_graph()
+        start_id, end_id = graph.id_of(start), graph.id_of(end)
+        if start_id < 0 or end_id < 0:
             return None
 
-        if avoid_regions is None:
-            avoid_regions = []
-
-        # BFS with path tracking
-        visited = {start}
-        queue = [(start, [start])]  # (current_region, path_to_here)
-
-        while queue:
-            current, path = queue.pop(0)
-
-            # Check adjacent regions
-            current_region = self.regions[current]
-            for adjacent in current_region.adjacent_regions:
-                if adjacent == end:
-                    return path + [end]
-
-                if adjacent not in visited and adjacent not in avoid_regions:
-                    visited.add(adjacent)
-                    queue.append((adjacent, path + [adjacent]))
-
-        return None  # Not reachable
+        avoid = {graph.id_of(name) for name in avoid_regions} if avoid_regions else None
+        path = graph.path(start_id, end_id, avoid)
+        return graph.names_of(path) if path is not None else None
 
     # ============================================================================
     # PATCH 2 CORRECTED: backend/models/world_state.py
@@ -1081,18 +1353,14 @@ class WorldState:
 
     def calculate_turn_income(self) -> Dict:
         """Calculate income for the current turn."""
-        player_regions = self.get_player_regions()
+        region_count = self.get_nation_region_count(self.player_nation)
 
-        # Base income from regions
-        base_income = 0
-        for region_name in player_regions:
-            region = self.regions[region_name]
-            base_income += region.income_value
+        # Base income from regions (running total, see CONTROL AGGREGATES)
+        base_income = self.get_nation_income(self.player_nation)
 
         # Capital bonus
         capital_bonus = 0
-        paris = self.regions.get("Paris")
-        if paris and paris.controller == self.player_nation:
+        if self.controls_region(self.player_nation, "Paris"):
             capital_bonus = 200
 
         total_income = base_income + capital_bonus
@@ -1100,12 +1368,12 @@ class WorldState:
         return {
             "income": total_income,
             "breakdown": {
-                "regions": len(player_regions),
+                "regions": region_count,
                 "base_income": base_income,
                 "capital_bonus": capital_bonus,
                 "total": total_income
             },
-            "message": f"Turn {self.current_turn} income: {total_income} gold ({len(player_regions)} regions)"
+            "message": f"Turn {self.current_turn} income: {total_income} gold ({region_count} regions)"
         }
 
     def apply_turn_income(self) -> Dict:
@@ -1278,12 +1546,16 @@ class WorldState:
             world.regions = {}
             for name, region_data in data["regions"].items():
                 world.regions[name] = Region.from_dict(region_data)
+            world._rebuild_control_aggregates()
 
         # ═══════ MARSHALS ═══════
         if data.get("marshals"):
             world.marshals = {}
             for name, marshal_data in data["marshals"].items():
                 world.marshals[name] = Marshal.from_dict(marshal_data)
+            world._marshal_ids = {}
+            world._marshal_names = []
+            world._assign_marshal_ids()
 
         # ═══════ DISOBEDIENCE SYSTEM ═══════
         if data.get("authority_tracker"):
@@ -1379,117 +1651,155 @@ class WorldState:
         # Use from_dict for actual loading
         return cls.from_dict(scenario_data)
 
-    def get_game_state_summary(self) -> Dict:
-        """Get a summary of current game state for API responses."""
-        # Build map_data with marshals (including debug info for player marshals)
-        map_data = {}
-        for region_name, region in self.regions.items():
-            # Get all alive marshals in this region
-            marshals_here = self.get_marshals_in_region(region_name)
-            alive_marshals = [m for m in marshals_here if m.strength > 0]
-
-            marshals_data = []
-            for m in alive_marshals:
-                marshal_data = {
-                    "name": m.name,
-                    "nation": m.nation,
-                    "strength": int(m.strength),
-                    "morale": int(m.morale),
-                    "movement_range": int(m.movement_range)
-                }
-
-                # Add debug info for player marshals
-                if m.nation == self.player_nation:
-                    marshal_data["personality"] = m.personality
-                    marshal_data["trust"] = int(m.trust.value) if hasattr(m, 'trust') else 70
-                    marshal_data["trust_label"] = m.trust.get_label() if hasattr(m, 'trust') else "Unknown"
-
-                    # Get vindication data
-                    vindication_data = self.vindication_tracker.get_vindication_data(m.name)
-                    marshal_data["vindication"] = vindication_data.get("score", 0)
-                    marshal_data["has_pending_vindication"] = self.vindication_tracker.has_pending(m.name)
-
-                    # Combat skills for hover display
-                    marshal_data["skills"] = {
-                        "shock": int(m.skills.get("shock", 5)) if hasattr(m, 'skills') else 5,
-                        "defense": int(m.skills.get("defense", 5)) if hasattr(m, 'skills') else 5,
-                        "tactical": int(m.skills.get("tactical", 5)) if hasattr(m, 'skills') else 5,
-                    }
-
-                    # Tactical states for hover info
-                    marshal_data["tactical_state"] = {
-                        # Stance (BUG-007 FIX: Added stance to tactical_state)
-                        "stance": m.stance.value if hasattr(m, 'stance') else "neutral",
-                        # Drill state
-                        "drilling": bool(getattr(m, 'drilling', False)),
-                        "drilling_locked": bool(getattr(m, 'drilling_locked', False)),
-                        "shock_bonus": int(getattr(m, 'shock_bonus', 0)),
-                        "drill_complete_turn": int(getattr(m, 'drill_complete_turn', -1)),
-                        # Fortify state
-                        "fortified": bool(getattr(m, 'fortified', False)),
-                        "defense_bonus": int(getattr(m, 'defense_bonus', 0) * 100),  # Convert 0.02 -> 2%
-                        "fortify_expires_turn": int(getattr(m, 'fortify_expires_turn', -1)),
-                        # Fortify direction for arrow display (Phase 3)
-                        "fortify_state": self._get_fortify_state(m),
-                        # Retreat state
-                        "retreating": bool(getattr(m, 'retreating', False)),
-                        "retreat_recovery": int(getattr(m, 'retreat_recovery', 0)),
-                        # Personality ability states (Phase 2.8)
-                        "cavalry": bool(getattr(m, 'cavalry', False)),
-                        "turns_defensive": int(getattr(m, 'turns_defensive', 0)),
-                        "counter_punch_available": bool(getattr(m, 'counter_punch_available', False)),
-                        "counter_punch_turns": int(getattr(m, 'counter_punch_turns', 0)),
-                        "holding_position": bool(getattr(m, 'holding_position', False)),
-                        "hold_region": str(getattr(m, 'hold_region', '')),
-                        # Broken army state (surrounded + forced retreat)
-                        "broken": bool(getattr(m, 'broken', False)),
-                        "broken_recovery": int(getattr(m, 'broken_recovery', 0)),
-                        # Cavalry Recklessness (Phase 3)
-                        "recklessness": int(getattr(m, 'recklessness', 0)),
-                        "is_reckless_cavalry": bool(getattr(m, 'is_reckless_cavalry', False) if hasattr(m, 'is_reckless_cavalry') else False),
-                        "pending_glorious_charge": bool(getattr(m, 'pending_glorious_charge', False)),
-                        "pending_charge_target": str(getattr(m, 'pending_charge_target', '')),
-                        # Strategic Orders (Phase J)
-                        "in_strategic_mode": bool(m.in_strategic_mode),
-                        "strategic_command_type": str(m.strategic_command_type) if m.strategic_command_type else "",
-                        "strategic_target": str(m.strategic_order.target) if m.strategic_order else "",
-                    }
-
-                marshals_data.append(marshal_data)
-
-            map_data[region_name] = {
-                "controller": region.controller,
-                "marshals": marshals_data
-            }
+    def get_game_state_summary(self, fields: Optional[Dict] = None) -> Dict:
+        """
+        Get a summary of current game state for API responses.
 
-        return {
-            "turn": int(self.current_turn),  # Explicit int cast
-            "max_turns": int(self.max_turns),
-            "gold": int(self.gold),
-            "player_nation": self.player_nation,
-            "regions_controlled": len(self.get_player_regions()),
-            "total_regions": len(self.regions),
-            "map_data": map_data,
-            "marshals": {
-                name: {
-                    "location": m.location,
-                    "strength": int(m.strength),
-                    "morale": int(m.morale)
-                }
+        Args:
+            fields: Projection tree from utils.field_projection.parse_fields()
+                    (None = full summary). Only selected fields are computed.
+        """
+        summary: Dict[str, Any] = {}
+        scalars = {
+            "turn": lambda: int(self.current_turn),  # Explicit int cast
+            "max_turns": lambda: int(self.max_turns),
+            "gold": lambda: int(self.gold),
+            "player_nation": lambda: self.player_nation,
+            "regions_controlled": lambda: self.get_nation_region_count(self.player_nation),
+            "total_regions": lambda: len(self.regions),
+        }
+        for key, value in scalars.items():
+            if select(fields, key):
+                summary[key] = value()
+
+        map_spec = select(fields, "map_data")
+        if map_spec:
+            summary["map_data"] = self._summarize_map(map_spec)
+
+        marshal_spec = select(fields, "marshals")
+        if marshal_spec:
+            summary["marshals"] = {
+                name: self._project(marshal_spec, {
+                    "location": lambda m=m: m.location,
+                    "strength": lambda m=m: int(m.strength),
+                    "morale": lambda m=m: int(m.morale),
+                })
                 for name, m in self.marshals.items()
                 if m.nation == self.player_nation
-            },
-            "enemies": {
-                name: {
-                    "location": m.location,
-                    "strength": int(m.strength),
-                    "nation": m.nation
-                }
+            }
+        enemy_spec = select(fields, "enemies")
+        if enemy_spec:
+            summary["enemies"] = {
+                name: self._project(enemy_spec, {
+                    "location": lambda m=m: m.location,
+                    "strength": lambda m=m: int(m.strength),
+                    "nation": lambda m=m: m.nation,
+                })
                 for name, m in self.marshals.items()
                 if m.nation != self.player_nation
+            }
+
+        if select(fields, "game_over"):
+            summary["game_over"] = self.game_over
+        if select(fields, "victory"):
+            summary["victory"] = self.victory
+        return summary
+
+    @staticmethod
+    def _project(spec, builders: Dict[str, Any]) -> Dict:
+        """Call the builders selected by spec."""
+        return {key: build() for key, build in builders.items() if select(spec, key)}
+
+    def _summarize_map(self, spec) -> Dict:
+        """map_data for get_game_state_summary(): controller and alive marshals per region."""
+        with_controller = select(spec, "controller")
+        marshal_spec = select(spec, "marshals")
+        map_data = {}
+        for region_name, region in self.regions.items():
+            entry = {}
+            if with_controller:
+                entry["controller"] = region.controller
+            if marshal_spec:
+                # Get all alive marshals in this region
+                entry["marshals"] = [
+                    self._summarize_map_marshal(m, marshal_spec)
+                    for m in self.get_marshals_in_region(region_name) if m.strength > 0
+                ]
+            map_data[region_name] = entry
+        return map_data
+
+    def _summarize_map_marshal(self, m: Marshal, spec) -> Dict:
+        """One map_data marshal entry (debug info for player marshals)."""
+        builders = {
+            "name": lambda: m.name,
+            "nation": lambda: m.nation,
+            "strength": lambda: int(m.strength),
+            "morale": lambda: int(m.morale),
+            "movement_range": lambda: int(m.movement_range),
+            # Relationships (Phase 4) - debug projection only
+            "relationships": lambda: {
+                name: int(value) for name, value in getattr(m, 'relationships', {}).items()
             },
-            "game_over": self.game_over,
-            "victory": self.victory
+        }
+        if m.nation == self.player_nation:
+            builders.update({
+                "personality": lambda: m.personality,
+                "trust": lambda: int(m.trust.value) if hasattr(m, 'trust') else 70,
+                "trust_label": lambda: m.trust.get_label() if hasattr(m, 'trust') else "Unknown",
+                # Get vindication data
+                "vindication": lambda: self.vindication_tracker.get_vindication_data(m.name).get("score", 0),
+                "has_pending_vindication": lambda: self.vindication_tracker.has_pending(m.name),
+                # Combat skills for hover display
+                "skills": lambda: {
+                    "shock": int(m.skills.get("shock", 5)) if hasattr(m, 'skills') else 5,
+                    "defense": int(m.skills.get("defense", 5)) if hasattr(m, 'skills') else 5,
+                    "tactical": int(m.skills.get("tactical", 5)) if hasattr(m, 'skills') else 5,
+                },
+                # Tactical states for hover info
+                "tactical_state": lambda: self._summarize_tactical_state(m),
+            })
+        entry = self._project(spec, builders)
+        entry.setdefault("name", m.name)  # Entries stay identifiable under any projection
+        return entry
+
+    def _summarize_tactical_state(self, m: Marshal) -> Dict:
+        """tactical_state hover info for a player marshal's map entry."""
+        return {
+            # Stance (BUG-007 FIX: Added stance to tactical_state)
+            "stance": m.stance.value if hasattr(m, 'stance') else "neutral",
+            # Drill state
+            "drilling": bool(getattr(m, 'drilling', False)),
+            "drilling_locked": bool(getattr(m, 'drilling_locked', False)),
+            "shock_bonus": int(getattr(m, 'shock_bonus', 0)),
+            "drill_complete_turn": int(getattr(m, 'drill_complete_turn', -1)),
+            # Fortify state
+            "fortified": bool(getattr(m, 'fortified', False)),
+            "defense_bonus": int(getattr(m, 'defense_bonus', 0) * 100),  # Convert 0.02 -> 2%
+            "fortify_expires_turn": int(getattr(m, 'fortify_expires_turn', -1)),
+            # Fortify direction for arrow display (Phase 3)
+            "fortify_state": self._get_fortify_state(m),
+            # Retreat state
+            "retreating": bool(getattr(m, 'retreating', False)),
+            "retreat_recovery": int(getattr(m, 'retreat_recovery', 0)),
+            # Personality ability states (Phase 2.8)
+            "cavalry": bool(getattr(m, 'cavalry', False)),
+            "turns_defensive": int(getattr(m, 'turns_defensive', 0)),
+            "counter_punch_available": bool(getattr(m, 'counter_punch_available', False)),
+            "counter_punch_turns": int(getattr(m, 'counter_punch_turns', 0)),
+            "holding_position": bool(getattr(m, 'holding_position', False)),
+            "hold_region": str(getattr(m, 'hold_region', '')),
+            # Broken army state (surrounded + forced retreat)
+            "broken": bool(getattr(m, 'broken', False)),
+            "broken_recovery": int(getattr(m, 'broken_recovery', 0)),
+            # Cavalry Recklessness (Phase 3)
+            "recklessness": int(getattr(m, 'recklessness', 0)),
+            "is_reckless_cavalry": bool(getattr(m, 'is_reckless_cavalry', False) if hasattr(m, 'is_reckless_cavalry') else False),
+            "pending_glorious_charge": bool(getattr(m, 'pending_glorious_charge', False)),
+            "pending_charge_target": str(getattr(m, 'pending_charge_target', '')),
+            # Strategic Orders (Phase J)
+            "in_strategic_mode": bool(m.in_strategic_mode),
+            "strategic_command_type": str(m.strategic_command_type) if m.strategic_command_type else "",
+            "strategic_target": str(m.strategic_order.target) if m.strategic_order else "",
         }
 
     # ========================================
@@ -1600,6 +1910,7 @@ class WorldState:
 
         IMPORTANT: Processes tactical states BEFORE advancing turn counter.
         """
+        self.mark_state_changed()
         # ════════════════════════════════════════════════════════════
         # CLEAR PER-TURN FLAGS (at turn start)
         # ════════════════════════════════════════════════════════════
@@ -1613,14 +1924,16 @@ class WorldState:
         # ════════════════════════════════════════════════════════════
         # PROCESS TACTICAL STATES (before turn counter advances!)
         # ════════════════════════════════════════════════════════════
-        tactical_events = self._process_tactical_states()
+        with profile_phase("advance_turn.tactical_states"):
+            tactical_events = self._process_tactical_states()
         # NOTE: _last_tactical_events stored AFTER all events collected (see below)
 
         old_turn = self.current_turn
         self.current_turn = int(self.current_turn + 1)
 
         # Apply income
-        income_data = self.calculate_turn_income()
+        with profile_phase("advance_turn.income"):
+            income_data = self.calculate_turn_income()
         self.gold = int(self.gold + income_data["income"])
 
         # Reset actions (recalculate in case bonuses changed)
@@ -1637,7 +1950,8 @@ class WorldState:
         # CAVALRY LIMITS CHECK (Phase 2.8) - Turn Start
         # Cavalry cannot hold defensive positions - auto-switch after 3 turns
         # ════════════════════════════════════════════════════════════
-        cavalry_events = self._check_cavalry_limits()
+        with profile_phase("advance_turn.cavalry_limits"):
+            cavalry_events = self._check_cavalry_limits()
         if cavalry_events:
             tactical_events.extend(cavalry_events)
 
@@ -1645,7 +1959,8 @@ class WorldState:
         # TRUST TRAJECTORY WARNINGS (Phase 3) - Turn Start
         # Alert player when marshal trust drops below 40 (one-time per crossing)
         # ════════════════════════════════════════════════════════════
-        trust_warnings = self._check_trust_warnings()
+        with profile_phase("advance_turn.trust_warnings"):
+            trust_warnings = self._check_trust_warnings()
         if trust_warnings:
             tactical_events.extend(trust_warnings)
 
@@ -1654,7 +1969,8 @@ class WorldState:
         # Reckless cavalry at recklessness 4+ auto-charges or moves toward enemy
         # This happens BEFORE player gets to act
         # ════════════════════════════════════════════════════════════
-        reckless_events = self._process_reckless_cavalry_turn_start()
+        with profile_phase("advance_turn.reckless_cavalry"):
+            reckless_events = self._process_reckless_cavalry_turn_start()
         if reckless_events:
             print(f"  [DEBUG] Adding {len(reckless_events)} reckless cavalry events to tactical_events")
             tactical_events.extend(reckless_events)
@@ -1666,7 +1982,7 @@ class WorldState:
         # Check for game over
         if self.current_turn > self.max_turns:
             self.game_over = True
-            player_regions = len(self.get_player_regions())
+            player_regions = self.get_nation_region_count(self.player_nation)
             if player_regions >= 8:
                 self.victory = "victory"
             else:
@@ -2164,11 +2480,13 @@ class WorldState:
                 print(f"  [AUTO-CHARGE] {marshal.name} (recklessness {recklessness}) charges {enemy.name}!")
                 print(f"  [AUTO-CHARGE DEBUG] marshal.location={marshal.location}, enemy.location={enemy.location}")
 
-                # Execute combat with glorious charge
+                # Execute combat with glorious charge (narrated only when
+                # one of the player's marshals is involved)
                 combat_result = combat_resolver.resolve_battle(
                     attacker=marshal,
                     defender=enemy,
-                    glorious_charge=True
+                    glorious_charge=True,
+                    narrate=self.player_nation in (marshal.nation, enemy.nation)
                 )
                 print(f"  [AUTO-CHARGE DEBUG] Combat result victor: {combat_result.get('victor')}")
 
@@ -2369,7 +2687,7 @@ class WorldState:
 
         return attack_record
 
-    def calculate_flanking_bonus(self, target_region: str) -> Dict:
+    def calculate_flanking_bonus(self, target_region: str, planned_origins: Iterable[str] = ()) -> Dict:
         """
         Calculate flanking bonus based on UNIQUE attack origins.
 
@@ -2378,6 +2696,8 @@ class WorldState:
 
         Args:
             target_region: The region being attacked
+            planned_origins: Origins of attacks ordered together with this
+                one (coordinated group order) that have not been made yet
 
         Returns:
             Dict with:
@@ -2385,7 +2705,8 @@ class WorldState:
             - unique_origins: set of origin region names
             - message: str describing the flanking situation
         """
-        if target_region not in self.attacks_this_turn:
+        origins = set(planned_origins)
+        if target_region not in self.attacks_this_turn and not origins:
             return {
                 "bonus": 0,
                 "unique_origins": set(),
@@ -2393,8 +2714,7 @@ class WorldState:
                 "message": None
             }
 
-        attacks = self.attacks_this_turn[target_region]
-        origins = set()
+        attacks = self.attacks_this_turn.get(target_region, [])
 
         for attack in attacks:
             origins.add(attack["origin"])
@@ -2422,7 +2742,8 @@ class WorldState:
             "message": message
         }
 
-    def get_flanking_message(self, attacker_name: str, origin: str, target_region: str) -> Optional[str]:
+    def get_flanking_message(self, attacker_name: str, origin: str, target_region: str,
+                             flanking_info: Optional[Dict] = None) -> Optional[str]:
         """
         Generate appropriate flanking message for THIS attack based on previous attacks.
 
@@ -2430,11 +2751,13 @@ class WorldState:
             attacker_name: Name of current attacker
             origin: Origin region of current attacker
             target_region: Target region being attacked
+            flanking_info: calculate_flanking_bonus() result if already computed
 
         Returns:
             Flanking message string or None if no flanking bonus
         """
-        flanking_info = self.calculate_flanking_bonus(target_region)
+        if flanking_info is None:
+            flanking_info = self.calculate_flanking_bonus(target_region)
 
         if flanking_info["bonus"] == 0:
             return None
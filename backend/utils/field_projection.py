@@ -0,0 +1,127 @@
+"""
+Response Field Projection for Project Sovereign
+
+Action endpoints return the game state summary with every response. Most
+clients only redraw part of it (a HUD, region colours), so they can ask
+for a projection:
+
+    POST /command?fields=turn,map.controller,marshals.strength
+    POST /command?profile=hud
+
+and WorldState.get_game_state_summary() computes only those fields.
+Without either parameter the full summary is returned, as before.
+
+SPEC FORMAT
+Comma-separated dotted paths into the summary. "map" is short for
+"map_data"; "*" selects every default field at that level, e.g.
+"map.*,map.marshals.relationships" is the full map plus relationships.
+Map marshal entries always carry "name".
+
+Parsed specs are trees: {"turn": True, "map_data": {"controller": True}}
+where True selects the whole subtree.
+"""
+
+from typing import Dict, Optional, Union
+
+Spec = Union[bool, Dict[str, "Spec"]]
+
+# Selectable summary fields. None = leaf; nested dicts list sub-fields.
+# Fields marked debug-only are left out of "*" and the full summary.
+MAP_MARSHAL_FIELDS = {
+    "name": None, "nation": None, "strength": None, "morale": None, "movement_range": None,
+    "personality": None, "trust": None, "trust_label": None, "vindication": None,
+    "has_pending_vindication": None, "skills": None, "tactical_state": None,
+    "relationships": None,  # Debug-only
+}
+DEBUG_ONLY_FIELDS = {"relationships"}
+
+GAME_STATE_FIELDS = {
+    "turn": None, "max_turns": None, "gold": None, "player_nation": None,
+    "regions_controlled": None, "total_regions": None,
+    "map_data": {"controller": None, "marshals": MAP_MARSHAL_FIELDS},
+    "marshals": {"location": None, "strength": None, "morale": None},
+    "enemies": {"location": None, "strength": None, "nation": None},
+    "game_over": None, "victory": None,
+}
+
+ALIASES = {"map": "map_data"}
+
+# Named profiles (None = full summary)
+PROFILES: Dict[str, Optional[str]] = {
+    # Turn counter and end-of-game flags only
+    "minimal": "turn,game_over,victory",
+    # Top bar, army list and region colours
+    "hud": "turn,max_turns,gold,regions_controlled,total_regions,game_over,victory,"
+           "marshals,map.controller",
+    "full": None,
+    # Full summary plus debug-only fields
+    "debug": "*,map.*,map.marshals.*,map.marshals.relationships",
+}
+
+
+def parse_fields(fields: Optional[str] = None, profile: Optional[str] = None) -> Optional[Dict]:
+    """
+    Turn ?fields= / ?profile= into a projection tree.
+
+    Args:
+        fields: Comma-separated dotted paths (takes precedence over profile)
+        profile: Name in PROFILES
+
+    Returns:
+        Projection tree, or None for the full summary
+
+    Raises:
+        ValueError: Unknown profile or field path
+    """
+    if not fields:
+        if not profile:
+            return None
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile '{profile}'. Profiles: {', '.join(PROFILES)}")
+        fields = PROFILES[profile]
+        if fields is None:
+            return None
+
+    spec: Dict[str, Spec] = {}
+    for path in fields.split(","):
+        path = path.strip()
+        if not path:
+            continue
+        node, schema = spec, GAME_STATE_FIELDS
+        parts = [ALIASES.get(p, p) if i == 0 else p for i, p in enumerate(path.split("."))]
+        for depth, part in enumerate(parts):
+            last = depth == len(parts) - 1
+            if part == "*" and last:
+                node["*"] = True
+                break
+            if not isinstance(schema, dict) or part not in schema:
+                raise ValueError(f"Unknown field '{path}'")
+            schema = schema[part]
+            if last:
+                if isinstance(node.get(part), dict):
+                    node[part]["*"] = True  # "map.x" then "map": everything
+                else:
+                    node[part] = True
+            else:
+                child = node.get(part)
+                if child is True:
+                    child = {"*": True}  # "map" then "map.x": keep everything, add x
+                elif child is None:
+                    child = {}
+                node[part] = child
+                node = child
+    return spec
+
+
+def select(spec: Optional[Spec], key: str) -> Optional[Spec]:
+    """
+    Sub-spec for key: None = not selected, True = whole subtree,
+    dict = partial. spec None/True means "default fields".
+    """
+    if spec is None or spec is True:
+        return None if key in DEBUG_ONLY_FIELDS else True
+    if key in spec:
+        return spec[key]
+    if "*" in spec and key not in DEBUG_ONLY_FIELDS:
+        return True
+    return None
@@ -0,0 +1,306 @@
+"""
+Operational Metrics for Project Sovereign
+
+Minimal Prometheus-style counters and histograms (text exposition format,
+no client library needed), served by GET /metrics in main.py.
+
+Cheap enough to leave on under load:
+- Label children are created once and cached; recording is a dict lookup,
+  a bisect over the bucket bounds and two additions under a per-metric lock.
+- Nothing is formatted until /metrics is scraped.
+- Collectors (turn profile, sessions) run only at scrape time.
+
+Usage:
+    PARSE_PATH_TOTAL.labels("fast").inc()
+    with LLM_REQUEST_SECONDS.labels("anthropic", "ok").time(): ...
+"""
+
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets (seconds): sub-ms API handlers up to multi-second LLM calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# (metric name, type, help, [(labels, value), ...]) produced by collectors
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values) -> object:
+        """Child for one label combination (cached)."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            lines.extend(child.render(self.name, self.labelnames, key))
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def render(self, name, labelnames, key) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, key)} {_format_value(self.value)}"]
+
+
+class Counter(_Metric):
+    """Monotonic counter (name should end in _total)."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...], lock: threading.Lock):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot = +Inf
+        self.sum = 0.0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the block's wall time in seconds."""
+        return _Timer(self)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def render(self, name, labelnames, key) -> List[str]:
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (float("inf"),), counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, key, le)} {cumulative}")
+        labels = _format_labels(labelnames, key)
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("child", "start")
+
+    def __init__(self, child: _HistogramChild):
+        self.child = child
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.child.observe(time.perf_counter() - self.start)
+        return False
+
+
+class Histogram(_Metric):
+    """Bucketed distribution (exposed as _bucket/_sum/_count)."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value: float) -> None:
+        """Observe on the unlabelled histogram."""
+        self.labels().observe(value)
+
+
+class Registry:
+    """Metrics plus scrape-time collectors, rendered in registration order."""
+
+    def __init__(self):
+        self.metrics: List[_Metric] = []
+        self.collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """Add a callable producing metric families at scrape time."""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric and collector."""
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        for collector in self.collectors:
+            for name, kind, help_text, samples in collector():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    label_str = _format_labels(list(labels), list(labels.values()))
+                    lines.append(f"{name}{label_str} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# ════════════════════════════════════════════════════════════
+# METRICS
+# ════════════════════════════════════════════════════════════
+
+HTTP_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "sovereign_http_request_duration_seconds",
+    "API request latency by route template",
+    ("method", "route"),
+))
+
+PARSE_PATH_TOTAL = REGISTRY.register(Counter(
+    "sovereign_parse_path_total",
+    "Commands by parse path (fast, classifier, llm, validation_fallback, "
+    "unmatched_fallback, error_fallback, timeout_fallback)",
+    ("path",),
+))
+
+LLM_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "sovereign_llm_request_duration_seconds",
+    "LLM provider HTTP latency by outcome",
+    ("provider", "outcome"),
+))
+
+LLM_TOKENS_TOTAL = REGISTRY.register(Counter(
+    "sovereign_llm_tokens_total",
+    "LLM tokens reported by the provider",
+    ("provider", "kind"),
+))
+
+LLM_BATCH_SIZE = REGISTRY.register(Histogram(
+    "sovereign_llm_batch_size",
+    "Commands per micro-batched provider request",
+    buckets=(1, 2, 4, 8, 16, 32),
+))
+
+LLM_SHORT_CIRCUIT_TOTAL = REGISTRY.register(Counter(
+    "sovereign_llm_short_circuit_total",
+    "Provider calls skipped straight to the fast parser (circuit_open, rate_limited, hedge_timeout)",
+    ("provider", "reason"),
+))
+
+LLM_HEDGE_TOTAL = REGISTRY.register(Counter(
+    "sovereign_llm_hedge_total",
+    "Hedged provider calls by which provider answered (primary, hedge, neither)",
+    ("winner",),
+))
+
+SPECULATION_TOTAL = REGISTRY.register(Counter(
+    "sovereign_speculation_total",
+    "Speculative fast-parse executions by outcome (committed, discarded, stale)",
+    ("outcome",),
+))
+
+ENEMY_PHASE_SECONDS = REGISTRY.register(Histogram(
+    "sovereign_enemy_phase_duration_seconds",
+    "Wall time of the enemy phase per end turn",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+))
+
+
+def _turn_profile_families() -> Iterable[Family]:
+    """Cross-turn profiler aggregate (see backend/game_logic/profiler.py)."""
+    from backend.game_logic.profiler import GROUPS, TURN_METRICS
+
+    snapshot = TURN_METRICS.snapshot()
+    yield ("sovereign_turns_total", "counter", "End turns processed",
+           [({}, snapshot["turns"])])
+    seconds, calls = [], []
+    for group in GROUPS:
+        for name, row in snapshot[group].items():
+            labels = {"group": group, "name": name}
+            seconds.append((labels, row["total_ms"] / 1000))
+            calls.append((labels, row["calls"]))
+    yield ("sovereign_turn_phase_seconds_total", "counter",
+           "End-turn wall time by phase, nation and AI handler (inclusive)", seconds)
+    yield ("sovereign_turn_phase_calls_total", "counter",
+           "End-turn calls by phase, nation and AI handler", calls)
+
+
+REGISTRY.register_collector(_turn_profile_families)
+
+
+def process_max_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    import sys
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # Linux reports KiB
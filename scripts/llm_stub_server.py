@@ -0,0 +1,225 @@
+"""
+Local stand-in for the Anthropic and Groq HTTP APIs.
+
+Lets the LLM fallback path (providers, resilience, batching) be load-tested
+without API keys or network. Answers are schema-valid for
+json_to_parse_result: the stub runs the game's own fast parser on each
+command found in the prompt, so validation in LLMClient passes as it would
+for a sensible LLM answer. Batch prompts ("# Command i of N") get a JSON
+array.
+
+Routes:
+    POST /v1/messages                  Anthropic Messages API shape
+    POST /openai/v1/chat/completions   Groq (OpenAI-compatible) shape
+
+Fault injection (per request, independent draws):
+    --latency fixed:MS | uniform:MIN_MS:MAX_MS | lognormal:MEDIAN_MS:SIGMA
+    --error-rate P       500 responses
+    --rate-limit-rate P  429 responses with retry-after: --retry-after
+    --malformed-rate P   200 responses whose text is not JSON
+
+Run with:
+    python -m scripts.llm_stub_server --port 8787 --latency lognormal:400:0.5 --error-rate 0.02
+
+Then point the server at it:
+    LLM_MODE=anthropic ANTHROPIC_API_KEY=stub \\
+    ANTHROPIC_API_ENDPOINT=http://127.0.0.1:8787/v1/messages uvicorn backend.main:app
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.ai.llm_client import LLMClient
+
+ANTHROPIC_PATH = "/v1/messages"
+GROQ_PATH = "/openai/v1/chat/completions"
+
+# Commands are quoted under this heading by prompt_builder._render_situation
+COMMAND_PATTERN = re.compile(r'## Command to Parse\n"(.*)"')
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Build a latency sampler (seconds) from a spec string.
+
+    Args:
+        spec: "fixed:MS", "uniform:MIN_MS:MAX_MS" or "lognormal:MEDIAN_MS:SIGMA"
+
+    Raises:
+        ValueError: If the spec is not recognised
+    """
+    kind, *args = spec.split(":")
+    values = [float(a) for a in args]
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0] / 1000.0
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000.0
+    if kind == "lognormal" and len(values) == 2:
+        mu = math.log(max(values[0], 0.001))
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000.0
+    raise ValueError(f"Unknown latency spec '{spec}' (fixed:MS, uniform:MIN:MAX, lognormal:MEDIAN:SIGMA)")
+
+
+class StubBehavior:
+    """Latency and fault-injection settings shared by all request threads."""
+
+    def __init__(
+        self,
+        latency: str = "fixed:0",
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        self.sample_latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._fast_parser = LLMClient(provider="mock")
+        self.counts: Dict[str, int] = {"ok": 0, "error": 0, "rate_limited": 0, "malformed": 0}
+
+    def draw(self) -> Tuple[str, float]:
+        """Pick (outcome, latency_seconds) for one request."""
+        with self._lock:
+            roll = self._rng.random()
+            latency = self.sample_latency(self._rng)
+            if roll < self.error_rate:
+                outcome = "error"
+            elif roll < self.error_rate + self.rate_limit_rate:
+                outcome = "rate_limited"
+            elif roll < self.error_rate + self.rate_limit_rate + self.malformed_rate:
+                outcome = "malformed"
+            else:
+                outcome = "ok"
+            self.counts[outcome] += 1
+        return outcome, latency
+
+    def answer(self, command_text: str) -> Dict:
+        """LLM-style JSON for one command (fast parser result)."""
+        result = self._fast_parser._parse_with_mock(command_text)
+        return {
+            "matched": result.matched,
+            "command_type": result.command_type,
+            "marshals": result.marshals,
+            "action": result.action,
+            "target": result.target,
+            "target_stance": result.target_stance,
+            "ambiguity": 20,
+            "strategic_score": 50,
+            "interpretation": f"stub: {result.action}",
+        }
+
+    def answer_prompt(self, prompt: str) -> str:
+        """Response text for a single or batch parse prompt."""
+        commands = COMMAND_PATTERN.findall(prompt)
+        answers = [self.answer(command) for command in commands]
+        if len(answers) == 1 and "# Command 1 of" not in prompt:
+            return json.dumps(answers[0])
+        return json.dumps(answers)
+
+
+def _user_prompt(body: Dict) -> str:
+    messages: List[Dict] = body.get("messages") or []
+    user = [m.get("content", "") for m in messages if m.get("role") == "user"]
+    return user[-1] if user else ""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves both provider shapes using server.behavior."""
+
+    def do_POST(self):
+        behavior: StubBehavior = self.server.behavior
+        length = int(self.headers.get("content-length", 0))
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return self._send(400, {"error": {"type": "invalid_request_error"}})
+
+        if self.path not in (ANTHROPIC_PATH, GROQ_PATH):
+            return self._send(404, {"error": {"type": "not_found_error"}})
+
+        outcome, latency = behavior.draw()
+        time.sleep(latency)
+        if outcome == "error":
+            return self._send(500, {"error": {"type": "api_error", "message": "stub failure"}})
+        if outcome == "rate_limited":
+            return self._send(429, {"error": {"type": "rate_limit_error"}},
+                              {"retry-after": f"{behavior.retry_after:g}"})
+
+        prompt = _user_prompt(body)
+        text = "Sorry, I can't help with that {" if outcome == "malformed" else behavior.answer_prompt(prompt)
+        input_tokens, output_tokens = len(prompt) // 4, len(text) // 4
+        if self.path == ANTHROPIC_PATH:
+            payload = {
+                "content": [{"type": "text", "text": text}],
+                "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+            }
+        else:
+            payload = {
+                "choices": [{"message": {"role": "assistant", "content": text}}],
+                "usage": {"prompt_tokens": input_tokens, "completion_tokens": output_tokens},
+            }
+        self._send(200, payload)
+
+    def _send(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass  # One line per request would swamp a load test
+
+
+def make_server(behavior: StubBehavior, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Create (not start) a stub server; port 0 picks a free port."""
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    server.behavior = behavior
+    return server
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Local Anthropic/Groq stub for load tests")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8787)
+    ap.add_argument("--latency", default="lognormal:400:0.5",
+                    help="fixed:MS | uniform:MIN_MS:MAX_MS | lognormal:MEDIAN_MS:SIGMA")
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rate-limit-rate", type=float, default=0.0)
+    ap.add_argument("--malformed-rate", type=float, default=0.0)
+    ap.add_argument("--retry-after", type=float, default=1.0, help="retry-after seconds on 429s")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args()
+
+    behavior = StubBehavior(args.latency, args.error_rate, args.rate_limit_rate,
+                            args.malformed_rate, args.retry_after, args.seed)
+    server = make_server(behavior, args.host, args.port)
+    print(f"LLM stub listening on http://{args.host}:{server.server_address[1]} "
+          f"(anthropic: {ANTHROPIC_PATH}, groq: {GROQ_PATH})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {behavior.counts}")
+
+
+if __name__ == "__main__":
+    main()
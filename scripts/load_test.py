@@ -0,0 +1,193 @@
+"""
+Load generator for POST /command.
+
+Replays a corpus of player commands against a running server at a target
+QPS (open loop: requests are sent on schedule even if earlier ones are still
+in flight) and reports p50/p95/p99 latency per parse path, read from the
+X-Parse-Path response header (fast, llm, *_fallback, interrupt).
+
+Pair with scripts/llm_stub_server.py to exercise the LLM fallback path
+without API keys:
+
+    python -m scripts.llm_stub_server --port 8787 --latency lognormal:400:0.5 &
+    LLM_MODE=anthropic ANTHROPIC_API_KEY=stub \\
+        ANTHROPIC_API_ENDPOINT=http://127.0.0.1:8787/v1/messages \\
+        uvicorn backend.main:app --port 8000 &
+    python -m scripts.load_test --url http://127.0.0.1:8000 --qps 20 --duration 30
+
+Corpus: one command per line (blank lines and # comments skipped); the
+built-in DEFAULT_CORPUS mixes confident orders, vague orders that fall back
+to the LLM, and meta commands.
+"""
+
+import argparse
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+# Realistic mix: ~half confident fast-parse orders, the rest vague enough
+# to fall below LLM_FALLBACK_CONFIDENCE_THRESHOLD
+DEFAULT_CORPUS = [
+    "Ney, attack Wellington",
+    "Davout, move to Belgium",
+    "Grouchy, defend Paris",
+    "Ney, fortify",
+    "Davout, drill",
+    "status",
+    "help",
+    "Ney, scout ahead",
+    "Davout, change stance to aggressive",
+    "Grouchy, pursue Blucher",
+    "Ney, go and deal with the British",
+    "Davout, do what you think is best",
+    "Have Grouchy shadow the Prussians but don't engage",
+    "Ney, push towards Brussels and hold if pressed",
+    "Davout, keep the road to Paris safe",
+    "someone reinforce Ney",
+    "Ney, take the fight to Wellington when ready",
+    "Grouchy, look for an opening on the flank",
+    "Davout, dig in and wait",
+    "what should Ney do now?",
+]
+
+# One sample: (parse path, HTTP status, latency seconds)
+Sample = Tuple[str, int, float]
+
+
+def load_corpus(path: Optional[str]) -> List[str]:
+    """Commands from a file (one per line, # comments allowed), or the default corpus."""
+    if not path:
+        return list(DEFAULT_CORPUS)
+    with open(path, encoding="utf-8") as f:
+        commands = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    if not commands:
+        raise ValueError(f"No commands in corpus file {path}")
+    return commands
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already-sorted values (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(pct / 100.0 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples: Sequence[Sample]) -> Dict[str, Dict[str, float]]:
+    """
+    Latency summary per parse path (plus "all").
+
+    Returns:
+        {path: {"count", "errors", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}
+    """
+    by_path: Dict[str, List[Sample]] = {"all": list(samples)}
+    for sample in samples:
+        by_path.setdefault(sample[0], []).append(sample)
+
+    summary = {}
+    for path, rows in by_path.items():
+        latencies = sorted(latency for _, _, latency in rows)
+        summary[path] = {
+            "count": len(rows),
+            "errors": sum(1 for _, status, _ in rows if status != 200),
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        }
+    return summary
+
+
+def format_report(summary: Dict[str, Dict[str, float]], elapsed: float) -> str:
+    """Fixed-width table of summarize() output."""
+    total = summary.get("all", {}).get("count", 0)
+    lines = [
+        f"{total} requests in {elapsed:.1f}s ({total / elapsed if elapsed else 0:.1f} req/s achieved)",
+        f"{'path':<22}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for path in sorted(summary, key=lambda p: (p == "all", p)):
+        row = summary[path]
+        lines.append(f"{path:<22}{row['count']:>7}{row['errors']:>8}{row['p50_ms']:>10.1f}"
+                     f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+    return "\n".join(lines)
+
+
+def http_sender(base_url: str, timeout: float = 30.0) -> Callable[[str], Tuple[str, int]]:
+    """send(command) -> (parse path, status) over HTTP against base_url/command."""
+    client = httpx.Client(base_url=base_url, timeout=timeout)
+
+    def send(command: str) -> Tuple[str, int]:
+        try:
+            response = client.post("/command", json={"command": command})
+        except httpx.HTTPError as e:
+            return f"client_error:{type(e).__name__}", 0
+        return response.headers.get("x-parse-path", "none"), response.status_code
+
+    return send
+
+
+def run_load(
+    send: Callable[[str], Tuple[str, int]],
+    commands: Sequence[str],
+    qps: float,
+    total: int,
+    max_in_flight: int = 64,
+) -> Tuple[List[Sample], float]:
+    """
+    Replay commands (cycling) at a fixed rate.
+
+    Args:
+        send: Issues one command, returns (parse path, status)
+        commands: Corpus to cycle through
+        qps: Target request rate
+        total: Number of requests to send
+        max_in_flight: Worker threads (caps concurrency if the server falls behind)
+
+    Returns:
+        (samples, elapsed seconds)
+    """
+    samples: List[Sample] = []
+    lock = threading.Lock()
+
+    def one(command: str) -> None:
+        start = time.perf_counter()
+        path, status = send(command)
+        latency = time.perf_counter() - start
+        with lock:
+            samples.append((path, status, latency))
+
+    interval = 1.0 / qps if qps > 0 else 0.0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        for i in range(total):
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(one, commands[i % len(commands)])
+    return samples, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Replay commands against /command and report latency per parse path")
+    ap.add_argument("--url", default="http://127.0.0.1:8000")
+    ap.add_argument("--qps", type=float, default=10.0)
+    ap.add_argument("--duration", type=float, default=30.0, help="seconds (ignored if --requests is set)")
+    ap.add_argument("--requests", type=int, default=None)
+    ap.add_argument("--corpus", default=None, help="file with one command per line")
+    ap.add_argument("--max-in-flight", type=int, default=64)
+    args = ap.parse_args()
+
+    commands = load_corpus(args.corpus)
+    total = args.requests or max(1, int(args.qps * args.duration))
+    print(f"Sending {total} commands to {args.url}/command at {args.qps} QPS "
+          f"({len(commands)} distinct commands)")
+    samples, elapsed = run_load(http_sender(args.url), commands, args.qps, total, args.max_in_flight)
+    print(format_report(summarize(samples), elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Train the local intent classifier (backend/ai/intent_classifier.py).
+
+Reads (raw_command, action) pairs from parse journals (LLM_PARSE_JOURNAL
+JSONL files) and/or saved games (their command_history), holds out a test
+split, and prints an offline report:
+
+- accuracy of the classifier (all test commands, and per action)
+- coverage at the confidence threshold: share of commands answered locally,
+  and accuracy on those
+- LLM calls saved: of the test commands the fast parser would send to the
+  LLM, the share the classifier answers instead
+- calibration (expected calibration error) and predict() latency
+
+The final model is then refit on all examples and written to --out.
+
+Run with:
+    python -m scripts.train_intent_classifier --journal logs/parses.jsonl --out models/intent.json
+Then:
+    LLM_INTENT_MODEL=models/intent.json
+"""
+
+import argparse
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Sequence, Tuple
+
+from backend.ai.intent_classifier import (
+    DEFAULT_INTENT_CONFIDENCE, IntentClassifier, expected_calibration_error, load_examples,
+)
+from backend.ai.llm_client import LLM_FALLBACK_CONFIDENCE_THRESHOLD, LLMClient
+
+
+def evaluate(
+    model: IntentClassifier,
+    examples: Sequence[Tuple[str, str]],
+    threshold: float = DEFAULT_INTENT_CONFIDENCE,
+) -> Dict:
+    """
+    Offline accuracy/coverage/latency report for a trained model.
+
+    Returns:
+        Dict with accuracy, per_action, coverage, covered_accuracy,
+        fallbacks, fallbacks_saved, ece, mean_us, p99_us
+    """
+    fast_parser = LLMClient(provider="mock")
+    predictions: List[Tuple[float, bool]] = []
+    per_action: Dict[str, List[bool]] = defaultdict(list)
+    latencies: List[float] = []
+    covered_correct: List[bool] = []
+    fallbacks = saved = 0
+
+    for text, action in examples:
+        start = time.perf_counter()
+        predicted, probability = model.predict(text)
+        latencies.append(time.perf_counter() - start)
+
+        correct = predicted == action
+        predictions.append((probability, correct))
+        per_action[action].append(correct)
+        if probability >= threshold:
+            covered_correct.append(correct)
+
+        # Would this command have gone to the LLM without the classifier?
+        if fast_parser._parse_with_mock(text).confidence < LLM_FALLBACK_CONFIDENCE_THRESHOLD:
+            fallbacks += 1
+            saved += probability >= threshold
+
+    latencies.sort()
+    total = len(examples) or 1
+    return {
+        "examples": len(examples),
+        "accuracy": sum(c for _, c in predictions) / total,
+        "per_action": {a: (sum(r) / len(r), len(r)) for a, r in sorted(per_action.items())},
+        "coverage": len(covered_correct) / total,
+        "covered_accuracy": sum(covered_correct) / len(covered_correct) if covered_correct else 0.0,
+        "fallbacks": fallbacks,
+        "fallbacks_saved": saved / fallbacks if fallbacks else 0.0,
+        "ece": expected_calibration_error(predictions),
+        "mean_us": sum(latencies) / total * 1e6,
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6 if latencies else 0.0,
+    }
+
+
+def format_report(report: Dict, threshold: float) -> str:
+    lines = [
+        f"Test examples: {report['examples']}",
+        f"Accuracy: {report['accuracy']:.1%}",
+        f"Coverage at p>={threshold}: {report['coverage']:.1%} "
+        f"(accuracy on covered: {report['covered_accuracy']:.1%})",
+        f"LLM fallbacks answered locally: {report['fallbacks_saved']:.1%} of {report['fallbacks']}",
+        f"Expected calibration error: {report['ece']:.3f}",
+        f"predict(): mean {report['mean_us']:.0f}us, p99 {report['p99_us']:.0f}us",
+        "Per action:",
+    ]
+    for action, (accuracy, count) in report["per_action"].items():
+        lines.append(f"  {action:<15}{accuracy:>7.1%}  (n={count})")
+    return "\n".join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Train the local char n-gram intent classifier")
+    ap.add_argument("--journal", action="append", default=[], help="parse journal JSONL (repeatable)")
+    ap.add_argument("--save", action="append", default=[], help="saved game JSON (repeatable)")
+    ap.add_argument("--out", default="intent_model.json")
+    ap.add_argument("--test-fraction", type=float, default=0.2)
+    ap.add_argument("--threshold", type=float, default=DEFAULT_INTENT_CONFIDENCE)
+    ap.add_argument("--epochs", type=int, default=15)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    examples = load_examples(args.journal, args.save)
+    if not examples:
+        ap.error("no training examples found (pass --journal and/or --save)")
+    print(f"Loaded {len(examples)} examples: {dict(Counter(a for _, a in examples).most_common())}")
+
+    shuffled = list(examples)
+    random.Random(args.seed).shuffle(shuffled)
+    n_test = int(len(shuffled) * args.test_fraction)
+    test, train = shuffled[:n_test], shuffled[n_test:]
+
+    start = time.perf_counter()
+    model = IntentClassifier.train(train, epochs=args.epochs, seed=args.seed)
+    print(f"Trained on {len(train)} in {time.perf_counter() - start:.1f}s "
+          f"({len(model.weights)} features, temperature={model.temperature})")
+    if test:
+        print(format_report(evaluate(model, test, args.threshold), args.threshold))
+
+    final = IntentClassifier.train(examples, epochs=args.epochs, seed=args.seed)
+    final.save(args.out)
+    print(f"Saved model trained on all {len(examples)} examples to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -330,6 +330,146 @@ class TestCriticalMessages:
         assert found_critical, "Should get critical failure in 200 battles"
 
 
+class TestNumericKernel:
+    """Test the numeric battle kernel and the separate narrative renderer."""
+
+    @staticmethod
+    def _armies():
+        ney = Marshal("Ney", "Belgium", 50000, "aggressive", tactical_skill=8)
+        wellington = Marshal("Wellington", "Waterloo", 50000, "cautious", tactical_skill=10)
+        return ney, wellington
+
+    def test_core_matches_resolve_battle(self):
+        """Same seed gives the same numbers with or without narrative."""
+        import random
+        combat = CombatResolver()
+        for seed in range(20):
+            random.seed(seed)
+            full = combat.resolve_battle(*self._armies(), terrain="river", flanking_bonus=1)
+            random.seed(seed)
+            core = combat.resolve_battle_core(*self._armies(), terrain="river", flanking_bonus=1)
+
+            numeric = core.to_dict()
+            assert {k: full[k] for k in numeric} == numeric
+
+    def test_core_builds_no_messages(self, monkeypatch):
+        """Headless resolution never touches the narrative helpers."""
+        combat = CombatResolver()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("narrative rendered")
+
+        monkeypatch.setattr(combat, "_generate_description", fail)
+        monkeypatch.setattr(combat, "_get_combat_narrative", fail)
+
+        ney, wellington = self._armies()
+        outcome = combat.resolve_battle_core(ney, wellington)
+        assert outcome.attacker_remaining == int(ney.strength)
+        assert outcome.defender_remaining == int(wellington.strength)
+
+    def test_render_battle_adds_description(self):
+        """render_battle turns a kernel outcome into the full result dict."""
+        combat = CombatResolver()
+        ney, wellington = self._armies()
+        wellington.drilling = True
+
+        outcome = combat.resolve_battle_core(ney, wellington)
+        result = combat.render_battle(outcome, flanking_message="From two sides")
+
+        assert "Ney" in result["description"]
+        assert result["drilling_penalty_triggered"] is not None
+        assert result["flanking_message"] == "From two sides"
+        assert wellington.drilling is False  # State change happens in the kernel
+
+    def test_unnarrated_battle_same_numbers_and_random_stream(self):
+        """narrate=False changes neither the numbers nor later random draws."""
+        import random
+        combat = CombatResolver()
+        for seed in range(20):
+            random.seed(seed)
+            full = combat.resolve_battle(*self._armies(), flanking_message="From two sides")
+            after_full = random.random()
+            random.seed(seed)
+            brief = combat.resolve_battle(*self._armies(), flanking_message="From two sides",
+                                          narrate=False)
+            after_brief = random.random()
+
+            assert {k: full[k] for k in brief if k != "description"} == \
+                {k: v for k, v in brief.items() if k != "description"}
+            assert after_full == after_brief
+            assert brief["description"].startswith("Ney vs Wellington")
+
+    def test_enemy_ai_battles_skip_narrative(self, monkeypatch):
+        """Enemy AI turns resolve battles without rendering prose."""
+        from backend.ai.enemy_ai import EnemyAI
+        from backend.commands.executor import CommandExecutor
+        from backend.models.world_state import WorldState
+
+        def fail(*args, **kwargs):
+            raise AssertionError("narrative rendered")
+
+        monkeypatch.setattr(CombatResolver, "render_battle", fail)
+        world = WorldState()
+        world.get_marshal("Grouchy").location = "Waterloo"  # Engaged: Britain attacks
+        executor = CommandExecutor()
+        results = EnemyAI(executor).process_nation_turn(
+            "Britain", world, {"world": world, "debug_mode": True})
+
+        battles = [e for r in results for e in r.get("events", []) if e.get("type") == "battle"]
+        assert battles
+
+
+class TestResolveMany:
+    """Test resolving several engagements in one call."""
+
+    @staticmethod
+    def _armies():
+        return [
+            Marshal("Ney", "Belgium", 50000, "aggressive", tactical_skill=8),
+            Marshal("Wellington", "Waterloo", 50000, "cautious", tactical_skill=10),
+            Marshal("Davout", "Paris", 40000, "cautious", tactical_skill=9),
+            Marshal("Blucher", "Rhine", 45000, "aggressive", tactical_skill=6),
+        ]
+
+    def test_matches_sequential_resolve_battle(self):
+        """Same results and same random draws as one resolve_battle() call per engagement."""
+        import random
+        combat = CombatResolver()
+
+        random.seed(7)
+        ney, wellington, davout, blucher = self._armies()
+        batch = combat.resolve_many([
+            {"attacker": ney, "defender": wellington, "flanking_message": "Flanked!"},
+            {"attacker": davout, "defender": blucher, "terrain": "river"},
+        ])
+        after_batch = random.random()
+
+        random.seed(7)
+        ney2, wellington2, davout2, blucher2 = self._armies()
+        sequential = [
+            combat.resolve_battle(ney2, wellington2, flanking_message="Flanked!"),
+            combat.resolve_battle(davout2, blucher2, terrain="river"),
+        ]
+
+        assert batch == sequential
+        assert random.random() == after_batch
+        assert [m.strength for m in (ney, wellington, davout, blucher)] == \
+            [m.strength for m in (ney2, wellington2, davout2, blucher2)]
+
+    def test_repeated_marshal_sees_updated_strength(self):
+        """A marshal fighting twice starts its second battle with losses applied."""
+        combat = CombatResolver()
+        ney, wellington, davout, _ = self._armies()
+
+        first, second = combat.resolve_many([
+            {"attacker": ney, "defender": wellington},
+            {"attacker": ney, "defender": davout},
+        ], narrate=False)
+
+        assert second.attacker_remaining == int(ney.strength)
+        assert second.attacker_remaining == first.attacker_remaining - second.attacker_casualties
+
+
 if __name__ == "__main__":
     """Run tests with pytest."""
     pytest.main([__file__, "-v"])
@@ -0,0 +1,135 @@
+"""
+Tests for pre-parse command dispatch (commands/dispatch.py): the compiled
+interrupt-choice matcher, the world's pending-interrupt set and the meta
+command fast path.
+
+Run: pytest tests/test_command_dispatch.py -v
+"""
+
+import pytest
+from backend.commands.dispatch import (
+    META_COMMANDS, match_interrupt_choice, parse_meta_command, route_interrupt,
+)
+from backend.commands.parser import CommandParser
+from backend.models.world_state import WorldState
+
+ALL_OPTIONS = ["investigate", "attack", "continue_order", "hold_position", "go_around", "cancel_order"]
+
+
+def _cascade(cmd_lower, options):
+    """The keyword cascade main.py used before the compiled matcher."""
+    if any(kw in cmd_lower for kw in ["investigate", "march to", "guns", "attack", "charge", "join"]):
+        return "investigate" if "investigate" in options else "attack" if "attack" in options else None
+    elif any(kw in cmd_lower for kw in ["continue", "ignore", "keep going", "carry on", "press on"]):
+        return "continue_order" if "continue_order" in options else None
+    elif any(kw in cmd_lower for kw in ["hold", "stay", "stop", "wait", "halt"]):
+        return "hold_position" if "hold_position" in options else None
+    elif any(kw in cmd_lower for kw in ["go around", "reroute", "avoid"]):
+        return "go_around" if "go_around" in options else None
+    elif any(kw in cmd_lower for kw in ["cancel", "abort", "belay"]):
+        return "cancel_order" if "cancel_order" in options else None
+    return None
+
+
+class TestInterruptMatcher:
+
+    @pytest.mark.parametrize("command", [
+        "investigate", "march to the guns!", "press on", "hold here, then attack",
+        "stay put and wait", "go around them", "reroute via lyon", "belay that",
+        "cancel", "keep going but avoid the river", "ney attack wellington", "what?", "",
+    ])
+    @pytest.mark.parametrize("options", [
+        ALL_OPTIONS,
+        ["attack", "hold_position"],
+        ["continue_order", "hold_position", "cancel_order"],
+        ["go_around", "hold_position"],
+    ])
+    def test_matches_old_cascade(self, command, options):
+        assert match_interrupt_choice(command, options) == _cascade(command, options)
+
+    def test_higher_priority_group_wins_even_later_in_text(self):
+        assert match_interrupt_choice("hold on, investigate", ALL_OPTIONS) == "investigate"
+
+    def test_unavailable_choice_does_not_fall_through(self):
+        assert match_interrupt_choice("attack then hold", ["hold_position"]) is None
+
+
+class TestPendingInterruptSet:
+
+    def test_tracks_raise_and_clear(self):
+        world = WorldState()
+        assert world.get_pending_interrupt_marshals() == []
+
+        davout = world.get_marshal("Davout")
+        davout.pending_interrupt = {"interrupt_type": "cannon_fire", "options": ["investigate"]}
+        assert world.get_pending_interrupt_marshals() == [davout]
+
+        davout.pending_interrupt = None
+        assert world.get_pending_interrupt_marshals() == []
+
+    def test_roster_order_and_player_only(self):
+        world = WorldState()
+        ney, davout = world.get_marshal("Ney"), world.get_marshal("Davout")
+        enemy = world.get_enemy_marshals()[0]
+        for marshal in (davout, enemy, ney):
+            marshal.pending_interrupt = {"interrupt_type": "blocked_path", "options": []}
+
+        expected = [m for m in world.get_player_marshals() if m in (ney, davout)]
+        assert world.get_pending_interrupt_marshals() == expected
+
+    def test_restored_by_load_and_independent_in_fork(self):
+        world = WorldState()
+        world.get_pending_interrupt_marshals()
+        world.get_marshal("Ney").pending_interrupt = {"interrupt_type": "cannon_fire", "options": []}
+
+        loaded = WorldState.from_dict(world.to_dict())
+        assert [m.name for m in loaded.get_pending_interrupt_marshals()] == ["Ney"]
+
+        fork = world.fork()
+        fork.get_marshal("Ney").pending_interrupt = None
+        assert fork.get_pending_interrupt_marshals() == []
+        assert [m.name for m in world.get_pending_interrupt_marshals()] == ["Ney"]
+
+    def test_route_interrupt(self):
+        world = WorldState()
+        assert route_interrupt("press on", world) is None
+
+        world.get_marshal("Ney").pending_interrupt = {
+            "interrupt_type": "cannon_fire", "options": ["investigate", "continue_order"]}
+        marshal, interrupt_type, choice = route_interrupt("Press on!", world)
+        assert (marshal.name, interrupt_type, choice) == ("Ney", "cannon_fire", "continue_order")
+        assert route_interrupt("go around", world) is None
+
+
+class TestMetaCommands:
+
+    @pytest.mark.parametrize("command", sorted(META_COMMANDS) + ["Help", " END TURN ", "end turn."])
+    def test_same_result_as_parser(self, command):
+        parser = CommandParser(use_real_llm=False)
+        assert parse_meta_command(command) == parser.parse(command, None, world=WorldState())
+
+    def test_same_result_as_parser_in_live_mode(self):
+        """Live clients answer meta commands with the fast parser too (mode "mock")."""
+        parser = CommandParser(use_real_llm=False)
+        parser.llm.provider_name, parser.llm.api_key = "anthropic", "test-key"
+        for command in ("help", "end turn"):
+            parsed = parser.parse(command, {"marshals": {}}, world=WorldState())
+            assert parsed == parse_meta_command(command)
+            assert parsed["mode"] == "mock"
+
+    @pytest.mark.parametrize("command", ["help me Ney", "Ney, end turn after attacking", "status"])
+    def test_other_commands_take_the_parser(self, command):
+        assert parse_meta_command(command) is None
+
+    def test_endpoint_reports_meta_path(self):
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        response = TestClient(app).post("/command", json={"command": "help"})
+        assert response.status_code == 200
+        assert response.headers["X-Parse-Path"] == "meta"
+        assert response.json()["success"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
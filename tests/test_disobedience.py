@@ -486,6 +486,151 @@ class TestSeverityBreakdown:
         assert attack_breakdown['will_object'] == False
 
 
+class TestSeverityBreakdownCache:
+    """Test per-state-version caching of severity breakdowns."""
+
+    def test_cached_breakdown_matches_uncached(self):
+        """Cached breakdown equals a fresh computation."""
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+        order = {'action': 'defend', 'target': ney.location}
+
+        cached = world.disobedience_system.get_severity_breakdown(ney, order, world)
+        assert cached == get_severity_breakdown(ney, order, world)
+
+    def test_repeat_evaluation_skips_situation_analysis(self, monkeypatch):
+        """Same (marshal, order) at the same state version analyzes once."""
+        import backend.commands.severity as severity
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+        order = {'action': 'defend', 'target': ney.location}
+
+        calls = []
+        original = severity.analyze_order_situation
+        monkeypatch.setattr(severity, 'analyze_order_situation',
+                            lambda *args: calls.append(args) or original(*args))
+
+        for _ in range(3):
+            world.disobedience_system.get_severity_breakdown(ney, order, world)
+        assert len(calls) == 1
+
+        world.mark_state_changed()
+        world.disobedience_system.get_severity_breakdown(ney, order, world)
+        assert len(calls) == 2
+
+    def test_trust_change_is_not_served_stale(self):
+        """Marshal's own modifier inputs are part of the cache key."""
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+        order = {'action': 'defend', 'target': ney.location}
+        system = world.disobedience_system
+
+        ney.trust.set(90)
+        high_trust = system.get_severity_breakdown(ney, order, world)
+        ney.trust.set(10)
+        low_trust = system.get_severity_breakdown(ney, order, world)
+
+        assert high_trust['modifiers']['trust'] == 0.7
+        assert low_trust['modifiers']['trust'] == 1.6
+
+    def test_returned_breakdown_is_a_copy(self):
+        """Mutating a returned breakdown does not poison the cache."""
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+        order = {'action': 'defend', 'target': ney.location}
+        system = world.disobedience_system
+
+        first = system.get_severity_breakdown(ney, order, world)
+        first['modifiers']['trust'] = 99.0
+        first['final_severity'] = 0.0
+
+        second = system.get_severity_breakdown(ney, order, world)
+        assert second['modifiers']['trust'] != 99.0
+        assert second['final_severity'] > 0.0
+
+    def test_executed_command_bumps_state_version(self):
+        """Every executed command invalidates state-versioned caches."""
+        from backend.commands.executor import CommandExecutor
+        world = WorldState()
+        version = world.get_state_version()
+
+        CommandExecutor().execute({"command": {"action": "help"}}, {"world": world})
+
+        assert world.get_state_version() > version
+
+
+class TestValidActionTable:
+    """Test the bulk valid-action table shared across marshals."""
+
+    @staticmethod
+    def _per_marshal_actions(marshal, world):
+        """Reference: per-marshal enumeration without the shared table."""
+        import backend.commands.disobedience as d
+        enemies = [e.name for e in d.get_enemies_in_range(marshal, world)]
+        return d._build_valid_actions(marshal, enemies, d.get_valid_move_targets(marshal, world))
+
+    def test_table_matches_per_marshal_enumeration(self):
+        """Every French marshal's row equals the per-marshal computation."""
+        from backend.commands.disobedience import get_valid_actions_for_all
+        world = WorldState()
+        table = get_valid_actions_for_all(world, "France")
+
+        assert set(table) == {m.name for m in world.get_marshals_by_nation("France")}
+        for name, entry in table.items():
+            marshal = world.get_marshal(name)
+            assert entry["actions"] == self._per_marshal_actions(marshal, world)
+
+    def test_table_matches_when_engaged(self):
+        """Engagement rule and enemies-in-region agree with per-marshal checks."""
+        from backend.commands.disobedience import get_valid_actions_for_all, get_enemies_in_region
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+        enemy = world.get_enemy_marshals()[0]
+        enemy.location = ney.location
+
+        entry = get_valid_actions_for_all(world, "France")["Ney"]
+        assert entry["enemies_in_region"] == [m.name for m in get_enemies_in_region(ney, world)]
+        assert entry["can_drill"] is False
+        assert entry["actions"] == self._per_marshal_actions(ney, world)
+
+    def test_table_cached_until_state_changes(self):
+        """Same state version returns the same table; a change rebuilds it."""
+        from backend.commands.disobedience import get_valid_actions_for_all
+        world = WorldState()
+        first = get_valid_actions_for_all(world, "France")
+        assert get_valid_actions_for_all(world, "France") is first
+
+        world.mark_state_changed()
+        assert get_valid_actions_for_all(world, "France") is not first
+
+    def test_redemption_response_invalidates_table(self):
+        """Dismissal and sidelining bypass execute() but still rebuild the table."""
+        from backend.commands.disobedience import DisobedienceSystem, get_valid_actions_for_all
+        world = WorldState()
+        system = DisobedienceSystem()
+        assert "Grouchy" in get_valid_actions_for_all(world, "France")
+
+        system.handle_redemption_response({"marshal": "Grouchy"}, "dismiss", world)
+        assert "Grouchy" not in get_valid_actions_for_all(world, "France")
+
+        version = world.get_state_version()
+        system.handle_redemption_response({"marshal": "Davout"}, "administrative_role", world)
+        assert world.get_state_version() != version
+
+    def test_get_valid_actions_returns_copies(self):
+        """get_valid_actions served from the table cannot poison it."""
+        from backend.commands.disobedience import get_valid_actions
+        world = WorldState()
+        ney = world.get_marshal("Ney")
+
+        actions = get_valid_actions(ney, world)
+        actions[0]["action"] = "bogus"
+        actions.clear()
+
+        assert get_valid_actions(ney, world)
+        assert all(a["action"] != "bogus" for a in get_valid_actions(ney, world))
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
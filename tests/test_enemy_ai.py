@@ -8,6 +8,7 @@ and controlled randomness (mood variance system).
 Run with: pytest tests/test_enemy_ai.py -v
 """
 
+import json
 import pytest
 import random
 from backend.models.world_state import WorldState
@@ -1584,5 +1585,109 @@ class TestBugFix5_CautiousCapture:
             assert is_safe, "Overwhelming strength should allow capture"
 
 
+class TestTurnEventStreaming:
+    """Test streaming of enemy phase events as they are produced."""
+
+    def setup_method(self):
+        self.world = WorldState()
+        self.executor = CommandExecutor()
+        self.game_state = {"world": self.world, "debug_mode": True}
+
+    def test_on_action_called_for_each_result(self):
+        """process_nation_turn reports every successful action in order."""
+        ai = EnemyAI(self.executor)
+        streamed = []
+        results = ai.process_nation_turn("Britain", self.world, self.game_state,
+                                         on_action=streamed.append)
+        assert streamed == results
+
+    def test_end_turn_streams_enemy_actions(self):
+        """end_turn pushes each enemy action to on_turn_event before returning."""
+        from backend.game_logic.turn_manager import TurnManager
+        events = []
+        game_state = {**self.game_state, "on_turn_event": events.append}
+
+        result = TurnManager(self.world, executor=self.executor).end_turn(game_state)
+
+        streamed = [(e["nation"], e["action"]) for e in events if e["type"] == "enemy_action"]
+        expected = [
+            (nation, action)
+            for nation, data in result["enemy_phase"]["nations"].items()
+            for action in data["actions"]
+        ]
+        assert streamed == expected
+        tactical = [e["event"] for e in events if e["type"] == "tactical_event"]
+        assert tactical == result.get("tactical_events", [])
+
+    def test_end_turn_without_callback_unchanged(self):
+        """No on_turn_event callback means no streaming and no errors."""
+        from backend.game_logic.turn_manager import TurnManager
+        result = TurnManager(self.world, executor=self.executor).end_turn(self.game_state)
+        assert result["next_turn"] == result["turn_ended"] + 1
+
+
+class TestEndTurnStreamEndpoint:
+    """Test the /end_turn/stream SSE endpoint end to end."""
+
+    @staticmethod
+    def _use_fresh_world(monkeypatch):
+        import backend.main as main
+        world = WorldState(player_nation="France")
+        monkeypatch.setattr(main, "world", world)
+        monkeypatch.setattr(main, "game_state", {"world": world, "debug_mode": True})
+        return main
+
+    @staticmethod
+    def _frames(text):
+        frames = []
+        for block in text.strip().split("\n\n"):
+            event_line, data_line = block.split("\n")
+            frames.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+        return frames
+
+    def test_event_sequence(self, monkeypatch):
+        """Nation headers precede their actions and a single summary closes the stream."""
+        from fastapi.testclient import TestClient
+        main = self._use_fresh_world(monkeypatch)
+
+        response = TestClient(main.app).post("/end_turn/stream")
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = self._frames(response.text)
+
+        kinds = [kind for kind, _ in frames]
+        assert kinds[-1] == "summary" and kinds.count("summary") == 1
+        current_nation = None
+        for kind, data in frames:
+            if kind == "nation_turn":
+                current_nation = data["nation"]
+            elif kind == "enemy_action":
+                assert data["nation"] == current_nation
+                assert "new_state" not in data["action"]
+
+        summary = frames[-1][1]
+        streamed = sum(kind == "enemy_action" for kind in kinds)
+        assert summary["enemy_phase"]["total_actions"] == streamed
+        assert all(set(data) == {"action_count"}
+                   for data in summary["enemy_phase"]["nations"].values())
+
+    def test_summary_matches_command_response(self, monkeypatch):
+        """The summary frame carries the /command end-turn fields (bar streamed actions)."""
+        from fastapi.testclient import TestClient
+
+        main = self._use_fresh_world(monkeypatch)
+        random.seed(7)
+        expected = TestClient(main.app).post("/command", json={"command": "end turn"}).json()
+
+        main = self._use_fresh_world(monkeypatch)
+        random.seed(7)
+        frames = self._frames(TestClient(main.app).post("/end_turn/stream").text)
+        summary = frames[-1][1]
+
+        assert summary.pop("type") == "summary"
+        for data in expected["enemy_phase"]["nations"].values():
+            data.pop("actions")
+        assert summary == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,110 @@
+"""
+Tests for game_state field projections (utils/field_projection.py and
+WorldState.get_game_state_summary(fields=...)).
+
+Run: pytest tests/test_field_projection.py -v
+"""
+
+import pytest
+from backend.models.world_state import WorldState
+from backend.utils.field_projection import PROFILES, parse_fields
+
+
+@pytest.fixture
+def world():
+    return WorldState()
+
+
+class TestParseFields:
+
+    def test_no_projection_means_full(self):
+        assert parse_fields() is None
+        assert parse_fields(profile="full") is None
+
+    def test_dotted_paths_build_a_tree(self):
+        assert parse_fields("turn, map.controller,marshals.strength") == {
+            "turn": True, "map_data": {"controller": True}, "marshals": {"strength": True},
+        }
+
+    def test_whole_field_and_subpath_merge(self):
+        expected = {"map_data": {"*": True, "controller": True}}
+        assert parse_fields("map,map.controller") == expected
+        assert parse_fields("map.controller,map") == expected
+
+    def test_fields_take_precedence_over_profile(self):
+        assert parse_fields("turn", profile="debug") == {"turn": True}
+
+    @pytest.mark.parametrize("fields", ["bogus", "turn.x", "map.marshals.bogus", "marshals.*.x"])
+    def test_unknown_field_rejected(self, fields):
+        with pytest.raises(ValueError):
+            parse_fields(fields)
+
+    def test_unknown_profile_rejected(self):
+        with pytest.raises(ValueError):
+            parse_fields(profile="tiny")
+
+
+class TestProjectedSummary:
+
+    def test_full_projection_equals_default(self, world):
+        assert world.get_game_state_summary(parse_fields("*")) == world.get_game_state_summary()
+
+    def test_minimal_profile(self, world):
+        summary = world.get_game_state_summary(parse_fields(profile="minimal"))
+        assert summary == {"turn": 1, "game_over": False, "victory": None}
+
+    def test_hud_profile_skips_marshal_detail(self, world):
+        summary = world.get_game_state_summary(parse_fields(profile="hud"))
+        assert "enemies" not in summary
+        assert summary["map_data"]["Paris"] == {"controller": "France"}
+        assert summary["marshals"] == world.get_game_state_summary()["marshals"]
+
+    def test_partial_marshal_entries_keep_name(self, world):
+        summary = world.get_game_state_summary(parse_fields("map.marshals.strength,enemies.nation"))
+        ney = next(m for m in summary["map_data"]["Belgium"]["marshals"] if m["name"] == "Ney")
+        assert ney == {"name": "Ney", "strength": int(world.get_marshal("Ney").strength)}
+        assert all(set(e) == {"nation"} for e in summary["enemies"].values())
+
+    def test_debug_profile_adds_relationships(self, world):
+        full = world.get_game_state_summary()
+        debug = world.get_game_state_summary(parse_fields(profile="debug"))
+        entries = [m for region in debug["map_data"].values() for m in region["marshals"]]
+        assert all("relationships" in m for m in entries)
+        assert not any("relationships" in m
+                       for region in full["map_data"].values() for m in region["marshals"])
+        for entry in entries:
+            entry.pop("relationships")
+        assert debug == full
+
+    def test_every_profile_is_valid(self, world):
+        for profile in PROFILES:
+            world.get_game_state_summary(parse_fields(profile=profile))
+
+
+class TestEndpoints:
+
+    @pytest.fixture(scope="class")
+    def client(self):
+        from fastapi.testclient import TestClient
+        from backend.main import app
+        return TestClient(app)
+
+    def test_status_profile(self, client):
+        response = client.get("/status", params={"profile": "minimal"})
+        assert response.status_code == 200
+        assert set(response.json()) == {"turn", "game_over", "victory"}
+
+    def test_command_fields(self, client):
+        response = client.post("/command", params={"fields": "turn,map.controller"},
+                               json={"command": "help"})
+        assert response.status_code == 200
+        assert set(response.json()["game_state"]) == {"turn", "map_data"}
+
+    def test_unknown_field_is_400(self, client):
+        response = client.post("/command", params={"fields": "bogus"}, json={"command": "help"})
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,167 @@
+"""
+Tests for the local intent classifier tier (intent_classifier.py, the
+LLMClient integration and scripts/train_intent_classifier.py).
+
+Run: pytest tests/test_intent_classifier.py -v
+"""
+
+import json
+
+import pytest
+from backend.ai.intent_classifier import (
+    IntentClassifier, ParseJournal, expected_calibration_error, featurize, load_examples,
+)
+from backend.ai.llm_client import LLMClient, last_parse_path
+from backend.ai.schemas import ParseResult
+from scripts.train_intent_classifier import evaluate, format_report
+
+MARSHALS = ["Ney", "Davout", "Grouchy", "Murat", "Soult"]
+PHRASES = {
+    "attack": ["{m}, go and deal with the British", "{m} smash them", "{m}, hit the enemy hard",
+               "{m} go crush those redcoats", "{m}, fall upon the enemy line"],
+    "retreat": ["{m}, pull your men back", "{m} get out of there", "{m}, withdraw at once",
+                "{m} fall back to safety", "{m}, pull back behind the river"],
+    "fortify": ["{m}, dig in where you stand", "{m} build earthworks", "{m}, dig trenches now",
+                "{m} entrench the position", "{m}, dig in and hold"],
+}
+STATE = {"marshals": {"Ney": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+
+
+def _examples():
+    return [(phrase.format(m=m), action)
+            for action, phrases in PHRASES.items() for phrase in phrases for m in MARSHALS]
+
+
+@pytest.fixture(scope="module")
+def model():
+    return IntentClassifier.train(_examples(), epochs=10)
+
+
+def _client(model=None, threshold=0.9):
+    """Live-mode client whose fast parse is always unsure and whose provider answers 'defend'."""
+    client = LLMClient(provider="mock")
+    client.provider_name = "anthropic"
+    client.api_key = "test-key"
+    client._parse_with_mock = lambda text: ParseResult(
+        matched=False, marshals=["Ney"], action="unknown", confidence=0.5, mode="mock", raw_command=text)
+    client.provider.parse = lambda text, state: ParseResult(
+        matched=True, marshals=["Ney"], action="defend", mode="anthropic", raw_command=text)
+    client.intent_classifier = model
+    client.intent_confidence = threshold
+    return client
+
+
+class TestIntentClassifier:
+
+    def test_featurize_has_words_and_char_ngrams(self):
+        features = featurize("Ney, DIG in!")
+        assert "w:dig" in features and " di" in features and "dig " in features
+        assert not any("," in f or "!" in f for f in features)
+
+    def test_learns_paraphrased_actions(self, model):
+        assert model.predict("Lannes, dig in right here")[0] == "fortify"
+        assert model.predict("Lannes, pull back now")[0] == "retreat"
+        assert model.predict("Lannes smash the enemy")[0] == "attack"
+
+    def test_probabilities_sum_to_one_and_temperature_fitted(self, model):
+        probs = model.predict_proba("Ney dig in")
+        assert set(probs) == {"attack", "fortify", "retreat"}
+        assert sum(probs.values()) == pytest.approx(1.0)
+        assert model.temperature != 1.0  # Fitted on the calibration split
+
+    def test_save_load_roundtrip(self, model, tmp_path):
+        path = tmp_path / "intent.json"
+        model.save(str(path))
+        loaded = IntentClassifier.load(str(path))
+        for text in ("Ney dig in", "Murat, fall back"):
+            assert loaded.predict(text)[0] == model.predict(text)[0]
+            assert loaded.predict(text)[1] == pytest.approx(model.predict(text)[1], abs=1e-3)
+
+    def test_single_action_rejected(self):
+        with pytest.raises(ValueError):
+            IntentClassifier.train([("Ney attack", "attack"), ("Ney charge", "attack")])
+
+    def test_expected_calibration_error(self):
+        assert expected_calibration_error([]) == 0.0
+        assert expected_calibration_error([(1.0, True)] * 10) == pytest.approx(0.0)
+        assert expected_calibration_error([(0.95, False)] * 10) == pytest.approx(0.95)
+
+
+class TestClassifierTier:
+
+    def test_confident_classifier_skips_llm(self, model):
+        client = _client(model, threshold=0.5)
+        client.provider.parse = lambda text, state: pytest.fail("LLM must not be called")
+
+        result = client.parse_command("Ney, dig in where you stand", STATE)
+        assert result["action"] == "fortify"
+        assert result["marshal"] == "Ney"  # Fast parser's marshal kept
+        assert result["mode"] == "classifier"
+        assert last_parse_path() == "classifier"
+
+    def test_unresolved_marshal_escalates(self, model):
+        client = _client(model, threshold=0.5)
+        client._parse_with_mock = lambda text: ParseResult(
+            matched=False, marshals=[], action="attack", target="British", confidence=0.5,
+            mode="mock", raw_command=text)
+
+        result = client.parse_command("go and deal with the british", STATE)
+        assert result["action"] == "defend"
+        assert last_parse_path() == "llm"
+
+    def test_classified_parse_is_validated(self, model):
+        client = _client(model, threshold=0.5)
+        result = client.parse_command("Ney, dig in where you stand",
+                                      {**STATE, "marshals": {"Davout": {}}})
+        assert result["marshal"] == "Ney"
+        assert last_parse_path() == "validation_fallback"  # Escalated; LLM's Ney fails too
+
+    def test_meta_action_never_classified(self, model, monkeypatch):
+        client = _client(model, threshold=0.5)
+        monkeypatch.setattr(model, "predict", lambda text: ("end_turn", 1.0))
+        assert client.parse_command("Ney, we are done here", STATE)["action"] == "defend"
+        assert last_parse_path() == "llm"
+
+    def test_unsure_classifier_escalates(self, model):
+        client = _client(model, threshold=1.01)
+        result = client.parse_command("Ney, dig in where you stand", STATE)
+        assert result["action"] == "defend"
+        assert last_parse_path() == "llm"
+
+    def test_no_model_goes_straight_to_llm(self):
+        assert _client().parse_command("Ney, do the thing", STATE)["action"] == "defend"
+
+    def test_validated_llm_parse_is_journaled(self, tmp_path):
+        path = tmp_path / "parses.jsonl"
+        client = _client()
+        client._journal = ParseJournal(str(path))
+        client.parse_command("Ney, hold firm", STATE)
+
+        entry = json.loads(path.read_text().strip())
+        assert entry["raw_command"] == "Ney, hold firm"
+        assert entry["action"] == "defend"
+        assert load_examples([str(path)]) == [("Ney, hold firm", "defend")]
+
+
+class TestTrainingReport:
+
+    def test_load_examples_reads_saves(self, tmp_path):
+        save = tmp_path / "save.json"
+        save.write_text(json.dumps({"command_history": [
+            {"raw_input": "Ney attack Wellington", "action": "attack"},
+            {"raw_input": "gibberish", "action": "unknown"},
+        ]}))
+        assert load_examples(save_paths=[str(save)]) == [("Ney attack Wellington", "attack")]
+
+    def test_evaluate_report(self, model):
+        held_out = [("Lannes, dig in right here", "fortify"), ("Lannes, pull back now", "retreat")]
+        report = evaluate(model, held_out, threshold=0.5)
+        assert report["examples"] == 2
+        assert report["accuracy"] == 1.0
+        assert 0.0 <= report["coverage"] <= 1.0
+        assert report["mean_us"] > 0
+        assert "Per action:" in format_report(report, 0.5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
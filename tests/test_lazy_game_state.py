@@ -0,0 +1,56 @@
+"""
+Tests for the lazy, per-version LLM game state used by /command.
+
+Run: pytest tests/test_lazy_game_state.py -v
+"""
+
+import pytest
+from backend.ai.llm_client import LLMClient, LazyGameState
+from backend.ai.schemas import ParseResult
+
+
+class _CountingBuilder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"marshals": {"Ney": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+
+
+class TestLazyGameState:
+    """The prompt state is only built when a provider is actually called."""
+
+    def test_confident_fast_parse_never_builds(self):
+        builder = _CountingBuilder()
+        client = LLMClient(provider="mock")
+        client.parse_command("Ney attack Wellington", LazyGameState(builder))
+        assert builder.calls == 0
+
+    def test_llm_fallback_builds_once(self):
+        builder = _CountingBuilder()
+        seen = []
+        client = LLMClient(provider="mock")
+        client.provider_name = "anthropic"
+        client.api_key = "test-key"
+        client.provider.parse = lambda text, state: seen.append(state.get("marshals")) or \
+            ParseResult(matched=True, marshals=["Ney"], action="defend")
+
+        state = LazyGameState(builder)
+        result = client.parse_command("zzz qqq", state)
+        assert seen == [{"Ney": {}}]
+        assert result["marshal"] == "Ney"
+        assert builder.calls == 1 and state.built
+
+    def test_main_state_cached_per_world_version(self):
+        from backend import main
+
+        first = main.get_llm_game_state()
+        assert main.get_llm_game_state() is first
+        main.world.mark_state_changed()
+        assert main.get_llm_game_state() is not first
+        assert main.get_llm_game_state() == first
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,174 @@
+"""
+Tests for micro-batched LLM fallbacks (BatchingDispatcher and
+provider.parse_batch).
+
+Run: pytest tests/test_llm_batching.py -v
+"""
+
+import threading
+import time
+
+import pytest
+from backend.ai import providers
+from backend.ai.batching import BatchingDispatcher
+from backend.ai.llm_client import LLMClient
+from backend.ai.schemas import ParseResult
+from backend.utils.metrics import PARSE_PATH_TOTAL
+
+GAME_STATE = {"marshals": {"Ney": {}, "Davout": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+
+
+class _BatchProvider:
+    """Records batch sizes; answers 'defend' for the named marshal."""
+
+    def __init__(self, delay=0.0):
+        self.batches = []
+        self.delay = delay
+
+    def parse_batch(self, commands):
+        self.batches.append([text for text, _ in commands])
+        time.sleep(self.delay)
+        return [ParseResult(matched=True, marshals=[text.split()[0]], action="defend",
+                            raw_command=text) for text, _ in commands]
+
+
+def _submit_concurrently(dispatcher, texts):
+    results = [None] * len(texts)
+
+    def run(i, text):
+        results[i] = dispatcher.submit(text, GAME_STATE)
+
+    threads = [threading.Thread(target=run, args=(i, t)) for i, t in enumerate(texts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestBatchingDispatcher:
+
+    def test_concurrent_fallbacks_share_one_request(self):
+        provider = _BatchProvider()
+        dispatcher = BatchingDispatcher(provider, window_seconds=0.5, max_batch=4)
+        results = _submit_concurrently(dispatcher, ["Ney a", "Davout b", "Ney c", "Davout d"])
+
+        assert len(provider.batches) == 1
+        assert sorted(provider.batches[0]) == ["Davout b", "Davout d", "Ney a", "Ney c"]
+        # Each caller gets the result for its own command
+        assert [r.raw_command for r in results] == ["Ney a", "Davout b", "Ney c", "Davout d"]
+
+    def test_full_batch_sent_early_and_split(self):
+        provider = _BatchProvider()
+        dispatcher = BatchingDispatcher(provider, window_seconds=5.0, max_batch=2)
+        start = time.perf_counter()
+        _submit_concurrently(dispatcher, ["Ney a", "Ney b", "Ney c", "Ney d"])
+        assert time.perf_counter() - start < 4.0
+        assert sorted(len(batch) for batch in provider.batches) == [2, 2]
+
+    def test_timeout_returns_none(self):
+        dispatcher = BatchingDispatcher(_BatchProvider(delay=0.3), window_seconds=0.0,
+                                        timeout_seconds=0.05)
+        results = _submit_concurrently(dispatcher, ["Ney a", "Ney b"])
+        assert results == [None, None]
+
+
+class TestClientBatching:
+    """LLMClient validates each batched result on its own."""
+
+    def _client(self, provider):
+        client = LLMClient(provider="mock")
+        client.provider_name = "anthropic"
+        client.api_key = "test-key"
+        client.provider = provider
+        client.enable_batching(window_ms=300, max_batch=2)
+        return client
+
+    def test_results_validated_independently(self):
+        class Provider(_BatchProvider):
+            def parse_batch(self, commands):
+                return [ParseResult(matched=True, marshals=["Ney"], action="defend", mode="anthropic"),
+                        ParseResult(matched=True, marshals=["Murat"], action="defend", mode="anthropic")]
+
+        client = self._client(Provider())
+        results = {}
+
+        def run(key):
+            results[key] = client.parse_command(f"{key} zzz qqq", GAME_STATE)
+
+        threads = [threading.Thread(target=run, args=(key,)) for key in ("first", "second")]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.05)  # Keep submission order deterministic
+        for thread in threads:
+            thread.join()
+
+        assert results["first"]["mode"] == "anthropic"
+        assert results["first"]["marshal"] == "Ney"
+        assert results["second"]["mode"] == "mock"  # Murat failed validation -> fast parser
+
+    def test_timeout_falls_back_to_fast_parser(self):
+        client = self._client(_BatchProvider(delay=0.5))
+        client._dispatcher.timeout_seconds = 0.05
+        client._dispatcher.window_seconds = 0.0
+        before = PARSE_PATH_TOTAL.labels("timeout_fallback").value
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            client.parse_command("Ney zzz qqq", GAME_STATE))) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert PARSE_PATH_TOTAL.labels("timeout_fallback").value >= before + 1
+        assert any(result["mode"] == "mock" for result in results)
+
+
+class TestAnthropicBatchRequest:
+
+    def test_one_request_demultiplexed(self, monkeypatch):
+        calls = []
+
+        class FakeResponse:
+            status_code = 200
+
+            def json(self):
+                return {"content": [{"type": "text", "text":
+                        '[{"matched": true, "marshals": ["Ney"], "action": "defend"},'
+                        ' {"matched": true, "marshals": ["Davout"], "action": "fortify"}]'}]}
+
+        class FakeClient:
+            def __init__(self, timeout):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def post(self, url, headers, json):
+                calls.append(json)
+                return FakeResponse()
+
+        monkeypatch.setattr(providers.httpx, "Client", FakeClient)
+        provider = providers.AnthropicProvider()
+        provider._api_key = "test-key"
+
+        results = provider.parse_batch([("Ney hold", GAME_STATE), ("Davout dig in", GAME_STATE)])
+        assert len(calls) == 1
+        assert "# Command 2 of 2" in calls[0]["messages"][0]["content"]
+        assert [(r.action, r.raw_command) for r in results] == \
+            [("defend", "Ney hold"), ("fortify", "Davout dig in")]
+
+    def test_wrong_length_fails_every_command(self, monkeypatch):
+        provider = providers.AnthropicProvider()
+        provider._api_key = "test-key"
+        monkeypatch.setattr(provider, "_make_api_request",
+                            lambda *args, **kwargs: ('[{"matched": true}]', None))
+        results = provider.parse_batch([("a", GAME_STATE), ("b", GAME_STATE)])
+        assert [r.matched for r in results] == [False, False]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Tests for the local LLM stub server and the /command load generator
+(scripts/llm_stub_server.py, scripts/load_test.py).
+
+Run: pytest tests/test_load_harness.py -v
+"""
+
+import threading
+
+import pytest
+from backend.ai.providers import AnthropicProvider, GroqProvider
+from scripts.llm_stub_server import StubBehavior, make_server, parse_latency
+from scripts.load_test import percentile, run_load, summarize
+
+GAME_STATE = {"marshals": {"Ney": {}, "Davout": {}}, "enemies": {"Wellington": {}},
+              "map_data": {"Paris": {}, "Belgium": {}}}
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**behavior):
+        server = make_server(StubBehavior(seed=1, **behavior))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _pointed_at(cls, server, path):
+    provider = cls()
+    provider.config.endpoint = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    provider._api_key = "stub"
+    return provider
+
+
+class TestStubServer:
+
+    def test_anthropic_and_groq_shapes_parse(self, stub):
+        server = stub()
+        anthropic = _pointed_at(AnthropicProvider, server, "/v1/messages")
+        groq = _pointed_at(GroqProvider, server, "/openai/v1/chat/completions")
+        for provider in (anthropic, groq):
+            result = provider.parse("Ney, attack Wellington", GAME_STATE)
+            assert result.matched and result.marshals == ["Ney"] and result.action == "attack"
+
+    def test_batch_prompt_gets_array(self, stub):
+        provider = _pointed_at(AnthropicProvider, stub(), "/v1/messages")
+        results = provider.parse_batch([("Ney, attack Wellington", GAME_STATE),
+                                        ("Davout, move to Belgium", GAME_STATE)])
+        assert [(r.marshals, r.action) for r in results] == [(["Ney"], "attack"), (["Davout"], "move")]
+
+    @pytest.mark.parametrize("behavior,interpretation", [
+        ({"error_rate": 1.0}, "Server error (500)"),
+        ({"rate_limit_rate": 1.0}, "Rate limited"),
+        ({"malformed_rate": 1.0}, "not valid JSON"),
+    ])
+    def test_fault_injection(self, stub, behavior, interpretation):
+        provider = _pointed_at(AnthropicProvider, stub(**behavior), "/v1/messages")
+        result = provider.parse("Ney, attack Wellington", GAME_STATE)
+        assert not result.matched and interpretation in result.interpretation
+
+    def test_latency_specs(self):
+        import random
+        rng = random.Random(0)
+        assert parse_latency("fixed:250")(rng) == 0.25
+        assert 0.1 <= parse_latency("uniform:100:200")(rng) <= 0.2
+        assert parse_latency("lognormal:400:0.5")(rng) > 0
+        with pytest.raises(ValueError):
+            parse_latency("gamma:1")
+
+
+class TestLoadGenerator:
+
+    def test_percentiles_and_summary(self):
+        assert percentile([1, 2, 3, 4], 50) == 2
+        assert percentile(list(range(1, 101)), 99) == 99
+        samples = [("fast", 200, 0.001 * i) for i in range(1, 101)] + [("llm", 500, 0.4)]
+        summary = summarize(samples)
+        assert summary["fast"]["count"] == 100 and summary["fast"]["p95_ms"] == pytest.approx(95)
+        assert summary["llm"]["errors"] == 1
+        assert summary["all"]["count"] == 101
+
+    def test_replays_against_command_endpoint(self):
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        client = TestClient(app)
+
+        def send(command):
+            response = client.post("/command", json={"command": command})
+            return response.headers.get("x-parse-path", "none"), response.status_code
+
+        samples, elapsed = run_load(send, ["status", "Ney, fortify"], qps=200, total=6, max_in_flight=1)
+        assert len(samples) == 6
+        assert {path for path, _, _ in samples} == {"fast"}
+        assert all(status == 200 for _, status, _ in samples)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
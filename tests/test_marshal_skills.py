@@ -330,6 +330,128 @@ class TestFutureSkillFoundations:
             # TODO Phase 5: Test morale management, discipline, looting prevention
 
 
+class TestCombatModifierCache:
+    """Test the cached per-marshal combat modifier vector."""
+
+    def test_cached_vector_reused_until_input_changes(self):
+        """Same inputs return the same vector; a stance change rebuilds it."""
+        from backend.models.marshal import Stance
+        ney = create_starting_marshals()["Ney"]
+
+        first = ney.get_combat_modifiers()
+        assert ney.get_combat_modifiers() is first
+
+        ney.stance = Stance.AGGRESSIVE
+        second = ney.get_combat_modifiers()
+        assert second is not first
+        assert second.attack > first.attack
+
+    def test_vector_matches_uncached_modifiers(self):
+        """Cached values equal the uncached computation across states."""
+        from backend.models.marshal import Stance
+        marshals = create_starting_marshals()
+        marshals.update(create_enemy_marshals())
+
+        for marshal in marshals.values():
+            for stance in Stance:
+                marshal.stance = stance
+                marshal.attacks_this_turn = 2
+                marshal.defense_bonus = 0.1
+                assert marshal.get_attack_modifier() == marshal._compute_attack_modifier(None)
+                assert marshal.get_attack_modifier(0.5) == marshal._compute_attack_modifier(0.5)
+                assert marshal.get_defense_modifier(True) == marshal._compute_defense_modifier(True)
+
+    def test_tactical_state_tracked(self):
+        """Drill, fortify and exhaustion setters invalidate the vector."""
+        davout = create_starting_marshals()["Davout"]
+        first = davout.get_combat_modifiers()
+
+        davout.attacks_this_turn = 3
+        assert davout.get_combat_modifiers().attack < first.attack
+
+        davout.defense_bonus = 0.15
+        assert davout.get_combat_modifiers().fortify_bonus == 0.15
+
+        davout.drilling = True
+        assert davout.get_combat_modifiers().drilling is True
+        assert davout.get_defense_modifier() == davout._compute_defense_modifier()
+
+    def test_strategic_bonus_still_consumed(self):
+        """One-shot strategic bonuses bypass the cache and are consumed."""
+        ney = create_starting_marshals()["Ney"]
+        baseline = ney.get_attack_modifier()
+
+        ney.strategic_combat_bonus = 10
+        assert ney.get_attack_modifier() > baseline
+        assert ney.strategic_combat_bonus == 0
+        assert ney.get_attack_modifier() == baseline
+
+
+class TestMarshalProfile:
+    """Static identity is shared and immutable; state is slotted."""
+
+    def test_profiles_shared_between_games(self):
+        """Two games building the same roster share one profile per marshal."""
+        first = create_starting_marshals()
+        second = create_starting_marshals()
+        for name in first:
+            assert first[name]._profile is second[name]._profile
+            assert first[name].skills is not second[name].skills
+
+    def test_state_is_slotted(self):
+        """Unknown attributes are rejected; _state_snapshot() is a copy."""
+        ney = create_starting_marshals()["Ney"]
+        assert not hasattr(ney, "__dict__")
+        with pytest.raises(AttributeError):
+            ney.not_a_field = 1
+
+        state = ney._state_snapshot()
+        assert state["name"] == "Ney" and state["stance"] is ney.stance
+        state["strength"] = 0
+        assert ney.strength > 0
+
+    def test_legacy_names_alias_real_fields(self):
+        """fortify_bonus and autonomous_turns_remaining write the real fields."""
+        ney = create_starting_marshals()["Ney"]
+        ney.fortify_bonus = 0.10
+        ney.autonomous_turns_remaining = 2
+        assert ney.defense_bonus == 0.10 and ney.autonomy_turns == 2
+        assert ney.get_combat_modifiers().fortify_bonus == 0.10
+
+    def test_unused_profiles_released(self):
+        """The intern table does not keep profiles no marshal uses."""
+        import gc
+        from backend.models.marshal import _PROFILE_CACHE
+        marshal = Marshal("Transient", "Paris", 1000, "cautious", nation="Nowhere")
+        key = next(k for k, p in _PROFILE_CACHE.items() if p is marshal._profile)
+
+        del marshal
+        gc.collect()
+        assert key not in _PROFILE_CACHE
+
+    def test_profile_fields_copy_on_write(self):
+        """Assigning a profile field only affects that marshal."""
+        ney = create_starting_marshals()["Ney"]
+        other_ney = create_starting_marshals()["Ney"]
+        cached = ney.get_combat_modifiers()
+
+        ney.cavalry = False
+        ney.nation = "Britain"
+        assert (ney.cavalry, ney.nation) == (False, "Britain")
+        assert (other_ney.cavalry, other_ney.nation) == (True, "France")
+        assert ney.get_combat_modifiers() is not cached
+
+    def test_ability_read_only_and_roundtrip(self):
+        """Ability cannot be mutated in place; to_dict/from_dict keep identity."""
+        davout = create_starting_marshals()["Davout"]
+        with pytest.raises(TypeError):
+            davout.ability["name"] = "Changed"
+
+        restored = Marshal.from_dict(davout.to_dict())
+        assert restored._profile is davout._profile
+        assert restored.to_dict() == davout.to_dict()
+
+
 if __name__ == "__main__":
     """Run tests with pytest."""
     pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+"""
+Tests for the columnar MarshalTable (structure-of-arrays marshal mirror).
+
+Run: pytest tests/test_marshal_table.py -v
+"""
+
+import pytest
+from backend.models.world_state import WorldState
+from backend.models.marshal import Marshal
+from backend.models.marshal_table import FLAG_BROKEN
+from backend.ai.enemy_ai import EnemyAI
+
+
+def _names(marshals):
+    return [m.name for m in marshals]
+
+
+class TestMarshalTable:
+    """Mask queries must match the object scans they replace."""
+
+    def setup_method(self):
+        self.world = WorldState()
+        self.scan_world = WorldState()
+        self.world.enable_marshal_table()
+
+    def test_small_games_do_not_attach(self):
+        """Standard rosters keep marshals detached; no class swapping either way."""
+        assert self.scan_world.get_marshal_table() is None
+        assert all(m._mirror is None for m in self.scan_world.marshals.values())
+        assert all(type(m) is Marshal and m._mirror is not None
+                   for m in self.world.marshals.values())
+
+    def test_queries_match_object_scans(self):
+        """Nation/enemy/player queries return the same marshals in the same order."""
+        for world in (self.world, self.scan_world):
+            world.get_marshal("Wellington").strength = 0
+            world.get_marshal("Ney").nation = "Britain"
+
+        for nation in ("France", "Britain", "Prussia", "Atlantis"):
+            assert _names(self.world.get_enemies_of_nation(nation)) == \
+                _names(self.scan_world.get_enemies_of_nation(nation))
+            assert _names(self.world.get_marshals_by_nation(nation)) == \
+                _names(self.scan_world.get_marshals_by_nation(nation))
+        assert _names(self.world.get_player_marshals()) == \
+            _names(self.scan_world.get_player_marshals())
+
+    def test_writes_flow_through(self):
+        """Location, strength and flag changes update the columns."""
+        table = self.world.get_marshal_table()
+        ney = self.world.get_marshal("Ney")
+
+        ney.move_to("Rhine")
+        ney.broken = True
+        assert ney in table.select(location="Rhine")
+        assert ney not in table.select(location="Rhine", exclude_flags=FLAG_BROKEN)
+
+        ney.strength -= ney.strength
+        assert ney not in table.select(location="Rhine")
+        assert ney in table.select(location="Rhine", alive=False)
+
+    def test_rebuilds_when_roster_changes(self):
+        """Removing a marshal from the world drops its row."""
+        removed = self.world.marshals.pop("Grouchy")
+        assert "Grouchy" not in _names(self.world.get_enemies_of_nation("Britain"))
+        assert removed._mirror is None
+
+    def test_rebuilds_when_marshal_replaced(self):
+        """Replacing a roster entry in place serves the new marshal, not the old row."""
+        old = self.world.get_marshal("Davout")
+        replacement = Marshal("Davout", "Rhine", 30000, "cautious", nation="France")
+        self.world.marshals["Davout"] = replacement
+
+        player = self.world.get_player_marshals()
+        assert replacement in player and old not in player
+        assert replacement in self.world.get_marshal_table().select(location="Rhine")
+        assert old._mirror is None
+
+        replacement.nation = "Britain"
+        assert replacement not in self.world.get_player_marshals()
+
+    def test_ai_helpers_match(self):
+        """Combined strength and path blocking agree with and without the table."""
+        results = []
+        for world in (self.world, self.scan_world):
+            ai = EnemyAI(None)
+            blucher = world.get_marshal("Blucher")
+            gneisenau = world.get_marshal("Gneisenau")
+            gneisenau.location = blucher.location
+            world.get_marshal("Ney").location = "Belgium"
+            results.append((
+                ai._get_combined_strength_in_region(blucher, "Prussia", world),
+                ai._path_is_blocked(["Rhine", "Belgium", "Waterloo"], "Prussia", world),
+            ))
+        assert results[0] == results[1]
+        assert results[0][1] == (True, "Ney")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,123 @@
+"""
+Tests for the Prometheus-style /metrics registry and its instrumentation
+(parse paths, LLM latency/tokens, enemy phase, request latency).
+
+Run: pytest tests/test_metrics.py -v
+"""
+
+import pytest
+from backend.utils.metrics import (
+    Counter, Histogram, Registry, PARSE_PATH_TOTAL, ENEMY_PHASE_SECONDS, LLM_REQUEST_SECONDS,
+)
+from backend.ai.llm_client import LLMClient
+from backend.ai.providers import AnthropicProvider
+from backend.ai.schemas import ParseResult
+from backend.models.world_state import WorldState
+from backend.commands.executor import CommandExecutor
+
+
+def _value(counter, *labels):
+    return counter.labels(*labels).value
+
+
+class TestRegistry:
+    """Text exposition format."""
+
+    def test_counter_and_histogram_render(self):
+        registry = Registry()
+        hits = registry.register(Counter("demo_hits_total", "Hits", ("path",)))
+        latency = registry.register(Histogram("demo_seconds", "Latency", buckets=(0.1, 1.0)))
+        hits.labels("fast").inc()
+        hits.labels("fast").inc(2)
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(3)
+
+        text = registry.render()
+        assert '# TYPE demo_hits_total counter' in text
+        assert 'demo_hits_total{path="fast"} 3' in text
+        assert 'demo_seconds_bucket{le="0.1"} 1' in text
+        assert 'demo_seconds_bucket{le="1"} 2' in text
+        assert 'demo_seconds_bucket{le="+Inf"} 3' in text
+        assert 'demo_seconds_count 3' in text
+
+    def test_label_arity_checked(self):
+        hits = Counter("demo_total", "Hits", ("path",))
+        with pytest.raises(ValueError):
+            hits.labels("a", "b")
+
+    def test_collectors_render_at_scrape_time(self):
+        registry = Registry()
+        calls = []
+
+        def collector():
+            calls.append(1)
+            yield ("demo_sessions", "gauge", "Sessions", [({"session": "x"}, 1)])
+
+        registry.register_collector(collector)
+        assert not calls
+        assert 'demo_sessions{session="x"} 1' in registry.render()
+
+
+class TestParsePathCounters:
+    """LLMClient counts fast hits and each fallback kind."""
+
+    def _client(self, llm_result):
+        client = LLMClient(provider="mock")
+        client.provider_name = "anthropic"
+        client.api_key = "test-key"
+        client.provider.parse = lambda text, state: llm_result
+        return client
+
+    def test_fast_path(self):
+        before = _value(PARSE_PATH_TOTAL, "fast")
+        LLMClient(provider="mock").parse_command("Ney attack Wellington", {})
+        assert _value(PARSE_PATH_TOTAL, "fast") == before + 1
+
+    def test_validation_and_unmatched_fallbacks(self):
+        state = {"marshals": {"Ney": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+        hallucinated = ParseResult(matched=True, marshals=["Murat"], action="attack", target="Paris")
+
+        before = _value(PARSE_PATH_TOTAL, "validation_fallback")
+        self._client(hallucinated).parse_command("zzz qqq", state)
+        assert _value(PARSE_PATH_TOTAL, "validation_fallback") == before + 1
+
+        before = _value(PARSE_PATH_TOTAL, "unmatched_fallback")
+        self._client(ParseResult(matched=False)).parse_command("zzz qqq", state)
+        assert _value(PARSE_PATH_TOTAL, "unmatched_fallback") == before + 1
+
+
+class TestProviderAndTurnMetrics:
+
+    def test_provider_latency_outcomes(self):
+        provider = AnthropicProvider()
+        before = LLM_REQUEST_SECONDS.labels("anthropic", "rate_limited").count
+        provider._record_latency(0.0, 429)
+        assert LLM_REQUEST_SECONDS.labels("anthropic", "rate_limited").count == before + 1
+
+    def test_enemy_phase_observed(self):
+        before = ENEMY_PHASE_SECONDS.labels().count
+        CommandExecutor().execute({"command": {"action": "end_turn"}}, {"world": WorldState()})
+        assert ENEMY_PHASE_SECONDS.labels().count == before + 1
+
+
+class TestMetricsEndpoint:
+
+    def test_metrics_served_as_text(self):
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        client = TestClient(app)
+        client.get("/status")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        text = response.text
+        assert 'sovereign_http_request_duration_seconds_count{method="GET",route="/status"}' in text
+        assert "sovereign_active_sessions 1" in text
+        assert 'sovereign_session_state_bytes{session="default"}' in text
+        assert client.get("/metrics/turns").json()["turns"]["turns"] >= 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,175 @@
+"""
+Tests for multi-marshal orders: CommandParser.split_multiple/parse_multiple
+(concurrent parsing) and CommandExecutor.execute_group (plan validation,
+coordinated flanking).
+
+Run: pytest tests/test_multi_command.py -v
+"""
+
+import time
+
+import pytest
+from backend.ai.schemas import ParseResult
+from backend.commands.executor import CommandExecutor
+from backend.commands.parser import CommandParser
+from backend.models.world_state import WorldState
+
+LLM_STATE = {"marshals": {"Ney": {}, "Davout": {}, "Murat": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+
+
+@pytest.fixture
+def parser():
+    return CommandParser(use_real_llm=False)
+
+
+class TestSplitMultiple:
+
+    @pytest.mark.parametrize("command, parts", [
+        ("Ney and Davout, attack Wellington", ["Ney, attack Wellington", "Davout, attack Wellington"]),
+        ("ney, davout and murat: fortify", ["Ney, fortify", "Davout, fortify", "Murat, fortify"]),
+        ("Ney attack Wellington and Davout defend Paris", ["Ney attack Wellington", "Davout defend Paris"]),
+    ])
+    def test_splits_per_marshal(self, parser, command, parts):
+        assert parser.split_multiple(command) == parts
+
+    @pytest.mark.parametrize("command", [
+        "Ney, attack and hold", "Ney attack Wellington and Blucher", "Ney and Ney attack", "Ney, attack Wellington",
+        "Ney, attack Wellington and Davout", "Ney attack Wellington and fortify",
+        "Ney attack Wellington and fortify beside Davout",
+    ])
+    def test_single_commands_unchanged(self, parser, command):
+        assert parser.split_multiple(command) == [command]
+
+
+class TestParseMultiple:
+
+    def test_llm_fallbacks_overlap(self, parser):
+        llm = parser.llm
+        llm.provider_name = "anthropic"
+        llm.api_key = "test-key"
+        llm._parse_with_mock = lambda text: ParseResult(
+            matched=False, marshals=[text.split(",")[0]], action="unknown", confidence=0.5,
+            mode="mock", raw_command=text)
+
+        def provider_parse(text, state):
+            time.sleep(0.2)
+            return ParseResult(matched=True, marshals=[text.split(",")[0]], action="defend",
+                               mode="anthropic", raw_command=text)
+
+        llm.provider.parse = provider_parse
+        start = time.perf_counter()
+        results = parser.parse_multiple("Ney, Davout and Murat, hold the line", LLM_STATE)
+        elapsed = time.perf_counter() - start
+
+        assert [r["command"]["marshal"] for r in results] == ["Ney", "Davout", "Murat"]
+        assert all(r["command"]["action"] == "defend" for r in results)
+        assert elapsed < 0.45  # Three 0.2s calls in parallel, not 0.6s in series
+
+    def test_single_command_uses_parse(self, parser):
+        results = parser.parse_multiple("Ney, attack Wellington")
+        assert len(results) == 1 and results[0]["command"]["action"] == "attack"
+
+    def test_marshal_named_as_target_stays_single(self, parser):
+        results = parser.parse_multiple("Ney, attack Wellington and Davout")
+        assert len(results) == 1
+        assert (results[0]["command"]["marshal"], results[0]["command"]["action"]) == ("Ney", "attack")
+
+
+    def test_compound_order_for_one_marshal_stays_single(self, parser):
+        results = parser.parse_multiple("Ney attack Wellington and fortify")
+        assert len(results) == 1 and results[0]["command"]["marshal"] == "Ney"
+
+    def test_endpoint_runs_compound_order_as_one_command(self):
+        from fastapi.testclient import TestClient
+        from backend.main import app
+
+        response = TestClient(app).post("/command", json={"command": "Ney attack Wellington and fortify"})
+        assert response.status_code == 200
+        assert response.headers["X-Parse-Path"] != "multi"
+
+
+class TestExecuteGroup:
+
+    def test_coordinated_attack_shares_flanking(self, parser):
+        world = WorldState()
+        parts = parser.parse_multiple("Ney and Davout, attack Wellington", world=world)
+        result = CommandExecutor().execute_group(parts, {"world": world})
+
+        assert result["success"]
+        battles = [e for e in result["events"] if e["type"] == "battle"]
+        assert [b["attacker"]["name"] for b in battles] == ["Ney", "Davout"]
+        assert [b["flanking_bonus"] for b in battles] == [1, 1]  # First attacker flanks too
+        assert len(world.attacks_this_turn["Waterloo"]) == 2      # Each origin recorded once
+        assert world.actions_remaining == 2
+        assert "new_state" not in result
+
+    def test_unreachable_member_not_planned(self, parser):
+        """A member who can't reach the target neither flanks nor leaves a record."""
+        world = WorldState()
+        world.get_marshal("Davout").location = "Lyon"  # Two regions from Waterloo
+        parts = parser.parse_multiple("Ney and Davout, attack Wellington", world=world)
+        result = CommandExecutor().execute_group(parts, {"world": world})
+
+        battles = [e for e in result["events"] if e["type"] == "battle"]
+        assert [(b["attacker"]["name"], b["flanking_bonus"]) for b in battles] == [("Ney", 0)]
+        assert [a["attacker"] for a in world.attacks_this_turn["Waterloo"]] == ["Ney"]
+
+    def test_stopped_member_leaves_no_record(self, parser, monkeypatch):
+        """A member stopping for an objection is withdrawn; only real attacks are recorded."""
+        world = WorldState()
+        objection = {"type": "major_objection", "severity": 0.9, "message": "Madness!"}
+        monkeypatch.setattr(world.disobedience_system, "evaluate_order",
+                            lambda marshal, order, game_state: objection if marshal.name == "Davout" else None)
+        parts = parser.parse_multiple("Ney and Davout, attack Wellington", world=world)
+        result = CommandExecutor().execute_group(parts, {"world": world})
+
+        assert result["state"] == "awaiting_player_choice"
+        assert [r["events"][0]["attacker"]["name"] for r in result["group_results"]] == ["Ney"]
+        assert [a["attacker"] for a in world.attacks_this_turn["Waterloo"]] == ["Ney"]
+
+    def test_withdrawn_member_undoes_records_and_replans(self):
+        """Withdrawing drops the member's records and resets the shared flanking."""
+        world = WorldState()
+        world.record_attack("Ney", "Belgium", "Waterloo")
+        recorded = {"Waterloo": 1}
+        world.record_attack("Davout", "Paris", "Waterloo")
+        world.record_attack("Davout", "Paris", "Rhine")
+        plans = {"Waterloo": {"attackers": {"Ney": "Belgium", "Davout": "Paris", "Grouchy": "Waterloo"},
+                              "flanking": {"bonus": 2}}}
+
+        CommandExecutor()._withdraw_coordinated_attacker(
+            {"command": {"marshal": "Davout"}}, plans, world, recorded)
+
+        assert [a["attacker"] for a in world.attacks_this_turn["Waterloo"]] == ["Ney"]
+        assert "Rhine" not in world.attacks_this_turn
+        assert plans["Waterloo"] == {"attackers": {"Ney": "Belgium", "Grouchy": "Waterloo"}, "flanking": None}
+
+    def test_lone_first_attack_has_no_flanking(self, parser):
+        world = WorldState()
+        executor = CommandExecutor()
+        first = executor.execute(parser.parse("Ney, attack Wellington", world=world), {"world": world})
+        assert first["events"][0]["flanking_bonus"] == 0
+
+    def test_plan_over_budget_executes_nothing(self, parser):
+        world = WorldState()
+        world.actions_remaining = 1
+        wellington = world.get_marshal("Wellington").strength
+        parts = parser.parse_multiple("Ney and Davout, attack Wellington", world=world)
+        result = CommandExecutor().execute_group(parts, {"world": world})
+
+        assert not result["success"]
+        assert "Need 2, have 1" in result["message"]
+        assert world.get_marshal("Wellington").strength == wellington
+        assert world.actions_remaining == 1
+
+    def test_unparsed_part_rejects_plan(self, parser):
+        world = WorldState()
+        parts = parser.parse_multiple("Ney and Davout", world=world)
+        result = CommandExecutor().execute_group(parts, {"world": world})
+        assert not result["success"]
+        assert "Could not understand" in result["message"]
+        assert world.actions_remaining == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
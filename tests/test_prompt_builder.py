@@ -0,0 +1,103 @@
+"""
+Tests for the static/dynamic prompt split and Anthropic prompt caching.
+
+Run: pytest tests/test_prompt_builder.py -v
+"""
+
+import pytest
+from backend.ai import prompt_builder, providers
+from backend.ai.prompt_builder import (
+    PARSE_INSTRUCTIONS, build_parse_prompt, build_system_blocks, _format_marshals,
+)
+
+GAME_STATE = {
+    "marshals": {
+        "Ney": {"location": "Belgium", "strength": 72000},
+        "Davout": {"location": "Paris", "strength": 65000},
+        "Murat": {"location": "Lyon", "strength": 500},
+    },
+    "enemies": {"Wellington": {"location": "Waterloo", "strength": 65000, "nation": "British"}},
+    "map_data": {
+        "Paris": {"marshals": [{"name": "Davout", "personality": "cautious"}]},
+        "Belgium": {"marshals": [{"name": "Ney", "personality": "aggressive"}]},
+        "Waterloo": {"marshals": []},
+    },
+}
+
+
+class TestPromptSplit:
+    """Static instructions are built once; the situation is per call."""
+
+    def test_full_prompt_is_instructions_plus_situation(self):
+        full = build_parse_prompt("Ney, attack Wellington", GAME_STATE)
+        situation = build_parse_prompt("Ney, attack Wellington", GAME_STATE, include_static=False)
+        assert full == PARSE_INSTRUCTIONS + "\n\n" + situation
+        assert '"Ney, attack Wellington"' in situation
+        assert "## Examples" not in situation
+
+    def test_instructions_are_state_independent(self):
+        """Every prompt shares the same cacheable prefix, whatever the state."""
+        other = build_parse_prompt("Retreat!", {"marshals": {}, "map_data": {"Atlantis": {}}})
+        assert other.startswith(PARSE_INSTRUCTIONS + "\n\n# Current Situation")
+        assert "Atlantis" not in PARSE_INSTRUCTIONS
+        assert prompt_builder.PARSE_INSTRUCTIONS is PARSE_INSTRUCTIONS
+
+    def test_marshal_personalities_from_map_data(self):
+        lines = _format_marshals(GAME_STATE).splitlines()
+        assert lines == [
+            "- Ney (aggressive) at Belgium, 72K troops",
+            "- Davout (cautious) at Paris, 65K troops",
+            "- Murat (unknown) at Lyon, 500 troops",
+        ]
+
+    def test_system_blocks_cache_instructions(self):
+        blocks = build_system_blocks()
+        assert blocks[-1]["text"] is PARSE_INSTRUCTIONS
+        assert blocks[-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[0]
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def json(self):
+        return {
+            "content": [{"type": "text", "text": '{"matched": true, "marshals": ["Ney"], "action": "defend"}'}],
+            "usage": {"input_tokens": 120, "output_tokens": 30,
+                      "cache_read_input_tokens": 1200, "cache_creation_input_tokens": 0},
+        }
+
+
+class TestAnthropicRequestBody:
+
+    def test_request_sends_cached_system_and_short_user_message(self, monkeypatch):
+        sent = {}
+
+        class FakeClient:
+            def __init__(self, timeout):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def post(self, url, headers, json):
+                sent.update(json)
+                return _FakeResponse()
+
+        monkeypatch.setattr(providers.httpx, "Client", FakeClient)
+        provider = providers.AnthropicProvider()
+        provider._api_key = "test-key"
+
+        result = provider.parse("Ney, hold", GAME_STATE)
+        assert result.matched and result.action == "defend"
+        assert sent["system"] == build_system_blocks()
+        user_message = sent["messages"][0]["content"]
+        assert PARSE_INSTRUCTIONS not in user_message
+        assert '"Ney, hold"' in user_message
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,188 @@
+"""
+Tests for the provider resilience layer (circuit breaker, token bucket with
+429 retry-after, hedged requests), run against a local stub HTTP server.
+
+Run: pytest tests/test_provider_resilience.py -v
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from backend.ai import providers
+from backend.ai.providers import AnthropicProvider, GroqProvider
+from backend.ai.resilience import (
+    CircuitBreaker, ResilientProvider, TokenBucket, CLOSED, OPEN, HALF_OPEN,
+)
+from backend.utils.metrics import LLM_SHORT_CIRCUIT_TOTAL
+
+PARSED = {"matched": True, "marshals": ["Ney"], "action": "defend"}
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers with server.replies.pop(0) (or the last reply, repeated)."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            reply = server.replies.pop(0) if len(server.replies) > 1 else server.replies[0]
+        status, delay, headers = reply.get("status", 200), reply.get("delay", 0), reply.get("headers", {})
+        time.sleep(delay)
+        if self.path.endswith("chat/completions"):
+            body = {"choices": [{"message": {"content": json.dumps(PARSED)}}]}
+        else:
+            body = {"content": [{"type": "text", "text": json.dumps(PARSED)}]}
+        payload = json.dumps(body if status == 200 else {"error": "stub"}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.replies = [{"status": 200}]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _provider(cls, server, path):
+    provider = cls()
+    provider.config.endpoint = f"http://127.0.0.1:{server.server_address[1]}{path}"
+    provider._api_key = "test-key"
+    return provider
+
+
+class TestCircuitBreaker:
+
+    def test_opens_on_failure_ratio_then_probes(self):
+        clock = _FakeClock()
+        breaker = CircuitBreaker(window=4, failure_ratio=0.5, min_calls=4, cooldown_seconds=10, clock=clock)
+        for failed in (False, True, False):
+            breaker.record(failed)
+        assert breaker.state == CLOSED
+        breaker.record(True)
+        assert breaker.state == OPEN and not breaker.allow()
+
+        clock.now += 10
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # One probe at a time
+        breaker.record(False)
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self):
+        clock = _FakeClock()
+        breaker = CircuitBreaker(window=2, min_calls=2, cooldown_seconds=5, clock=clock)
+        breaker.record(True)
+        breaker.record(True)
+        clock.now += 5
+        assert breaker.allow()
+        breaker.record(True)
+        assert breaker.state == OPEN
+
+
+class TestTokenBucket:
+
+    def test_rate_limit_and_max_wait(self):
+        clock = _FakeClock()
+        slept = []
+        bucket = TokenBucket(rate_per_second=2, capacity=1, clock=clock, sleep=slept.append)
+        assert bucket.acquire()
+        assert not bucket.acquire(max_wait=0.1)  # Next token in 0.5s
+        assert bucket.acquire(max_wait=1.0)
+        assert slept == [0.5]
+
+    def test_pause_blocks_even_without_rate(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(clock=clock, sleep=lambda s: None)
+        bucket.pause(3)
+        assert not bucket.acquire(max_wait=1.0)
+        clock.now += 3
+        assert bucket.acquire()
+
+
+class TestResilientProviderAgainstStub:
+
+    def test_5xx_opens_circuit_and_skips_provider(self, stub_server):
+        stub_server.replies = [{"status": 503}]
+        provider = ResilientProvider(
+            _provider(AnthropicProvider, stub_server, "/v1/messages"),
+            breaker=CircuitBreaker(window=3, min_calls=3, cooldown_seconds=60))
+        for _ in range(3):
+            assert not provider.parse("Ney hold").matched
+        assert len(stub_server.requests) == 3
+
+        before = LLM_SHORT_CIRCUIT_TOTAL.labels("anthropic", "circuit_open").value
+        start = time.perf_counter()
+        result = provider.parse("Ney hold")
+        assert not result.matched and time.perf_counter() - start < 0.05
+        assert len(stub_server.requests) == 3
+        assert LLM_SHORT_CIRCUIT_TOTAL.labels("anthropic", "circuit_open").value == before + 1
+
+    def test_429_retry_after_pauses_requests(self, stub_server):
+        stub_server.replies = [{"status": 429, "headers": {"retry-after": "30"}}, {"status": 200}]
+        provider = ResilientProvider(_provider(AnthropicProvider, stub_server, "/v1/messages"),
+                                     max_wait_seconds=0.1)
+        assert not provider.parse("Ney hold").matched
+        assert provider.bucket.paused_for > 25
+        assert provider.parse("Ney hold").interpretation == "Provider skipped: rate_limited"
+        assert len(stub_server.requests) == 1
+        assert provider.breaker.state == CLOSED  # 429 is not a provider failure
+
+    def test_hedge_wins_when_primary_slow(self, stub_server):
+        stub_server.replies = [{"status": 200, "delay": 1.0}, {"status": 200}]
+        primary = _provider(AnthropicProvider, stub_server, "/v1/messages")
+        hedge = _provider(GroqProvider, stub_server, "/openai/v1/chat/completions")
+        provider = ResilientProvider(primary, hedge=hedge, hedge_after_seconds=0.1)
+
+        start = time.perf_counter()
+        result = provider.parse("Ney hold")
+        assert result.matched and result.mode == "groq"
+        assert time.perf_counter() - start < 0.8
+        assert stub_server.requests == ["/v1/messages", "/openai/v1/chat/completions"]
+
+    def test_fast_primary_is_not_hedged(self, stub_server):
+        primary = _provider(AnthropicProvider, stub_server, "/v1/messages")
+        hedge = _provider(GroqProvider, stub_server, "/openai/v1/chat/completions")
+        result = ResilientProvider(primary, hedge=hedge, hedge_after_seconds=1.0).parse("Ney hold")
+        assert result.mode == "anthropic"
+        assert stub_server.requests == ["/v1/messages"]
+
+
+class TestRetryAfterHeader:
+
+    @pytest.mark.parametrize("value,expected", [("2", 2.0), ("0.5", 0.5), ("Wed, 21 Oct 2015", None)])
+    def test_parsed_as_seconds(self, value, expected):
+        class Response:
+            headers = {"retry-after": value}
+
+        assert providers.retry_after_seconds(Response()) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,205 @@
+"""
+Tests for the integer-interned RegionGraph, world id maps and the
+per-nation control aggregates built on region ids.
+
+Run: pytest tests/test_region_graph.py -v
+"""
+
+import pytest
+from backend.models.world_state import WorldState
+from backend.game_logic.turn_manager import TurnManager
+from backend.models.region_graph import UNREACHABLE, MAX_NEIGHBORHOOD_HOPS
+
+
+def _reference_distance(world, region_a, region_b):
+    """Name-based BFS, as get_distance() used to compute it."""
+    if region_a == region_b:
+        return 0
+    if region_a not in world.regions or region_b not in world.regions:
+        return UNREACHABLE
+    visited = {region_a}
+    queue = [(region_a, 0)]
+    while queue:
+        current, distance = queue.pop(0)
+        for adjacent in world.regions[current].adjacent_regions:
+            if adjacent == region_b:
+                return distance + 1
+            if adjacent not in visited:
+                visited.add(adjacent)
+                queue.append((adjacent, distance + 1))
+    return UNREACHABLE
+
+
+def _reference_path(world, start, end, avoid=()):
+    """Name-based BFS with path tracking, as find_path() used to compute it."""
+    if start == end:
+        return [start]
+    visited = {start}
+    queue = [(start, [start])]
+    while queue:
+        current, path = queue.pop(0)
+        for adjacent in world.regions[current].adjacent_regions:
+            if adjacent == end:
+                return path + [end]
+            if adjacent not in visited and adjacent not in avoid:
+                visited.add(adjacent)
+                queue.append((adjacent, path + [adjacent]))
+    return None
+
+
+class TestRegionGraph:
+    """Int-based BFS must reproduce the name-based results exactly."""
+
+    def setup_method(self):
+        self.world = WorldState()
+
+    def test_region_ids_round_trip(self):
+        """Ids follow map order and convert back to names."""
+        for i, name in enumerate(self.world.regions):
+            assert self.world.get_region_id(name) == i
+            assert self.world.get_region_name(i) == name
+        assert self.world.get_region_id("Atlantis") == -1
+
+    def test_distances_match_reference(self):
+        """Every pair (plus unknown names) matches the old BFS."""
+        names = list(self.world.regions) + ["Atlantis"]
+        for a in names:
+            for b in names:
+                assert self.world.get_distance(a, b) == _reference_distance(self.world, a, b)
+
+    def test_paths_match_reference(self):
+        """Shortest paths break ties the same way, with and without avoid sets."""
+        names = list(self.world.regions)
+        for a in names:
+            for b in names:
+                assert self.world.find_path(a, b) == _reference_path(self.world, a, b)
+                avoid = ["Lyon", "Belgium"]
+                assert self.world.find_path(a, b, avoid_regions=avoid) == \
+                    _reference_path(self.world, a, b, avoid)
+
+    def test_graph_rebuilt_when_regions_replaced(self):
+        """Loading a save with a different map rebuilds the graph."""
+        data = self.world.to_dict()
+        data["regions"].pop("Geneva")
+        for region in data["regions"].values():
+            region["adjacent_regions"] = [r for r in region["adjacent_regions"] if r != "Geneva"]
+        loaded = WorldState.from_dict(data)
+        assert loaded.get_region_id("Geneva") == -1
+        assert loaded.get_distance("Marseille", "Milan") == \
+            _reference_distance(loaded, "Marseille", "Milan")
+
+
+class TestAdjacencyBitsets:
+    """Bitset neighborhoods agree with the name lists and BFS hop counts."""
+
+    def setup_method(self):
+        self.world = WorldState()
+        self.graph = self.world.get_region_graph()
+
+    def test_is_adjacent_to_matches_lists(self):
+        names = list(self.world.regions) + ["Atlantis"]
+        for region in self.world.regions.values():
+            for other in names:
+                assert region.is_adjacent_to(other) == (other in region.adjacent_regions)
+
+    def test_k_hop_neighborhoods_match_bfs(self):
+        """within(r, k) = regions 1..k hops away, for every k up to the max."""
+        for name in self.world.regions:
+            region_id = self.graph.id_of(name)
+            for k in range(1, MAX_NEIGHBORHOOD_HOPS + 1):
+                expected = [other for other in self.world.regions
+                            if 1 <= _reference_distance(self.world, name, other) <= k]
+                assert self.graph.names_in(self.graph.within(region_id, k)) == expected
+            assert sorted(self.world._get_regions_within_range(name, 2)) == sorted(
+                other for other in self.world.regions
+                if 1 <= _reference_distance(self.world, name, other) <= 2)
+
+    def test_regions_within_range_capped_at_two_hops(self):
+        """A max_range above 2 still returns the 2-hop neighborhood."""
+        for name in self.world.regions:
+            two_hops = self.world._get_regions_within_range(name, 2)
+            assert self.world._get_regions_within_range(name, 3) == two_hops
+        assert "Paris" not in self.world._get_regions_within_range("Paris", 3)
+
+    def test_common_neighbors_and_two_hop_paths(self):
+        regions = self.world.regions
+        for a in regions:
+            for b in regions:
+                shared = [r for r in regions[a].adjacent_regions if b in regions[r].adjacent_regions]
+                bits = self.graph.common_neighbors(self.graph.id_of(a), self.graph.id_of(b))
+                assert sorted(self.graph.names_in(bits)) == sorted(shared)
+                assert self.world._has_valid_path(a, b) == bool(shared)
+
+    def test_to_dict_keeps_name_lists(self):
+        """Saves still carry adjacency as lists of names."""
+        self.world.get_region_graph()
+        data = self.world.regions["Lyon"].to_dict()
+        assert data["adjacent_regions"] == ["Paris", "Rhine", "Bavaria", "Marseille", "Milan"]
+
+
+class TestControlAggregates:
+    """Running control/income totals match a rescan of every region."""
+
+    def _rescan(self, world, nation):
+        return [name for name, region in world.regions.items() if region.controller == nation]
+
+    def _assert_matches_rescan(self, world):
+        for nation in ("France", "Britain", "Prussia", "Austria", "Neutral", None):
+            regions = self._rescan(world, nation)
+            assert world.get_nation_regions(nation) == regions
+            assert world.get_nation_region_count(nation) == len(regions)
+            assert world.get_nation_income(nation) == \
+                sum(world.regions[r].income_value for r in regions)
+
+    def test_capture_and_direct_assignment_update_totals(self):
+        world = WorldState()
+        self._assert_matches_rescan(world)
+
+        world.capture_region("Rhine", "France")
+        world.regions["Paris"].controller = "Britain"
+        world.regions["Geneva"].controller = None
+        self._assert_matches_rescan(world)
+        assert not world.controls_region("France", "Paris")
+
+    def test_income_and_victory_checks_use_totals(self):
+        world = WorldState()
+        income = world.calculate_turn_income()
+        assert income["breakdown"]["regions"] == len(self._rescan(world, "France"))
+        assert income["breakdown"]["capital_bonus"] == 200
+
+        world.regions["Paris"].controller = "Britain"
+        result = TurnManager(world)._check_victory_conditions()
+        assert result["result"] == "defeat"
+
+    def test_totals_rebuilt_on_load(self):
+        world = WorldState()
+        world.capture_region("Vienna", "France")
+        loaded = WorldState.from_dict(world.to_dict())
+        self._assert_matches_rescan(loaded)
+        loaded.capture_region("Milan", "France")
+        self._assert_matches_rescan(loaded)
+        assert world.get_nation_region_count("France") == loaded.get_nation_region_count("France") - 1
+
+
+class TestMarshalIds:
+    """Marshal ids are assigned at load and stable."""
+
+    def test_ids_assigned_in_roster_order(self):
+        world = WorldState()
+        for i, name in enumerate(world.marshals):
+            assert world.get_marshal_id(name) == i
+            assert world.get_marshal_name(i) == name
+
+    def test_ids_survive_removal_and_reload(self):
+        world = WorldState()
+        ney_id = world.get_marshal_id("Ney")
+        world.marshals.pop("Davout")
+        assert world.get_marshal_id("Ney") == ney_id
+
+        loaded = WorldState.from_dict(world.to_dict())
+        assert [loaded.get_marshal_name(i) for i in range(len(loaded.marshals))] == \
+            list(loaded.marshals)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -31,10 +31,13 @@ def get_instance_attributes(obj: Any) -> Set[str]:
     Get all instance attributes, excluding private/dunder.
 
     For dataclasses, uses fields().
+    For slotted classes (Marshal), uses _state_snapshot().
     For regular classes, uses vars().
     """
     if is_dataclass(obj):
         return {f.name for f in fields(obj)}
+    if hasattr(obj, '_state_snapshot'):
+        return {k for k in obj._state_snapshot() if not k.startswith('_')}
     return {k for k in vars(obj).keys() if not k.startswith('_')}
 
 
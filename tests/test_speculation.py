@@ -0,0 +1,120 @@
+"""
+Tests for speculative fast-parse execution (WorldState.fork/adopt and
+SpeculativeRunner).
+
+Run: pytest tests/test_speculation.py -v
+"""
+
+import time
+
+import pytest
+from backend.ai.schemas import ParseResult
+from backend.commands.executor import CommandExecutor
+from backend.commands.parser import CommandParser
+from backend.commands.speculation import SpeculativeRunner
+from backend.models.world_state import WorldState
+from backend.utils.metrics import SPECULATION_TOTAL
+
+LLM_STATE = {"marshals": {"Davout": {}}, "enemies": {}, "map_data": {"Paris": {}}}
+
+
+def _runner(llm_action, fast_confidence=0.5, on_llm_call=None):
+    """Runner whose fast parse is 'Davout fortify' and whose LLM answers llm_action."""
+    parser = CommandParser(use_real_llm=False)
+    llm = parser.llm
+    llm.provider_name = "anthropic"
+    llm.api_key = "test-key"
+    llm._parse_with_mock = lambda text: ParseResult(
+        matched=True, marshals=["Davout"], action="fortify", confidence=fast_confidence,
+        mode="mock", raw_command=text)
+
+    def provider_parse(text, state):
+        time.sleep(0.05)
+        if on_llm_call:
+            on_llm_call()
+        return ParseResult(matched=True, marshals=["Davout"], action=llm_action,
+                           mode="anthropic", raw_command=text)
+
+    llm.provider.parse = provider_parse
+    return SpeculativeRunner(parser, CommandExecutor())
+
+
+class TestWorldFork:
+
+    def test_fork_is_independent_and_adopt_commits(self):
+        world = WorldState()
+        fork = world.fork()
+        fork.get_marshal("Davout").strength -= 1000
+        fork.actions_remaining -= 1
+        assert fork.get_state_version() != world.get_state_version()
+        assert world.get_marshal("Davout").strength == fork.get_marshal("Davout").strength + 1000
+
+        holder = {"world": world}
+        world.adopt(fork)
+        assert holder["world"] is world
+        assert world.actions_remaining == fork.actions_remaining
+        assert world.get_marshal("Davout") is fork.get_marshal("Davout")
+
+    def test_adopt_reattaches_listeners(self):
+        """Region and marshal listeners report to the adopting world, not the fork."""
+        world = WorldState()
+        world.get_pending_interrupt_marshals()  # Attach interrupt listeners
+        fork = world.fork()
+        world.adopt(fork)
+
+        regions = world.get_nation_region_count("France")
+        world.regions["Rhine"].controller = "France"
+        world.get_marshal("Ney").pending_interrupt = {"type": "cannon_fire"}
+
+        assert world.get_nation_region_count("France") == regions + 1
+        assert [m.name for m in world.get_pending_interrupt_marshals()] == ["Ney"]
+        assert world.regions["Rhine"]._control_listener.__self__ is world
+        assert world.get_marshal("Ney")._interrupt_listener.__self__ is world
+
+
+class TestSpeculativeRunner:
+
+    def test_agreeing_llm_commits_speculation(self):
+        world = WorldState()
+        before = SPECULATION_TOTAL.labels("committed").value
+        parsed, result = _runner("fortify").run("Davout fortify", LLM_STATE, {"world": world})
+
+        assert result["success"]
+        assert parsed["mode"] == "anthropic"
+        assert world.get_marshal("Davout").fortified
+        assert SPECULATION_TOTAL.labels("committed").value == before + 1
+
+    def test_disagreeing_llm_discards_fork(self):
+        world = WorldState()
+        actions = world.actions_remaining
+        before = SPECULATION_TOTAL.labels("discarded").value
+        parsed, result = _runner("defend").run("Davout fortify", LLM_STATE, {"world": world})
+
+        assert parsed["command"]["action"] == "defend"
+        assert result["success"]
+        assert not world.get_marshal("Davout").fortified  # Speculative fortify dropped
+        assert world.actions_remaining == actions - 1       # Only the defend was paid for
+        assert SPECULATION_TOTAL.labels("discarded").value == before + 1
+
+    def test_world_change_during_llm_call_is_stale(self):
+        world = WorldState()
+        before = SPECULATION_TOTAL.labels("stale").value
+        runner = _runner("fortify", on_llm_call=world.mark_state_changed)
+        parsed, result = runner.run("Davout fortify", LLM_STATE, {"world": world})
+
+        assert result["success"] and world.get_marshal("Davout").fortified
+        assert SPECULATION_TOTAL.labels("stale").value == before + 1
+
+    def test_confident_fast_parse_does_not_speculate(self):
+        world = WorldState()
+        runner = _runner("defend", fast_confidence=0.95)
+        runner.parser.llm.provider.parse = lambda text, state: pytest.fail("LLM must not be called")
+        committed = SPECULATION_TOTAL.labels("committed").value
+
+        parsed, result = runner.run("Davout fortify", LLM_STATE, {"world": world})
+        assert result["success"] and world.get_marshal("Davout").fortified
+        assert SPECULATION_TOTAL.labels("committed").value == committed
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
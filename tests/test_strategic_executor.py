@@ -2814,3 +2814,73 @@ class TestGenericTargetResolutionAllTypes:
             if result.get("state") == "awaiting_clarification":
                 assert "strategic_type" in result, \
                     f"{stype} clarification missing strategic_type"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SHARED PASS CONTEXT (batched strategic order processing)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestStrategicTurnContext:
+    """StrategicTurnContext must match the per-marshal world queries it replaces."""
+
+    def test_enemies_in_region_matches_world(self, world):
+        """Occupancy map returns the same enemies as get_enemies_in_region."""
+        from backend.commands.strategic import StrategicTurnContext
+        ctx = StrategicTurnContext(world)
+        for region_name in world.regions:
+            expected = [m.name for m in world.get_enemies_in_region(region_name, "France")]
+            actual = [m.name for m in ctx.enemies_in_region(region_name, "France")]
+            assert actual == expected
+
+    def test_battles_near_matches_world(self, world):
+        """Cannon-range lookup returns the same battles, in order, as get_battles_within_range."""
+        from backend.commands.strategic import StrategicTurnContext
+        ctx = StrategicTurnContext(world)
+        world.record_battle("Waterloo", "Wellington", "Ney", "stalemate")
+        world.record_battle("Vienna", "Blucher", "Davout", "victory")
+        world.record_battle("Berlin", "Wellington", "Blucher", "victory")
+        for region_name in world.regions:
+            assert ctx.battles_near(region_name) == world.get_battles_within_range(region_name, 2)
+
+        # New battle mid-pass is picked up
+        world.record_battle("Lyon", "Blucher", "Ney", "defeat")
+        assert ctx.battles_near("Paris") == world.get_battles_within_range("Paris", 2)
+
+    def test_cached_path_is_a_copy(self, world):
+        """Callers pop from paths; the cached path must not be mutated."""
+        from backend.commands.strategic import StrategicTurnContext
+        ctx = StrategicTurnContext(world)
+        path = ctx.find_path("Paris", "Vienna")
+        path.pop(0)
+        assert ctx.find_path("Paris", "Vienna") == world.find_path("Paris", "Vienna")
+
+    def test_executed_command_invalidates_occupancy(self, world, game_state, strategic_executor):
+        """A command run during the pass drops the cached occupancy."""
+        from backend.commands.strategic import StrategicTurnContext
+        ctx = StrategicTurnContext(world)
+        strategic_executor._turn_context = ctx
+        try:
+            wellington = world.get_marshal("Wellington")
+            assert wellington in ctx.enemies_in_region(wellington.location, "France")
+
+            wellington.location = "Vienna"
+            with _suppress_output():
+                strategic_executor._execute(
+                    {"command": {"marshal": "Ney", "action": "wait",
+                                 "_strategic_execution": True}},
+                    game_state
+                )
+            assert wellington in ctx.enemies_in_region("Vienna", "France")
+        finally:
+            strategic_executor._turn_context = None
+
+    def test_context_cleared_after_pass(self, world, game_state, strategic_executor):
+        """The pass context never outlives process_strategic_orders()."""
+        davout = world.get_marshal("Davout")
+        davout.location = "Paris"
+        _set_strategic_order(davout, "MOVE_TO", "Lyon", path=["Lyon"])
+
+        with _suppress_output():
+            strategic_executor.process_strategic_orders(world, game_state)
+
+        assert strategic_executor._turn_context is None
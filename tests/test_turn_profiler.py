@@ -0,0 +1,95 @@
+"""
+Tests for the end-turn profiler (per-phase, per-nation and per-AI-handler
+timings, opt-in "timings" key and cross-turn aggregation).
+
+Run: pytest tests/test_turn_profiler.py -v
+"""
+
+import pytest
+from backend.models.world_state import WorldState
+from backend.commands.executor import CommandExecutor
+from backend.game_logic.profiler import (
+    TurnMetrics, TurnProfiler, get_active_profiler, profile_phase, profiled,
+)
+
+
+def _end_turn(world, executor, **extra):
+    state = {"world": world, **extra}
+    return executor.execute({"command": {"action": "end_turn"}}, state)
+
+
+class TestTurnProfiler:
+    """Profiler mechanics independent of the game."""
+
+    def test_no_active_profiler_is_a_no_op(self):
+        """Instrumented code runs normally outside end_turn()."""
+        @profiled()
+        def handler(x):
+            return x * 2
+
+        assert get_active_profiler() is None
+        with profile_phase("anything"):
+            pass
+        assert handler(21) == 42
+
+    def test_counts_calls_and_groups(self):
+        @profiled()
+        def handler():
+            return None
+
+        with TurnProfiler() as profiler:
+            handler()
+            handler()
+            with profile_phase("Britain", group="nations"):
+                pass
+        assert get_active_profiler() is None
+
+        timings = profiler.to_dict()
+        assert timings["ai"]["handler"]["calls"] == 2
+        assert timings["nations"]["Britain"]["calls"] == 1
+        assert timings["total_ms"] >= timings["ai"]["handler"]["ms"]
+
+    def test_metrics_aggregate_across_turns(self):
+        metrics = TurnMetrics()
+        for _ in range(3):
+            with TurnProfiler() as profiler:
+                with profile_phase("enemy_phase"):
+                    pass
+            metrics.record(profiler)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["turns"] == 3
+        assert snapshot["phases"]["enemy_phase"]["calls"] == 3
+        metrics.reset()
+        assert metrics.snapshot()["turns"] == 0
+
+
+class TestEndTurnTimings:
+    """end_turn() through the executor."""
+
+    def test_timings_only_when_requested(self):
+        world = WorldState()
+        executor = CommandExecutor()
+        assert "timings" not in _end_turn(world, executor)
+
+        result = _end_turn(world, executor, include_timings=True)
+        timings = result["timings"]
+        for phase in ("enemy_phase", "strategic_orders", "advance_turn",
+                      "advance_turn.tactical_states", "advance_turn.income",
+                      "autonomous_marshals", "victory_check"):
+            assert phase in timings["phases"], phase
+        assert set(timings["nations"]) <= set(world.enemy_nations)
+        assert timings["nations"]
+        assert "_evaluate_marshal" in timings["ai"]
+        assert "_check_threats" in timings["ai"]
+
+    def test_turns_recorded_in_process_metrics(self):
+        from backend.game_logic.profiler import TURN_METRICS
+
+        before = TURN_METRICS.snapshot()["turns"]
+        _end_turn(WorldState(), CommandExecutor())
+        assert TURN_METRICS.snapshot()["turns"] == before + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
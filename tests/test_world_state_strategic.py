@@ -1,7 +1,8 @@
 """
 Tests for WorldState methods added for Phase 5.2 strategic commands.
 
-Tests get_enemies_in_region() and find_path(avoid_regions=).
+Tests get_enemies_in_region(), find_path(avoid_regions=) and the
+battle index behind get_battles_within_range().
 
 Run with: pytest tests/test_world_state_strategic.py -v
 """
@@ -116,3 +117,52 @@ class TestFindPathAvoidRegions:
         """Same start and end returns immediately regardless of avoid list."""
         path = self.world.find_path("Paris", "Paris", avoid_regions=["Paris"])
         assert path == ["Paris"]
+
+
+class TestBattleSpatialIndex:
+    """Tests for the cannon fire index behind get_battles_within_range()."""
+
+    def setup_method(self):
+        self.world = WorldState()
+        self.world.record_battle("Waterloo", "Wellington", "Ney", "stalemate")
+        self.world.record_battle("Vienna", "Blucher", "Davout", "victory")
+        self.world.record_battle("Lyon", "Blucher", "Grouchy", "defeat")
+
+    def _brute_force(self, location, max_distance):
+        return [b for b in self.world.battles_this_turn
+                if self.world.get_distance(location, b["location"]) <= max_distance]
+
+    def test_matches_bfs_for_every_region(self):
+        """Index lookup agrees with a BFS per battle, in recorded order."""
+        for region_name in self.world.regions:
+            for max_distance in (0, 1, 2, 3):
+                assert (self.world.get_battles_within_range(region_name, max_distance)
+                        == self._brute_force(region_name, max_distance))
+
+    def test_unknown_battle_location_never_in_range(self):
+        """A battle at an unknown region is not heard from real regions."""
+        self.world.record_battle("Berlin", "Wellington", "Blucher", "victory")
+        nearby = self.world.get_battles_within_range("Rhine", 2)
+        assert all(b["location"] != "Berlin" for b in nearby)
+
+    def test_clear_turn_battles_empties_index(self):
+        """clear_turn_battles() drops every indexed battle."""
+        self.world.clear_turn_battles()
+        assert self.world.get_battles_within_range("Paris", 2) == []
+
+        self.world.record_battle("Paris", "Wellington", "Ney", "victory")
+        assert len(self.world.get_battles_within_range("Belgium", 1)) == 1
+
+    def test_reassigned_battle_list_is_reindexed(self):
+        """Directly replacing battles_this_turn (as from_dict does) stays consistent."""
+        self.world.battles_this_turn = [
+            {"location": "Brittany", "attacker": "Ney", "defender": "Wellington"}
+        ]
+        nearby = self.world.get_battles_within_range("Paris", 1)
+        assert [b["location"] for b in nearby] == ["Brittany"]
+
+    def test_survives_save_load(self):
+        """Loaded worlds answer range queries from the restored battle list."""
+        restored = WorldState.from_dict(self.world.to_dict())
+        assert (restored.get_battles_within_range("Paris", 2)
+                == self.world.get_battles_within_range("Paris", 2))